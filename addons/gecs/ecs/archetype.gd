@@ -11,6 +11,7 @@
 ## - [b]Signature:[/b] Hash of all component types (determines archetype identity)
 ## - [b]Entities:[/b] Flat array of entities with this exact component combination
 ## - [b]Edges:[/b] Fast lookup for when components are added/removed (future optimization)
+## - [b]Packed columns:[/b] Typed packed arrays mirroring [method Component.packed_fields] (opt-in)
 ##
 ## [b]Example:[/b]
 ## [codeblock]
@@ -58,6 +59,14 @@ var enabled_bitset: PackedInt64Array = []
 ## Enables Flecs-style direct array iteration without dictionary lookups
 var columns: Dictionary = {}  # int (script_instance_id) -> Array of components
 
+## OPTIMIZATION: Packed numeric columns for components that declare [method Component.packed_fields]
+## Maps script_instance_id (int) -> { field (StringName) -> Packed*Array } in entity index order.
+## Only packable components have an entry; see [PackedColumns].
+var packed_columns: Dictionary = {}  # int (script_instance_id) -> Dictionary
+
+## Column keys whose packed layout has been resolved (packable or not)
+var _packed_checked: Dictionary = {}  # int (script_instance_id) -> true
+
 ## Archetype edges for fast component add/remove
 ## Maps: Variant (int for components, String for relationships) -> Archetype
 var add_edges: Dictionary = {}  # Variant (int|String) -> Archetype
@@ -98,12 +107,46 @@ func add_entity(entity: Entity) -> void:
 	# OPTIMIZATION: Populate column arrays from entity.components
 	# Iterate columns keys (skips rel:// keys which have no columns)
 	for comp_key in columns:
-		if entity.components.has(comp_key):
-			columns[comp_key].append(entity.components[comp_key])
-		else:
-			# Entity doesn't have this component yet (might be mid-initialization)
-			# Push null placeholder, will be fixed when component is added
-			columns[comp_key].append(null)
+		# Entity may not have this component yet (might be mid-initialization)
+		# In that case push a null placeholder, fixed by set_component() when it is added
+		var component = entity.components.get(comp_key)
+		columns[comp_key].append(component)
+		if component != null and not _packed_checked.has(comp_key):
+			# First real instance of this column: resolve its packed layout (gathers existing rows too)
+			_init_packed(comp_key, component)
+		elif packed_columns.has(comp_key):
+			_append_packed(packed_columns[comp_key], component)
+
+
+## Add many entities at once (see [method World.spawn]). Storage is grown once for the whole
+## batch instead of once per entity; rows end up exactly as with repeated [method add_entity].
+func add_entities(batch: Array) -> void:
+	var start = entities.size()
+	var end = start + batch.size()
+	entities.append_array(batch)
+	_ensure_bitset_capacity(end)
+	for i in batch.size():
+		var entity: Entity = batch[i]
+		entity_to_index[entity] = start + i
+		_set_enabled_bit(start + i, entity.enabled)
+
+	for comp_key in columns:
+		var column: Array = columns[comp_key]
+		column.resize(end)
+		for i in batch.size():
+			column[start + i] = batch[i].components.get(comp_key)
+		if not _packed_checked.has(comp_key):
+			var component = _first_component(comp_key)
+			if component != null:
+				_init_packed(comp_key, component)
+		elif packed_columns.has(comp_key):
+			var fields: Dictionary = packed_columns[comp_key]
+			for field in fields:
+				fields[field].resize(end)
+				for i in batch.size():
+					var component = column[start + i]
+					if component != null:
+						fields[field][start + i] = component.get(field)
 
 
 ## Remove an entity from this archetype using swap-remove
@@ -125,6 +168,10 @@ func remove_entity(entity: Entity) -> bool:
 		# OPTIMIZATION: Swap in column arrays too (maintain same ordering)
 		for comp_key in columns:
 			columns[comp_key][index] = columns[comp_key][last_index]
+		for comp_key in packed_columns:
+			var fields: Dictionary = packed_columns[comp_key]
+			for field in fields:
+				fields[field][index] = fields[field][last_index]
 
 		# OPTIMIZATION: Swap enabled bit
 		var last_enabled = _get_enabled_bit(last_index)
@@ -137,6 +184,10 @@ func remove_entity(entity: Entity) -> bool:
 	# OPTIMIZATION: Remove last element from all columns
 	for comp_key in columns:
 		columns[comp_key].pop_back()
+	for comp_key in packed_columns:
+		var fields: Dictionary = packed_columns[comp_key]
+		for field in fields:
+			fields[field].resize(last_index)
 
 	# OPTIMIZATION: Update bitset size (no need to clear the bit, just reduce logical size)
 	# The bit will be overwritten when a new entity is added
@@ -167,6 +218,10 @@ func clear() -> void:
 	# OPTIMIZATION: Clear column arrays
 	for comp_key in columns:
 		columns[comp_key].clear()
+	for comp_key in packed_columns:
+		var fields: Dictionary = packed_columns[comp_key]
+		for field in fields:
+			fields[field].clear()
 
 	# OPTIMIZATION: Clear bitset
 	enabled_bitset.clear()
@@ -291,6 +346,80 @@ func get_column(comp_key: Variant) -> Array:
 	return columns.get(comp_key, [])
 
 
+## Set the component stored for the entity at [param index] (e.g. a component added to an
+## entity whose archetype already had a column for it). Keeps packed columns in sync.
+func set_component(index: int, comp_key: int, component: Resource) -> void:
+	columns[comp_key][index] = component
+	if component == null:
+		return
+	if not _packed_checked.has(comp_key):
+		_init_packed(comp_key, component)
+	elif packed_columns.has(comp_key):
+		var fields: Dictionary = packed_columns[comp_key]
+		for field in fields:
+			fields[field][index] = component.get(field)
+
+
+## OPTIMIZATION: Get the packed arrays of a component declaring [method Component.packed_fields]
+## [param comp_key] The component key (Script.get_instance_id())
+## [returns] Dictionary of field name -> packed array in entity index order (the live storage,
+## not a copy), or an empty Dictionary if the component is not packed in this archetype
+##
+## Example:
+## [codeblock]
+## var velocity: PackedVector3Array = archetype.get_packed_column(C_Velocity.get_instance_id()).velocity
+## for i in velocity.size():
+##     positions[i] += velocity[i] * delta
+## [/codeblock]
+func get_packed_column(comp_key: Variant) -> Dictionary:
+	return packed_columns.get(comp_key, {})
+
+
+## Update one packed value after a component property changed.
+## Called by the World when a component emits [signal Component.property_changed].
+func sync_packed_field(entity: Entity, comp_key: int, field: StringName, value: Variant) -> void:
+	var fields: Dictionary = packed_columns.get(comp_key, {})
+	if not fields.has(field):
+		return
+	var index = entity_to_index.get(entity, -1)
+	if index >= 0:
+		fields[field][index] = value
+
+
+## Rebuild the packed arrays of a component from its Resources.
+## Use after changing packed fields without emitting [signal Component.property_changed].
+func refresh_packed(comp_key: int) -> void:
+	if not packed_columns.has(comp_key):
+		return
+	var component = _first_component(comp_key)
+	if component != null:
+		packed_columns[comp_key] = PackedColumns.gather(columns[comp_key], PackedColumns.layout_for(component))
+
+
+## Resolve whether a column is packable and, if so, build its packed arrays from the column
+func _init_packed(comp_key: int, component: Resource) -> void:
+	_packed_checked[comp_key] = true
+	var layout = PackedColumns.layout_for(component)
+	if not layout.is_empty():
+		packed_columns[comp_key] = PackedColumns.gather(columns[comp_key], layout)
+
+
+## Append one row to a component's packed arrays (zero values for a null placeholder)
+func _append_packed(fields: Dictionary, component: Resource) -> void:
+	for field in fields:
+		if component == null:
+			fields[field].resize(fields[field].size() + 1)
+		else:
+			fields[field].append(component.get(field))
+
+
+func _first_component(comp_key: int) -> Resource:
+	for component in columns.get(comp_key, []):
+		if component != null:
+			return component
+	return null
+
+
 ## OPTIMIZATION: Get entities filtered by enabled state using bitset
 ## [param enabled_only] If true, return only enabled entities; if false, only disabled
 ## [returns] Array of entities matching the enabled state
@@ -157,8 +157,17 @@ func execute() -> void:
 	_world._end_suppress()
 
 	# Update statistics
+	var duration_usec := Time.get_ticks_usec() - start_time
 	_stats["commands_executed"] += to_run.size()
-	_stats["last_execution_time_ms"] = (Time.get_ticks_usec() - start_time) / 1000.0
+	_stats["last_execution_time_ms"] = duration_usec / 1000.0
+	if _world._tracing:
+		var trace := _world.frame_trace
+		var label_id := trace.name_id(
+			FrameTrace.Kind.COMMAND_FLUSH, 0, func(): return "CommandBuffer.execute"
+		)
+		trace.record(
+			FrameTrace.Kind.COMMAND_FLUSH, label_id, start_time, duration_usec, to_run.size()
+		)
 
 
 ## Clear all queued commands without executing them
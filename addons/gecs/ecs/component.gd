@@ -32,6 +32,21 @@
 ##      Relationship.new({C_Damage: {'amount': {"_eq": 100}}}, target)
 ##  ]).execute()
 ##[/codeblock]
+##[br]
+## [b]Packed fields:[/b] Override [method packed_fields] to store numeric fields in packed arrays
+## inside each [Archetype], so systems using [method QueryBuilder.packed] can iterate them as
+## contiguous memory. Packed fields should emit [signal property_changed] from their setter so
+## the packed copy stays in sync:[br]
+##[codeblock]
+##  @export var velocity: Vector3 = Vector3.ZERO:
+##      set(value):
+##          var old = velocity
+##          velocity = value
+##          property_changed.emit(self, "velocity", old, value)
+##
+##  func packed_fields() -> Array:
+##      return [&"velocity"]
+##[/codeblock]
 @icon("res://addons/gecs/assets/component.svg")
 class_name Component
 extends Resource
@@ -45,6 +60,13 @@ signal property_changed(
 var parent: Entity
 
 
+## Override to opt into packed column storage. Returns the names of fields to mirror in
+## typed packed arrays ([code]float[/code], [code]int[/code], [code]Vector2/3/4[/code], [code]Color[/code]).
+## See [PackedColumns].
+func packed_fields() -> Array:
+	return []
+
+
 ## Used to serialize the component to a dictionary with only the export variables
 ## This is used for the debugger to send the data to the editor
 func serialize() -> Dictionary:
@@ -250,7 +250,7 @@ func add_components(_components: Array):
 			for component in added_components:
 				var comp_key = _comp_key(component)
 				var entity_index = old_archetype.entity_to_index[self]
-				old_archetype.columns[comp_key][entity_index] = component
+				old_archetype.set_component(entity_index, comp_key, component)
 
 	# Emit signals for all added components
 	for component in added_components:
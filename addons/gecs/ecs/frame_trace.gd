@@ -0,0 +1,203 @@
+## FrameTrace
+##
+## Low-overhead trace recorder for a [World]. Every event (frame, kind, name, start,
+## duration, entity count, thread) is written into preallocated packed-array columns
+## arranged as a ring buffer, so recording never allocates and the oldest events are
+## overwritten once [member capacity] is reached.[br]
+## [br]
+## Unlike [method World.perf_mark] it does not need [code]ECS.debug[/code]; start one with
+## [method World.start_trace] in any build. Only every [member sample_every]-th frame is
+## recorded, which keeps the cost negligible on long sessions. Export the buffer with
+## [method save_chrome_trace] and open it in [code]chrome://tracing[/code] or Perfetto, or
+## summarize it with [code]tools/analyze_trace.py[/code].
+##
+## [codeblock]
+## var trace := ECS.world.start_trace(65536, 4)  # Record every 4th frame
+## # ... play for a while ...
+## ECS.world.stop_trace().save_chrome_trace("user://frame_trace.json")
+## [/codeblock]
+class_name FrameTrace
+extends RefCounted
+
+## What a recorded event measures
+enum Kind { FRAME, SYSTEM, QUERY, OBSERVER, COMMAND_FLUSH }
+
+const DEFAULT_CAPACITY := 65536
+## Chrome trace category per [enum Kind]
+const KIND_NAMES: Array[String] = ["frame", "system", "query", "observer", "command_flush"]
+
+## Maximum number of events kept; older events are overwritten
+var capacity: int
+## Record one frame out of every [code]sample_every[/code]
+var sample_every: int
+
+# Event columns, one slot per event
+var _frames := PackedInt64Array()
+var _kinds := PackedByteArray()
+var _names := PackedInt32Array()
+var _starts := PackedInt64Array()
+var _durations := PackedInt64Array()
+var _counts := PackedInt32Array()
+var _threads := PackedInt64Array()
+## Next slot to write
+var _head := 0
+## Number of valid events in the ring
+var _size := 0
+## Events overwritten since the last clear()
+var _dropped := 0
+
+## Name table: label -> id, and id -> label
+var _label_ids: Dictionary = {}
+var _labels := PackedStringArray()
+## Per-kind key -> name id cache (see name_id)
+var _key_ids: Array[Dictionary] = []
+## Systems run on worker threads under parallel scheduling
+var _mutex := Mutex.new()
+
+
+func _init(p_capacity: int = DEFAULT_CAPACITY, p_sample_every: int = 1) -> void:
+	capacity = maxi(p_capacity, 1)
+	sample_every = maxi(p_sample_every, 1)
+	_frames.resize(capacity)
+	_kinds.resize(capacity)
+	_names.resize(capacity)
+	_starts.resize(capacity)
+	_durations.resize(capacity)
+	_counts.resize(capacity)
+	_threads.resize(capacity)
+	for kind in Kind.size():
+		_key_ids.append({})
+
+
+## True when the current process frame is one of the sampled frames.
+func is_sampled_frame() -> bool:
+	return Engine.get_process_frames() % sample_every == 0
+
+
+## Id of [param label] in the name table, adding it when new.
+func intern(label: String) -> int:
+	_mutex.lock()
+	var id: int = _label_ids.get(label, -1)
+	if id == -1:
+		id = _labels.size()
+		_labels.append(label)
+		_label_ids[label] = id
+	_mutex.unlock()
+	return id
+
+
+## Cached name id for [param key] (an instance id, a query cache key...) of [param kind].
+## [param make_label] is only called the first time a key is seen, so building the
+## display name costs nothing on later frames.
+func name_id(kind: Kind, key: int, make_label: Callable) -> int:
+	_mutex.lock()
+	var id: int = _key_ids[kind].get(key, -1)
+	_mutex.unlock()
+	if id == -1:
+		id = intern(make_label.call())
+		_mutex.lock()
+		_key_ids[kind][key] = id
+		_mutex.unlock()
+	return id
+
+
+## Record one event. Safe to call from worker threads.
+## [param start_usec] is a [method Time.get_ticks_usec] timestamp.
+func record(
+	kind: Kind, label_id: int, start_usec: int, duration_usec: int, entity_count: int = 0
+) -> void:
+	var thread_id := OS.get_thread_caller_id()
+	var frame := Engine.get_process_frames()
+	_mutex.lock()
+	var i := _head
+	_frames[i] = frame
+	_kinds[i] = kind
+	_names[i] = label_id
+	_starts[i] = start_usec
+	_durations[i] = duration_usec
+	_counts[i] = entity_count
+	_threads[i] = thread_id
+	_head = (i + 1) % capacity
+	if _size < capacity:
+		_size += 1
+	else:
+		_dropped += 1
+	_mutex.unlock()
+
+
+## Number of events currently held.
+func size() -> int:
+	return _size
+
+
+## Number of events overwritten because the ring was full.
+func get_dropped() -> int:
+	return _dropped
+
+
+## Drop all recorded events (the name table is kept).
+func clear() -> void:
+	_mutex.lock()
+	_head = 0
+	_size = 0
+	_dropped = 0
+	_mutex.unlock()
+
+
+## Recorded events oldest first, as Dictionaries with [code]frame, kind, name, start_usec,
+## duration_usec, entities, thread[/code].
+func get_events() -> Array[Dictionary]:
+	var events: Array[Dictionary] = []
+	_mutex.lock()
+	var first := (_head - _size + capacity) % capacity
+	for n in _size:
+		var i := (first + n) % capacity
+		events.append(
+			{
+				"frame": _frames[i],
+				"kind": _kinds[i],
+				"name": _labels[_names[i]],
+				"start_usec": _starts[i],
+				"duration_usec": _durations[i],
+				"entities": _counts[i],
+				"thread": _threads[i],
+			}
+		)
+	_mutex.unlock()
+	return events
+
+
+## The buffer in Chrome trace-event format (complete "X" events, microsecond timestamps).
+func to_chrome_trace() -> Dictionary:
+	var main_thread := OS.get_main_thread_id()
+	var trace_events: Array = [
+		{"name": "thread_name", "ph": "M", "pid": 1, "tid": main_thread, "args": {"name": "main"}}
+	]
+	for event in get_events():
+		trace_events.append(
+			{
+				"name": event.name,
+				"cat": KIND_NAMES[event.kind],
+				"ph": "X",
+				"ts": event.start_usec,
+				"dur": event.duration_usec,
+				"pid": 1,
+				"tid": event.thread,
+				"args": {"frame": event.frame, "entities": event.entities},
+			}
+		)
+	return {
+		"traceEvents": trace_events,
+		"displayTimeUnit": "ms",
+		"otherData": {"sample_every": sample_every, "dropped": _dropped},
+	}
+
+
+## Write [method to_chrome_trace] as JSON to [param path].
+func save_chrome_trace(path: String) -> Error:
+	var file := FileAccess.open(path, FileAccess.WRITE)
+	if file == null:
+		return FileAccess.get_open_error()
+	file.store_string(JSON.stringify(to_chrome_trace()))
+	file.close()
+	return OK
@@ -0,0 +1,112 @@
+## PackedColumns
+##
+## Helpers for packed numeric column storage in [Archetype]s.
+##
+## A [Component] opts in by overriding [method Component.packed_fields] with the names of
+## exported fields of a supported type. Each archetype then mirrors those fields in typed
+## packed arrays (one array per field, entity index order), and systems that call
+## [method QueryBuilder.packed] receive those arrays instead of the component Resources.
+##
+## [b]Supported field types:[/b] [code]float[/code] (PackedFloat64Array), [code]int[/code]
+## (PackedInt64Array), [code]Vector2[/code], [code]Vector3[/code], [code]Vector4[/code] and
+## [code]Color[/code] (their packed array types).
+##
+## The component Resources stay the source of truth outside of packed systems. The archetype
+## keeps the arrays in sync on add/remove/swap-remove and whenever a component emits
+## [signal Component.property_changed] for a packed field, so packed fields should emit it
+## from their setter (or call [method Archetype.refresh_packed] after bulk edits).[br]
+## While a packed system runs, the arrays are the source of truth. Afterwards its write-back
+## components are copied to the Resources in one pass without emitting
+## [signal Component.property_changed], so observers and monitors do not see packed writes.
+class_name PackedColumns
+extends RefCounted
+
+## Layout cache: script instance id (int) -> Dictionary[StringName, int] (field -> Variant.Type).
+## Empty Dictionary when the component does not declare packed fields.
+static var _layouts: Dictionary = {}
+
+
+## Packed field layout of [param component]'s script (cached per script)
+static func layout_for(component: Resource) -> Dictionary:
+	var comp_key = component.get_script().get_instance_id()
+	var layout = _layouts.get(comp_key)
+	if layout != null:
+		return layout
+	layout = {}
+	if component.has_method("packed_fields"):
+		for field in component.packed_fields():
+			var type = typeof(component.get(field))
+			if is_supported(type):
+				layout[StringName(field)] = type
+			else:
+				push_warning(
+					(
+						"%s: packed field '%s' has unsupported type %s and is not packed"
+						% [component.get_script().resource_path, field, type_string(type)]
+					)
+				)
+	_layouts[comp_key] = layout
+	return layout
+
+
+## Whether values of [param type] (Variant.Type) can be stored in a packed column
+static func is_supported(type: int) -> bool:
+	return type in [TYPE_FLOAT, TYPE_INT, TYPE_VECTOR2, TYPE_VECTOR3, TYPE_VECTOR4, TYPE_COLOR]
+
+
+## Create an empty packed array for values of [param type]
+static func new_array(type: int) -> Variant:
+	match type:
+		TYPE_FLOAT:
+			return PackedFloat64Array()
+		TYPE_INT:
+			return PackedInt64Array()
+		TYPE_VECTOR2:
+			return PackedVector2Array()
+		TYPE_VECTOR3:
+			return PackedVector3Array()
+		TYPE_VECTOR4:
+			return PackedVector4Array()
+		TYPE_COLOR:
+			return PackedColorArray()
+	return null
+
+
+## Build packed arrays for [param layout] from an Array of component Resources.
+## Null entries (components not yet attached) become zero values.
+static func gather(components: Array, layout: Dictionary) -> Dictionary:
+	var fields := {}
+	var count = components.size()
+	for field in layout:
+		var values = new_array(layout[field])
+		values.resize(count)
+		for i in count:
+			var component = components[i]
+			if component != null:
+				values[i] = component.get(field)
+		fields[field] = values
+	return fields
+
+
+## Copy every row of [param fields] back to the component Resources.[br]
+## The component's signals are blocked while it is written: the packed arrays already hold
+## the new values, so the [signal Component.property_changed] round trip (Entity, World,
+## observers, [method Archetype.sync_packed_field]) would only write them back again.[br]
+## Returns the number of components written.
+static func write_back(fields: Dictionary, components: Array) -> int:
+	var names: Array = fields.keys()
+	var columns: Array = fields.values()
+	var count := components.size()
+	for values in columns:
+		count = mini(count, values.size())
+	var written := 0
+	for i in count:
+		var component = components[i]
+		if component == null:
+			continue
+		component.set_block_signals(true)
+		for f in names.size():
+			component.set(names[f], columns[f][i])
+		component.set_block_signals(false)
+		written += 1
+	return written
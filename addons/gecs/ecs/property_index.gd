@@ -0,0 +1,224 @@
+## PropertyIndex
+##
+## A value index over one property of one [Component] type, declared with
+## [method World.add_property_index]. Property queries such as
+## [code]with_all([{C_Health: {"hp": {"_lt": 10}}}])[/code] use it to look up the matching
+## entities instead of running [method ComponentQueryMatcher.matches_query] on every entity of
+## the structural archetypes.
+##
+## [b]Kinds:[/b]
+## [br]• [b]HASH:[/b] value -> entities. Answers [code]_eq[/code] and [code]_in[/code].
+## [br]• [b]SORTED:[/b] values kept in ascending order. Also answers [code]_gt[/code],
+## [code]_gte[/code], [code]_lt[/code] and [code]_lte[/code] with a binary search.
+##
+## Lookups only narrow the candidates; the full query is still checked on each of them, so
+## operators the index can't answer ([code]_ne[/code], [code]_nin[/code], [code]func[/code])
+## keep working. The [World] keeps the index in sync when components are added or removed and
+## when a component emits [signal Component.property_changed] for the indexed property, so
+## indexed properties must emit it from their setter.
+##
+## [codeblock]
+##     ECS.world.add_property_index(C_Health, &"hp", true)
+##     # Now a binary search + O(k) instead of a scan over every C_Health entity
+##     var dying = ECS.world.query.with_all([{C_Health: {"hp": {"_lt": 10}}}]).execute()
+## [/codeblock]
+class_name PropertyIndex
+extends RefCounted
+
+enum Kind { HASH, SORTED }
+
+## Script of the indexed [Component]
+var component_type: Script
+## Name of the indexed property
+var property: StringName
+## [enum Kind] of this index
+var kind: Kind
+
+## Entity -> indexed value
+var _values: Dictionary = {}
+## HASH: normalized value -> Dictionary[Entity, bool]
+var _buckets: Dictionary = {}
+## SORTED: ascending values with the owning entity at the same position
+var _sorted_values: Array = []
+var _sorted_entities: Array[Entity] = []
+## SORTED: entities whose value can't be ordered against the others (always candidates)
+var _unordered: Dictionary = {}
+## SORTED: comparison class of the ordered values (see [method _order_class])
+var _value_class: int = 0
+
+
+func _init(_component_type: Script, _property: StringName, _kind: Kind = Kind.HASH) -> void:
+	component_type = _component_type
+	property = _property
+	kind = _kind
+
+
+## Number of indexed entities
+func size() -> int:
+	return _values.size()
+
+
+## Whether [param entity] is indexed
+func has(entity: Entity) -> bool:
+	return _values.has(entity)
+
+
+## Index (or re-index) [param entity] under [param value]
+func set_value(entity: Entity, value: Variant) -> void:
+	if _values.has(entity):
+		var old = _values[entity]
+		if typeof(old) == typeof(value) and old == value:
+			return
+		_remove(entity, old)
+	_values[entity] = value
+	if kind == Kind.HASH:
+		var key = _hash_key(value)
+		if not _buckets.has(key):
+			_buckets[key] = {}
+		_buckets[key][entity] = true
+		return
+	var value_class = _order_class(value)
+	if _value_class == 0 and value_class != 0:
+		_value_class = value_class
+	if value_class == 0 or value_class != _value_class:
+		_unordered[entity] = true
+		return
+	var at = _sorted_values.bsearch(value, false)
+	_sorted_values.insert(at, value)
+	_sorted_entities.insert(at, entity)
+
+
+## Remove [param entity] from the index
+func erase(entity: Entity) -> void:
+	if _values.has(entity):
+		_remove(entity, _values[entity])
+		_values.erase(entity)
+
+
+## Remove every entity from the index
+func clear() -> void:
+	_values.clear()
+	_buckets.clear()
+	_sorted_values.clear()
+	_sorted_entities.clear()
+	_unordered.clear()
+	_value_class = 0
+
+
+## Entities that may satisfy [param property_query] (an operator Dictionary such as
+## [code]{"_gte": 5, "_lt": 10}[/code]), or [code]null[/code] when none of its operators can be
+## answered by this index. The result is a superset of the matches only for operators the
+## index ignores; callers must still check the full query.
+func lookup(property_query: Dictionary) -> Variant:
+	if kind == Kind.HASH:
+		return _lookup_hash(property_query)
+	return _lookup_sorted(property_query)
+
+
+func _lookup_hash(property_query: Dictionary) -> Variant:
+	var keys: Array
+	if property_query.has("_eq"):
+		keys = [property_query["_eq"]]
+	elif property_query.has("_in"):
+		keys = Array(property_query["_in"])
+	else:
+		return null
+	# Repeated or equal values ([1, 1] or [1, 1.0]) share a bucket: visit each one once
+	var buckets := {}
+	for value in keys:
+		buckets[_hash_key(value)] = true
+	var result: Array[Entity] = []
+	for key in buckets:
+		var bucket = _buckets.get(key)
+		if bucket != null:
+			result.append_array(bucket.keys())
+	return result
+
+
+func _lookup_sorted(property_query: Dictionary) -> Variant:
+	var lo := 0
+	var hi := _sorted_values.size()
+	var narrowed := false
+	for operator in property_query:
+		var value = property_query[operator]
+		if operator != "_in" and _order_class(value) != _value_class:
+			continue
+		match operator:
+			"_eq":
+				lo = maxi(lo, _sorted_values.bsearch(value, true))
+				hi = mini(hi, _sorted_values.bsearch(value, false))
+			"_gt":
+				lo = maxi(lo, _sorted_values.bsearch(value, false))
+			"_gte":
+				lo = maxi(lo, _sorted_values.bsearch(value, true))
+			"_lt":
+				hi = mini(hi, _sorted_values.bsearch(value, true))
+			"_lte":
+				hi = mini(hi, _sorted_values.bsearch(value, false))
+			_:
+				continue
+		narrowed = true
+
+	var result: Array[Entity] = []
+	if property_query.has("_in"):
+		# Union of the equal ranges of each value, clipped to the range operators.
+		# Equal values share a range: each start is taken once.
+		var seen_starts := {}
+		for value in property_query["_in"]:
+			if _order_class(value) != _value_class:
+				continue
+			var start = maxi(lo, _sorted_values.bsearch(value, true))
+			var end = mini(hi, _sorted_values.bsearch(value, false))
+			if start < end and not seen_starts.has(start):
+				seen_starts[start] = true
+				result.append_array(_sorted_entities.slice(start, end))
+		narrowed = true
+	elif not narrowed:
+		return null
+	elif lo < hi:
+		result = _sorted_entities.slice(lo, hi)
+
+	for entity in _unordered:
+		result.append(entity)
+	return result
+
+
+func _remove(entity: Entity, value: Variant) -> void:
+	if kind == Kind.HASH:
+		var key = _hash_key(value)
+		var bucket = _buckets.get(key)
+		if bucket != null:
+			bucket.erase(entity)
+			if bucket.is_empty():
+				_buckets.erase(key)
+		return
+	if _unordered.erase(entity):
+		return
+	var start = _sorted_values.bsearch(value, true)
+	var end = _sorted_values.bsearch(value, false)
+	for i in range(start, end):
+		if _sorted_entities[i] == entity:
+			_sorted_values.remove_at(i)
+			_sorted_entities.remove_at(i)
+			return
+
+
+## Dictionary key for [param value]: ints and floats compare equal in queries, and so do
+## String and StringName, so they share a key
+static func _hash_key(value: Variant) -> Variant:
+	match typeof(value):
+		TYPE_INT:
+			return float(value)
+		TYPE_STRING_NAME:
+			return String(value)
+	return value
+
+
+## Values of the same non-zero class can be ordered with [code]<[/code]: 1 = numbers, 2 = strings
+static func _order_class(value: Variant) -> int:
+	match typeof(value):
+		TYPE_INT, TYPE_FLOAT:
+			return 1
+		TYPE_STRING, TYPE_STRING_NAME:
+			return 2
+	return 0
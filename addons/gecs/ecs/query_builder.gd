@@ -37,6 +37,9 @@ var _post_filter_relationships: Array = []  # Property-query and script-target r
 var _structural_ex_rel_keys: Array = []
 var _wildcard_ex_rel_types: Array = []
 var _post_filter_ex_relationships: Array = []
+# Reverse relationship filter (with_relationship_to): only sources pointing at this entity
+var _relationship_target: Entity = null
+var _relationship_target_relation = null  # Optional relation Script/Component filter
 # Components queries that an entity must match
 var _all_components_queries: Array = []
 # Components queries that an entity must match for any components
@@ -49,6 +52,10 @@ var _exclude_groups: Array = []
 var _enabled_filter = null
 # Components to iterate in archetype mode (ordered array of component types)
 var _iterate_components: Array = []
+# Pass packed field arrays instead of component Resources for packable iterate() components
+var _iterate_packed: bool = false
+# Component keys (script instance ids) whose packed arrays are written back after processing
+var _packed_write_back: Dictionary = {}  # int -> true
 
 # ------------------------------------------------------------------------------
 # Observer event declarations (FLECS-style). A query with any of these set is an
@@ -101,12 +108,16 @@ func clear():
 	_structural_ex_rel_keys = []
 	_wildcard_ex_rel_types = []
 	_post_filter_ex_relationships = []
+	_relationship_target = null
+	_relationship_target_relation = null
 	_all_components_queries = []
 	_any_components_queries = []
 	_groups = []
 	_exclude_groups = []
 	_enabled_filter = null
 	_iterate_components = []
+	_iterate_packed = false
+	_packed_write_back = {}
 	_observer_events_mask = 0
 	_observer_changed_props = []
 	_observer_rel_add_types = []
@@ -230,6 +241,24 @@ func without_relationship(relationships: Array = []) -> QueryBuilder:
 	return self
 
 
+## Finds entities holding a relationship that targets [param target] ("who points at X").[br]
+## Candidates come from the World's reverse relationship index, so only the actual sources
+## are visited; the other filters of the query are then checked on them.[br]
+## [param target] The target [Entity].[br]
+## [param relation] Optional relation filter: a [Component] script or instance.[br]
+## [param returns] [QueryBuilder] instance for chaining.[br]
+## [b]Example:[/b]
+##      [codeblock]
+##      var followers = ECS.world.query.with_relationship_to(leader, C_Follows).execute()
+##      [/codeblock]
+func with_relationship_to(target: Entity, relation = null) -> QueryBuilder:
+	_relationship_target = target
+	_relationship_target_relation = relation
+	_cache_valid = false
+	_cache_key_valid = false
+	return self
+
+
 ## Finds entities with specific groups.
 func with_group(groups: Array[String] = []) -> QueryBuilder:
 	_groups.append_array(groups)
@@ -282,6 +311,39 @@ func iterate(components: Array) -> QueryBuilder:
 	return self
 
 
+## Hand [method iterate] components that declare [method Component.packed_fields] to the
+## system as packed arrays instead of component Resources.[br]
+## For those components, [code]components[i][/code] is a Dictionary of field name -> packed
+## array ([PackedFloat64Array], [PackedVector3Array], ...) in entity order. Components without
+## packed fields are still passed as Arrays of Resources.[br]
+## [param write_back] Components whose packed arrays the system modifies. After processing,
+## their values are copied back to the component Resources in one pass, and property indexes
+## on those fields are updated. The copy does not emit [signal Component.property_changed], so
+## observers and monitors are not notified of packed writes. Changes to other packed arrays
+## are not written back.[br][br]
+## Packed arrays are the live archetype storage: modify elements in place, never resize them,
+## and queue structural changes through the [CommandBuffer] while iterating. Packed queries
+## are processed on the calling thread.[br][br]
+## [b]Example:[/b]
+## [codeblock]
+## func query() -> QueryBuilder:
+##     return q.with_all([C_Transform, C_Velocity]).iterate([C_Transform, C_Velocity]).packed([C_Transform])
+##
+## func process(entities: Array[Entity], components: Array, delta: float) -> void:
+##     var positions: PackedVector3Array = components[0].position
+##     var velocities: PackedVector3Array = components[1].velocity
+##     for i in entities.size():
+##         positions[i] += velocities[i] * delta
+## [/codeblock]
+func packed(write_back: Array = []) -> QueryBuilder:
+	_iterate_packed = true
+	_packed_write_back = {}
+	for comp_type in write_back:
+		var script = comp_type if comp_type is Script else comp_type.get_script()
+		_packed_write_back[script.get_instance_id()] = true
+	return self
+
+
 #region Observer Event Declarations
 ## Declare this query as an [Observer] spec that fires when a component matching
 ## [method with_all]/[method with_any] is added to a matching entity.[br]
@@ -414,26 +476,31 @@ func execute_one() -> Entity:
 ## Executes the constructed query and retrieves matching entities.[br]
 ## [param returns] -  An [Array] of [Entity] that match the query criteria.
 func execute() -> Array:
+	# Only sampled frames of an active World.frame_trace pay for the timestamps
+	var trace_start := Time.get_ticks_usec() if _world and _world._tracing else 0
 	# For relationship or group filters we need fresh filtering every call (no stale cached filtered result)
 	# Only post-filter relationships and groups prevent caching
 	var has_post_filter_rels := (
 		not _post_filter_relationships.is_empty() or not _post_filter_ex_relationships.is_empty()
 	)
 	var uses_group_filters := not _groups.is_empty() or not _exclude_groups.is_empty()
+	# Reverse relationship results depend on the index, not the archetypes: never cache them
+	var uses_reverse_index := _relationship_target != null
+	var cacheable := not has_post_filter_rels and not uses_group_filters and not uses_reverse_index
 
 	# Detect stale cache via world version counter (robust fallback for signal delivery)
 	if _cache_valid and _world and _cached_world_version != _world.cache_version:
 		_cache_valid = false
 
 	var structural_result: Array
-	if _cache_valid and not has_post_filter_rels and not uses_group_filters:
+	if _cache_valid and cacheable:
 		# Safe to reuse full cached result only for purely structural component queries
 		structural_result = _cached_result
 	else:
 		# Recompute base structural/group result (without relationship filtering caching)
 		structural_result = _internal_execute()
 		# Only cache if no dynamic relationship/group filters are present
-		if not has_post_filter_rels and not uses_group_filters:
+		if cacheable:
 			_cached_result = structural_result
 			_cache_valid = true
 			_cached_world_version = _world.cache_version if _world else -1
@@ -443,16 +510,35 @@ func execute() -> Array:
 	var result = structural_result
 	# Apply component property queries (post structural)
 	if not _all_components_queries.is_empty() and _has_actual_queries(_all_components_queries):
+		# Start from the property index candidates when one applies (World.add_property_index)
+		var candidates = (
+			null if has_post_filter_rels or uses_reverse_index else _indexed_candidates()
+		)
+		if candidates != null and candidates.size() < result.size():
+			result = candidates
 		result = _filter_entities_by_queries(result, _all_components, _all_components_queries, true)
 	if not _any_components_queries.is_empty() and _has_actual_queries(_any_components_queries):
 		result = _filter_entities_by_queries(
 			result, _any_components, _any_components_queries, false
 		)
 
+	if trace_start != 0:
+		var trace := _world.frame_trace
+		trace.record(
+			FrameTrace.Kind.QUERY,
+			trace.name_id(FrameTrace.Kind.QUERY, get_cache_key(), _to_string),
+			trace_start,
+			Time.get_ticks_usec() - trace_start,
+			result.size()
+		)
 	return result
 
 
 func _internal_execute() -> Array:
+	# Reverse relationship query: start from the indexed sources of the target
+	if _relationship_target != null:
+		return _relationship_target_execute()
+
 	# If we have groups or exclude groups, gather entities from those groups
 	if not _groups.is_empty() or not _exclude_groups.is_empty():
 		var entities_in_group = []
@@ -557,6 +643,75 @@ func _internal_execute() -> Array:
 	return result
 
 
+## Sources of [member _relationship_target] from the World's reverse relationship index,
+## narrowed by the enabled, group, component and relationship filters of this query.
+func _relationship_target_execute() -> Array:
+	if _world == null or not is_instance_valid(_relationship_target):
+		return []
+	var result: Array = []
+	for entity in matches(
+		_world.get_relationship_sources(_relationship_target, _relationship_target_relation)
+	):
+		if _enabled_filter != null and entity.enabled != _enabled_filter:
+			continue
+		if not _in_groups(entity):
+			continue
+		result.append(entity)
+	return result
+
+
+## Whether [param entity] satisfies the with_group/without_group filters.
+func _in_groups(entity: Entity) -> bool:
+	for group_name in _groups:
+		if not entity.is_in_group(group_name):
+			return false
+	for group_name in _exclude_groups:
+		if entity.is_in_group(group_name):
+			return false
+	return true
+
+
+## Entities pre-selected by the World's property indexes for this query's [method with_all]
+## property filters, restricted to the matching archetypes and enabled filter. Uses the index
+## with the fewest candidates. Returns null when no declared index applies, or when group
+## filters are present (group membership isn't tracked by archetypes).
+## The property queries must still be checked on the result.
+func _indexed_candidates() -> Variant:
+	if _world == null or _world._property_indexes.is_empty():
+		return null
+	if not _groups.is_empty() or not _exclude_groups.is_empty():
+		return null
+	var best = null
+	for i in range(mini(_all_components.size(), _all_components_queries.size())):
+		var query: Dictionary = _all_components_queries[i]
+		if query.is_empty():
+			continue
+		var indexes = _world._property_indexes.get(_all_components[i].get_instance_id())
+		if indexes == null:
+			continue
+		for property in query:
+			var index = indexes.get(StringName(property))
+			if index == null:
+				continue
+			var found = index.lookup(query[property])
+			if found != null and (best == null or found.size() < best.size()):
+				best = found
+	if best == null:
+		return null
+
+	var matching := {}
+	for archetype in archetypes():
+		matching[archetype] = true
+	var result: Array[Entity] = []
+	for entity in best:
+		if not matching.has(_world.entity_to_archetype.get(entity)):
+			continue
+		if _enabled_filter != null and entity.enabled != _enabled_filter:
+			continue
+		result.append(entity)
+	return result
+
+
 ## Check if any query in the array has actual property filters (not just empty {})
 func _has_actual_queries(queries: Array) -> bool:
 	for query in queries:
@@ -675,6 +830,9 @@ func combine(other: QueryBuilder) -> QueryBuilder:
 	_exclude_relationships += other._exclude_relationships
 	_groups += other._groups
 	_exclude_groups += other._exclude_groups
+	if other._relationship_target != null:
+		_relationship_target = other._relationship_target
+		_relationship_target_relation = other._relationship_target_relation
 	_cache_valid = false
 	_reclassify_relationships()
 	return self
@@ -706,6 +864,7 @@ func is_empty() -> bool:
 		and _exclude_components.is_empty()
 		and _relationships.is_empty()
 		and _exclude_relationships.is_empty()
+		and _relationship_target == null
 	)
 
 
@@ -727,6 +886,9 @@ func _to_string() -> String:
 	if not _exclude_relationships.is_empty():
 		parts.append("without_relationship(" + _format_relationships(_exclude_relationships) + ")")
 
+	if _relationship_target != null:
+		parts.append("with_relationship_to(" + str(_relationship_target) + ")")
+
 	if not _groups.is_empty():
 		parts.append("with_group(" + str(_groups) + ")")
 
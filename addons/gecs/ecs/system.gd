@@ -32,6 +32,18 @@
 ##         for i in entities.size():
 ##             transforms[i].position += velocities[i].velocity * delta
 ##[/codeblock]
+## [b]Example (Packed fields with packed()):[/b] components declaring [method Component.packed_fields]
+## arrive as field -> packed array Dictionaries; [code]packed([Transform])[/code] writes them back.
+##[codeblock]
+##     func query():
+##         return q.with_all([Transform, Velocity]).iterate([Transform, Velocity]).packed([Transform])
+##
+##     func process(entities: Array[Entity], components: Array, delta: float) -> void:
+##         var positions: PackedVector3Array = components[0].position
+##         var velocities: PackedVector3Array = components[1].velocity
+##         for i in entities.size():
+##             positions[i] += velocities[i] * delta
+##[/codeblock]
 @icon("res://addons/gecs/assets/system.svg")
 class_name System
 extends Node
@@ -48,8 +60,26 @@ enum Runs {
 ## Internal flush mode enum — mirrors @export_enum "PER_SYSTEM","PER_GROUP","MANUAL"
 enum FlushMode { PER_SYSTEM, PER_GROUP, MANUAL }
 
+## How a system accesses component data, see [method access]
+enum Access {
+	## Components the system only reads
+	Read,
+	## Components the system writes
+	Write,
+}
+
 #endregion Enums
 
+#region Constants
+## Adaptive parallel chunks never go below this many entities
+const ADAPTIVE_MIN_CHUNK := 32
+## Adaptive chunks averaging less than this (µs) are doubled: task overhead dominates
+const CHUNK_MIN_USEC := 100
+## Adaptive chunks averaging more than this (µs) are halved, while that keeps <= 4 chunks per worker
+const CHUNK_MAX_USEC := 2000
+
+#endregion Constants
+
 #region Exported Variables
 ## What group this system belongs to. Systems can be organized and run by group
 @export var group: String = ""
@@ -63,6 +93,26 @@ enum FlushMode { PER_SYSTEM, PER_GROUP, MANUAL }
 @export var parallel_processing := false
 ## Minimum entities required to use parallel processing (performance threshold)
 @export var parallel_threshold := 50
+## Give each parallel chunk an index range over the shared entity and component arrays through
+## [method process_range] (zero-copy) instead of calling [method process] with sliced copies.
+## Also lets [method QueryBuilder.packed] queries run in parallel, when [method process_range]
+## is overridden (the default copies the range, which would drop packed writes).
+@export var parallel_ranges := false
+## Entities per parallel chunk. 0 = adaptive: starts at about four chunks per worker, then grows or
+## shrinks from the previous run's chunk timings.
+@export var parallel_chunk_size := 0
+## Allow this system to run at the same time as the other [member concurrent] systems of its
+## group that it doesn't conflict with (see [method access]), when [member World.parallel_systems]
+## is on. The system then runs on a worker thread with the same restrictions as
+## [member parallel_processing]: no scene tree access, structural changes only through
+## [member cmd], and no ad-hoc queries besides its own. PER_SYSTEM command buffers are flushed at
+## the end of the system's stage.[br]
+## While a stage runs on worker threads, the World serializes its query cache and the
+## [signal Component.property_changed] path (packed columns, property indexes, monitors and
+## observers), so property setters are safe. Observers they trigger run on the worker thread
+## under the same rules.
+@export var concurrent := false:
+	set = _set_concurrent
 
 @export_group("Command Buffer")
 ## When to flush the command buffer:
@@ -145,6 +195,22 @@ var _last_execution_time_ms: float = 0.0
 ## Registered Performance custom monitor id, empty when not registered.
 var _perf_monitor_id: StringName = &""
 
+## Adaptive parallel chunk size carried between frames (0 = not sized yet)
+var _adaptive_chunk_size: int = 0
+## Per-chunk time of the last parallel run, in microseconds (one slot per chunk)
+var _chunk_usec: Array = []
+
+## Whether the script overrides process_range (-1 = not checked yet)
+var _overrides_process_range: int = -1
+
+## Time spent in the last measured [method _handle] call, in microseconds
+var _last_handle_usec: int = 0
+## Entities passed to process() (or subsystem callables) in the last _handle call
+var _last_entity_count: int = 0
+## Resolved component access for the parallel scheduler (built by _get_access, cleared by
+## refresh_schedule)
+var _access_cache: Dictionary = {}
+
 ## Running min/max/avg execution time, aggregated on the runtime side so the
 ## numbers stay correct even when the editor debugger drops messages under heavy
 ## entity churn. Shipped via lastRunData; displayed directly by the GECS tab.
@@ -167,6 +233,23 @@ func deps() -> Dictionary[int, Array]:
 	}
 
 
+## Override this method to declare which [Component]s this system reads and writes.[br]
+## [member World.parallel_systems] uses it to run [member concurrent] systems side by side: two
+## systems conflict when one writes a component the other reads or writes.[br]
+## If not overridden, every component of the system's query (and sub-system queries) counts as
+## written, and a system without components conflicts with every other system.[br]
+## [b]Example:[/b]
+## [codeblock]
+## func access() -> Dictionary[int, Array]:
+##     return {
+##         Access.Read: [C_Velocity],
+##         Access.Write: [C_Transform],
+##     }
+## [/codeblock]
+func access() -> Dictionary[int, Array]:
+	return {}
+
+
 ## Override this method and return a [QueryBuilder] to define the required [Component]s for the system.[br]
 ## If not overridden, the system will run on every update with no entities.[br][br]
 ## You can use [code]q[/code] or [code]ECS.world.query[/code] - both are equivalent.
@@ -217,6 +300,25 @@ func process(entities: Array[Entity], components: Array, delta: float) -> void:
 	pass  # Override in subclasses - base implementation does nothing
 
 
+## Parallel counterpart of [method process], used when [member parallel_ranges] is on.[br]
+## Called from worker threads with the full, shared [param entities] and [param components]
+## arrays; only indices [code][from, to)[/code] belong to this call. Don't resize the arrays.
+## Packed fields ([method QueryBuilder.packed]) are shared the same way.[br]
+## The default copies the range and calls [method process], so packed queries only run in
+## parallel when this is overridden; otherwise they run serially and report an error.[br][br]
+## [b]Example:[/b]
+## [codeblock]
+## func process_range(entities, components, from, to, delta):
+##     var velocities = components[0]
+##     for i in range(from, to):
+##         entities[i].position += velocities[i].velocity * delta
+## [/codeblock]
+func process_range(
+	entities: Array[Entity], components: Array, from: int, to: int, delta: float
+) -> void:
+	_process_slice(entities, components, from, to, delta)
+
+
 ## Create and assign an interval [SystemTimer] for this system.[br]
 ## Returns the timer so it can be shared with other systems.[br][br]
 ## [b]Example — private timer:[/b]
@@ -252,6 +354,16 @@ func reset_performance_metrics() -> void:
 	_metric_sample_count = 0
 
 
+## Drop the resolved [method access] set and the [member World.parallel_systems] stage plan
+## of this system's group, so both are rebuilt on the next frame. Setting [member concurrent]
+## calls this; call it yourself when [method access] or [method deps] start returning
+## something different.
+func refresh_schedule() -> void:
+	_access_cache.clear()
+	if _world:
+		_world._system_schedules.erase(group)
+
+
 #endregion Public Methods
 
 #region Private Methods
@@ -298,6 +410,15 @@ func _set_performance_monitor(value: bool) -> void:
 			_unregister_performance_monitor()
 
 
+## Setter for [member concurrent]. Rebuilds the stage schedule so the system moves
+## between the serial and threaded stages when the flag flips at runtime.
+func _set_concurrent(value: bool) -> void:
+	if value == concurrent:
+		return
+	concurrent = value
+	refresh_schedule()
+
+
 ## Resolve a unique id for this system's Performance monitor. Uses the script
 ## basename (same shape as [code]lastRunData.system_name[/code]); appends
 ## [code]#N[/code] if another monitor with that id is already registered so two
@@ -369,53 +490,259 @@ func _warn_if_query_has_observer_events() -> void:
 				)
 
 
-## Process entities in parallel using WorkerThreadPool
-## Splits entities into batches and processes them concurrently
+## Whether [param count] entities should be processed with [method _process_parallel].
+## Packed columns can only be shared through [method process_range].
+func _use_parallel(count: int, packed: bool) -> bool:
+	if not parallel_processing or count < parallel_threshold:
+		return false
+	if not packed:
+		return true
+	if not parallel_ranges:
+		return false
+	# Packed writes must land in the live arrays: the default process_range works on copies
+	if _overrides_process_range == -1:
+		_overrides_process_range = 1 if _declares_process_range() else 0
+		if _overrides_process_range == 0:
+			push_error(
+				(
+					"%s: packed query with parallel_ranges needs a process_range() override;"
+					+ " running serially"
+				)
+				% get_script().resource_path.get_file()
+			)
+	return _overrides_process_range == 1
+
+
+## True when a script below System overrides [method process_range]. A script's method list
+## includes its base scripts' methods, so an override shows up more than once.
+func _declares_process_range() -> bool:
+	var declared := 0
+	for method in get_script().get_script_method_list():
+		if method.name == "process_range":
+			declared += 1
+	return declared > 1
+
+
+## Whether [method _handle] would run this frame (active, not paused, tick source fired)
+func _will_run() -> bool:
+	if not active or paused:
+		return false
+	# Timer gate: only run when tick source fires (null = every frame)
+	return tick_source == null or tick_source.ticked
+
+
+## Lazily build the cached main query
+func _ensure_query_cache() -> void:
+	if not _query_cache:
+		_query_cache = query()
+		_uses_non_structural_cached = -1
+
+
+## Lazily build the cached sub-system tuples and their per-subsystem flags
+func _ensure_subsystems_cache() -> void:
+	if not _subsystems_cache.is_empty():
+		return
+	_subsystems_cache = sub_systems()
+	_subsystem_non_structural_cache.clear()
+	_subsystem_timers_cache.clear()
+	for subsystem_tuple in _subsystems_cache:
+		var sq := subsystem_tuple[0] as QueryBuilder
+		_subsystem_non_structural_cache.append(1 if _query_has_non_structural_filters(sq) else 0)
+		_subsystem_timers_cache.append(subsystem_tuple[2] if subsystem_tuple.size() > 2 else null)
+
+
+## The queries this system runs: its sub-system queries, or its main query
+func _get_queries() -> Array[QueryBuilder]:
+	if _has_subsystems_cached == -1:
+		_has_subsystems_cached = 1 if not sub_systems().is_empty() else 0
+	var queries: Array[QueryBuilder] = []
+	if _has_subsystems_cached == 1:
+		_ensure_subsystems_cache()
+		for subsystem_tuple in _subsystems_cache:
+			queries.append(subsystem_tuple[0])
+	else:
+		_ensure_query_cache()
+		queries.append(_query_cache)
+	return queries
+
+
+## Called on the main thread before [method _handle] runs on a worker thread: builds the lazy
+## query caches and primes the World's archetype cache, so the worker only reads shared state.
+func _prepare_concurrent() -> void:
+	for query_builder in _get_queries():
+		query_builder.archetypes()
+
+
+## Resolved [method access] as script instance id sets:
+## [code]{"read": {id: true}, "write": {id: true}, "exclusive": bool}[/code]
+func _get_access() -> Dictionary:
+	if not _access_cache.is_empty():
+		return _access_cache
+	var reads := {}
+	var writes := {}
+	var declared := access()
+	if declared.is_empty():
+		# Derived: everything the queries touch may be written
+		for query_builder in _get_queries():
+			for list in [
+				query_builder._all_components,
+				query_builder._any_components,
+				query_builder._iterate_components,
+			]:
+				for comp_type in list:
+					writes[_access_key(comp_type)] = true
+	else:
+		for comp_type in declared.get(Access.Read, []):
+			reads[_access_key(comp_type)] = true
+		for comp_type in declared.get(Access.Write, []):
+			writes[_access_key(comp_type)] = true
+	_access_cache = {
+		"read": reads,
+		"write": writes,
+		"exclusive": reads.is_empty() and writes.is_empty(),
+	}
+	return _access_cache
+
+
+static func _access_key(comp_type) -> int:
+	return (
+		comp_type.get_instance_id()
+		if comp_type is Script
+		else comp_type.get_script().get_instance_id()
+	)
+
+
+## Whether this system must not run at the same time as [param other]: either is not
+## [member concurrent], one depends on the other through [method deps], or their
+## [method access] sets overlap with at least one write.
+func _conflicts_with(other: System) -> bool:
+	if not concurrent or not other.concurrent:
+		return true
+	if _depends_on(other) or other._depends_on(self):
+		return true
+	var mine := _get_access()
+	var theirs := other._get_access()
+	if mine.exclusive or theirs.exclusive:
+		return true
+	for key in mine.write:
+		if theirs.write.has(key) or theirs.read.has(key):
+			return true
+	for key in theirs.write:
+		if mine.read.has(key):
+			return true
+	return false
+
+
+## Whether [method deps] orders this system relative to [param other] (wildcards included)
+func _depends_on(other: System) -> bool:
+	var deps_dict := deps()
+	for runs in [Runs.Before, Runs.After]:
+		for dep in deps_dict.get(runs, []):
+			if dep == null or ArrayExtensions._find_system_by_type([other], dep) != null:
+				return true
+	return false
+
+
+## Process entities in parallel with one WorkerThreadPool group task.[br]
+## Each chunk is an index range over the shared arrays: with [member parallel_ranges] it goes to
+## [method process_range] as-is, otherwise the worker slices its range and calls [method process].
 func _process_parallel(entities: Array[Entity], components: Array, delta: float) -> void:
-	if entities.is_empty():
+	var count := entities.size()
+	if count == 0:
 		return
 
 	# Use OS thread count as fallback since WorkerThreadPool.get_thread_count() doesn't exist
-	var worker_count = OS.get_processor_count()
-	var batch_size = max(1, entities.size() / worker_count)
-	var tasks = []
-
-	# Submit tasks for each batch
-	for batch_start in range(0, entities.size(), batch_size):
-		var batch_end = min(batch_start + batch_size, entities.size())
-
-		# Slice entities and components for this batch
-		var batch_entities = entities.slice(batch_start, batch_end)
-		var batch_components = []
-		for comp_array in components:
-			batch_components.append(comp_array.slice(batch_start, batch_end))
-
-		var task_id = WorkerThreadPool.add_task(
-			_process_batch_callable.bind(batch_entities, batch_components, delta)
-		)
-		tasks.append(task_id)
+	var worker_count := OS.get_processor_count()
+	var chunk_size := _chunk_size_for(count, worker_count)
+	var chunk_count := ceili(count / float(chunk_size))
+	# Sized on this thread; workers only write their own slot
+	_chunk_usec.resize(chunk_count)
+
+	var group_id := WorkerThreadPool.add_group_task(
+		_process_chunk.bind(entities, components, chunk_size, delta), chunk_count
+	)
+	WorkerThreadPool.wait_for_group_task_completion(group_id)
+
+	var total_usec := 0
+	var max_usec := 0
+	for usec in _chunk_usec:
+		total_usec += usec
+		max_usec = maxi(max_usec, usec)
+	var mean_usec := total_usec / chunk_count
+	_adapt_chunk_size(chunk_size, chunk_count, mean_usec, worker_count)
+	if ECS.debug:
+		lastRunData["parallel_chunks"] = chunk_count
+		lastRunData["chunk_size"] = chunk_size
+		lastRunData["chunk_usec"] = _chunk_usec.duplicate()
+		lastRunData["chunk_mean_usec"] = mean_usec
+		lastRunData["chunk_max_usec"] = max_usec
+
+
+## Group task body - called by worker threads with the chunk index
+func _process_chunk(
+	chunk_index: int, entities: Array[Entity], components: Array, chunk_size: int, delta: float
+) -> void:
+	var start_usec := Time.get_ticks_usec()
+	var from := chunk_index * chunk_size
+	var to := mini(from + chunk_size, entities.size())
+	if parallel_ranges:
+		process_range(entities, components, from, to, delta)
+	else:
+		_process_slice(entities, components, from, to, delta)
+	_chunk_usec[chunk_index] = Time.get_ticks_usec() - start_usec
+
+
+## Call [method process] with copies of the [code][from, to)[/code] range
+func _process_slice(
+	entities: Array[Entity], components: Array, from: int, to: int, delta: float
+) -> void:
+	var batch_components := []
+	for column in components:
+		if column is Dictionary:
+			# Packed fields: slice every field array (read-only copies)
+			var fields := {}
+			for field in column:
+				fields[field] = column[field].slice(from, to)
+			batch_components.append(fields)
+		else:
+			batch_components.append(column.slice(from, to))
+	process(entities.slice(from, to), batch_components, delta)
+
 
-	# Wait for all tasks to complete
-	for task_id in tasks:
-		WorkerThreadPool.wait_for_task_completion(task_id)
+## Entities per chunk for [param count] entities: [member parallel_chunk_size], or the adaptive size
+func _chunk_size_for(count: int, worker_count: int) -> int:
+	if parallel_chunk_size > 0:
+		return parallel_chunk_size
+	if _adaptive_chunk_size <= 0:
+		# About four chunks per worker so uneven chunks still balance out
+		_adaptive_chunk_size = ceili(count / float(worker_count * 4))
+	return clampi(_adaptive_chunk_size, mini(ADAPTIVE_MIN_CHUNK, count), count)
 
 
-## Process a batch of entities - called by worker threads
-func _process_batch_callable(entities: Array[Entity], components: Array, delta: float) -> void:
-	process(entities, components, delta)
+## Grow chunks that finish too fast to be worth a task, split ones that are slow to balance
+func _adapt_chunk_size(chunk_size: int, chunk_count: int, mean_usec: int, worker_count: int) -> void:
+	if parallel_chunk_size > 0:
+		return
+	if mean_usec < CHUNK_MIN_USEC:
+		_adaptive_chunk_size = chunk_size * 2
+	elif mean_usec > CHUNK_MAX_USEC and chunk_count < worker_count * 4:
+		_adaptive_chunk_size = maxi(chunk_size / 2, ADAPTIVE_MIN_CHUNK)
 
 
 ## Called by World.process() each frame - main entry point for system execution
 ## [param delta] The time elapsed since the last frame
-func _handle(delta: float) -> void:
-	if not active or paused:
-		return
-	# Timer gate: only run when tick source fires (null = every frame)
-	if tick_source and not tick_source.ticked:
+## [param defer_flush] Leave PER_SYSTEM commands queued for the World's stage barrier
+## (parallel scheduling, where this may run on a worker thread)
+func _handle(delta: float, defer_flush: bool = false) -> void:
+	if not _will_run():
 		return
 	# Always measure time when the Performance monitor is on, even without ECS.debug,
-	# so the monitor callable has a live value to return.
-	var measure_time := ECS.debug or performance_monitor
+	# so the monitor callable has a live value to return. The parallel scheduler
+	# (defer_flush) always measures to report achieved parallelism, and a sampled
+	# World.frame_trace records every system it runs.
+	var world: World = _world if _world else ECS.world
+	var tracing := world != null and world._tracing
+	var measure_time := ECS.debug or performance_monitor or defer_flush or tracing
 	var start_time_usec := 0
 	if measure_time:
 		start_time_usec = Time.get_ticks_usec()
@@ -426,17 +753,23 @@ func _handle(delta: float) -> void:
 		}
 	if _has_subsystems_cached == -1:
 		_has_subsystems_cached = 1 if not sub_systems().is_empty() else 0
+	_last_entity_count = 0
 	if _has_subsystems_cached == 1:
 		_run_subsystems(delta)
 	else:
 		_run_process(delta)
 	# Flush command buffer if mode is PER_SYSTEM
-	if command_buffer_flush_mode == FlushMode.PER_SYSTEM and has_pending_commands():
+	if (
+		not defer_flush
+		and command_buffer_flush_mode == FlushMode.PER_SYSTEM
+		and has_pending_commands()
+	):
 		cmd.execute()
 
 	if measure_time:
 		var end_time_usec = Time.get_ticks_usec()
-		_last_execution_time_ms = (end_time_usec - start_time_usec) / 1000.0
+		_last_handle_usec = end_time_usec - start_time_usec
+		_last_execution_time_ms = _last_handle_usec / 1000.0
 		# Aggregate min/max/avg on the runtime side — every frame contributes even
 		# when editor debugger messages are dropped, so peaks are never lost.
 		if _metric_sample_count == 0:
@@ -449,6 +782,15 @@ func _handle(delta: float) -> void:
 		_metric_avg_ms = (
 			_metric_avg_ms + (_last_execution_time_ms - _metric_avg_ms) / _metric_sample_count
 		)
+		if tracing:
+			var trace := world.frame_trace
+			trace.record(
+				FrameTrace.Kind.SYSTEM,
+				trace.name_id(FrameTrace.Kind.SYSTEM, get_instance_id(), _trace_label),
+				start_time_usec,
+				_last_handle_usec,
+				_last_entity_count
+			)
 		if ECS.debug:
 			lastRunData["execution_time_ms"] = _last_execution_time_ms
 			lastRunData["min_ms"] = _metric_min_ms
@@ -465,18 +807,7 @@ func _handle(delta: float) -> void:
 ## [param delta] Time delta
 ## [param subsystem_index] Index for debug tracking (-1 for main system)
 func _run_subsystems(delta: float) -> void:
-	if _subsystems_cache.is_empty():
-		_subsystems_cache = sub_systems()
-		_subsystem_non_structural_cache.clear()
-		_subsystem_timers_cache.clear()
-		for subsystem_tuple in _subsystems_cache:
-			var sq := subsystem_tuple[0] as QueryBuilder
-			_subsystem_non_structural_cache.append(
-				1 if _query_has_non_structural_filters(sq) else 0
-			)
-			_subsystem_timers_cache.append(
-				subsystem_tuple[2] if subsystem_tuple.size() > 2 else null
-			)
+	_ensure_subsystems_cache()
 	var subsystem_index := 0
 	for subsystem_tuple in _subsystems_cache:
 		var subsystem_query := subsystem_tuple[0] as QueryBuilder
@@ -493,9 +824,13 @@ func _run_subsystems(delta: float) -> void:
 		if uses_non_structural:
 			# Gather ALL structural entities first then filter once (avoid per-archetype filtering churn)
 			var all_entities: Array[Entity] = []
-			for arch in subsystem_query.archetypes():
-				if not arch.entities.is_empty():
-					all_entities.append_array(arch.entities)  # no snapshot to allow mid-frame changes visible to later subsystems
+			var candidates = subsystem_query._indexed_candidates()
+			if candidates != null:
+				all_entities = candidates
+			else:
+				for arch in subsystem_query.archetypes():
+					if not arch.entities.is_empty():
+						all_entities.append_array(arch.entities)  # no snapshot to allow mid-frame changes visible to later subsystems
 			var filtered = _filter_entities_global(subsystem_query, all_entities)
 			if filtered.is_empty():
 				if ECS.debug:
@@ -510,7 +845,14 @@ func _run_subsystems(delta: float) -> void:
 			if not iterate_comps.is_empty():
 				for comp_type in iterate_comps:
 					components.append(_build_component_column_from_entities(filtered, comp_type))
+			var write_backs := (
+				_pack_components(subsystem_query, components, null)
+				if subsystem_query._iterate_packed
+				else []
+			)
 			subsystem_callable.call(filtered, components, delta)
+			_write_back_packed(write_backs)
+			_last_entity_count += filtered.size()
 			if ECS.debug:
 				lastRunData[subsystem_index] = {
 					"subsystem_index": subsystem_index,
@@ -549,7 +891,14 @@ func _run_subsystems(delta: float) -> void:
 								else comp_type.get_script().get_instance_id()
 							)
 							components.append(archetype.get_column(comp_key))
+				var write_backs := []
+				if subsystem_query._iterate_packed and not components.is_empty():
+					write_backs = _pack_components(
+						subsystem_query, components, archetype if enabled_filter == null else null
+					)
 				subsystem_callable.call(arch_entities, components, delta)
+				_write_back_packed(write_backs)
+			_last_entity_count += total_entity_count
 			if ECS.debug:
 				lastRunData[subsystem_index] = {
 					"subsystem_index": subsystem_index,
@@ -560,9 +909,7 @@ func _run_subsystems(delta: float) -> void:
 
 
 func _run_process(delta: float) -> void:
-	if not _query_cache:
-		_query_cache = query()
-		_uses_non_structural_cached = -1
+	_ensure_query_cache()
 	if _component_keys.is_empty():
 		var iterate_comps = _query_cache._iterate_components
 		for comp_type in iterate_comps:
@@ -579,9 +926,14 @@ func _run_process(delta: float) -> void:
 	if uses_non_structural:
 		# Gather all entities across structural archetypes and then filter once
 		var all_entities: Array[Entity] = []
-		for arch in _query_cache.archetypes():
-			if not arch.entities.is_empty():
-				all_entities.append_array(arch.entities)
+		# Property index candidates (World.add_property_index) replace the full archetype scan
+		var candidates = _query_cache._indexed_candidates()
+		if candidates != null:
+			all_entities = candidates
+		else:
+			for arch in _query_cache.archetypes():
+				if not arch.entities.is_empty():
+					all_entities.append_array(arch.entities)
 		if all_entities.is_empty():
 			if process_empty:
 				process([], [], delta)
@@ -595,15 +947,20 @@ func _run_process(delta: float) -> void:
 		if not iterate_comps.is_empty():
 			for comp_type in iterate_comps:
 				components.append(_build_component_column_from_entities(filtered, comp_type))
-		if parallel_processing and filtered.size() >= parallel_threshold:
+		var packed := _query_cache._iterate_packed
+		var write_backs := _pack_components(_query_cache, components, null) if packed else []
+		var run_parallel := _use_parallel(filtered.size(), packed)
+		_last_entity_count = filtered.size()
+		if run_parallel:
 			_process_parallel(filtered, components, delta)
 		else:
 			process(filtered, components, delta)
+		_write_back_packed(write_backs)
 		if ECS.debug:
 			lastRunData["entity_count"] = filtered.size()
 			lastRunData["archetype_count"] = _query_cache.archetypes().size()
 			lastRunData["fallback_execute"] = true
-			lastRunData["parallel"] = parallel_processing and filtered.size() >= parallel_threshold
+			lastRunData["parallel"] = run_parallel
 		return
 	# Structural fast path — single pass over archetypes
 	var matching_archetypes = _query_cache.archetypes()
@@ -618,6 +975,7 @@ func _run_process(delta: float) -> void:
 		if arch_entities.is_empty():
 			continue
 		processed_any = true
+		_last_entity_count += arch_entities.size()
 		# Snapshot entities to avoid mutation skipping during component add/remove.
 		# When safe_iteration is false the system uses CommandBuffer for ALL structural
 		# changes so the snapshot copy is unnecessary — use the archetype array directly.
@@ -637,7 +995,14 @@ func _run_process(delta: float) -> void:
 			else:
 				for comp_key in _component_keys:
 					components.append(arch.get_column(comp_key))
-		if parallel_processing and snapshot_entities.size() >= parallel_threshold:
+		var packed := _query_cache._iterate_packed and not components.is_empty()
+		var write_backs := []
+		if packed:
+			# Live archetype storage when unfiltered, gathered copies for the enabled subset
+			write_backs = _pack_components(
+				_query_cache, components, arch if enabled_filter == null else null
+			)
+		if _use_parallel(snapshot_entities.size(), packed):
 			if ECS.debug:
 				lastRunData["parallel"] = true
 				lastRunData["threshold"] = parallel_threshold
@@ -646,6 +1011,7 @@ func _run_process(delta: float) -> void:
 			if ECS.debug:
 				lastRunData["parallel"] = false
 			process(snapshot_entities, components, delta)
+		_write_back_packed(write_backs)
 	if not processed_any:
 		if process_empty:
 			process([], [], delta)
@@ -663,6 +1029,11 @@ func _run_process(delta: float) -> void:
 		lastRunData["fallback_execute"] = false
 
 
+## Display name of this system in a [FrameTrace] (same as the debugger's system_name)
+func _trace_label() -> String:
+	return get_script().resource_path.get_file().get_basename()
+
+
 ## Determine if a query includes non-structural filters requiring execute() fallback
 func _query_has_non_structural_filters(qb: QueryBuilder) -> bool:
 	# Structural relationships (exact type-match, wildcard) are handled at archetype level
@@ -671,6 +1042,9 @@ func _query_has_non_structural_filters(qb: QueryBuilder) -> bool:
 		return true
 	if not qb._post_filter_ex_relationships.is_empty():
 		return true
+	# Reverse relationship queries are served from the World's reverse index
+	if qb._relationship_target != null:
+		return true
 	if not qb._groups.is_empty():
 		return true
 	if not qb._exclude_groups.is_empty():
@@ -687,6 +1061,49 @@ func _query_has_non_structural_filters(qb: QueryBuilder) -> bool:
 	return false
 
 
+## Replace packable component columns with packed field arrays for [method QueryBuilder.packed] queries.[br]
+## [param arch] Archetype whose live packed storage is used, or null to gather copies from the Resources.[br]
+## Returns write-back records ([code][resources, fields, comp_key, live][/code]) for [method _write_back_packed].
+func _pack_components(qb: QueryBuilder, components: Array, arch: Archetype) -> Array:
+	var write_backs := []
+	for i in components.size():
+		var resources: Array = components[i]
+		var comp_type = qb._iterate_components[i]
+		var comp_key = (
+			comp_type.get_instance_id()
+			if comp_type is Script
+			else comp_type.get_script().get_instance_id()
+		)
+		var fields := {}
+		if arch != null:
+			fields = arch.get_packed_column(comp_key)
+		else:
+			for component in resources:
+				if component != null:
+					var layout = PackedColumns.layout_for(component)
+					if not layout.is_empty():
+						fields = PackedColumns.gather(resources, layout)
+					break
+		if fields.is_empty():
+			continue
+		components[i] = fields
+		if qb._packed_write_back.has(comp_key):
+			write_backs.append([resources, fields, comp_key, arch != null])
+	return write_backs
+
+
+## Copy packed write-back columns to the component Resources after processing. No
+## [signal Component.property_changed] is emitted; the World updates property indexes (and
+## the archetype arrays, for gathered copies) in one pass per column instead.
+func _write_back_packed(write_backs: Array) -> void:
+	if write_backs.is_empty():
+		return
+	var world: World = _world if _world else ECS.world
+	for record in write_backs:
+		PackedColumns.write_back(record[1], record[0])
+		world._on_packed_written(record[2], record[0], record[1], record[3])
+
+
 ## Build component arrays for iterate() when falling back to execute() result (no archetype columns)
 func _build_component_column_from_entities(entities: Array[Entity], comp_type) -> Array:
 	var out := []
@@ -47,6 +47,11 @@ signal cache_invalidated
 @export var system_nodes_root: NodePath
 ## Default serialization config for all entities in this world
 @export var default_serialize_config: GECSSerializeConfig
+## Run non-conflicting [member System.concurrent] systems of a group at the same time on the
+## [WorkerThreadPool]. Each group is split into stages of systems whose [method System.access]
+## sets don't conflict; stages run in order, and PER_SYSTEM command buffers are flushed at the
+## end of each stage. See [method get_schedule_stats].
+@export var parallel_systems := false
 
 #endregion Exported Variables
 
@@ -65,6 +70,16 @@ var _obs_entries_by_custom_event: Dictionary = {}
 ## All observer/sub-observer entries belonging to a given [Observer], keyed by observer instance.
 ## Used for O(1) cleanup on [method remove_observer].
 var _obs_entries_by_observer: Dictionary = {}
+## Compiled dispatch tables for component lifecycle events, built lazily from
+## [member _obs_entries_by_event] by [method _observer_dispatch_table]. Key = [enum Observer.Event]
+## int flag. Value = Dictionary keyed by component script instance id (plus property
+## [StringName] for [code]CHANGED[/code]) -> Array of the entries that can fire for it.
+## Cleared whenever observer registration changes; the Arrays are never mutated afterwards, so
+## dispatch iterates them directly instead of snapshotting.
+var _obs_dispatch_tables: Dictionary = {}
+## Compiled monitor tables: touched path -> Array of monitor entries whose sensitivity includes
+## it (see [method _monitor_dispatch_table]). Cleared together with [member _obs_dispatch_tables].
+var _obs_monitor_tables: Dictionary = {}
 ## All the [System]s by group Dictionary[String, Array[System]]
 var systems_by_group: Dictionary[String, Array] = {}
 ## All the [System]s in the world flattened into a single array
@@ -96,14 +111,25 @@ var _next_entity_id: int = 1
 ## Relation-type archetype index: maps relation resource_path -> { archetype_signature -> Archetype }
 ## Enables O(1) wildcard relationship queries (find all archetypes with any (RelationType, *) pair)
 var _relation_type_archetype_index: Dictionary = {}  # String -> Dictionary[int, Archetype]
+## Reverse relationship index: maps target Entity -> { source Entity -> Array[Relationship] }
+## Maintained on relationship add/remove so target cleanup and "who points at X" queries
+## only touch the actual sources instead of scanning every relationship archetype.
+var _relationship_sources: Dictionary = {}  # Entity -> Dictionary[Entity, Array]
 ## Logger for the world to only log to a specific domain
 var _worldLogger = GECSLogger.new().domain("World")
 ## Cache for commonly used query results - stores matching archetypes, not entities
-## This dramatically reduces cache invalidation since archetypes are stable
+## This dramatically reduces cache invalidation since archetypes are stable.
+## Maintained incrementally: new archetypes are appended to the queries they match and
+## deleted archetypes are removed, so entries are only dropped wholesale on purge.
 var _query_archetype_cache: Dictionary = {}  # query_sig -> Array[Archetype]
+## Match criteria for each cached query, used to test newly created archetypes
+var _query_archetype_specs: Dictionary = {}  # query_sig -> Dictionary
 ## Track cache hits for performance monitoring
 var _cache_hits: int = 0
 var _cache_misses: int = 0
+## Track incremental cache maintenance (archetypes added to / removed from cached queries)
+var _cache_archetype_adds: int = 0
+var _cache_archetype_removes: int = 0
 ## Track cache invalidations for debugging
 var _cache_invalidation_count: int = 0
 ## Monotonic version counter — incremented on every structural cache invalidation.
@@ -121,6 +147,8 @@ var _pending_invalidation: bool = false
 var _in_batch_relationship_emit: bool = false
 ## One-shot guard: fires push_error once when archetype count first exceeds 500 in debug mode
 var _archetype_explosion_warned: bool = false
+## Property value indexes: script_instance_id (int) -> { StringName property -> PropertyIndex }
+var _property_indexes: Dictionary = {}
 ## Frame + accumulated performance metrics (debug-only)
 var _perf_metrics := {"frame": {}, "accum": {}}  # Per-frame aggregated timings  # Long-lived totals (cleared manually)
 ## Queue of systems waiting for setup after ECS.world is assigned
@@ -129,6 +157,19 @@ var _deferred_setup_systems: Array[System] = []
 var _group_timers: Dictionary = {}  # group_name -> Array[SystemTimer]
 ## True when systems have been added/removed and _group_timers needs rebuilding
 var _timers_dirty: bool = true
+## Parallel stage plans per group: group -> {"systems": Array (order planned for), "stages": Array[Array]}
+var _system_schedules: Dictionary = {}
+## Scheduling stats of the last parallel process() call per group (see get_schedule_stats)
+var _schedule_stats: Dictionary = {}
+## True while a stage of concurrent systems runs on worker threads. Shared state those
+## systems can reach (query cache and counters, the property-change path) is then
+## serialized with _stage_mutex (reentrant, so observers may query under it).
+var _stage_threaded := false
+var _stage_mutex := Mutex.new()
+## Active trace recorder (see start_trace), null when not tracing
+var frame_trace: FrameTrace = null
+## True while process() runs a frame sampled by frame_trace
+var _tracing: bool = false
 
 
 ## Internal perf helper (debug only)
@@ -172,6 +213,22 @@ func perf_reset_accum() -> void:
 		_perf_metrics.accum.clear()
 
 
+## Start recording a [FrameTrace] of frames, systems, queries, observers and command buffer
+## flushes. Works without [code]ECS.debug[/code]. [param capacity] bounds the ring buffer
+## (oldest events are overwritten), [param sample_every] records one frame in N.
+func start_trace(capacity: int = FrameTrace.DEFAULT_CAPACITY, sample_every: int = 1) -> FrameTrace:
+	frame_trace = FrameTrace.new(capacity, sample_every)
+	return frame_trace
+
+
+## Stop recording and return the trace (null if none was running).
+func stop_trace() -> FrameTrace:
+	var trace := frame_trace
+	frame_trace = null
+	_tracing = false
+	return trace
+
+
 #endregion Public Variables
 
 
@@ -270,6 +327,8 @@ func finalize_system_setup() -> void:
 func process(delta: float, group: String = "") -> void:
 	# PERF: Reset frame metrics at start of processing step
 	perf_reset_frame()
+	_tracing = frame_trace != null and frame_trace.is_sampled_frame()
+	var trace_start := Time.get_ticks_usec() if _tracing else 0
 	if systems_by_group.has(group):
 		# Advance all unique timers for this group BEFORE running systems
 		if _timers_dirty:
@@ -277,18 +336,24 @@ func process(delta: float, group: String = "") -> void:
 		if _group_timers.has(group):
 			for timer in _group_timers[group]:
 				timer.advance(delta)
-		var system_index = 0
-		for system in systems_by_group[group]:
-			if system.active:
-				system._handle(delta)
-				if ECS.debug:
-					# Add execution order to last run data
-					system.lastRunData["execution_order"] = system_index
-					assert(
-						GECSEditorDebuggerMessages.system_last_run_data(system, system.lastRunData),
-						"",
-					)
-					system_index += 1
+		if parallel_systems:
+			_process_stages(delta, group)
+		else:
+			var system_index = 0
+			for system in systems_by_group[group]:
+				if system.active:
+					system._handle(delta)
+					if ECS.debug:
+						# Add execution order to last run data
+						system.lastRunData["execution_order"] = system_index
+						assert(
+							(
+								GECSEditorDebuggerMessages
+								.system_last_run_data(system, system.lastRunData)
+							),
+							"",
+						)
+						system_index += 1
 
 		# Flush PER_GROUP command buffers after all systems in the group complete
 		for system in systems_by_group[group]:
@@ -297,10 +362,128 @@ func process(delta: float, group: String = "") -> void:
 				and system.has_pending_commands()
 			):
 				system.cmd.execute()
+	if _tracing:
+		frame_trace.record(
+			FrameTrace.Kind.FRAME,
+			frame_trace.intern("process(%s)" % group),
+			trace_start,
+			Time.get_ticks_usec() - trace_start,
+			entities.size()
+		)
+		_tracing = false
 	if ECS.debug:
 		assert(GECSEditorDebuggerMessages.process_world(delta, group), "")
 
 
+## Scheduling stats of the last [method process] call for [param group] with
+## [member parallel_systems] on (empty before that):[br]
+## [code]stages[/code] planned stages, [code]stages_run[/code] stages with a system that ran,
+## [code]systems_run[/code], [code]max_width[/code] (most systems run in one stage),
+## [code]concurrent_stages[/code] (stages dispatched to worker threads), [code]busy_ms[/code]
+## (summed system time), [code]wall_ms[/code] (time for the whole group) and
+## [code]parallelism[/code] = busy_ms / wall_ms (1.0 = no overlap).[br]
+## [b]Example:[/b]
+## [codeblock]
+## ECS.process(delta)
+## print(ECS.world.get_schedule_stats().parallelism)
+## [/codeblock]
+func get_schedule_stats(group: String = "") -> Dictionary:
+	return _schedule_stats.get(group, {}).duplicate()
+
+
+## Split a group's (already ordered) systems into stages. Each system goes into the stage after
+## the last earlier system it conflicts with ([method System._conflicts_with]), so systems of a
+## stage never conflict and conflicting systems keep their group order.
+func _plan_system_stages(systems: Array) -> Array:
+	var stages: Array = []
+	var stage_of := {}
+	for i in systems.size():
+		var system: System = systems[i]
+		var stage := 0
+		for j in i:
+			if system._conflicts_with(systems[j]):
+				stage = maxi(stage, stage_of[systems[j]] + 1)
+		stage_of[system] = stage
+		if stage == stages.size():
+			stages.append([])
+		stages[stage].append(system)
+	return stages
+
+
+## Run a group stage by stage ([member parallel_systems]). Stages with more than one runnable
+## system are dispatched to the [WorkerThreadPool]; with [code]ECS.debug[/code] on they run
+## sequentially because the debug instrumentation isn't thread-safe.
+func _process_stages(delta: float, group: String) -> void:
+	var systems: Array = systems_by_group[group]
+	var schedule = _system_schedules.get(group)
+	if schedule == null or schedule.systems != systems:
+		schedule = {"systems": systems.duplicate(), "stages": _plan_system_stages(systems)}
+		_system_schedules[group] = schedule
+
+	var threaded := not ECS.debug
+	var start_usec := Time.get_ticks_usec()
+	var busy_usec := 0
+	var stages_run := 0
+	var systems_run := 0
+	var max_width := 0
+	var concurrent_stages := 0
+	var system_index := 0
+	for stage in schedule.stages:
+		var runnable: Array[System] = []
+		for system in stage:
+			if system._will_run():
+				runnable.append(system)
+		if runnable.is_empty():
+			continue
+		stages_run += 1
+		systems_run += runnable.size()
+		max_width = maxi(max_width, runnable.size())
+
+		if threaded and runnable.size() > 1:
+			concurrent_stages += 1
+			for system in runnable:
+				system._prepare_concurrent()
+			_stage_threaded = true
+			var tasks := []
+			for system in runnable:
+				tasks.append(WorkerThreadPool.add_task(system._handle.bind(delta, true)))
+			for task_id in tasks:
+				WorkerThreadPool.wait_for_task_completion(task_id)
+			_stage_threaded = false
+		else:
+			for system in runnable:
+				system._handle(delta, true)
+
+		# Stage barrier: apply structural changes in group order before the next stage
+		for system in runnable:
+			busy_usec += system._last_handle_usec
+			if (
+				system.command_buffer_flush_mode == System.FlushMode.PER_SYSTEM
+				and system.has_pending_commands()
+			):
+				system.cmd.execute()
+			if ECS.debug:
+				system.lastRunData["execution_order"] = system_index
+				system.lastRunData["stage"] = stages_run - 1
+				assert(
+					GECSEditorDebuggerMessages.system_last_run_data(system, system.lastRunData),
+					"",
+				)
+			system_index += 1
+
+	var wall_usec := Time.get_ticks_usec() - start_usec
+	_schedule_stats[group] = {
+		"stages": schedule.stages.size(),
+		"stages_run": stages_run,
+		"systems_run": systems_run,
+		"max_width": max_width,
+		"concurrent_stages": concurrent_stages,
+		"busy_ms": busy_usec / 1000.0,
+		"wall_ms": wall_usec / 1000.0,
+		"parallelism": float(busy_usec) / wall_usec if wall_usec > 0 else 1.0,
+	}
+
+
 ## Manually flush all command buffers with MANUAL flush mode.[br]
 ## This executes all queued commands from systems that use command_buffer_flush_mode = FlushMode.MANUAL.[br]
 ## [b]Example:[/b]
@@ -378,6 +561,7 @@ func add_entity(entity: Entity, components = null, add_to_tree = true) -> void:
 	for relationship in entity.relationships:
 		if relationship.target is Entity:
 			_ensure_entity_ecs_id(relationship.target)
+			_index_relationship_source(entity, relationship)
 
 	# ID will auto-generate in _enter_tree if empty, or via property getter on first access
 
@@ -450,6 +634,177 @@ func add_entities(_entities: Array, components = null):
 	_end_suppress()
 
 
+## Spawns [param count] new entities that all start with the same components. Unlike
+## [method add_entities], the components are not added one by one: the target archetype is
+## resolved once, its storage grows once for the whole batch, and observers receive their
+## [code]ADDED[/code] events in one pass after every entity is in place.[br]
+## [param template] Either an [Array] of [Component]s copied onto every entity, or a
+## [PackedScene] whose root is an [Entity] (a prefab). A prefab is instantiated
+## [param count] times; its [member Entity.component_resources] and
+## [method Entity.define_components] are read once, from the first instance, and copied onto all
+## of them. Copies are shallow, as in [method Entity._initialize]. Relationships a prefab
+## sets up before it is added are indexed as in [method add_entity].[br]
+## As with [method add_entity], an entity whose id is already in the world replaces that
+## entity; entities of the same batch that share an id get fresh ones.
+## [method Entity.on_ready] runs after the [code]ADDED[/code] observers, and in the editor
+## no components are added.[br]
+## [param add_to_tree] Whether to add the entities to the scene tree.[br]
+## Returns the spawned entities.[br]
+## [b]Example:[/b]
+## [codeblock]
+## var bullets = world.spawn(10000, [C_Bullet.new(), C_Velocity.new(Vector3.FORWARD * 40)])
+## var enemies = world.spawn(50, preload("res://entities/enemy.tscn"))
+## [/codeblock]
+func spawn(count: int, template: Variant = [], add_to_tree := true) -> Array[Entity]:
+	var spawned: Array[Entity] = []
+	if count <= 0:
+		return spawned
+	var prefab: PackedScene = template if template is PackedScene else null
+	var first: Entity = null
+	var template_components: Array = []
+	if prefab != null:
+		first = prefab.instantiate() as Entity
+		assert(first != null, "spawn() prefab root must be an Entity: %s" % prefab.resource_path)
+		template_components.append_array(first.component_resources)
+		template_components.append_array(first.define_components())
+	else:
+		template_components = template
+	# Components are only initialized in game, as in add_entity()
+	var prototypes := _spawn_prototypes(template_components) if not Engine.is_editor_hint() else []
+
+	var batch_ids: Dictionary = {}  # ids given out by this call
+	_begin_suppress()
+	for i in count:
+		var entity: Entity
+		if prefab == null:
+			entity = Entity.new()
+		elif i == 0:
+			entity = first
+		else:
+			entity = prefab.instantiate()
+		if not entity.id:
+			entity.id = GECSIO.uuid()
+		elif entity_id_registry.has(entity.id):
+			if batch_ids.has(entity.id):
+				# A prefab with a fixed id: every spawned entity needs its own
+				entity.id = GECSIO.uuid()
+			else:
+				var existing: Entity = entity_id_registry[entity.id]
+				_worldLogger.debug("ID collision detected, replacing entity: ", existing.name)
+				remove_entity(existing)
+		batch_ids[entity.id] = true
+		entity_id_registry[entity.id] = entity
+		_ensure_entity_ecs_id(entity)
+		for relationship in entity.relationships:
+			if relationship.target is Entity:
+				_ensure_entity_ecs_id(relationship.target)
+				_index_relationship_source(entity, relationship)
+
+		entity.component_added.connect(_on_entity_component_added)
+		entity.component_removed.connect(_on_entity_component_removed)
+		entity.component_property_changed.connect(_on_entity_component_property_change)
+		entity.relationship_added.connect(_on_entity_relationship_added)
+		entity.relationship_removed.connect(_on_entity_relationship_removed)
+		entity.relationships_batch_added.connect(_on_entity_relationships_batch_added)
+		entity.relationships_batch_removed.connect(_on_entity_relationships_batch_removed)
+		if add_to_tree and not entity.is_inside_tree():
+			get_node(entity_nodes_root).add_child(entity)
+
+		# Write the components directly; component_added is emitted below, once the
+		# entity is in its archetype
+		for prototype in prototypes:
+			var component: Component = prototype["type"].new()
+			var values: Dictionary = prototype["values"]
+			for property in values:
+				component.set(property, values[property])
+			entity.components[prototype["key"]] = component
+			entity._component_key_cache[component] = prototype["key"]
+			component.parent = entity
+			component.property_changed.connect(entity._on_component_property_changed)
+		spawned.append(entity)
+	entities.append_array(spawned)
+
+	# Every entity has the same components, so they share one archetype unless a prefab
+	# gave them relationships of their own
+	var batches: Dictionary = {}  # signature -> Array of entities
+	var shared_signature := -1
+	for entity in spawned:
+		var signature: int
+		if entity.relationships.is_empty():
+			if shared_signature == -1:
+				shared_signature = _calculate_entity_signature(entity)
+			signature = shared_signature
+		else:
+			signature = _calculate_entity_signature(entity)
+		if not batches.has(signature):
+			batches[signature] = []
+		batches[signature].append(entity)
+	for signature in batches:
+		var batch: Array = batches[signature]
+		var archetype := _get_or_create_archetype(signature, _get_entity_archetype_keys(batch[0]))
+		archetype.add_entities(batch)
+		for entity in batch:
+			entity_to_archetype[entity] = archetype
+			for component in entity.components.values():
+				_index_component(entity, component)
+	_invalidate_cache("spawn")
+
+	# Batched notifications: one pass per component type over the whole batch. Callbacks
+	# may remove entities, so skip the ones that already left the world.
+	var touched_paths: Array = []
+	for prototype in prototypes:
+		touched_paths.append(prototype["type"].resource_path)
+		for entity in spawned:
+			if not entity_to_archetype.has(entity):
+				continue
+			var component = entity.components.get(prototype["key"])
+			if component == null:
+				continue
+			component_added.emit(entity, component)
+			_handle_observer_component_added(entity, component)
+			if ECS.debug:
+				assert(GECSEditorDebuggerMessages.entity_component_added(entity, component), "")
+	for entity in spawned:
+		if entity_to_archetype.has(entity):
+			_evaluate_monitors_for_entity(entity, touched_paths)
+	# Like Entity._initialize: on_ready once the components and their observers are done
+	if not Engine.is_editor_hint():
+		for entity in spawned:
+			if entity_to_archetype.has(entity):
+				entity.on_ready()
+	_end_suppress()
+
+	for entity in spawned:
+		if not entity_to_archetype.has(entity):
+			continue
+		entity_added.emit(entity)
+		for processor in ECS.entity_preprocessors:
+			processor.call(entity)
+		if ECS.debug:
+			assert(GECSEditorDebuggerMessages.entity_added(entity, add_to_tree), "")
+	return spawned
+
+
+## One [code]{type, values, key}[/code] prototype per component type in
+## [param components] for [method spawn]. [code]values[/code] holds the stored property values
+## copied onto each new instance; a later component of the same type replaces an earlier one,
+## as with [method Entity.add_component].
+func _spawn_prototypes(components: Array) -> Array:
+	var by_key: Dictionary = {}
+	for component in components:
+		if component == null:
+			continue
+		var values: Dictionary = {}
+		for prop in component.get_property_list():
+			if prop.name == "script":
+				continue
+			if prop.usage & (PROPERTY_USAGE_STORAGE | PROPERTY_USAGE_SCRIPT_VARIABLE):
+				values[prop.name] = component.get(prop.name)
+		var key := Entity._comp_key(component)
+		by_key[key] = {"type": component.get_script(), "values": values, "key": key}
+	return by_key.values()
+
+
 ## Removes an [Entity] and all its components from the world.[br]
 ## [br]
 ## [b]Teardown order (guaranteed):[/b][br]
@@ -474,6 +829,9 @@ func remove_entity(entity: Entity) -> void:
 
 	# REMOVE policy: Clean up relationships pointing TO this entity from other entities
 	_cleanup_relationships_to_target(entity)
+	# Drop this entity's own outgoing relationships from the reverse index
+	for relationship in entity.relationships:
+		_unindex_relationship_source(entity, relationship)
 
 	# Disconnect entity signals before notifying observers to prevent re-entrancy:
 	# if a REMOVED observer callback calls entity.remove_component() as a side effect,
@@ -494,6 +852,7 @@ func remove_entity(entity: Entity) -> void:
 	# Emit component_removed for each component before teardown
 	# so observers learn about removal when an entity is destroyed
 	for comp in entity.components.values():
+		_unindex_component(entity, comp)
 		component_removed.emit(entity, comp)
 		_handle_observer_component_removed(entity, comp)
 
@@ -647,6 +1006,99 @@ func has_entity_with_id(id: String) -> bool:
 	return id in entity_id_registry
 
 
+## Find the entities holding a relationship that targets [param target] ("who points at X").[br]
+## Served from the reverse relationship index, so the cost is proportional to the number
+## of sources rather than the number of relationship archetypes.[br]
+## [param target] The target [Entity][br]
+## [param relation] Optional relation filter: a [Component] script or instance[br]
+## [return] The source entities, each listed once[br]
+## [b]Example:[/b]
+##      [codeblock]var followers = world.get_relationship_sources(leader, C_Follows)[/codeblock]
+func get_relationship_sources(target: Entity, relation: Variant = null) -> Array[Entity]:
+	var result: Array[Entity] = []
+	var sources: Dictionary = _relationship_sources.get(target, {})
+	var relation_script = relation.get_script() if relation is Component else relation
+	for source in sources:
+		if not is_instance_valid(source):
+			continue
+		if relation_script == null:
+			result.append(source)
+			continue
+		for rel in sources[source]:
+			if rel.relation and rel.relation.get_script() == relation_script:
+				result.append(source)
+				break
+	return result
+
+
+#region Property Indexes
+
+
+## Declare a value index on [param property] of [param component_type]. Property queries on it
+## ([code]with_all([{C_Health: {"hp": {"_lt": 10}}}])[/code]) then look matching entities up in
+## the index instead of testing every entity of the matching archetypes.[br]
+## [param sorted] [code]false[/code] builds a hash index ([code]_eq[/code], [code]_in[/code]);
+## [code]true[/code] builds a sorted index that also answers [code]_gt[/code], [code]_gte[/code],
+## [code]_lt[/code] and [code]_lte[/code].[br]
+## The property must emit [signal Component.property_changed] from its setter, otherwise the
+## index goes stale (see [PropertyIndex]).[br]
+## [b]Example:[/b]
+##      [codeblock]world.add_property_index(C_Health, &"hp", true)[/codeblock]
+func add_property_index(component_type: Script, property: StringName, sorted := false) -> PropertyIndex:
+	var comp_key = component_type.get_instance_id()
+	var existing = _property_indexes.get(comp_key, {}).get(property)
+	var kind = PropertyIndex.Kind.SORTED if sorted else PropertyIndex.Kind.HASH
+	if existing != null and existing.kind == kind:
+		return existing
+	var index = PropertyIndex.new(component_type, property, kind)
+	for entity in entities:
+		var component = entity.components.get(comp_key)
+		if component != null:
+			index.set_value(entity, component.get(property))
+	if not _property_indexes.has(comp_key):
+		_property_indexes[comp_key] = {}
+	_property_indexes[comp_key][property] = index
+	return index
+
+
+## Remove the index declared with [method add_property_index]
+func remove_property_index(component_type: Script, property: StringName) -> void:
+	var comp_key = component_type.get_instance_id()
+	var indexes = _property_indexes.get(comp_key)
+	if indexes == null:
+		return
+	indexes.erase(property)
+	if indexes.is_empty():
+		_property_indexes.erase(comp_key)
+
+
+## The [PropertyIndex] on [param property] of [param component_type], or null
+func get_property_index(component_type: Script, property: StringName) -> PropertyIndex:
+	return _property_indexes.get(component_type.get_instance_id(), {}).get(property)
+
+
+## Add [param entity] to the indexes declared on [param component]'s type
+func _index_component(entity: Entity, component: Resource) -> void:
+	if _property_indexes.is_empty() or component == null or component.get_script() == null:
+		return
+	var indexes = _property_indexes.get(component.get_script().get_instance_id())
+	if indexes != null:
+		for property in indexes:
+			indexes[property].set_value(entity, component.get(property))
+
+
+## Remove [param entity] from the indexes declared on [param component]'s type
+func _unindex_component(entity: Entity, component: Resource) -> void:
+	if _property_indexes.is_empty() or component == null or component.get_script() == null:
+		return
+	var indexes = _property_indexes.get(component.get_script().get_instance_id())
+	if indexes != null:
+		for property in indexes:
+			indexes[property].erase(entity)
+
+#endregion Property Indexes
+
+
 #region Systems
 
 
@@ -747,13 +1199,28 @@ func remove_system_group(group: String, topo_sort: bool = false) -> void:
 func purge(should_free = true, keep := []) -> void:
 	# Get rid of all entities
 	_worldLogger.debug("Purging Entities", entities)
+	var purged: Dictionary = {}
 	for entity in entities.duplicate().filter(func(x): return not keep.has(x)):
+		purged[entity] = true
 		remove_entity(entity)
 
 	# Clear relationship indexes after purging entities
 	_relation_type_archetype_index.clear()
 	if keep.is_empty():
+		_relationship_sources.clear()
 		_next_entity_id = 1
+	else:
+		# Kept entities stay indexed; drop every entry whose source or target was purged
+		for target in _relationship_sources.keys():
+			if purged.has(target):
+				_relationship_sources.erase(target)
+				continue
+			var sources: Dictionary = _relationship_sources[target]
+			for source in sources.keys():
+				if purged.has(source):
+					sources.erase(source)
+			if sources.is_empty():
+				_relationship_sources.erase(target)
 	_worldLogger.debug("Cleared relationship indexes after purge")
 
 	# ARCHETYPE: Clear archetype system
@@ -763,9 +1230,11 @@ func purge(should_free = true, keep := []) -> void:
 		archetype.remove_edges.clear()
 	archetypes.clear()
 	entity_to_archetype.clear()
+	_clear_query_archetype_cache()
 	_worldLogger.debug("Cleared archetype storage after purge")
 
 	# Purge all systems
+	_system_schedules.clear()
 	_worldLogger.debug("Purging All Systems")
 	for group_key in systems_by_group.keys():
 		for system in systems_by_group[group_key].duplicate():
@@ -776,6 +1245,9 @@ func purge(should_free = true, keep := []) -> void:
 	for observer in observers.duplicate():
 		remove_observer(observer)
 
+	# Drop property index declarations (kept entities are not re-indexed)
+	_property_indexes.clear()
+
 	_invalidate_cache("purge")
 
 	# remove itself
@@ -838,6 +1310,7 @@ func _on_entity_component_added(entity: Entity, component: Resource) -> void:
 		# within archetypes changed, so cached query results are stale.
 		_invalidate_cache("entity_component_added")
 
+	_index_component(entity, component)
 	# Emit Signal
 	component_added.emit(entity, component)
 	_handle_observer_component_added(entity, component)
@@ -849,6 +1322,39 @@ func _on_entity_component_added(entity: Entity, component: Resource) -> void:
 		assert(GECSEditorDebuggerMessages.entity_component_added(entity, component), "")
 
 
+## Called by [System] after it copied packed write-back columns to the component Resources
+## without emitting [signal Component.property_changed]. Updates the property indexes on the
+## written fields and, when the system worked on gathered copies ([param live] false), the
+## archetypes' packed arrays. Observers and monitors are not notified of packed writes.[br]
+## [param comp_key] Component script instance id.[br]
+## [param resources] The written component Resources, in packed row order.[br]
+## [param fields] Field name -> packed array of the written values.[br]
+## [param live] Whether [param fields] are the archetype's own packed arrays.
+func _on_packed_written(comp_key: int, resources: Array, fields: Dictionary, live: bool) -> void:
+	var indexes = _property_indexes.get(comp_key) if not _property_indexes.is_empty() else null
+	if live and indexes == null:
+		return
+	if _stage_threaded:
+		_stage_mutex.lock()
+	for field in fields:
+		var values = fields[field]
+		var index: PropertyIndex = indexes.get(field) if indexes != null else null
+		if live and index == null:
+			continue
+		for i in mini(values.size(), resources.size()):
+			var component = resources[i]
+			if component == null or component.parent == null:
+				continue
+			if not live:
+				var archetype = entity_to_archetype.get(component.parent)
+				if archetype != null:
+					archetype.sync_packed_field(component.parent, comp_key, field, values[i])
+			if index != null:
+				index.set_value(component.parent, values[i])
+	if _stage_threaded:
+		_stage_mutex.unlock()
+
+
 ## Called when a component property changes through signals called on the components and connected to.[br]
 ## in the _ready method.[br]
 ## [param entity] The [Entity] with the component change.[br]
@@ -863,6 +1369,20 @@ func _on_entity_component_property_change(
 	old_value: Variant,
 	new_value: Variant,
 ) -> void:
+	# Concurrent systems can emit from worker threads (see System.concurrent)
+	if _stage_threaded:
+		_stage_mutex.lock()
+	# Keep packed columns (Component.packed_fields) in sync with the Resource
+	var archetype = entity_to_archetype.get(entity)
+	if archetype != null and not archetype.packed_columns.is_empty():
+		archetype.sync_packed_field(
+			entity, component.get_script().get_instance_id(), property_name, new_value
+		)
+	# Keep property indexes (add_property_index) in sync
+	if not _property_indexes.is_empty():
+		var indexes = _property_indexes.get(component.get_script().get_instance_id())
+		if indexes != null and indexes.has(StringName(property_name)):
+			indexes[StringName(property_name)].set_value(entity, new_value)
 	# Notify the World to trigger observers
 	_handle_observer_component_changed(entity, component, property_name, new_value, old_value)
 	# Re-evaluate monitor queries whose filters include property-query criteria on this
@@ -872,6 +1392,8 @@ func _on_entity_component_property_change(
 	if component != null and component.get_script() != null:
 		_evaluate_monitors_for_entity(entity, [component.get_script().resource_path])
 	# ARCHETYPE: No cache invalidation - property changes don't affect archetype membership
+	if _stage_threaded:
+		_stage_mutex.unlock()
 	# Send the message to the debugger if we're in debug
 	if ECS.debug:
 		assert(
@@ -906,6 +1428,7 @@ func _on_entity_component_removed(entity, component: Resource) -> void:
 		# within archetypes changed, so cached query results are stale.
 		_invalidate_cache("entity_component_removed")
 
+	_unindex_component(entity, component)
 	component_removed.emit(entity, component)
 	_handle_observer_component_removed(entity, component)
 	if component != null and component.get_script() != null:
@@ -916,6 +1439,8 @@ func _on_entity_component_removed(entity, component: Resource) -> void:
 
 ## Update index when a relationship is added and move entity to new archetype.
 func _on_entity_relationship_added(entity: Entity, relationship: Relationship) -> void:
+	# Reverse index runs for batch re-emits too: each relationship arrives here once
+	_index_relationship_source(entity, relationship)
 	# Skip archetype move when called from batch handler re-emitting per-entity signals
 	if not _in_batch_relationship_emit:
 		# STRUCTURAL: Move entity to new archetype including the pair slot key
@@ -937,6 +1462,7 @@ func _on_entity_relationship_added(entity: Entity, relationship: Relationship) -
 
 ## Update index when a relationship is removed and move entity to archetype without the pair slot key.
 func _on_entity_relationship_removed(entity: Entity, relationship: Relationship) -> void:
+	_unindex_relationship_source(entity, relationship)
 	# Dispatch observer RELATIONSHIP_REMOVED BEFORE archetype move so the entity still
 	# structurally satisfies match() queries that reference the relationship type.
 	_dispatch_observer_event(Observer.Event.RELATIONSHIP_REMOVED, entity, relationship)
@@ -1186,6 +1712,11 @@ func _index_observer_entry(entry: Dictionary) -> void:
 	var q: QueryBuilder = entry.query
 	if q == null:
 		return
+	_compile_observer_entry(entry)
+	_obs_dispatch_tables.clear()
+	_obs_monitor_tables.clear()
+	# Index arrays are replaced, never mutated in place, so a dispatch already iterating
+	# one (e.g. add_observer called from a callback) doesn't see the new entry.
 	# Index by Observer.Event bit flags
 	for e in [
 		Observer.Event.ADDED,
@@ -1197,12 +1728,12 @@ func _index_observer_entry(entry: Dictionary) -> void:
 		Observer.Event.RELATIONSHIP_REMOVED,
 	]:
 		if q.has_event(e):
-			var arr: Array = _obs_entries_by_event.get(e, [])
+			var arr: Array = _obs_entries_by_event.get(e, []).duplicate()
 			arr.append(entry)
 			_obs_entries_by_event[e] = arr
 	# Index by custom event StringName
 	for ev_name in q._observer_event_names:
-		var arr2: Array = _obs_entries_by_custom_event.get(ev_name, [])
+		var arr2: Array = _obs_entries_by_custom_event.get(ev_name, []).duplicate()
 		arr2.append(entry)
 		_obs_entries_by_custom_event[ev_name] = arr2
 
@@ -1228,6 +1759,85 @@ func _unregister_observer_entries(_observer: Observer) -> void:
 				kept2.append(entry)
 		_obs_entries_by_custom_event[ev_name] = kept2
 	_obs_entries_by_observer.erase(_observer)
+	_obs_dispatch_tables.clear()
+	_obs_monitor_tables.clear()
+
+
+## Precompute the lookup keys of [param entry]: [code]watched_ids[/code] (script instance ids
+## of [code]watched_paths[/code]) for the dispatch tables, and the all/any/exclude component
+## ids plus an empty [code]archetype_matches[/code] memo for
+## [method _observer_entry_components_match]. The memo is left out when the query holds
+## anything other than component scripts.
+func _compile_observer_entry(entry: Dictionary) -> void:
+	var q: QueryBuilder = entry.query
+	var watched_ids: Array[int] = []
+	for c in q._all_components + q._any_components:
+		if c is Script and c.resource_path != "" and not watched_ids.has(c.get_instance_id()):
+			watched_ids.append(c.get_instance_id())
+	entry["watched_ids"] = watched_ids
+	var ids: Array = []
+	for components in [q._all_components, q._any_components, q._exclude_components]:
+		var keys: Array = []
+		for c in components:
+			if not (c is Script):
+				entry.erase("archetype_matches")
+				return
+			keys.append(c.get_instance_id())
+		ids.append(keys)
+	entry["all_ids"] = ids[0]
+	entry["any_ids"] = ids[1]
+	entry["exclude_ids"] = ids[2]
+	entry["archetype_matches"] = {}
+
+
+## Entries indexed under the lifecycle [param event] that can fire for a component whose
+## script instance id is [param script_id]: those watching that component (or watching none)
+## and, for [code]CHANGED[/code], whose [code]on_changed()[/code] properties include
+## [param property]. Compiled on first use and kept until observer registration changes.
+func _observer_dispatch_table(event: int, script_id: int, property: StringName = &"") -> Array:
+	if not _obs_dispatch_tables.has(event):
+		_obs_dispatch_tables[event] = {}
+	var by_script: Dictionary = _obs_dispatch_tables[event]
+	if not by_script.has(script_id):
+		by_script[script_id] = {}
+	var by_property: Dictionary = by_script[script_id]
+	var table = by_property.get(property)
+	if table != null:
+		return table
+	table = []
+	for entry in _obs_entries_by_event.get(event, []):
+		var watched: Array = entry.get("watched_ids", [])
+		if not watched.is_empty() and not watched.has(script_id):
+			continue
+		if event == Observer.Event.CHANGED:
+			var props: Array = entry.query._observer_changed_props
+			if not props.is_empty() and not props.has(property):
+				continue
+		table.append(entry)
+	by_property[property] = table
+	return table
+
+
+## Monitor entries (MATCH/UNMATCH, deduplicated) whose sensitivity includes
+## [param touched_path], or every monitor entry when [param touched_path] is empty. Compiled on
+## first use and kept until observer registration changes.
+func _monitor_dispatch_table(touched_path: String) -> Array:
+	var table = _obs_monitor_tables.get(touched_path)
+	if table != null:
+		return table
+	table = []
+	var seen: Dictionary = {}
+	for e_key in [Observer.Event.MATCH, Observer.Event.UNMATCH]:
+		for entry in _obs_entries_by_event.get(e_key, []):
+			if seen.has(entry) or not entry.get("is_monitor", false):
+				continue
+			seen[entry] = true
+			var sens: Array = entry.get("monitor_sensitivity", [])
+			if touched_path != "" and not sens.is_empty() and not sens.has(touched_path):
+				continue
+			table.append(entry)
+	_obs_monitor_tables[touched_path] = table
+	return table
 
 
 ## Unified observer event dispatch. Called by the three legacy `_handle_observer_component_*`
@@ -1243,40 +1853,43 @@ func _dispatch_observer_event(event: Variant, entity: Entity, payload: Variant)
 		entries = _obs_entries_by_event.get(event, [])
 	if entries.is_empty():
 		return
-	# Snapshot so re-entrant add_observer/remove_observer inside a callback cannot
-	# mutate the list we're iterating (new observers would otherwise receive the
-	# event that caused their creation).
-	entries = entries.duplicate()
-	# Snapshot deferred-mode observers at the end (so callback invocations happen
-	# below and deferred observers drain later).
+	# No snapshot needed: the index arrays are copy-on-write (see _index_observer_entry), so
+	# re-entrant add_observer/remove_observer inside a callback can't mutate the list we're
+	# iterating and new observers don't receive the event that caused their creation.
 	# Component-lifecycle events (ADDED/REMOVED/CHANGED) are keyed by the specific
-	# component that triggered them — we can cheaply reject entries whose watched_paths
-	# don't include that component's script path BEFORE running any world query.
-	# This avoids stale-cache false negatives by sidestepping the archetype index.
+	# component that triggered them — swap in the compiled table for that component (and
+	# property) so entries whose watched components or on_changed() properties can't match
+	# are never visited. This avoids stale-cache false negatives by sidestepping the
+	# archetype index.
 	var is_int_event := not (event is StringName)
-	var component_path: String = ""
+	var component: Resource = null
 	if is_int_event:
 		if event == Observer.Event.ADDED or event == Observer.Event.REMOVED:
-			if payload != null and payload is Resource and payload.get_script() != null:
-				component_path = payload.get_script().resource_path
+			if payload is Resource:
+				component = payload
 		elif event == Observer.Event.CHANGED:
 			if payload is Dictionary and payload.has("component"):
-				var comp = payload.component
-				if comp != null and comp.get_script() != null:
-					component_path = comp.get_script().resource_path
+				component = payload.component
+	var component_path: String = ""
+	var compiled := false
+	if component != null and component.get_script() != null:
+		var script: Script = component.get_script()
+		component_path = script.resource_path
+		if component_path != "":
+			var property: StringName = &""
+			if event == Observer.Event.CHANGED and payload.has("property"):
+				property = StringName(payload.property)
+			entries = _observer_dispatch_table(event, script.get_instance_id(), property)
+			compiled = true
 	for entry in entries:
 		var obs: Observer = entry.observer
 		if obs == null or not is_instance_valid(obs):
 			continue
 		if not obs.active or obs.paused:
 			continue
-		# Watched-component filter for lifecycle events
-		if component_path != "":
-			var watched: Array = entry.get("watched_paths", [])
-			if not watched.is_empty() and not watched.has(component_path):
-				continue
-		# Property filter for CHANGED events (from on_changed([&"prop"]))
-		if is_int_event and event == Observer.Event.CHANGED:
+		# Property filter for CHANGED events (from on_changed([&"prop"])) on components the
+		# tables don't cover
+		if not compiled and is_int_event and event == Observer.Event.CHANGED:
 			var q_prop: QueryBuilder = entry.query
 			if q_prop != null and not q_prop._observer_changed_props.is_empty():
 				if payload is Dictionary and payload.has("property"):
@@ -1328,7 +1941,20 @@ func _dispatch_observer_event(event: Variant, entity: Entity, payload: Variant)
 		elif not _observer_entry_entity_matches(entry, entity):
 			continue
 		# Invoke the callable.
-		entry.callable.call(event, entity, payload)
+		if _tracing:
+			var trace_start := Time.get_ticks_usec()
+			entry.callable.call(event, entity, payload)
+			frame_trace.record(
+				FrameTrace.Kind.OBSERVER,
+				frame_trace.name_id(
+					FrameTrace.Kind.OBSERVER, obs.get_instance_id(), _observer_trace_label.bind(obs)
+				),
+				trace_start,
+				Time.get_ticks_usec() - trace_start,
+				1 if entity != null else 0
+			)
+		else:
+			entry.callable.call(event, entity, payload)
 		# Flush command buffer if PER_CALLBACK mode
 		if (
 			obs.has_pending_commands()
@@ -1337,6 +1963,12 @@ func _dispatch_observer_event(event: Variant, entity: Entity, payload: Variant)
 			obs.cmd.execute()
 
 
+## Display name of [param obs] in a [FrameTrace]
+func _observer_trace_label(obs: Observer) -> String:
+	var script_path: String = obs.get_script().resource_path
+	return script_path.get_file().get_basename() if script_path != "" else String(obs.name)
+
+
 func _observer_entry_entity_matches(entry: Dictionary, entity: Entity) -> bool:
 	var q: QueryBuilder = entry.query
 	if q == null:
@@ -1345,6 +1977,34 @@ func _observer_entry_entity_matches(entry: Dictionary, entity: Entity) -> bool:
 	# stale archetype cache while observer events fire inside a suppressed batch (e.g.
 	# during add_entity's _initialize loop). Query matching here mirrors
 	# QueryBuilder.matches() for a single entity.
+	if not _observer_entry_components_match(entry, entity):
+		return false
+	for rel in q._relationships:
+		if not entity.has_relationship(rel):
+			return false
+	for rel in q._exclude_relationships:
+		if entity.has_relationship(rel):
+			return false
+	if not _evaluate_property_queries(q, entity):
+		return false
+	if not _evaluate_group_enabled_filters(q, entity):
+		return false
+	return true
+
+
+## The all/any/exclude component part of [method _observer_entry_entity_matches]. It only
+## depends on the entity's component set, so when the entity's archetype is in step with its
+## components the result is memoized per archetype signature in the entry.
+func _observer_entry_components_match(entry: Dictionary, entity: Entity) -> bool:
+	var memo = entry.get("archetype_matches")
+	var archetype: Archetype = entity_to_archetype.get(entity)
+	if memo != null and archetype != null and archetype.columns.size() == entity.components.size():
+		var matched = memo.get(archetype.signature)
+		if matched == null:
+			matched = archetype.matches_query(entry.all_ids, entry.any_ids, entry.exclude_ids)
+			memo[archetype.signature] = matched
+		return matched
+	var q: QueryBuilder = entry.query
 	for c in q._all_components:
 		if not entity.has_component(c):
 			return false
@@ -1359,16 +2019,6 @@ func _observer_entry_entity_matches(entry: Dictionary, entity: Entity) -> bool:
 	for c in q._exclude_components:
 		if entity.has_component(c):
 			return false
-	for rel in q._relationships:
-		if not entity.has_relationship(rel):
-			return false
-	for rel in q._exclude_relationships:
-		if entity.has_relationship(rel):
-			return false
-	if not _evaluate_property_queries(q, entity):
-		return false
-	if not _evaluate_group_enabled_filters(q, entity):
-		return false
 	return true
 
 
@@ -1661,23 +2311,16 @@ func _seed_monitor_membership(entry: Dictionary, yield_existing: bool = false) -
 func _evaluate_monitors_for_entity(entity: Entity, touched_paths: Array) -> void:
 	if entity == null or not is_instance_valid(entity):
 		return
-	# Walk monitor entries once; dedup by entry identity since MATCH + UNMATCH share entries.
-	var seen: Dictionary = {}
-	var candidates: Array = []
-	for e_key in [Observer.Event.MATCH, Observer.Event.UNMATCH]:
-		for entry in _obs_entries_by_event.get(e_key, []):
-			if seen.has(entry):
-				continue
-			seen[entry] = true
-			candidates.append(entry)
+	# The compiled table already holds only the monitors sensitive to a single touched path
+	var candidates: Array = _monitor_dispatch_table(
+		touched_paths[0] if touched_paths.size() == 1 else ""
+	)
 	for entry in candidates:
-		if not entry.get("is_monitor", false):
-			continue
 		var obs: Observer = entry.observer
 		if obs == null or not is_instance_valid(obs) or not obs.active or obs.paused:
 			continue
 		# Cheap rejection by sensitivity
-		if not touched_paths.is_empty():
+		if touched_paths.size() > 1:
 			var sens: Array = entry.get("monitor_sensitivity", [])
 			if not sens.is_empty():
 				var touches := false
@@ -1803,6 +2446,8 @@ func _query(
 
 	# Check if we have cached matching archetypes for this query
 	var matching_archetypes: Array[Archetype] = []
+	if _stage_threaded:
+		_stage_mutex.lock()
 	if _query_archetype_cache.has(cache_key):
 		_cache_hits += 1
 		matching_archetypes = _query_archetype_cache[cache_key]
@@ -1813,44 +2458,27 @@ func _query(
 		var _perf_start_scan := 0
 		if ECS.debug:
 			_perf_start_scan = Time.get_ticks_usec()
-		# Find all archetypes that match this query
-		var map_to_key = func(x): return x.get_instance_id()
-		var _all := all_components.map(map_to_key)
-		var _any := any_components.map(map_to_key)
-		var _exclude := exclude_components.map(map_to_key)
-
-		# Determine candidate archetypes: use wildcard index if available
-		var candidates: Array = []
-		if not wildcard_rel_types.is_empty():
-			# Narrow candidates using _relation_type_archetype_index intersection
-			candidates = _get_archetypes_with_all_relation_types(wildcard_rel_types)
-		else:
-			candidates = archetypes.values()
-		var has_structural_rels := (
-			not rel_slot_keys.is_empty()
-			or not ex_rel_slot_keys.is_empty()
-			or not wildcard_ex_rel_types.is_empty()
+		# Find all archetypes that match this query and cache them (not the entity arrays!)
+		matching_archetypes = _cache_matching_archetypes(
+			cache_key,
+			_query_spec(
+				all_components,
+				any_components,
+				exclude_components,
+				rel_slot_keys,
+				wildcard_rel_types,
+				ex_rel_slot_keys,
+				wildcard_ex_rel_types,
+			),
 		)
-		for archetype in candidates:
-			if archetype.matches_query(_all, _any, _exclude):
-				if has_structural_rels:
-					if not archetype.matches_relationship_query(rel_slot_keys, ex_rel_slot_keys):
-						continue
-					# Check wildcard exclusion: archetype must not have any of the excluded rel types
-					if (
-						not wildcard_ex_rel_types.is_empty()
-						and _archetype_has_any_relation_type(archetype, wildcard_ex_rel_types)
-					):
-						continue
-				matching_archetypes.append(archetype)
-		# Cache the matching archetypes (not the entity arrays!)
-		_query_archetype_cache[cache_key] = matching_archetypes
 		if ECS.debug:
 			perf_mark(
 				"query_archetype_scan",
 				Time.get_ticks_usec() - _perf_start_scan,
 				{"archetypes": matching_archetypes.size()},
 			)
+	if _stage_threaded:
+		_stage_mutex.unlock()
 
 	# OPTIMIZATION: If there's only ONE matching archetype with no filtering, return it directly
 	# This avoids array allocation and copying for the common case
@@ -1932,67 +2560,49 @@ func group_entities_by_archetype(entities: Array) -> Dictionary:
 ##             # Process with cache-friendly column access
 ## [/codeblock]
 func get_matching_archetypes(query_builder: QueryBuilder) -> Array[Archetype]:
+	if _stage_threaded:
+		_stage_mutex.lock()
+		var matching := _get_matching_archetypes(query_builder)
+		_stage_mutex.unlock()
+		return matching
+	return _get_matching_archetypes(query_builder)
+
+
+func _get_matching_archetypes(query_builder: QueryBuilder) -> Array[Archetype]:
 	var _perf_start := 0
 	if ECS.debug:
 		_perf_start = Time.get_ticks_usec()
-	var all_components = query_builder._all_components
-	var any_components = query_builder._any_components
-	var exclude_components = query_builder._exclude_components
-
-	# Extract structural relationship info from query builder
-	var rel_slot_keys = query_builder._structural_rel_keys
-	var wildcard_rel_types = query_builder._wildcard_rel_types
-	var ex_rel_slot_keys = query_builder._structural_ex_rel_keys
-	var wildcard_ex_rel_types = query_builder._wildcard_ex_rel_types
-
 	# Use the relationship-aware cache key from query builder
 	var cache_key = query_builder.get_cache_key()
 
 	if _query_archetype_cache.has(cache_key):
+		_cache_hits += 1
 		if ECS.debug:
 			perf_mark("archetypes_cache_hit", Time.get_ticks_usec() - _perf_start)
 		return _query_archetype_cache[cache_key]
 
-	var map_to_key = func(x): return x.get_instance_id()
-	var _all := all_components.map(map_to_key)
-	var _any := any_components.map(map_to_key)
-	var _exclude := exclude_components.map(map_to_key)
-
-	var matching: Array[Archetype] = []
+	_cache_misses += 1
 	var _perf_scan_start := 0
 	if ECS.debug:
 		_perf_scan_start = Time.get_ticks_usec()
-	# Determine candidate archetypes: use wildcard index if available
-	var candidates: Array = []
-	if not wildcard_rel_types.is_empty():
-		candidates = _get_archetypes_with_all_relation_types(wildcard_rel_types)
-	else:
-		candidates = archetypes.values()
-	var has_structural_rels := (
-		not rel_slot_keys.is_empty()
-		or not ex_rel_slot_keys.is_empty()
-		or not wildcard_ex_rel_types.is_empty()
+	var matching := _cache_matching_archetypes(
+		cache_key,
+		_query_spec(
+			query_builder._all_components,
+			query_builder._any_components,
+			query_builder._exclude_components,
+			query_builder._structural_rel_keys,
+			query_builder._wildcard_rel_types,
+			query_builder._structural_ex_rel_keys,
+			query_builder._wildcard_ex_rel_types,
+		),
 	)
-	for archetype in candidates:
-		if archetype.matches_query(_all, _any, _exclude):
-			if has_structural_rels:
-				if not archetype.matches_relationship_query(rel_slot_keys, ex_rel_slot_keys):
-					continue
-				if (
-					not wildcard_ex_rel_types.is_empty()
-					and _archetype_has_any_relation_type(archetype, wildcard_ex_rel_types)
-				):
-					continue
-			matching.append(archetype)
 	if ECS.debug:
 		perf_mark(
 			"archetypes_scan",
 			Time.get_ticks_usec() - _perf_scan_start,
 			{"archetypes": matching.size()},
 		)
-
-	_query_archetype_cache[cache_key] = matching
-	if ECS.debug:
 		perf_mark(
 			"archetypes_total",
 			Time.get_ticks_usec() - _perf_start,
@@ -2001,7 +2611,9 @@ func get_matching_archetypes(query_builder: QueryBuilder) -> Array[Archetype]:
 	return matching
 
 
-## Get performance statistics for cache usage
+## Get performance statistics for cache usage.[br]
+## [code]archetype_adds[/code] / [code]archetype_removes[/code] count how often a created or
+## deleted archetype was patched into / out of a cached query instead of rescanning it.
 func get_cache_stats() -> Dictionary:
 	var total_requests = _cache_hits + _cache_misses
 	var hit_rate = 0.0 if total_requests == 0 else float(_cache_hits) / float(total_requests)
@@ -2011,6 +2623,8 @@ func get_cache_stats() -> Dictionary:
 		"hit_rate": hit_rate,
 		"cached_queries": _query_archetype_cache.size(),
 		"total_archetypes": archetypes.size(),
+		"archetype_adds": _cache_archetype_adds,
+		"archetype_removes": _cache_archetype_removes,
 		"invalidation_count": _cache_invalidation_count,
 		"invalidation_reasons": _cache_invalidation_reasons.duplicate(),
 	}
@@ -2020,17 +2634,117 @@ func get_cache_stats() -> Dictionary:
 func reset_cache_stats() -> void:
 	_cache_hits = 0
 	_cache_misses = 0
+	_cache_archetype_adds = 0
+	_cache_archetype_removes = 0
 	_cache_invalidation_count = 0
 	_cache_invalidation_reasons.clear()
 
 
-## Internal helper to track cache invalidations (debug mode only)
-## KNOWN ISSUE: During suppression, observer queries (via _handle_observer_component_added)
-## may hit stale archetype cache entries if new archetypes are created mid-batch.
-## This can occur when: (1) observers are registered, (2) add_entities() batches entities
-## with different component compositions, and (3) a new archetype created mid-batch
-## matches an observer's match() query that was already cached from an earlier entity.
-## Clearing the cache here would fix it but defeats suppression (N*M clears vs 1).
+## Match criteria for [method _archetype_matches_spec], with components mapped to script ids
+func _query_spec(
+	all_components: Array,
+	any_components: Array,
+	exclude_components: Array,
+	rel_slot_keys: Array,
+	wildcard_rel_types: Array,
+	ex_rel_slot_keys: Array,
+	wildcard_ex_rel_types: Array,
+) -> Dictionary:
+	var map_to_key = func(x): return x.get_instance_id()
+	return {
+		"all": all_components.map(map_to_key),
+		"any": any_components.map(map_to_key),
+		"exclude": exclude_components.map(map_to_key),
+		"rel_slot_keys": rel_slot_keys.duplicate(),
+		"wildcard_rel_types": wildcard_rel_types.duplicate(),
+		"ex_rel_slot_keys": ex_rel_slot_keys.duplicate(),
+		"wildcard_ex_rel_types": wildcard_ex_rel_types.duplicate(),
+		"has_structural_rels":
+		(
+			not rel_slot_keys.is_empty()
+			or not ex_rel_slot_keys.is_empty()
+			or not wildcard_ex_rel_types.is_empty()
+		),
+	}
+
+
+## Whether [param archetype] satisfies a query spec built by [method _query_spec]
+func _archetype_matches_spec(archetype: Archetype, spec: Dictionary) -> bool:
+	if not archetype.matches_query(spec.all, spec.any, spec.exclude):
+		return false
+	# Wildcard relationships: archetype must have every required relation type
+	for rel_path in spec.wildcard_rel_types:
+		if not _relation_type_archetype_index.get(rel_path, {}).has(archetype.signature):
+			return false
+	if spec.has_structural_rels:
+		if not archetype.matches_relationship_query(spec.rel_slot_keys, spec.ex_rel_slot_keys):
+			return false
+		# Wildcard exclusion: archetype must not have any of the excluded rel types
+		if (
+			not spec.wildcard_ex_rel_types.is_empty()
+			and _archetype_has_any_relation_type(archetype, spec.wildcard_ex_rel_types)
+		):
+			return false
+	return true
+
+
+## Scan all archetypes for [param spec], then cache the result and the spec under [param cache_key]
+func _cache_matching_archetypes(cache_key: int, spec: Dictionary) -> Array[Archetype]:
+	# Determine candidate archetypes: narrow using the wildcard index if available
+	var candidates: Array = []
+	if not spec.wildcard_rel_types.is_empty():
+		candidates = _get_archetypes_with_all_relation_types(spec.wildcard_rel_types)
+	else:
+		candidates = archetypes.values()
+	var matching: Array[Archetype] = []
+	for archetype in candidates:
+		if _archetype_matches_spec(archetype, spec):
+			matching.append(archetype)
+	_query_archetype_cache[cache_key] = matching
+	_query_archetype_specs[cache_key] = spec
+	return matching
+
+
+## Append a newly created archetype to every cached query it matches.
+## Cached arrays are replaced rather than mutated, so callers iterating a previously
+## returned array (e.g. a system mid-process) never see it change underneath them.
+func _add_archetype_to_query_caches(archetype: Archetype) -> void:
+	for cache_key in _query_archetype_cache.keys():
+		var spec = _query_archetype_specs.get(cache_key)
+		if spec == null:
+			# Entry was injected without a spec; drop it so the next query rescans
+			_query_archetype_cache.erase(cache_key)
+			continue
+		if _archetype_matches_spec(archetype, spec):
+			var updated: Array[Archetype] = _query_archetype_cache[cache_key].duplicate()
+			updated.append(archetype)
+			_query_archetype_cache[cache_key] = updated
+			_cache_archetype_adds += 1
+
+
+## Remove a deleted archetype from every cached query that contains it (copy-on-write)
+func _remove_archetype_from_query_caches(archetype: Archetype) -> void:
+	for cache_key in _query_archetype_cache:
+		var cached: Array[Archetype] = _query_archetype_cache[cache_key]
+		var index = cached.find(archetype)
+		if index != -1:
+			var updated: Array[Archetype] = cached.duplicate()
+			updated.remove_at(index)
+			_query_archetype_cache[cache_key] = updated
+			_cache_archetype_removes += 1
+
+
+## Drop all cached query results (only needed when the archetype set is torn down)
+func _clear_query_archetype_cache() -> void:
+	_query_archetype_cache.clear()
+	_query_archetype_specs.clear()
+
+
+## Internal helper to track cache invalidations (debug mode only).
+## Cached archetype matches are kept up to date incrementally by
+## [method _add_archetype_to_query_caches] / [method _remove_archetype_from_query_caches],
+## so this only bumps [member cache_version] and notifies QueryBuilders whose cached
+## entity results may now be stale.
 func _invalidate_cache(reason: String) -> void:
 	# OPTIMIZATION: Skip invalidation during batch operations; mark pending for deferred fire
 	if _suppress_invalidation_depth > 0:
@@ -2038,7 +2752,6 @@ func _invalidate_cache(reason: String) -> void:
 		return
 
 	_pending_invalidation = false
-	_query_archetype_cache.clear()
 	cache_version += 1
 	cache_invalidated.emit()
 
@@ -2153,43 +2866,54 @@ func _on_entity_relationships_batch_removed(entity: Entity, _relationships: Arra
 
 
 ## REMOVE policy: Clean up relationships pointing TO a target entity being removed.
-## Called inside remove_entity() before the target is freed.
+## Called inside remove_entity() before the target is freed. Uses the reverse
+## relationship index, so the cost is proportional to the number of sources.
 func _cleanup_relationships_to_target(target: Entity) -> void:
-	var target_ecs_id = target.ecs_id
-	if target_ecs_id == 0:
-		return
-
-	# Find all entities in archetypes that hold a slot key pointing to this target.
-	# Slot key format: "rel://relation_path::target_ecs_id"
-	var suffix = "::entity#" + str(target_ecs_id)
-	var source_entities: Array[Entity] = []
-
-	for rel_path in _relation_type_archetype_index.keys():
-		var type_archetypes: Dictionary = _relation_type_archetype_index[rel_path]
-		for archetype in type_archetypes.values():
-			for rel_key in archetype.relationship_types:
-				if rel_key.ends_with(suffix):
-					source_entities.append_array(archetype.entities.duplicate())
-					break  # found one matching slot in this archetype — all entities match
-
-	if source_entities.is_empty():
+	var sources: Dictionary = _relationship_sources.get(target, {})
+	if sources.is_empty():
+		_relationship_sources.erase(target)
 		return
 
 	_begin_suppress()
 
-	for source_entity in source_entities:
+	for source_entity in sources.keys():
 		if not is_instance_valid(source_entity):
 			continue
-		var rels_to_remove: Array = []
-		for rel in source_entity.relationships:
-			if rel.target is Entity and rel.target == target:
-				rels_to_remove.append(rel)
 		# Go through the documented Entity.remove_relationship API so any future
 		# bookkeeping there (beyond erase+emit) stays consistent with other removal paths.
-		for rel in rels_to_remove:
+		for rel in sources[source_entity].duplicate():
 			source_entity.remove_relationship(rel)
 
 	_end_suppress()
+	_relationship_sources.erase(target)
+
+
+## Record [param source] -> [param relationship] under the relationship's target entity.
+func _index_relationship_source(source: Entity, relationship: Relationship) -> void:
+	if not relationship.target is Entity:
+		return
+	var target: Entity = relationship.target
+	if not _relationship_sources.has(target):
+		_relationship_sources[target] = {}
+	var sources: Dictionary = _relationship_sources[target]
+	if not sources.has(source):
+		sources[source] = []
+	if not sources[source].has(relationship):
+		sources[source].append(relationship)
+
+
+## Remove [param source] -> [param relationship] from the reverse relationship index.
+func _unindex_relationship_source(source: Entity, relationship: Relationship) -> void:
+	if not relationship.target is Entity:
+		return
+	var sources: Dictionary = _relationship_sources.get(relationship.target, {})
+	if not sources.has(source):
+		return
+	sources[source].erase(relationship)
+	if sources[source].is_empty():
+		sources.erase(source)
+		if sources.is_empty():
+			_relationship_sources.erase(relationship.target)
 
 
 ## Calculate archetype signature for an entity based on its components
@@ -2341,6 +3065,9 @@ func _get_or_create_archetype(signature: int, component_types: Array) -> Archety
 					_relation_type_archetype_index[rel_path] = {}
 				_relation_type_archetype_index[rel_path][archetype.signature] = archetype
 
+		# Patch the new archetype into cached queries (immediately, even mid-batch)
+		_add_archetype_to_query_caches(archetype)
+
 		# ARCHETYPE OPTIMIZATION: Only invalidate cache when NEW archetype is created
 		# This is rare compared to entities moving between existing archetypes
 		_invalidate_cache("new_archetype_created")
@@ -2392,6 +3119,8 @@ func _remove_entity_from_archetype(entity: Entity) -> bool:
 ## Delete an archetype from the world, cleaning up reverse edges in all neighbor archetypes.
 ## Replaces all three inline deletion sites for consistent cleanup.
 func _delete_archetype(archetype: Archetype) -> void:
+	_remove_archetype_from_query_caches(archetype)
+
 	# Clean up wildcard index entries for this archetype's relationship types
 	for rel_key in archetype.relationship_types:
 		var rel_path = _extract_relation_path_from_slot_key(rel_key)
@@ -0,0 +1,843 @@
+## GECS Streaming Snapshot[br]
+##
+## Binary world snapshots written to and read from a file in chunks, with component data
+## grouped by archetype. An alternative to [method GECSIO.save] / [method GECSIO.deserialize]
+## for large worlds: no [GecsData] Resource graph is built, each chunk of up to
+## [constant CHUNK_SIZE] entities is compressed independently, and the async variants run
+## encoding, compression and file IO on the [WorkerThreadPool].[br]
+## [br]
+## Component values are always captured on the main thread (a plain read of each stored
+## property); entities are always created and added on the main thread. Only the
+## byte-level work moves to the worker.[br]
+## [br]
+## Nothing holds the whole file in memory: writing stores each chunk as soon as it fills
+## up, and reading first checks the header and every chunk's size against the file, then
+## decompresses and builds one chunk at a time. A chunk whose compressed data turns out to
+## be corrupt in that second pass stops the load part-way.[br]
+## [br]
+## [b]Delta snapshots:[/b] a [GECSSnapshot] remembers a hash of every entity component it
+## last wrote or read. Writing with [code]delta = true[/code] stores only the entities and
+## components that changed since then, plus the ids of entities that are gone. Apply a
+## delta on top of its base snapshot with [method apply].[br]
+## [br]
+## [b]Example:[/b]
+## [codeblock]
+## var snapshot := GECSSnapshot.new()
+## var persistent := ECS.world.query.with_all([C_Persistent])
+## snapshot.write(persistent.execute(), "user://save.gsnap")
+## # Later: only what changed since save.gsnap
+## snapshot.write(persistent.execute(), "user://save_1.gsnap", true)
+##
+## # Restore: full snapshot first, then its deltas in order
+## var loader := GECSSnapshot.new()
+## loader.apply("user://save.gsnap", ECS.world)
+## loader.apply("user://save_1.gsnap", ECS.world)
+##
+## # Off the main thread (keep a reference to the snapshot until the signal fires)
+## snapshot.write_completed.connect(func(path, error): print("Saved ", path, " ", error))
+## snapshot.write_async(persistent.execute(), "user://save.gsnap")
+## [/codeblock]
+class_name GECSSnapshot
+extends RefCounted
+
+## Emitted on the main thread when [method write_async] has finished.
+signal write_completed(path: String, error: Error)
+## Emitted on the main thread when [method read_async] has finished.
+## [param entities] is empty on error.
+signal read_completed(path: String, entities: Array)
+## Emitted on the main thread when [method apply_async] has finished.
+signal apply_completed(path: String, error: Error)
+
+const MAGIC := "GSNP"
+const VERSION := 1
+## Entities per compressed chunk
+const CHUNK_SIZE := 1024
+
+const FLAG_DELTA := 1
+const BLOCK_END := 0
+const BLOCK_CHUNK := 1
+const BLOCK_REMOVED := 2
+
+## Captured chunks [method write_async] queues before capture waits for the writer
+const MAX_PENDING_CHUNKS := 4
+
+## Row layout: [id, name, scene_path, values, relationships, removed_types]
+enum Row { ID, NAME, SCENE, VALUES, RELATIONSHIPS, REMOVED }
+## Chunk entry of [method _scan_file]: [types, props, raw size, file offset, packed size]
+enum Chunk { TYPES, PROPS, RAW_SIZE, OFFSET, SIZE }
+enum Target { NONE, ENTITY, COMPONENT, SCRIPT }
+
+## Keys of packed Resource values
+const RES_PATH := "__gecs_res"
+const RES_TYPE := "__gecs_sub"
+const RES_VALUES := "__gecs_values"
+## Baseline key of an entity's relationship hash
+const RELATIONSHIPS_KEY := "__relationships"
+
+## Serialization config; null resolves per entity like [method GECSIO.serialize]
+var config: GECSSerializeConfig
+## Id of the snapshot last written or applied; the base of the next delta
+var snapshot_id: String = ""
+
+## Baseline for deltas: entity id -> { component path or RELATIONSHIPS_KEY: hash }
+var _baseline: Dictionary = {}
+## Stored property names per Script (or built-in class name)
+var _props_by_type: Dictionary = {}
+## Running WorkerThreadPool task, -1 when idle
+var _task_id: int = -1
+## An async write/read/apply is in progress (it may be between two worker tasks)
+var _busy := false
+
+
+func _init(p_config: GECSSerializeConfig = null) -> void:
+	config = p_config
+
+
+#region Public API
+
+
+## Write [param entities] (and related entities, per config) to [param path].[br]
+## With [param delta], only what changed since the last snapshot written or applied
+## by this instance is stored; the first snapshot is always a full one.[br]
+## Each chunk is encoded, compressed and written as soon as it fills up, so only one
+## unfinished chunk per archetype is held in memory.[br]
+## The delta baseline only advances when the file was written successfully.
+func write(entities: Array, path: String, delta: bool = false) -> Error:
+	var file := FileAccess.open(path, FileAccess.WRITE)
+	if file == null:
+		return FileAccess.get_open_error()
+	var captured := _begin_capture(delta)
+	_store_header(file, captured)
+	_capture(entities, captured, _store_chunk.bind(file))
+	var error := _store_end(file, captured)
+	if error == OK:
+		_commit(captured)
+	return error
+
+
+## Like [method write], but encodes, compresses and writes the chunks on the
+## [WorkerThreadPool] while they are captured.[br]
+## Values are captured before this returns, so the world can keep changing. Capture
+## waits for the writer when it falls [constant MAX_PENDING_CHUNKS] chunks behind.[br]
+## Emits [signal write_completed]. Returns [constant ERR_BUSY] while a task is running,
+## or the error opening [param path].
+func write_async(entities: Array, path: String, delta: bool = false) -> Error:
+	if is_busy():
+		return ERR_BUSY
+	var file := FileAccess.open(path, FileAccess.WRITE)
+	if file == null:
+		return FileAccess.get_open_error()
+	var captured := _begin_capture(delta)
+	_store_header(file, captured)
+	var pipe := {
+		"queue": [],  # [types, props, rows] chunks, then null
+		"mutex": Mutex.new(),
+		"queued": Semaphore.new(),  # posted per queued item
+		"free": Semaphore.new(),  # posted per free queue slot
+	}
+	for i in MAX_PENDING_CHUNKS:
+		pipe["free"].post()
+	_busy = true
+	_task_id = WorkerThreadPool.add_task(
+		_write_task.bind(file, captured, path, pipe), false, "GECSSnapshot write"
+	)
+	_capture(entities, captured, _queue_chunk.bind(pipe))
+	_queue_item(pipe, null)
+	return OK
+
+
+## Read a full snapshot into new entities that are not added to any world.[br]
+## Relationships between the snapshot's entities are restored. Returns an empty
+## array on error; delta snapshots need [method apply].
+func read(path: String) -> Array[Entity]:
+	var state := _build_state(null)
+	var error := _stream(state, path)
+	if error != OK:
+		push_error("GECSSnapshot read: Failed to read %s (%s)" % [path, error_string(error)])
+		return []
+	return state["entities"]
+
+
+## Like [method read], but decompresses and decodes the chunks on the [WorkerThreadPool],
+## one ahead of the chunk being built.[br]
+## Emits [signal read_completed]. Returns [constant ERR_BUSY] while a task is running.
+func read_async(path: String) -> Error:
+	if is_busy():
+		return ERR_BUSY
+	_start_async_stream(_build_state(null), path, _finish_read.bind(path))
+	return OK
+
+
+## Apply a full or delta snapshot to [param world]: entities are matched by id,
+## existing ones are updated in place, missing ones are created and added, and
+## entities removed since the base snapshot are removed.[br]
+## A delta must be applied on top of the snapshot it was written against.[br]
+## A first pass checks the header and every block's size without decompressing, so a
+## truncated or mismatched file leaves [param world] untouched. Chunks are then
+## decompressed and applied one at a time; a chunk whose compressed data is corrupt
+## stops the apply part-way and clears the delta base.
+func apply(path: String, world: World) -> Error:
+	var error := _stream(_build_state(world), path)
+	if error != OK:
+		push_error("GECSSnapshot apply: Failed to read %s (%s)" % [path, error_string(error)])
+	return error
+
+
+## Like [method apply], but decompresses and decodes the chunks on the [WorkerThreadPool],
+## one ahead of the chunk being applied.[br]
+## Emits [signal apply_completed]. Returns [constant ERR_BUSY] while a task is running.
+func apply_async(path: String, world: World) -> Error:
+	if is_busy():
+		return ERR_BUSY
+	_start_async_stream(_build_state(world), path, _finish_apply.bind(path))
+	return OK
+
+
+## Whether an async write/read/apply is running.
+func is_busy() -> bool:
+	return _busy
+
+
+#endregion Public API
+
+#region Capture (main thread)
+
+
+## Capture state for [method _capture]; ends up as the delta base via [method _commit].
+func _begin_capture(delta: bool) -> Dictionary:
+	delta = delta and snapshot_id != ""
+	return {
+		"delta": delta,
+		"id": GECSIO.uuid(),
+		"base_id": snapshot_id if delta else "",
+		"hashes": {},  # entity id -> { component path: hash }
+		"removed": PackedStringArray(),
+	}
+
+
+## Read the stored values of every entity into rows grouped by archetype. Every full
+## chunk is handed to [param on_chunk] (types, props, rows) as soon as it fills up and
+## the partial ones at the end, so rows are never held for the whole capture.
+func _capture(entities: Array, captured: Dictionary, on_chunk: Callable) -> void:
+	var delta: bool = captured["delta"]
+	var groups: Dictionary = {}  # component script ids -> { "types", "props", "rows" }
+	var queued: Dictionary = {}  # entity id -> true
+	var related: Array = []  # Relationship targets not in [param entities]
+	for entity in entities:
+		if is_instance_valid(entity):
+			queued[entity.id] = true
+	for entity in entities:
+		if is_instance_valid(entity):
+			_capture_entity(entity, delta, captured, groups, on_chunk, queued, related)
+	var i := 0
+	while i < related.size():
+		_capture_entity(related[i], delta, captured, groups, on_chunk, queued, related)
+		i += 1
+	for group in groups.values():
+		if not group["rows"].is_empty():
+			on_chunk.call(group["types"], group["props"], group["rows"])
+
+	if delta:
+		for entity_id in _baseline:
+			if not captured["hashes"].has(entity_id):
+				captured["removed"].append(entity_id)
+
+
+## Make a written capture the base of the next delta.
+func _commit(captured: Dictionary) -> void:
+	_baseline = captured["hashes"]
+	snapshot_id = captured["id"]
+
+
+func _capture_entity(
+	entity: Entity,
+	delta: bool,
+	captured: Dictionary,
+	groups: Dictionary,
+	on_chunk: Callable,
+	queued: Dictionary,
+	related: Array
+) -> void:
+	var effective_config := GECSIO._resolve_config(entity, config)
+	var keys := entity.components.keys()
+	keys.sort()  # Same archetype -> same column order
+	var components: Array = []
+	var type_ids: Array = []
+	for key in keys:
+		var component: Component = entity.components[key]
+		if effective_config.should_include_component(component):
+			components.append(component)
+			type_ids.append(key)
+
+	if not groups.has(type_ids):
+		var types := PackedStringArray()
+		var props: Array = []
+		for component in components:
+			types.append(component.get_script().resource_path)
+			props.append(_props_for(component))
+		groups[type_ids] = {"types": types, "props": props, "rows": []}
+	var chunk: Dictionary = groups[type_ids]
+
+	var base: Dictionary = _baseline.get(entity.id, {}) if delta else {}
+	var hashes: Dictionary = {}
+	var changed := base.is_empty()
+	var values: Array = []
+	for i in components.size():
+		var component_values := _pack_values(components[i], chunk["props"][i])
+		var type: String = chunk["types"][i]
+		hashes[type] = hash(component_values)
+		if base.get(type) == hashes[type]:
+			values.append(null)
+		else:
+			values.append(component_values)
+			changed = true
+
+	var relationships = null
+	if effective_config.include_relationships:
+		relationships = []
+		for relationship in entity.relationships:
+			relationships.append(_pack_relationship(relationship))
+			if (
+				effective_config.include_related_entities
+				and relationship.target is Entity
+				and not queued.has(relationship.target.id)
+			):
+				queued[relationship.target.id] = true
+				related.append(relationship.target)
+		hashes[RELATIONSHIPS_KEY] = hash(relationships)
+		if base.get(RELATIONSHIPS_KEY) == hashes[RELATIONSHIPS_KEY]:
+			relationships = null
+		else:
+			changed = true
+
+	var removed := PackedStringArray()
+	for type in base:
+		if not hashes.has(type) and type != RELATIONSHIPS_KEY:
+			removed.append(type)
+	captured["hashes"][entity.id] = hashes
+	if not changed and removed.is_empty():
+		return
+
+	chunk["rows"].append(
+		[entity.id, String(entity.name), entity.scene_file_path, values, relationships, removed]
+	)
+	if chunk["rows"].size() >= CHUNK_SIZE:
+		on_chunk.call(chunk["types"], chunk["props"], chunk["rows"])
+		chunk["rows"] = []  # The handed-off rows may still be in use by the writer
+
+
+func _pack_values(object: Object, props: PackedStringArray) -> Array:
+	var values: Array = []
+	for prop in props:
+		values.append(_pack(object.get(prop)))
+	return values
+
+
+func _pack_relationship(relationship: Relationship) -> Array:
+	var target = relationship.target
+	var relation = _pack(relationship.relation)
+	if target is Entity:
+		return [relation, Target.ENTITY, target.id]
+	if target is Component:
+		return [relation, Target.COMPONENT, _pack(target)]
+	if target is Script:
+		return [relation, Target.SCRIPT, target.resource_path]
+	return [relation, Target.NONE, null]
+
+
+## Convert a property value to plain data: Resources become tagged Dictionaries
+## (a path for external resources, stored properties for embedded ones).
+func _pack(value: Variant) -> Variant:
+	match typeof(value):
+		TYPE_OBJECT:
+			if not value is Resource:
+				return null
+			if value.resource_path != "" and not value.resource_path.contains("::"):
+				return {RES_PATH: value.resource_path}
+			var script = value.get_script()
+			var values := {}
+			for prop in _props_for(value):
+				values[prop] = _pack(value.get(prop))
+			return {
+				RES_TYPE: script.resource_path if script else value.get_class(),
+				RES_VALUES: values,
+			}
+		TYPE_ARRAY:
+			if _is_plain_array(value):
+				return value
+			var items: Array = []
+			for item in value:
+				items.append(_pack(item))
+			return items
+		TYPE_DICTIONARY:
+			var entries := {}
+			for key in value:
+				entries[key] = _pack(value[key])
+			return entries
+	return value
+
+
+## Stored property names of a Resource, cached per script (or built-in class).
+func _props_for(object: Object) -> PackedStringArray:
+	var script = object.get_script()
+	var type = script if script else object.get_class()
+	if _props_by_type.has(type):
+		return _props_by_type[type]
+	var props := PackedStringArray()
+	var list = script.get_script_property_list() if script else object.get_property_list()
+	for prop_info in list:
+		if prop_info.usage & PROPERTY_USAGE_STORAGE and prop_info.name != "script":
+			props.append(prop_info.name)
+	_props_by_type[type] = props
+	return props
+
+
+static func _is_plain_array(value: Array) -> bool:
+	return (
+		value.is_typed()
+		and not value.get_typed_builtin() in [TYPE_OBJECT, TYPE_ARRAY, TYPE_DICTIONARY]
+	)
+
+
+#endregion Capture (main thread)
+
+#region File format (any thread)
+
+
+## File layout:[br]
+## header: MAGIC, u16 VERSION, u8 flags, snapshot id, base id[br]
+## BLOCK_CHUNK: component paths, property names, u32 raw size, u32 packed size, zstd rows[br]
+## BLOCK_REMOVED: removed entity ids, then BLOCK_END
+static func _store_header(file: FileAccess, captured: Dictionary) -> void:
+	file.store_buffer(MAGIC.to_ascii_buffer())
+	file.store_16(VERSION)
+	file.store_8(FLAG_DELTA if captured["delta"] else 0)
+	file.store_pascal_string(captured["id"])
+	file.store_pascal_string(captured["base_id"])
+
+
+## Encode, compress and append one chunk of rows.
+static func _store_chunk(
+	types: PackedStringArray, props: Array, rows: Array, file: FileAccess
+) -> void:
+	var raw := var_to_bytes(rows)
+	var packed := raw.compress(FileAccess.COMPRESSION_ZSTD)
+	file.store_8(BLOCK_CHUNK)
+	file.store_var(types)
+	file.store_var(props)
+	file.store_32(raw.size())
+	file.store_32(packed.size())
+	file.store_buffer(packed)
+
+
+## Append the removed ids and BLOCK_END, then close [param file].
+static func _store_end(file: FileAccess, captured: Dictionary) -> Error:
+	file.store_8(BLOCK_REMOVED)
+	file.store_var(captured["removed"])
+	file.store_8(BLOCK_END)
+	var error := file.get_error()
+	file.close()
+	return error
+
+
+## First pass over a snapshot file: reads the header and every block header and checks
+## each chunk's size against the file, seeking past the compressed data without
+## decompressing it. Returns { "error": Error, "header": {delta, id, base_id},
+## "chunks": Array of [enum Chunk] entries, "removed": PackedStringArray }.
+static func _scan_file(path: String) -> Dictionary:
+	var scan := {"error": OK, "header": {}, "chunks": [], "removed": PackedStringArray()}
+	var file := FileAccess.open(path, FileAccess.READ)
+	if file == null:
+		scan["error"] = FileAccess.get_open_error()
+		return scan
+	var length := file.get_length()
+	var magic := file.get_buffer(MAGIC.length()).get_string_from_ascii()
+	if magic != MAGIC or file.get_16() > VERSION:
+		scan["error"] = ERR_FILE_UNRECOGNIZED
+		file.close()
+		return scan
+	scan["header"] = {
+		"delta": (file.get_8() & FLAG_DELTA) != 0,
+		"id": file.get_pascal_string(),
+		"base_id": file.get_pascal_string(),
+	}
+	while scan["error"] == OK:
+		var block := file.get_8()
+		if file.eof_reached():
+			scan["error"] = ERR_FILE_CORRUPT
+		elif block == BLOCK_END:
+			break
+		elif block == BLOCK_REMOVED:
+			var removed = file.get_var()
+			if removed is PackedStringArray:
+				scan["removed"] = removed
+			else:
+				scan["error"] = ERR_FILE_CORRUPT
+		elif block == BLOCK_CHUNK:
+			var types = file.get_var()
+			var props = file.get_var()
+			var raw_size := file.get_32()
+			var packed_size := file.get_32()
+			var offset := file.get_position()
+			if (
+				file.eof_reached()
+				or not types is PackedStringArray
+				or not props is Array
+				or offset + packed_size > length
+			):
+				scan["error"] = ERR_FILE_CORRUPT
+			else:
+				scan["chunks"].append([types, props, raw_size, offset, packed_size])
+				file.seek(offset + packed_size)
+		else:
+			scan["error"] = ERR_FILE_CORRUPT
+	file.close()
+	return scan
+
+
+## Second pass: decompress and decode the rows of one chunk found by [method _scan_file].
+## Returns null when its data is corrupt.
+static func _decode_chunk(file: FileAccess, chunk: Array) -> Variant:
+	file.seek(chunk[Chunk.OFFSET])
+	var packed := file.get_buffer(chunk[Chunk.SIZE])
+	var rows = bytes_to_var(packed.decompress(chunk[Chunk.RAW_SIZE], FileAccess.COMPRESSION_ZSTD))
+	return rows if rows is Array else null
+
+
+#endregion File format (any thread)
+
+#region Build (main thread)
+
+
+func _build_state(world: World) -> Dictionary:
+	var entities: Array[Entity] = []  # New entities, in file order
+	return {
+		"world": world,
+		"entities": entities,
+		"by_id": {},  # entity id -> Entity built from this snapshot
+		"links": [],  # [Entity, packed relationships, created]
+	}
+
+
+func _begin_build(state: Dictionary, header: Dictionary) -> Error:
+	if header["delta"]:
+		if state["world"] == null:
+			push_error("GECSSnapshot: Delta snapshots can only be applied to a World")
+			return ERR_INVALID_PARAMETER
+		if header["base_id"] != snapshot_id:
+			push_error("GECSSnapshot: Delta was written against a different base snapshot")
+			return ERR_INVALID_DATA
+	else:
+		_baseline.clear()
+	snapshot_id = header["id"]
+	return OK
+
+
+func _build_chunk(state: Dictionary, types: PackedStringArray, props: Array, rows: Array) -> void:
+	var world: World = state["world"]
+	var scripts: Array = []
+	for type in types:
+		var script = load(type) if ResourceLoader.exists(type) else null
+		if script == null:
+			push_warning("GECSSnapshot: Component script not found, skipping: " + type)
+		scripts.append(script)
+
+	for row in rows:
+		var entity_id: String = row[Row.ID]
+		var entity: Entity = world.get_entity_by_id(entity_id) if world else null
+		var created := entity == null
+		if created:
+			entity = GECSIO._instantiate_entity(row[Row.SCENE])
+			entity.name = row[Row.NAME]
+			entity.id = entity_id
+		if not _baseline.has(entity_id):
+			_baseline[entity_id] = {}
+		var hashes: Dictionary = _baseline[entity_id]
+
+		var values: Array = row[Row.VALUES]
+		for i in scripts.size():
+			if values[i] == null or scripts[i] == null:
+				continue
+			hashes[types[i]] = hash(values[i])
+			var component = null if created else entity.get_component(scripts[i])
+			if component == null:
+				component = scripts[i].new()
+				_apply_values(component, props[i], values[i])
+				entity.add_component(component)
+			else:
+				_apply_values(component, props[i], values[i])
+		for type in row[Row.REMOVED]:
+			hashes.erase(type)
+			if ResourceLoader.exists(type):
+				entity.remove_component(load(type))
+		if row[Row.RELATIONSHIPS] != null:
+			hashes[RELATIONSHIPS_KEY] = hash(row[Row.RELATIONSHIPS])
+			state["links"].append([entity, row[Row.RELATIONSHIPS], created])
+
+		state["by_id"][entity_id] = entity
+		if created:
+			state["entities"].append(entity)
+			if world:
+				world.add_entity(entity)
+
+
+## Restore relationships once every entity exists, then drop removed entities.
+func _finish_build(state: Dictionary, removed: PackedStringArray) -> void:
+	var world: World = state["world"]
+	for link in state["links"]:
+		var entity: Entity = link[0]
+		if not link[2]:
+			entity.remove_all_relationships()
+		for packed in link[1]:
+			var relationship := _unpack_relationship(packed, state["by_id"], world)
+			if relationship:
+				entity.add_relationship(relationship)
+
+	for entity_id in removed:
+		_baseline.erase(entity_id)
+		var entity = world.get_entity_by_id(entity_id) if world else null
+		if entity:
+			world.remove_entity(entity)
+
+
+func _unpack_relationship(packed: Array, by_id: Dictionary, world: World) -> Relationship:
+	var target = null
+	match packed[1]:
+		Target.ENTITY:
+			target = by_id.get(packed[2])
+			if target == null and world:
+				target = world.get_entity_by_id(packed[2])
+			if target == null:
+				push_warning("GECSSnapshot: Could not resolve entity with ID: " + packed[2])
+				return null
+		Target.COMPONENT:
+			target = _unpack(packed[2])
+		Target.SCRIPT:
+			target = load(packed[2]) if ResourceLoader.exists(packed[2]) else null
+			if target == null:
+				push_warning("GECSSnapshot: Relationship target script not found: " + packed[2])
+				return null
+	return Relationship.new(_unpack(packed[0]), target)
+
+
+func _apply_values(object: Object, props: Array, values: Array) -> void:
+	for i in mini(props.size(), values.size()):
+		object.set(props[i], _unpack(values[i], object.get(props[i])))
+
+
+## Inverse of [method _pack]. [param current] is the property's present value, used to
+## keep typed arrays typed.
+func _unpack(value: Variant, current: Variant = null) -> Variant:
+	match typeof(value):
+		TYPE_DICTIONARY:
+			if value.has(RES_PATH):
+				return load(value[RES_PATH]) if ResourceLoader.exists(value[RES_PATH]) else null
+			if value.has(RES_TYPE):
+				return _unpack_resource(value)
+			var entries := {}
+			for key in value:
+				entries[key] = _unpack(value[key])
+			return entries
+		TYPE_ARRAY:
+			var items: Array = value
+			if not _is_plain_array(value):
+				items = []
+				for item in value:
+					items.append(_unpack(item))
+			if current is Array and current.is_typed():
+				var typed: Array = current.duplicate()
+				typed.assign(items)
+				return typed
+			return items
+	return value
+
+
+func _unpack_resource(packed: Dictionary) -> Resource:
+	var type: String = packed[RES_TYPE]
+	var resource: Resource = null
+	if type.begins_with("res://") or type.begins_with("uid://"):
+		var script = load(type) if ResourceLoader.exists(type) else null
+		resource = script.new() if script else null
+	elif ClassDB.can_instantiate(type):
+		resource = ClassDB.instantiate(type)
+	if resource == null:
+		push_warning("GECSSnapshot: Could not create resource of type: " + type)
+		return null
+	var values: Dictionary = packed[RES_VALUES]
+	for prop in values:
+		resource.set(prop, _unpack(values[prop], resource.get(prop)))
+	return resource
+
+
+## Read [param path] into [param state]: [method _scan_file] checks the whole layout
+## first, then chunks are decompressed, decoded and built one at a time.
+func _stream(state: Dictionary, path: String) -> Error:
+	var scan := _scan_file(path)
+	var error := _start_stream(state, scan)
+	if error != OK:
+		return error
+	var file := FileAccess.open(path, FileAccess.READ)
+	if file == null:
+		_abort_stream(state)
+		return FileAccess.get_open_error()
+	for chunk in scan["chunks"]:
+		var rows = _decode_chunk(file, chunk)
+		if rows == null:
+			file.close()
+			_abort_stream(state)
+			return ERR_FILE_CORRUPT
+		_build_chunk(state, chunk[Chunk.TYPES], chunk[Chunk.PROPS], rows)
+	file.close()
+	_finish_build(state, scan["removed"])
+	return OK
+
+
+## Checks that run before the first entity is touched.
+func _start_stream(state: Dictionary, scan: Dictionary) -> Error:
+	if scan["error"] != OK:
+		return scan["error"]
+	return _begin_build(state, scan["header"])
+
+
+## A chunk failed to decode after building started: free the detached entities built
+## so far and drop the delta base, which no longer matches any file.
+func _abort_stream(state: Dictionary) -> void:
+	if state["world"] == null:
+		for entity in state["entities"]:
+			entity.free()
+		state["entities"].clear()
+	snapshot_id = ""
+	_baseline.clear()
+
+
+#endregion Build (main thread)
+
+#region Async
+
+
+## Worker: write the chunks [method write_async] queues until the null end marker.
+func _write_task(file: FileAccess, captured: Dictionary, path: String, pipe: Dictionary) -> void:
+	while true:
+		pipe["queued"].wait()
+		pipe["mutex"].lock()
+		var item = pipe["queue"].pop_front()
+		pipe["mutex"].unlock()
+		if item == null:
+			break
+		_store_chunk(item[0], item[1], item[2], file)
+		pipe["free"].post()
+	var error := _store_end(file, captured)
+	_finish_write.call_deferred(path, error, captured)
+
+
+## Main thread: hand a captured chunk to the writer, waiting while the queue is full.
+static func _queue_chunk(
+	types: PackedStringArray, props: Array, rows: Array, pipe: Dictionary
+) -> void:
+	pipe["free"].wait()
+	_queue_item(pipe, [types, props, rows])
+
+
+static func _queue_item(pipe: Dictionary, item: Variant) -> void:
+	pipe["mutex"].lock()
+	pipe["queue"].append(item)
+	pipe["mutex"].unlock()
+	pipe["queued"].post()
+
+
+func _finish_write(path: String, error: Error, captured: Dictionary) -> void:
+	_finish_task()
+	_busy = false
+	if error == OK:
+		_commit(captured)
+	write_completed.emit(path, error)
+
+
+## Scan [param path] on the worker, then decode its chunks there one at a time while the
+## main thread builds the previous one. [param on_done] gets (state, error).
+func _start_async_stream(state: Dictionary, path: String, on_done: Callable) -> void:
+	var stream := {"state": state, "path": path, "scan": {}, "next": 0, "on_done": on_done}
+	_busy = true
+	_task_id = WorkerThreadPool.add_task(
+		_scan_task.bind(path, stream), false, "GECSSnapshot scan"
+	)
+
+
+## Worker: first pass over the file (see [method _scan_file]).
+func _scan_task(path: String, stream: Dictionary) -> void:
+	_stream_scanned.call_deferred(stream, _scan_file(path))
+
+
+func _stream_scanned(stream: Dictionary, scan: Dictionary) -> void:
+	_finish_task()
+	stream["scan"] = scan
+	var error := _start_stream(stream["state"], scan)
+	if error != OK:
+		_end_async_stream(stream, error)
+	elif not _decode_next(stream):
+		_finish_build(stream["state"], scan["removed"])
+		_end_async_stream(stream, OK)
+
+
+## Start decoding the next chunk on the worker. Returns false when every chunk is done.
+func _decode_next(stream: Dictionary) -> bool:
+	var chunks: Array = stream["scan"]["chunks"]
+	if stream["next"] >= chunks.size():
+		return false
+	var chunk: Array = chunks[stream["next"]]
+	stream["next"] += 1
+	_task_id = WorkerThreadPool.add_task(
+		_decode_task.bind(stream["path"], chunk, stream), false, "GECSSnapshot decode"
+	)
+	return true
+
+
+## Worker: decompress and decode one chunk (see [method _decode_chunk]).
+func _decode_task(path: String, chunk: Array, stream: Dictionary) -> void:
+	var rows = null
+	var file := FileAccess.open(path, FileAccess.READ)
+	if file != null:
+		rows = _decode_chunk(file, chunk)
+		file.close()
+	_stream_chunk.call_deferred(stream, chunk, rows)
+
+
+## Main thread: build one decoded chunk while the worker decodes the next.
+func _stream_chunk(stream: Dictionary, chunk: Array, rows: Variant) -> void:
+	_finish_task()
+	if rows == null:
+		_abort_stream(stream["state"])
+		_end_async_stream(stream, ERR_FILE_CORRUPT)
+		return
+	var more := _decode_next(stream)
+	_build_chunk(stream["state"], chunk[Chunk.TYPES], chunk[Chunk.PROPS], rows)
+	if not more:
+		_finish_build(stream["state"], stream["scan"]["removed"])
+		_end_async_stream(stream, OK)
+
+
+func _end_async_stream(stream: Dictionary, error: Error) -> void:
+	_busy = false
+	stream["on_done"].call(stream["state"], error)
+
+
+func _finish_read(state: Dictionary, error: Error, path: String) -> void:
+	if error != OK:
+		push_error("GECSSnapshot read: Failed to read %s (%s)" % [path, error_string(error)])
+		read_completed.emit(path, [])
+		return
+	read_completed.emit(path, state["entities"])
+
+
+func _finish_apply(state: Dictionary, error: Error, path: String) -> void:
+	if error != OK:
+		push_error("GECSSnapshot apply: Failed to read %s (%s)" % [path, error_string(error)])
+	apply_completed.emit(path, error)
+
+
+func _finish_task() -> void:
+	if _task_id != -1:
+		WorkerThreadPool.wait_for_task_completion(_task_id)
+	_task_id = -1
+
+#endregion Async
@@ -226,32 +226,7 @@ static func _load_from_path(file_path: String) -> Array[Entity]:
 
 ## Helper function to deserialize a single entity with its components and uuid
 static func _deserialize_entity(entity_data: GecsEntityData) -> Entity:
-	var entity: Entity
-
-	# Check if this entity is a prefab (has scene file)
-	if entity_data.scene_path != "":
-		var scene_path = entity_data.scene_path
-		if ResourceLoader.exists(scene_path):
-			var packed_scene = load(scene_path) as PackedScene
-			if packed_scene:
-				entity = packed_scene.instantiate() as Entity
-			else:
-				push_warning(
-					(
-						"GECS deserialize: Could not load scene: "
-						+ scene_path
-						+ ", creating new entity"
-					)
-				)
-				entity = Entity.new()
-		else:
-			push_warning(
-				"GECS deserialize: Scene file not found: " + scene_path + ", creating new entity"
-			)
-			entity = Entity.new()
-	else:
-		# Create new entity
-		entity = Entity.new()
+	var entity := _instantiate_entity(entity_data.scene_path)
 
 	# Set entity name
 	entity.name = entity_data.entity_name
@@ -264,3 +239,23 @@ static func _deserialize_entity(entity_data: GecsEntityData) -> Entity:
 		entity.add_component(component.duplicate(true))
 
 	return entity
+
+
+## Helper function to create an entity from its prefab scene, or a plain [Entity]
+## when [param scene_path] is empty or can't be loaded
+static func _instantiate_entity(scene_path: String) -> Entity:
+	# Check if this entity is a prefab (has scene file)
+	if scene_path == "":
+		return Entity.new()
+	if not ResourceLoader.exists(scene_path):
+		push_warning(
+			"GECS deserialize: Scene file not found: " + scene_path + ", creating new entity"
+		)
+		return Entity.new()
+	var packed_scene = load(scene_path) as PackedScene
+	if not packed_scene:
+		push_warning(
+			"GECS deserialize: Could not load scene: " + scene_path + ", creating new entity"
+		)
+		return Entity.new()
+	return packed_scene.instantiate() as Entity
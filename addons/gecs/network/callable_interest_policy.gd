@@ -0,0 +1,24 @@
+class_name CallableInterestPolicy
+extends InterestPolicy
+## CallableInterestPolicy — interest policy backed by a user Callable.
+##
+## Callable signature:
+##   func(entity: Entity, peer_id: int) -> bool
+##
+## The callable runs when an entity spawns or changes owner. Call
+## NetworkSync.refresh_interest(entity) when something else it reads changes.
+##
+## Example (team-only visibility):
+##   ns.set_interest_policy(CallableInterestPolicy.new(
+##       func(entity, peer_id): return entity.get_component(C_Team).id == team_of(peer_id)
+##   ))
+
+var _filter: Callable
+
+
+func _init(filter: Callable) -> void:
+	_filter = filter
+
+
+func is_relevant(entity: Entity, peer_id: int) -> bool:
+	return _filter.call(entity, peer_id)
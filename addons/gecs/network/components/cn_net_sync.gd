@@ -6,6 +6,10 @@ extends Component
 ## once after adding/removing sibling components to build the scan tables. [br]
 ## Then call check_changes_for_priority(priority) each tick to get changed props. [br]
 ##[br]
+## Change detection is push-first: once a synced property emits [br]
+## [signal Component.property_changed], it is only compared when it emits again.[br]
+## Properties that never emit (plain vars without a setter) are polled every flush.[br]
+##[br]
 ## Property grouping via @export_group in sibling components:[br]
 ##   @export_group(CN_NetSync.REALTIME)  # ~60 Hz [br]
 ##   @export_group(CN_NetSync.HIGH)      # 20 Hz (default if no group)[br]
@@ -13,6 +17,9 @@ extends Component
 ##   @export_group(CN_NetSync.LOW)       # 2 Hz (default, configurable via gecs/network/sync/low_hz)[br]
 ##   @export_group(CN_NetSync.SPAWN_ONLY)# sent at spawn only (SpawnManager handles it)[br]
 ##   @export_group(CN_NetSync.LOCAL)     # never synced[br]
+##[br]
+## Quantization hints via @export_subgroup inside a sync group (packed encoding only):[br]
+##   @export_subgroup(CN_NetSync.QUANTIZE_HALF)  # float/Vector2/Vector3 sent as 16-bit floats[br]
 
 # ============================================================================
 # SYNC TIER CONSTANTS — use with @export_group() for autocomplete & typo safety
@@ -25,6 +32,10 @@ const LOW = "LOW"  ## 2 Hz, reliable — inventory, stats
 const SPAWN_ONLY = "SPAWN_ONLY"  ## Once at spawn, reliable — initial position/velocity
 const LOCAL = "LOCAL"  ## Never synced — client-only state
 
+## @export_subgroup hint: send float/Vector2/Vector3 props as 16-bit floats when
+## gecs/network/sync/packed_encoding is on. Lossy (~3 significant digits).
+const QUANTIZE_HALF = "QUANTIZE_HALF"
+
 # ============================================================================
 # PRIORITY ENUM & CONSTANTS
 # ============================================================================
@@ -64,6 +75,24 @@ var _comp_refs: Dictionary = {}
 ## Component type names for wire format: { inst_id: String }
 var _comp_type_names: Dictionary = {}
 
+## Quantization hints from @export_subgroup: { "CompTypeName": { prop_name: hint } }
+var _quantize_hints: Dictionary = {}
+
+## Priority of every synced prop: { inst_id: { prop_name: priority_int } }
+var _prop_priority: Dictionary = {}
+
+## Props still compared every flush: their component never emitted property_changed
+## for them, or they hold an Array/Dictionary/Object that can change in place without
+## a setter call: { inst_id: { priority_int: [prop_names] } }
+var _polled_by_comp: Dictionary = {}
+
+## Number of polled props per priority: { priority_int: int }
+var _polled_count: Dictionary = {}
+
+## Props that emitted property_changed since their last check:
+## { priority_int: { inst_id: { prop_name: true } } }
+var _dirty: Dictionary = {}
+
 ## Sync interval seconds by priority (populated from ProjectSettings in _init)
 var _intervals: Dictionary = {}
 
@@ -91,10 +120,19 @@ func _init() -> void:
 ## Call once after adding/removing components; rebuilds all caches from scratch.
 ## Skips: self (CN_NetSync), CN_NetworkIdentity, and components without a script.
 func scan_entity_components(entity: Entity) -> void:
+	for comp in _comp_refs.values():
+		if is_instance_valid(comp) and comp.property_changed.is_connected(_on_property_changed):
+			comp.property_changed.disconnect(_on_property_changed)
 	_cache_by_comp.clear()
 	_props_by_comp.clear()
 	_comp_refs.clear()
 	_comp_type_names.clear()
+	_quantize_hints.clear()
+	_prop_priority.clear()
+	_polled_by_comp.clear()
+	for priority in Priority.values():
+		_polled_count[priority] = 0
+		_dirty[priority] = {}
 
 	for comp in entity.components.values():
 		if not is_instance_valid(comp):
@@ -117,26 +155,46 @@ func scan_entity_components(entity: Entity) -> void:
 			global_name = script.resource_path.get_file().get_basename()
 		_comp_type_names[inst_id] = global_name
 
-		_props_by_comp[inst_id] = _scan_component(comp)
+		var hints: Dictionary = {}
+		_props_by_comp[inst_id] = _scan_component(comp, hints)
+		if not hints.is_empty():
+			_quantize_hints[global_name] = hints
 
-		# Initialize cache with current values for all synced priorities
+		# Initialize cache with current values for all synced priorities.
+		# Every prop starts polled until its component proves it emits property_changed.
 		_cache_by_comp[inst_id] = {}
+		_prop_priority[inst_id] = {}
+		_polled_by_comp[inst_id] = {}
 		for priority in _props_by_comp[inst_id].keys():
+			_polled_by_comp[inst_id][priority] = _props_by_comp[inst_id][priority].duplicate()
+			_polled_count[priority] += _props_by_comp[inst_id][priority].size()
 			for prop_name in _props_by_comp[inst_id][priority]:
+				_prop_priority[inst_id][prop_name] = priority
 				_cache_by_comp[inst_id][prop_name] = _deep_copy(comp.get(prop_name))
+		if not _prop_priority[inst_id].is_empty():
+			comp.property_changed.connect(_on_property_changed)
 
 
 ## Scan a single component's exported properties and group by priority.
 ## Returns: { priority_int: [prop_name, ...] }
-func _scan_component(comp: Component) -> Dictionary:
+## Props under a recognized @export_subgroup hint are written to [param hints] as
+## { prop_name: hint }.
+func _scan_component(comp: Component, hints: Dictionary = {}) -> Dictionary:
 	var result: Dictionary = {}
 	var current_priority: int = Priority.HIGH  # Default when no @export_group set
+	var current_hint: String = ""
 
 	for prop_info in comp.get_script().get_script_property_list():
 		var usage: int = prop_info.usage
 
+		# @export_subgroup annotation — quantization hint for the props that follow
+		if usage & PROPERTY_USAGE_SUBGROUP:
+			current_hint = prop_info.name if prop_info.name == QUANTIZE_HALF else ""
+			continue
+
 		# @export_group annotation — update current priority tracking
 		if usage & PROPERTY_USAGE_GROUP:
+			current_hint = ""
 			var group_name: String = prop_info.name
 			if group_name in PRIORITY_MAP:
 				current_priority = PRIORITY_MAP[group_name]
@@ -166,47 +224,113 @@ func _scan_component(comp: Component) -> Dictionary:
 		if current_priority not in result:
 			result[current_priority] = []
 		result[current_priority].append(prop_name)
+		if current_hint != "":
+			hints[prop_name] = current_hint
 
 	return result
 
 
+## Quantization hints of the scanned components, keyed by wire type name.
+## Returns: { "CompTypeName": { prop_name: hint } }
+func get_quantize_hints() -> Dictionary:
+	return _quantize_hints
+
+
 # ============================================================================
 # CHANGE DETECTION
 # ============================================================================
 
 
+## True when check_changes_for_priority(priority) has anything to compare: a prop
+## marked dirty by property_changed, or a prop that is still polled.
+## Lets SyncSender skip entities whose components are all push-tracked and quiet.
+func has_changes_for_priority(priority: int) -> bool:
+	return _polled_count.get(priority, 0) > 0 or not _dirty.get(priority, {}).is_empty()
+
+
 ## Check all tracked components for property changes at the given priority level.
+## Only dirty and still-polled props are compared against the cache, unless
+## [param full_poll] is set: then every prop is compared (SyncSender's low-rate fallback
+## for writes that bypass property_changed, e.g. setters that only emit past an epsilon).
 ## Returns wire-format dict: { "CompTypeName": { "prop_name": new_value, ... } }
 ## Only components with at least one changed property are included.
-func check_changes_for_priority(priority: int) -> Dictionary:
+func check_changes_for_priority(priority: int, full_poll: bool = false) -> Dictionary:
 	var result: Dictionary = {}
+	var dirty: Dictionary = _dirty.get(priority, {})
 
 	for inst_id in _comp_refs.keys():
 		if not is_instance_valid(_comp_refs[inst_id]):
 			continue
 		var comp: Component = _comp_refs[inst_id]
 
-		var props_at_priority: Array = _props_by_comp[inst_id].get(priority, [])
-		if props_at_priority.is_empty():
+		var polled: Array = (
+			_props_by_comp[inst_id].get(priority, [])
+			if full_poll
+			else _polled_by_comp[inst_id].get(priority, [])
+		)
+		var comp_dirty: Dictionary = dirty.get(inst_id, {})
+		if polled.is_empty() and comp_dirty.is_empty():
 			continue
 
 		var comp_cache: Dictionary = _cache_by_comp[inst_id]
 		var changed: Dictionary = {}
 
-		for prop_name in props_at_priority:
-			var current_value: Variant = comp.get(prop_name)
-			var cached_value: Variant = comp_cache.get(prop_name)
-
-			if _has_changed(cached_value, current_value):
-				changed[prop_name] = current_value
-				comp_cache[prop_name] = _deep_copy(current_value)
+		for prop_name in polled:
+			_collect_change(comp, comp_cache, prop_name, changed)
+		for prop_name in comp_dirty:
+			if not changed.has(prop_name):
+				_collect_change(comp, comp_cache, prop_name, changed)
 
 		if not changed.is_empty():
 			result[_comp_type_names[inst_id]] = changed
 
+	dirty.clear()
 	return result
 
 
+## Compare one prop against the cache; record and cache it when it changed.
+func _collect_change(
+	comp: Component, comp_cache: Dictionary, prop_name: String, changed: Dictionary
+) -> void:
+	var current_value: Variant = comp.get(prop_name)
+	if _has_changed(comp_cache.get(prop_name), current_value):
+		changed[prop_name] = current_value
+		comp_cache[prop_name] = _deep_copy(current_value)
+
+
+## property_changed from a scanned component: mark the prop dirty for its priority.
+## The first emission also moves the prop from polled to push-tracked, except for
+## containers (append/erase on an Array never calls the setter), which stay polled.
+func _on_property_changed(
+	component: Resource, property_name: String, _old_value: Variant, new_value: Variant
+) -> void:
+	var inst_id: int = component.get_instance_id()
+	var priority = _prop_priority.get(inst_id, {}).get(property_name)
+	if priority == null:
+		return  # Not synced (LOCAL, SPAWN_ONLY or not exported)
+	if not _is_mutable_in_place(new_value):
+		var polled: Array = _polled_by_comp[inst_id][priority]
+		var index := polled.find(property_name)
+		if index != -1:
+			polled.remove_at(index)
+			_polled_count[priority] -= 1
+	if not _dirty[priority].has(inst_id):
+		_dirty[priority][inst_id] = {}
+	_dirty[priority][inst_id][property_name] = true
+
+
+## True for values that can change without assignment: Array, Dictionary, Object and
+## the packed arrays.
+func _is_mutable_in_place(value: Variant) -> bool:
+	var type := typeof(value)
+	return (
+		type == TYPE_ARRAY
+		or type == TYPE_DICTIONARY
+		or type == TYPE_OBJECT
+		or type >= TYPE_PACKED_BYTE_ARRAY
+	)
+
+
 ## Update cache without triggering change detection.
 ## Called by SyncReceiver after applying remote data to avoid echo sync loops.
 func update_cache_silent(comp: Component, prop: String, value: Variant) -> void:
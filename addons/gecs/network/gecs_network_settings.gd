@@ -1,7 +1,7 @@
 ## GECSNetworkSettings — typed constants for all gecs/network/sync/* ProjectSettings paths.
 ##
 ## Use these constants instead of raw strings to prevent typos and make
-## refactoring safe. All four network settings are registered by
+## refactoring safe. All network settings are registered by
 ## addons/gecs/plugin.gd via add_gecs_network_project_settings().
 ##
 ## Usage:
@@ -19,3 +19,7 @@ const LOW_HZ := "gecs/network/sync/low_hz"
 
 ## Project Settings path for reconciliation broadcast interval in seconds (default: 30.0).
 const RECONCILIATION_INTERVAL := "gecs/network/sync/reconciliation_interval"
+
+## Project Settings path for the packed binary sync encoding (default: false).
+## When true, property sync batches are sent through SyncCodec instead of as Dictionaries.
+const PACKED_ENCODING := "gecs/network/sync/packed_encoding"
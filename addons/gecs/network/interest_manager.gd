@@ -0,0 +1,312 @@
+class_name InterestManager
+extends RefCounted
+## InterestManager — server-side per-peer relevance filtering for network sync.
+##
+## Delegates from NetworkSync. Disabled (every peer receives every entity) until
+## NetworkSync.set_interest_policy() installs an InterestPolicy.
+##
+## Relevance is kept up to date incrementally. The manager tracks every announced
+## networked entity with its policy cell (InterestPolicy.cell_of) and owner, spawning and
+## despawning through on_entity_spawned()/on_entity_despawned(). Every update_interval
+## seconds it walks SyncSender's networked-entity index (CN_NetworkIdentity + CN_NetSync)
+## and re-checks only entities whose cell or owner changed:
+##   - the entity itself against every connected peer
+##   - for a peer's own entity (a viewer), the entities in the cells it stopped or
+##     started seeing, against that peer only
+## Entities entering a peer's set are spawned on it (SpawnManager.serialize_entity) and
+## entities leaving it are despawned. Sync batches, reconciliation state and late-join
+## world state are then filtered per peer against these sets, so bandwidth follows what
+## each peer can see rather than entities x peers.
+##
+## Entities without CN_NetSync are not re-read between spawn and despawn.
+## NetworkSync.refresh_interest() re-checks one entity after a change the policy reads
+## that is neither its cell nor its owner (a team switch).
+##
+## Entities owned by a peer are always relevant to it.
+
+var _ns  # NetworkSync reference (untyped to avoid circular deps)
+
+## Active policy; null disables interest management.
+var policy: InterestPolicy
+
+## Seconds between relevance updates.
+var update_interval: float = 0.25
+
+## Relevant entity ids per peer: { peer_id: { entity_id: true } }
+var _relevant: Dictionary = {}
+
+## Tracked networked entities: { entity_id: Entity }
+var _entities: Dictionary = {}
+## Last seen policy cell and owner per tracked entity: { entity_id: Variant / int }
+var _cells: Dictionary = {}
+var _owners: Dictionary = {}
+## Tracked entities by cell: { cell: { entity_id: Entity } }
+var _grid: Dictionary = {}
+## Cells each peer's own entities see, with a viewer count: { peer_id: { cell: int } }
+var _seen: Dictionary = {}
+
+## Re-check every tracked entity against every peer on the next update
+var _full_update: bool = false
+var _timer: float = 0.0
+
+
+func _init(network_sync) -> void:
+	_ns = network_sync
+
+
+# ============================================================================
+# PUBLIC API
+# ============================================================================
+
+
+func is_enabled() -> bool:
+	return policy != null
+
+
+## Install a policy. Peers are assumed to hold every networked entity (the
+## unfiltered behaviour), so the first update despawns what is not relevant.
+func set_policy(p_policy: InterestPolicy, p_update_interval: float = 0.25) -> void:
+	policy = p_policy
+	update_interval = p_update_interval
+	_relevant.clear()
+	_entities.clear()
+	_cells.clear()
+	_owners.clear()
+	_grid.clear()
+	_seen.clear()
+	_timer = 0.0
+	if policy == null or not _ns.net_adapter.is_server():
+		return
+	for entity in _networked_entities():
+		_track(entity)
+	var everything: Dictionary = {}
+	for entity_id in _entities:
+		everything[entity_id] = true
+	for peer_id in _ns.net_adapter.get_connected_peers():
+		_relevant[peer_id] = everything.duplicate()
+	_full_update = true
+
+
+## Call once per frame from NetworkSync._process(). Server-only.
+func tick(delta: float) -> void:
+	if policy == null or not _ns.net_adapter.is_server():
+		return
+	_timer += delta
+	if _timer >= update_interval:
+		_timer = 0.0
+		update()
+
+
+## Re-check the synced entities that changed cell or owner since the last update and
+## send the resulting spawns/despawns. The first update after set_policy() checks
+## every tracked entity once.
+func update() -> void:
+	if _full_update:
+		_full_update = false
+		for peer_id in _ns.net_adapter.get_connected_peers():
+			for entity in _entities.values():
+				_recheck(peer_id, entity)
+
+	var sender = _ns._sender
+	sender._ensure_index()
+	for entity in sender._synced:
+		if not is_instance_valid(entity) or not _entities.has(entity.id):
+			continue  # Freed, or not announced yet (spawn still pending)
+		var net_id: CN_NetworkIdentity = entity.get_component(CN_NetworkIdentity)
+		var owner := net_id.peer_id if net_id else 0
+		if policy.cell_of(entity) != _cells[entity.id] or owner != _owners[entity.id]:
+			_move(entity)
+
+
+## Re-check [param entity] against every peer now, for policy inputs that are
+## not part of its cell (see InterestPolicy.cell_of).
+func refresh(entity: Entity) -> void:
+	if policy == null or not _entities.has(entity.id):
+		return
+	for peer_id in _ns.net_adapter.get_connected_peers():
+		_recheck(peer_id, entity)
+
+
+## Keep only the entities relevant to [param peer_id] from a sync batch.
+func filter_batch(peer_id: int, batch: Dictionary) -> Dictionary:
+	var relevant: Dictionary = _relevant.get(peer_id, {})
+	var result: Dictionary = {}
+	for entity_id in batch:
+		if relevant.has(entity_id):
+			result[entity_id] = batch[entity_id]
+	return result
+
+
+## Keep only the serialized entities relevant to [param peer_id].
+## [param entities] is an Array of SpawnManager.serialize_entity() dictionaries.
+func filter_serialized(peer_id: int, entities: Array) -> Array:
+	var relevant: Dictionary = _relevant.get(peer_id, {})
+	var result: Array = []
+	for entity_data in entities:
+		if relevant.has(entity_data.get("id", "")):
+			result.append(entity_data)
+	return result
+
+
+## A newly spawned entity: send it to the peers it is relevant to, and if it is a
+## peer's own entity, what it can now see to that peer.
+## Replaces the broadcast spawn RPC while a policy is installed.
+func on_entity_spawned(entity: Entity, data: Dictionary) -> void:
+	if _entities.has(entity.id):
+		_untrack(entity.id)
+	var gained := _track(entity)
+	for peer_id in _ns.net_adapter.get_connected_peers():
+		_recheck(peer_id, entity, data)
+	_recheck_cells(_owners[entity.id], gained)
+
+
+## A despawned entity: send the despawn only to peers that had it.
+## Replaces the broadcast despawn RPC while a policy is installed.
+func on_entity_despawned(entity_id: String, session_id: int) -> void:
+	if _entities.has(entity_id):
+		var owner: int = _owners[entity_id]
+		var lost := _untrack(entity_id)
+		_recheck_cells(owner, lost)
+	for peer_id in _relevant:
+		if _relevant[peer_id].has(entity_id):
+			_relevant[peer_id].erase(entity_id)
+			_ns._send_despawn_to_peer(peer_id, entity_id, session_id)
+
+
+## Late join: the relevant set of a new peer starts from the policy alone
+## (it owns no entities yet); returns the filtered world state to send.
+func world_state_for_peer(peer_id: int, state: Dictionary) -> Dictionary:
+	var now: Dictionary = {}
+	for entity_id in _entities:
+		if _is_relevant(peer_id, _entities[entity_id]):
+			now[entity_id] = true
+	_relevant[peer_id] = now
+	var filtered := state.duplicate()
+	filtered["entities"] = filter_serialized(peer_id, state.get("entities", []))
+	return filtered
+
+
+func forget_peer(peer_id: int) -> void:
+	_relevant.erase(peer_id)
+
+
+# ============================================================================
+# PRIVATE
+# ============================================================================
+
+
+## Networked entities already announced to peers (pending spawn broadcasts excluded).
+## Walks the whole world; only used when a policy is installed.
+func _networked_entities() -> Array:
+	var result: Array = []
+	for entity in _ns._world.entities:
+		if not is_instance_valid(entity):
+			continue
+		if _ns._broadcast_pending.has(entity.id):
+			continue
+		if entity.get_component(CN_NetworkIdentity) == null:
+			continue
+		result.append(entity)
+	return result
+
+
+## Start tracking [param entity]. Returns the cells its owner newly sees through it.
+func _track(entity: Entity) -> Array:
+	var net_id: CN_NetworkIdentity = entity.get_component(CN_NetworkIdentity)
+	var owner := net_id.peer_id if net_id else 0
+	var cell = policy.cell_of(entity)
+	_entities[entity.id] = entity
+	_cells[entity.id] = cell
+	_owners[entity.id] = owner
+	if cell != null:
+		if not _grid.has(cell):
+			_grid[cell] = {}
+		_grid[cell][entity.id] = entity
+	return _add_viewer(owner, cell, 1)
+
+
+## Stop tracking an entity. Returns the cells its owner no longer sees.
+func _untrack(entity_id: String) -> Array:
+	var cell = _cells[entity_id]
+	var owner: int = _owners[entity_id]
+	_entities.erase(entity_id)
+	_cells.erase(entity_id)
+	_owners.erase(entity_id)
+	if cell != null:
+		_grid[cell].erase(entity_id)
+		if _grid[cell].is_empty():
+			_grid.erase(cell)
+	return _add_viewer(owner, cell, -1)
+
+
+## [param entity] changed cell or owner: re-check it for every peer, then re-check the
+## cells its old and new owner stopped or started seeing through it.
+func _move(entity: Entity) -> void:
+	var old_owner: int = _owners[entity.id]
+	var lost := _untrack(entity.id)
+	var gained := _track(entity)
+	for peer_id in _ns.net_adapter.get_connected_peers():
+		_recheck(peer_id, entity)
+	_recheck_cells(old_owner, lost)
+	_recheck_cells(_owners[entity.id], gained)
+
+
+## Add (count 1) or remove (count -1) the cells seen from [param cell] as a viewer of
+## [param peer_id]. Returns the cells whose visibility for the peer changed.
+func _add_viewer(peer_id: int, cell: Variant, count: int) -> Array:
+	var changed: Array = []
+	if peer_id <= 0 or cell == null:
+		return changed
+	if not _seen.has(peer_id):
+		_seen[peer_id] = {}
+	var seen: Dictionary = _seen[peer_id]
+	for seen_cell in policy.cells_seen_from(cell):
+		var viewers: int = seen.get(seen_cell, 0) + count
+		if viewers > 0:
+			seen[seen_cell] = viewers
+		else:
+			seen.erase(seen_cell)
+		if viewers == 0 or (viewers == 1 and count > 0):
+			changed.append(seen_cell)
+	if seen.is_empty():
+		_seen.erase(peer_id)
+	return changed
+
+
+## Re-check every tracked entity in [param cells] for [param peer_id].
+func _recheck_cells(peer_id: int, cells: Array) -> void:
+	if not _relevant.has(peer_id):
+		return  # Not connected (or not joined yet)
+	for cell in cells:
+		for entity in _grid.get(cell, {}).values():
+			_recheck(peer_id, entity)
+
+
+## Compare the relevance of [param entity] for [param peer_id] with what the peer has
+## and spawn or despawn it on the peer accordingly.
+func _recheck(peer_id: int, entity: Entity, data: Dictionary = {}) -> void:
+	if not _relevant.has(peer_id):
+		_relevant[peer_id] = {}
+	var relevant: Dictionary = _relevant[peer_id]
+	var now := _is_relevant(peer_id, entity)
+	if now == relevant.has(entity.id):
+		return
+	if now:
+		relevant[entity.id] = true
+		if data.is_empty():
+			data = _ns._spawn_manager.serialize_entity(entity)
+		_ns._send_spawn_to_peer(peer_id, data)
+	else:
+		relevant.erase(entity.id)
+		_ns._send_despawn_to_peer(peer_id, entity.id, _ns._game_session_id)
+
+
+## Owned by the peer, or accepted by the policy and (when placed) in a cell one of the
+## peer's own entities sees.
+func _is_relevant(peer_id: int, entity: Entity) -> bool:
+	if _owners[entity.id] == peer_id:
+		return true
+	var cell = _cells[entity.id]
+	if cell != null and not _seen.get(peer_id, {}).has(cell):
+		return false
+	return policy.is_relevant(entity, peer_id)
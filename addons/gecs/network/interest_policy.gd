@@ -0,0 +1,37 @@
+class_name InterestPolicy
+extends RefCounted
+## InterestPolicy — decides which networked entities each peer receives.
+##
+## Install one with NetworkSync.set_interest_policy(). The server's InterestManager
+## only asks again when an entity's cell (cell_of()) or owner changes, so a policy
+## describes relevance in two parts:
+##   - cell_of()/cells_seen_from(): a spatial grid. A placed entity is only relevant to
+##     a peer when one of the peer's own entities sees its cell.
+##   - is_relevant(): any other per-entity rule, checked after the grid.
+## Entities owned by a peer are always relevant to that peer, whatever the policy returns.
+##
+## Subclass and override is_relevant() for simple per-entity rules, and cell_of()/
+## cells_seen_from() for spatial ones (see RadiusInterestPolicy). When is_relevant()
+## reads something other than the cell, call NetworkSync.refresh_interest() after it
+## changes.
+##
+## Built-in policies:
+##   RadiusInterestPolicy   — spatial grid + radius around the peer's own entities
+##   CallableInterestPolicy — wraps func(entity: Entity, peer_id: int) -> bool
+
+
+## Grid cell of [param entity], or null when it has no position (then the grid does not
+## limit its relevance). Called on spawn and once per interest update for synced entities.
+func cell_of(_entity: Entity) -> Variant:
+	return null
+
+
+## Cells seen by a peer's own entity in [param cell], its own cell included.
+func cells_seen_from(_cell: Variant) -> Array:
+	return []
+
+
+## Return true when [param entity] should be replicated to [param peer_id].
+## Called only when the grid allows it.
+func is_relevant(_entity: Entity, _peer_id: int) -> bool:
+	return true
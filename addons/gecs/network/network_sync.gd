@@ -57,8 +57,16 @@ var _receiver: SyncReceiver
 var _native_sync_handler: NativeSyncHandler
 var _relationship_handler  # SyncRelationshipHandler (untyped — no class_name)
 var _reconciliation_handler  # SyncReconciliationHandler (untyped — no class_name)
+var _interest_manager: InterestManager
 var _is_ready: bool = false
 
+# Packed encoding (gecs/network/sync/packed_encoding) — one SyncCodec per remote peer
+# and channel, so reliable and unreliable packets have separate sequence spaces
+var _packed_encoding: bool = false
+var _codecs: Dictionary = {}  # peer_id -> SyncCodec (unreliable channel)
+var _reliable_codecs: Dictionary = {}  # peer_id -> SyncCodec (reliable channel)
+var _quantize_hints: Dictionary = {}  # comp_type -> { prop: hint }, from CN_NetSync scans
+
 # ============================================================================
 # STATIC FACTORY METHOD
 # ============================================================================
@@ -105,6 +113,8 @@ func _ready() -> void:
 		"res://addons/gecs/network/sync_reconciliation_handler.gd"
 	)
 	_reconciliation_handler = SyncReconciliationHandlerScript.new(self)
+	_interest_manager = InterestManager.new(self)
+	_packed_encoding = ProjectSettings.get_setting(GECSNetworkSettings.PACKED_ENCODING, false)
 
 	_world.entity_added.connect(_on_entity_added)
 	_world.entity_removed.connect(_on_entity_removed)
@@ -131,6 +141,8 @@ func reset_for_new_game() -> void:
 	_game_session_id += 1  # Monotonic increment invalidates all in-flight RPCs
 	_broadcast_pending.clear()
 	_spawn_counter = 0
+	_codecs.clear()
+	_reliable_codecs.clear()
 	if _relationship_handler != null:
 		_relationship_handler.reset()
 
@@ -176,6 +188,35 @@ func broadcast_full_state() -> void:
 	_reconciliation_handler.broadcast_full_state()
 
 
+# ============================================================================
+# PUBLIC API — Interest Management
+# ============================================================================
+
+
+## Install a per-peer relevance policy (server). Each peer then only receives
+## spawns, property sync and reconciliation state for entities the policy deems
+## relevant to it; entities entering or leaving relevance are spawned/despawned
+## on that peer. Pass null to disable (every peer receives every entity).
+##
+## Example:
+##   ns.set_interest_policy(RadiusInterestPolicy.new(50.0))
+##   ns.set_interest_policy(CallableInterestPolicy.new(func(e, peer_id): return true))
+func set_interest_policy(policy: InterestPolicy, update_interval: float = 0.25) -> void:
+	if _interest_manager == null:
+		push_error("NetworkSync: set_interest_policy called before _ready()")
+		return
+	_interest_manager.set_policy(policy, update_interval)
+
+
+## Re-check [param entity]'s relevance for every peer now (server). Only needed after
+## a change the installed policy's is_relevant() reads that is not a position or
+## owner change, such as a team switch; those are picked up by the next update.
+func refresh_interest(entity: Entity) -> void:
+	if _interest_manager == null or not net_adapter.is_server():
+		return
+	_interest_manager.refresh(entity)
+
+
 # ============================================================================
 # PUBLIC API — Custom Sync Handlers (ADV-03)
 # ============================================================================
@@ -238,6 +279,9 @@ func _process(delta: float) -> void:
 	_sender.tick(delta)  # Phase 2: priority-tiered property sync
 	if _reconciliation_handler != null:
 		_reconciliation_handler.tick(delta)
+	if _packed_encoding:
+		_tick_codecs(delta)
+	_interest_manager.tick(delta)
 
 
 # ============================================================================
@@ -286,6 +330,8 @@ func _on_entity_added(entity: Entity) -> void:
 func _on_entity_removed(entity: Entity) -> void:
 	if not net_adapter.is_in_game():
 		return
+	for codec in _codecs.values() + _reliable_codecs.values():
+		codec.forget_entity(entity.id)
 	# Server-only: broadcast despawn to clients (mirrors _on_entity_added guard)
 	if net_adapter.is_server():
 		_spawn_manager.on_entity_removed(entity)
@@ -300,12 +346,17 @@ func _on_peer_connected(peer_id: int) -> void:
 	if not net_adapter.is_server() or _world == null:
 		return
 	var state = _spawn_manager.serialize_world_state()
+	if _interest_manager.is_enabled():
+		state = _interest_manager.world_state_for_peer(peer_id, state)
 	_sync_world_state.rpc_id(peer_id, state)
 	# Deferred so spawn RPC fires first, then synchronizers refresh for new peer
 	call_deferred("_deferred_refresh_visibility")
 
 
 func _on_peer_disconnected(peer_id: int) -> void:
+	_codecs.erase(peer_id)
+	_reliable_codecs.erase(peer_id)
+	_interest_manager.forget_peer(peer_id)
 	if not net_adapter.is_server() or _world == null:
 		return
 	_spawn_manager.on_peer_disconnected(peer_id)
@@ -342,13 +393,38 @@ func _deferred_broadcast(entity: Entity, entity_id: String) -> void:
 	if net_sync:
 		net_sync.scan_entity_components(entity)
 	var data = _spawn_manager.serialize_entity(entity)
-	_spawn_entity.rpc(data)
+	if _interest_manager.is_enabled():
+		_interest_manager.on_entity_spawned(entity, data)
+	else:
+		_spawn_entity.rpc(data)
 
 
 ## Called directly by SpawnManager.on_entity_removed to broadcast a despawn.
 ## Public so SpawnManager (a RefCounted) can call it via the _ns reference.
 func rpc_broadcast_despawn(entity_id: String, session_id: int) -> void:
-	_despawn_entity.rpc(entity_id, session_id)
+	if _interest_manager != null and _interest_manager.is_enabled():
+		_interest_manager.on_entity_despawned(entity_id, session_id)
+	else:
+		_despawn_entity.rpc(entity_id, session_id)
+
+
+## Spawn an entity on a single peer (interest management: entity became relevant).
+func _send_spawn_to_peer(peer_id: int, data: Dictionary) -> void:
+	_spawn_entity.rpc_id(peer_id, data)
+
+
+## Despawn an entity on a single peer (interest management: entity left relevance).
+func _send_despawn_to_peer(peer_id: int, entity_id: String, session_id: int) -> void:
+	_despawn_entity.rpc_id(peer_id, entity_id, session_id)
+	for codecs in [_codecs, _reliable_codecs]:
+		var codec: SyncCodec = codecs.get(peer_id)
+		if codec != null:
+			codec.forget_entity(entity_id)
+
+
+## Send reconciliation state to a single peer (interest management: filtered per peer).
+func _send_full_state_to_peer(peer_id: int, payload: Dictionary) -> void:
+	_sync_full_state.rpc_id(peer_id, payload)
 
 
 # ============================================================================
@@ -362,7 +438,14 @@ func rpc_broadcast_despawn(entity_id: String, session_id: int) -> void:
 ## Send an unreliable component sync batch.
 ## Server: broadcasts to all clients. Client: sends to server only.
 func _send_sync_unreliable(batch: Dictionary) -> void:
-	if net_adapter.is_server():
+	if _packed_encoding:
+		_send_packed(batch, false)
+	elif _filters_by_interest():
+		for peer_id in _sync_peers():
+			var peer_batch := _interest_manager.filter_batch(peer_id, batch)
+			if not peer_batch.is_empty():
+				_sync_components_unreliable.rpc_id(peer_id, peer_batch)
+	elif net_adapter.is_server():
 		_sync_components_unreliable.rpc(batch)
 	else:
 		_sync_components_unreliable.rpc_id(1, batch)
@@ -371,12 +454,93 @@ func _send_sync_unreliable(batch: Dictionary) -> void:
 ## Send a reliable component sync batch.
 ## Server: broadcasts to all clients. Client: sends to server only.
 func _send_sync_reliable(batch: Dictionary) -> void:
-	if net_adapter.is_server():
+	if _packed_encoding:
+		_send_packed(batch, true)
+	elif _filters_by_interest():
+		for peer_id in _sync_peers():
+			var peer_batch := _interest_manager.filter_batch(peer_id, batch)
+			if not peer_batch.is_empty():
+				_sync_components_reliable.rpc_id(peer_id, peer_batch)
+	elif net_adapter.is_server():
 		_sync_components_reliable.rpc(batch)
 	else:
 		_sync_components_reliable.rpc_id(1, batch)
 
 
+## Encode a batch once per destination peer with that peer's SyncCodec for the channel.
+## Codecs are per peer because each one tracks what its peer has acknowledged, and per
+## channel so a reliable packet is never dropped as older than an unreliable one.
+func _send_packed(batch: Dictionary, reliable: bool) -> void:
+	var hints := _quantize_hints_for(batch)
+	var filtered := _filters_by_interest()
+	for peer_id in _sync_peers():
+		var peer_batch := _interest_manager.filter_batch(peer_id, batch) if filtered else batch
+		if peer_batch.is_empty():
+			continue  # Pending resends are flushed by _tick_codecs
+		var bytes: PackedByteArray = _codec_for(peer_id, reliable).encode(peer_batch, hints)
+		if reliable:
+			_sync_components_packed_reliable.rpc_id(peer_id, bytes)
+		else:
+			_sync_components_packed_unreliable.rpc_id(peer_id, bytes)
+
+
+## Send pending acks, and flush unacknowledged values to peers that have not
+## been sent anything recently (a lost final update would otherwise stick).
+func _tick_codecs(delta: float) -> void:
+	for peer_id in _codecs.keys():
+		var codec: SyncCodec = _codecs[peer_id]
+		var ack := codec.take_ack()
+		if ack > 0:
+			_sync_ack.rpc_id(peer_id, ack)
+		if codec.needs_resend(delta):
+			_sync_components_packed_unreliable.rpc_id(peer_id, codec.encode({}, _quantize_hints))
+
+
+## True when outgoing sync batches are filtered per peer (server with an interest policy).
+func _filters_by_interest() -> bool:
+	return net_adapter.is_server() and _interest_manager.is_enabled()
+
+
+## Peers a sync batch goes to. Server: every connected client. Client: the server.
+func _sync_peers() -> Array:
+	if net_adapter.is_server():
+		return net_adapter.get_connected_peers()
+	return [1]
+
+
+## Return the SyncCodec for a remote peer and channel, creating it on first use.
+func _codec_for(peer_id: int, reliable: bool = false) -> SyncCodec:
+	var codecs: Dictionary = _reliable_codecs if reliable else _codecs
+	var codec: SyncCodec = codecs.get(peer_id)
+	if codec == null:
+		codec = SyncCodec.new(reliable)
+		codecs[peer_id] = codec
+	return codec
+
+
+## Collect CN_NetSync quantization hints for the component types in a batch.
+## Hints are per component type, so each type is looked up once per session.
+func _quantize_hints_for(batch: Dictionary) -> Dictionary:
+	for entity_id in batch:
+		var comps: Dictionary = batch[entity_id]
+		var known := true
+		for comp_type in comps:
+			if not _quantize_hints.has(comp_type):
+				known = false
+				break
+		if known:
+			continue
+		var entity: Entity = _world.entity_id_registry.get(entity_id)
+		var net_sync: CN_NetSync = entity.get_component(CN_NetSync) if entity else null
+		if net_sync == null:
+			continue
+		var entity_hints: Dictionary = net_sync.get_quantize_hints()
+		for comp_type in comps:
+			if not _quantize_hints.has(comp_type):
+				_quantize_hints[comp_type] = entity_hints.get(comp_type, {})
+	return _quantize_hints
+
+
 # ============================================================================
 # RPC DECLARATIONS — all @rpc methods must live on this Node (Godot requirement)
 # ============================================================================
@@ -416,6 +580,27 @@ func _sync_components_reliable(batch: Dictionary) -> void:
 	_receiver.handle_apply_sync_data(batch)
 
 
+@rpc("any_peer", "unreliable_ordered")
+func _sync_components_packed_unreliable(bytes: PackedByteArray) -> void:
+	if _receiver == null:
+		return
+	_receiver.handle_packed_sync_data(bytes)
+
+
+@rpc("any_peer", "reliable")
+func _sync_components_packed_reliable(bytes: PackedByteArray) -> void:
+	if _receiver == null:
+		return
+	_receiver.handle_packed_sync_data(bytes, true)
+
+
+@rpc("any_peer", "unreliable_ordered")
+func _sync_ack(seq: int) -> void:
+	var codec: SyncCodec = _codecs.get(net_adapter.get_remote_sender_id())
+	if codec != null:
+		codec.acknowledge(seq)
+
+
 @rpc("any_peer", "reliable")
 func _sync_relationship_add(payload: Dictionary) -> void:
 	if _relationship_handler == null:
@@ -0,0 +1,63 @@
+class_name RadiusInterestPolicy
+extends InterestPolicy
+## RadiusInterestPolicy — replicate entities within a radius of the peer's own entities.
+##
+## Viewers are the entities a peer owns (CN_NetworkIdentity.peer_id), typically its
+## player. Positions are bucketed into a uniform grid and relevance is decided per cell:
+## everything in a cell within [member radius] of a viewer's cell is relevant, which
+## includes every entity within [member radius] of the viewer. The interest manager
+## only re-checks entities that change cell, so a smaller [member cell_size] tightens
+## the area at the cost of more cells per viewer.
+##
+## Positions come from [member position_getter] when set, otherwise from the entity
+## node's global_position (Node3D or Node2D). Entities without a position (plain
+## Node entities such as game-state holders) are always relevant.
+##
+## Example:
+##   ns.set_interest_policy(RadiusInterestPolicy.new(50.0))
+
+## Replication radius in world units.
+var radius: float
+
+## Grid cell edge length. Defaults to the radius (27 cells seen per viewer in 3D).
+var cell_size: float
+
+## Optional func(entity: Entity) -> Variant returning a Vector2/Vector3, or null.
+var position_getter: Callable
+
+
+func _init(p_radius: float, p_cell_size: float = 0.0, p_position_getter := Callable()) -> void:
+	radius = p_radius
+	cell_size = p_cell_size if p_cell_size > 0.0 else maxf(p_radius, 0.001)
+	position_getter = p_position_getter
+
+
+func cell_of(entity: Entity) -> Variant:
+	var pos = _position_of(entity)
+	if pos == null:
+		return null
+	return Vector3i((pos / cell_size).floor())
+
+
+## Every cell within [member radius] of [param cell] on each axis.
+func cells_seen_from(cell: Variant) -> Array:
+	var result: Array = []
+	var reach := ceili(radius / cell_size)
+	for x in range(cell.x - reach, cell.x + reach + 1):
+		for y in range(cell.y - reach, cell.y + reach + 1):
+			for z in range(cell.z - reach, cell.z + reach + 1):
+				result.append(Vector3i(x, y, z))
+	return result
+
+
+func _position_of(entity: Entity) -> Variant:
+	var pos = (
+		position_getter.call(entity)
+		if position_getter.is_valid()
+		else entity.get("global_position")
+	)
+	if pos is Vector2:
+		return Vector3(pos.x, pos.y, 0.0)
+	if pos is Vector3:
+		return pos
+	return null
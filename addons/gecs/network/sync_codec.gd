@@ -0,0 +1,444 @@
+class_name SyncCodec
+extends RefCounted
+## SyncCodec — compact binary encoding of component sync batches for one remote peer.
+##
+## Used by NetworkSync when gecs/network/sync/packed_encoding is enabled. Each
+## remote peer gets its own codec, which holds both directions of the link:
+## the encoder state for packets we send to that peer and the decoder state for
+## packets it sends to us.
+##
+## Packet layout (all integers are LEB128 varints unless noted):
+##   u8 version | seq | def_count { id, utf8 name } |
+##   entity_count { entity_ref, comp_count { comp_ref, prop_count { prop_ref, value } } }
+##
+## Entity ids, component type names and property names are interned: the first
+## packet that uses a name carries an inline definition, and definitions stop
+## being sent once the peer acknowledged a packet that carried them.
+##
+## Delta baseline: the receiver acks the newest sequence it applied (see
+## take_ack()). Values the peer has not acknowledged yet are re-sent with the
+## next packet, so an unreliable channel converges without a reliable resend.
+## Values equal to the acknowledged baseline are dropped from the packet.
+##
+## Reliable and unreliable packets use separate codecs (separate sequence
+## spaces), so a reliable packet is never dropped as older than an unreliable
+## one. A reliable codec treats every packet as acknowledged once it is sent:
+## the channel delivers it, in order, before anything encoded later.
+##
+## Entity ids are recycled: forget_entity() frees an entity's interned id on
+## both ends, and the id is defined again by the next packet that reuses it.
+##
+## Batches keep the SyncSender wire shape on both ends:
+##   { entity_id: { comp_type: { prop: value } } }
+
+const VERSION := 1
+
+## Upper bound on unacknowledged values re-sent in a single packet.
+const MAX_RESEND := 256
+
+## Packets kept for acknowledgement; older ones are forgotten (their values
+## stay pending and are re-sent).
+const MAX_IN_FLIGHT := 64
+
+## Seconds without an outgoing packet before pending values are flushed on their own.
+const RESEND_INTERVAL := 0.1
+
+enum Tag {
+	FALSE = 0,
+	TRUE = 1,
+	INT = 2,  ## Zigzag varint
+	FLOAT = 3,  ## 32-bit, used when the value round-trips exactly
+	DOUBLE = 4,
+	HALF = 5,  ## 16-bit, CN_NetSync.QUANTIZE_HALF
+	VECTOR2 = 6,
+	VECTOR2_HALF = 7,
+	VECTOR3 = 8,
+	VECTOR3_HALF = 9,
+	VARIANT = 10,  ## var_to_bytes() fallback for every other type
+}
+
+# ============================================================================
+# ENCODER STATE — packets sent to the peer
+# ============================================================================
+
+var _reliable: bool = false
+var _next_seq: int = 1
+var _ids: Dictionary = {}  # name -> interned id
+var _names: Array[String] = []  # interned id - 1 -> name
+var _free_ids: Array[int] = []  # ids of forgotten entities, reused by _intern()
+var _peer_known: Dictionary = {}  # interned id -> true once the peer acked its definition
+var _defs_by_seq: Dictionary = {}  # seq -> Array of ids defined in that packet
+var _sent_by_seq: Dictionary = {}  # seq -> { Vector3i(entity, comp, prop): value }
+var _latest: Dictionary = {}  # Vector3i -> last value sent
+var _acked: Dictionary = {}  # Vector3i -> value in the newest acknowledged packet
+var _unacked: Dictionary = {}  # Vector3i -> true while _latest differs from _acked
+var _acked_seq: int = 0
+var _idle_time: float = 0.0
+
+# ============================================================================
+# DECODER STATE — packets received from the peer
+# ============================================================================
+
+var _remote_names: Dictionary = {}  # interned id -> name
+var _remote_ids: Dictionary = {}  # name -> interned id
+var _received_seq: int = 0
+var _ack_pending: bool = false
+
+var _f32 := PackedFloat32Array([0.0])
+var _half := PackedByteArray([0, 0])
+
+
+## [param reliable]: packets from this codec go over a reliable, ordered channel.
+func _init(reliable: bool = false) -> void:
+	_reliable = reliable
+
+# ============================================================================
+# ENCODING
+# ============================================================================
+
+
+## Encode a sync batch into a packet for this peer.
+## [param hints] maps comp_type -> { prop: quantize_hint } (see CN_NetSync.get_quantize_hints()).
+## The packet also carries every value the peer has not acknowledged yet.
+func encode(batch: Dictionary, hints: Dictionary = {}) -> PackedByteArray:
+	var seq := _next_seq
+	_next_seq += 1
+	_idle_time = 0.0
+
+	var sent: Dictionary = {}
+	var grouped: Dictionary = {}  # entity_ref -> { comp_ref -> { prop_ref: value } }
+	for entity_id in batch:
+		var entity_ref := _intern(entity_id)
+		var comps: Dictionary = batch[entity_id]
+		for comp_type in comps:
+			var comp_ref := _intern(comp_type)
+			var props: Dictionary = comps[comp_type]
+			for prop in props:
+				var key := Vector3i(entity_ref, comp_ref, _intern(prop))
+				var value = props[prop]
+				if not _unacked.has(key) and _acked.has(key) and _same(_acked[key], value):
+					continue  # Peer already holds this value
+				sent[key] = value
+
+	var resent := 0
+	for key in _unacked:
+		if resent >= MAX_RESEND:
+			break
+		if sent.has(key):
+			continue
+		sent[key] = _latest[key]
+		resent += 1
+
+	var defs: Dictionary = {}  # interned id -> true, definitions this packet carries
+	for key in sent:
+		_latest[key] = sent[key]
+		_unacked[key] = true
+		if not _peer_known.has(key.x):
+			defs[key.x] = true
+		if not _peer_known.has(key.y):
+			defs[key.y] = true
+		if not _peer_known.has(key.z):
+			defs[key.z] = true
+		if not grouped.has(key.x):
+			grouped[key.x] = {}
+		if not grouped[key.x].has(key.y):
+			grouped[key.x][key.y] = {}
+		grouped[key.x][key.y][key.z] = sent[key]
+
+	_sent_by_seq[seq] = sent
+	_defs_by_seq[seq] = defs.keys()
+	if _sent_by_seq.size() > MAX_IN_FLIGHT:
+		var oldest: int = _sent_by_seq.keys()[0]
+		_sent_by_seq.erase(oldest)
+		_defs_by_seq.erase(oldest)
+
+	var w := StreamPeerBuffer.new()
+	w.put_u8(VERSION)
+	_put_varint(w, seq)
+	_put_varint(w, defs.size())
+	for ref in defs:
+		_put_varint(w, ref)
+		var name_bytes: PackedByteArray = _name_of(ref).to_utf8_buffer()
+		_put_varint(w, name_bytes.size())
+		w.put_data(name_bytes)
+	_put_varint(w, grouped.size())
+	for entity_ref in grouped:
+		_put_varint(w, entity_ref)
+		var comps: Dictionary = grouped[entity_ref]
+		_put_varint(w, comps.size())
+		for comp_ref in comps:
+			_put_varint(w, comp_ref)
+			var comp_hints: Dictionary = hints.get(_name_of(comp_ref), {})
+			var props: Dictionary = comps[comp_ref]
+			_put_varint(w, props.size())
+			for prop_ref in props:
+				_put_varint(w, prop_ref)
+				_put_value(w, props[prop_ref], comp_hints.get(_name_of(prop_ref), ""))
+	if _reliable:
+		acknowledge(seq)  # Delivered before any later packet
+	return w.data_array
+
+
+## Apply an acknowledgement from the peer: [param seq] is the newest packet it applied.
+## That packet's values become the delta baseline and its definitions are known.
+func acknowledge(seq: int) -> void:
+	if seq <= _acked_seq:
+		return
+	_acked_seq = seq
+	for s in _sent_by_seq.keys():
+		if s > seq:
+			break
+		if s == seq:
+			var sent: Dictionary = _sent_by_seq[s]
+			for key in sent:
+				_acked[key] = sent[key]
+				if _unacked.has(key) and _same(_latest[key], sent[key]):
+					_unacked.erase(key)
+			for ref in _defs_by_seq[s]:
+				_peer_known[ref] = true
+		_sent_by_seq.erase(s)
+		_defs_by_seq.erase(s)
+
+
+## True when values are pending and nothing was sent for RESEND_INTERVAL seconds.
+## NetworkSync then sends an empty batch, which carries the pending values.
+func needs_resend(delta: float) -> bool:
+	_idle_time += delta
+	return not _unacked.is_empty() and _idle_time >= RESEND_INTERVAL
+
+
+## Drop baseline, pending values and interned ids for a despawned entity.
+## The freed id is reused (and defined again) for the next new entity.
+func forget_entity(entity_id: String) -> void:
+	var remote_ref = _remote_ids.get(entity_id)
+	if remote_ref != null:
+		_remote_ids.erase(entity_id)
+		_remote_names.erase(remote_ref)
+
+	if not _ids.has(entity_id):
+		return
+	var entity_ref: int = _ids[entity_id]
+	for key in _latest.keys():
+		if key.x == entity_ref:
+			_latest.erase(key)
+			_acked.erase(key)
+			_unacked.erase(key)
+	# In-flight packets must not ack old values or the old definition into the reused id
+	for seq in _sent_by_seq:
+		var sent: Dictionary = _sent_by_seq[seq]
+		for key in sent.keys():
+			if key.x == entity_ref:
+				sent.erase(key)
+		_defs_by_seq[seq].erase(entity_ref)
+	_ids.erase(entity_id)
+	_peer_known.erase(entity_ref)
+	_names[entity_ref - 1] = ""
+	_free_ids.append(entity_ref)
+
+
+# ============================================================================
+# DECODING
+# ============================================================================
+
+
+## Decode a packet from the peer back into a batch.
+## Returns null for packets that are stale (older than one already applied)
+## or malformed.
+func decode(bytes: PackedByteArray) -> Variant:
+	var r := StreamPeerBuffer.new()
+	r.data_array = bytes
+	if bytes.is_empty() or r.get_u8() != VERSION:
+		return null
+	var seq := _get_varint(r)
+
+	if seq <= _received_seq:
+		return null  # Out of order — a newer packet already carried these values
+
+	var def_count := _get_varint(r)
+	if def_count > r.get_available_bytes():
+		return null
+	for i in def_count:
+		var ref := _get_varint(r)
+		var size := _get_varint(r)
+		if size > r.get_available_bytes():
+			return null
+		var text := r.get_data(size)[1].get_string_from_utf8()
+		# A recycled id replaces the name it had before
+		var previous = _remote_names.get(ref)
+		if previous != null and _remote_ids.get(previous) == ref:
+			_remote_ids.erase(previous)
+		_remote_names[ref] = text
+		_remote_ids[text] = ref
+
+	var batch: Dictionary = {}
+	var entity_count := _get_varint(r)
+	if entity_count > r.get_available_bytes():
+		return null
+	for i in entity_count:
+		var entity_id = _remote_names.get(_get_varint(r))
+		var comps: Dictionary = {}
+		var comp_count := _get_varint(r)
+		if comp_count > r.get_available_bytes():
+			return null
+		for j in comp_count:
+			var comp_type = _remote_names.get(_get_varint(r))
+			var props: Dictionary = {}
+			var prop_count := _get_varint(r)
+			if prop_count > r.get_available_bytes():
+				return null
+			for k in prop_count:
+				var prop = _remote_names.get(_get_varint(r))
+				if prop == null:
+					return null
+				props[prop] = _get_value(r)
+			if comp_type == null:
+				return null
+			comps[comp_type] = props
+		if entity_id == null:
+			continue  # Entity this end already forgot (despawned); its values are moot
+		batch[entity_id] = comps
+
+	_received_seq = seq
+	_ack_pending = true
+	return batch
+
+
+## Sequence number to acknowledge to the peer, or 0 when nothing new arrived
+## since the last call.
+func take_ack() -> int:
+	if not _ack_pending:
+		return 0
+	_ack_pending = false
+	return _received_seq
+
+
+# ============================================================================
+# INTERNAL HELPERS
+# ============================================================================
+
+
+func _intern(text: String) -> int:
+	var ref = _ids.get(text)
+	if ref == null:
+		if _free_ids.is_empty():
+			_names.append(text)
+			ref = _names.size()
+		else:
+			ref = _free_ids.pop_back()
+			_names[ref - 1] = text
+		_ids[text] = ref
+	return ref
+
+
+func _name_of(ref: int) -> String:
+	return _names[ref - 1]
+
+
+func _same(a: Variant, b: Variant) -> bool:
+	return typeof(a) == typeof(b) and a == b
+
+
+func _put_varint(w: StreamPeerBuffer, value: int) -> void:
+	while value < 0 or value >= 0x80:
+		w.put_u8((value & 0x7F) | 0x80)
+		value = (value >> 7) & 0x01FFFFFFFFFFFFFF  # Logical shift
+	w.put_u8(value)
+
+
+func _get_varint(r: StreamPeerBuffer) -> int:
+	var value := 0
+	var shift := 0
+	while shift < 64 and r.get_available_bytes() > 0:
+		var byte := r.get_u8()
+		value |= (byte & 0x7F) << shift
+		if byte < 0x80:
+			break
+		shift += 7
+	return value
+
+
+func _put_half(w: StreamPeerBuffer, value: float) -> void:
+	_half.encode_half(0, value)
+	w.put_data(_half)
+
+
+func _get_half(r: StreamPeerBuffer) -> float:
+	return r.get_data(2)[1].decode_half(0)
+
+
+func _put_value(w: StreamPeerBuffer, value: Variant, hint: String) -> void:
+	var half := hint == CN_NetSync.QUANTIZE_HALF
+	match typeof(value):
+		TYPE_BOOL:
+			w.put_u8(Tag.TRUE if value else Tag.FALSE)
+		TYPE_INT:
+			w.put_u8(Tag.INT)
+			_put_varint(w, (value << 1) ^ (value >> 63))
+		TYPE_FLOAT:
+			_f32[0] = value
+			if half:
+				w.put_u8(Tag.HALF)
+				_put_half(w, value)
+			elif _f32[0] == value:
+				w.put_u8(Tag.FLOAT)
+				w.put_float(value)
+			else:
+				w.put_u8(Tag.DOUBLE)
+				w.put_double(value)
+		TYPE_VECTOR2:
+			if half:
+				w.put_u8(Tag.VECTOR2_HALF)
+				_put_half(w, value.x)
+				_put_half(w, value.y)
+			else:
+				w.put_u8(Tag.VECTOR2)
+				w.put_float(value.x)
+				w.put_float(value.y)
+		TYPE_VECTOR3:
+			if half:
+				w.put_u8(Tag.VECTOR3_HALF)
+				_put_half(w, value.x)
+				_put_half(w, value.y)
+				_put_half(w, value.z)
+			else:
+				w.put_u8(Tag.VECTOR3)
+				w.put_float(value.x)
+				w.put_float(value.y)
+				w.put_float(value.z)
+		_:
+			var bytes := var_to_bytes(value)
+			w.put_u8(Tag.VARIANT)
+			_put_varint(w, bytes.size())
+			w.put_data(bytes)
+
+
+# gdlint: disable=max-returns
+func _get_value(r: StreamPeerBuffer) -> Variant:
+	match r.get_u8():
+		Tag.FALSE:
+			return false
+		Tag.TRUE:
+			return true
+		Tag.INT:
+			var zigzag := _get_varint(r)
+			return ((zigzag >> 1) & 0x7FFFFFFFFFFFFFFF) ^ -(zigzag & 1)
+		Tag.FLOAT:
+			return r.get_float()
+		Tag.DOUBLE:
+			return r.get_double()
+		Tag.HALF:
+			return _get_half(r)
+		Tag.VECTOR2:
+			return Vector2(r.get_float(), r.get_float())
+		Tag.VECTOR2_HALF:
+			return Vector2(_get_half(r), _get_half(r))
+		Tag.VECTOR3:
+			return Vector3(r.get_float(), r.get_float(), r.get_float())
+		Tag.VECTOR3_HALF:
+			return Vector3(_get_half(r), _get_half(r), _get_half(r))
+		Tag.VARIANT:
+			var size := _get_varint(r)
+			if size > r.get_available_bytes():
+				return null
+			return bytes_to_var(r.get_data(size)[1])
+	return null
@@ -58,6 +58,21 @@ func handle_apply_sync_data(batch: Dictionary) -> void:
 		_handle_client_path(batch, sender_id)
 
 
+## Entry point for packed batches (gecs/network/sync/packed_encoding).
+## Decodes with the sender's SyncCodec for the channel ([param reliable]), then applies
+## the same authority rules. Stale (out-of-order) and malformed packets are dropped.
+func handle_packed_sync_data(bytes: PackedByteArray, reliable: bool = false) -> void:
+	var sender_id: int = _ns.net_adapter.get_remote_sender_id()
+	var batch = _ns._codec_for(sender_id, reliable).decode(bytes)
+	if batch == null:
+		return
+
+	if _ns.net_adapter.is_server():
+		_handle_server_path(batch, sender_id)
+	else:
+		_handle_client_path(batch, sender_id)
+
+
 # ============================================================================
 # PRIVATE — SERVER PATH
 # ============================================================================
@@ -63,6 +63,17 @@ func broadcast_full_state() -> void:
 	if full_state.is_empty():
 		return
 
+	var interest = _ns.get("_interest_manager")
+	if interest != null and interest.is_enabled():
+		# Per-peer state: a peer only keeps what is relevant to it (ghost removal
+		# on the client drops the rest, matching the interest despawns)
+		for peer_id in _ns.net_adapter.get_connected_peers():
+			var peer_state: Array = interest.filter_serialized(peer_id, full_state)
+			_ns._send_full_state_to_peer(
+				peer_id, {"entities": peer_state, "session_id": _ns._game_session_id}
+			)
+		return
+
 	var payload := {"entities": full_state, "session_id": _ns._game_session_id}
 	_ns.rpc("_sync_full_state", payload)
 
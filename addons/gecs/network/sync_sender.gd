@@ -2,9 +2,13 @@ class_name SyncSender
 extends RefCounted
 ## SyncSender — timer-accumulator driven, priority-tiered batch RPC dispatcher.
 ##
-## Delegates from NetworkSync. Iterates world entities each tick, detects
+## Delegates from NetworkSync. Keeps an index of networked entities
+## (CN_NetworkIdentity + CN_NetSync) from world entity/component signals, detects
 ## property changes via CN_NetSync, and dispatches batched RPCs at the correct
-## frequency for each priority tier.
+## frequency for each priority tier. Entities whose CN_NetSync reports nothing
+## dirty or polled for a tier are skipped without a dirty-check. Every
+## FULL_POLL_EVERY flushes of a tier compare every prop, so writes that never emit
+## property_changed (epsilon-gated setters) still reach peers.
 ##
 ## Priority Hz (default, overridden by ProjectSettings):
 ##   REALTIME: every frame (0.0 interval)
@@ -12,6 +16,9 @@ extends RefCounted
 ##   MEDIUM:   10 Hz  (0.10 s)
 ##   LOW:       2 Hz  (0.50 s)
 
+## Every Nth flush of a priority compares all props, push-tracked ones included
+const FULL_POLL_EVERY := 10
+
 var _ns  # NetworkSync reference (untyped to avoid circular deps)
 
 ## Timer accumulators (seconds since last dispatch) per priority.
@@ -30,11 +37,24 @@ var _pending: Dictionary = {
 	CN_NetSync.Priority.LOW: {},
 }
 
+## Flushes per priority since the last full poll
+var _flushes_since_full_poll: Dictionary = {
+	CN_NetSync.Priority.REALTIME: 0,
+	CN_NetSync.Priority.HIGH: 0,
+	CN_NetSync.Priority.MEDIUM: 0,
+	CN_NetSync.Priority.LOW: 0,
+}
+
 ## Custom send handlers: { "CompTypeName": Callable }
 ## Callable signature: func(entity: Entity, comp: Component, priority: int) -> Dictionary
 ## Return {} to suppress, null to use default dirty-check.
 var _custom_send_handlers: Dictionary = {}
 
+## Networked entity index: { Entity: CN_NetSync }. Built lazily from the world,
+## then maintained by world signals (see _ensure_index()).
+var _synced: Dictionary = {}
+var _indexed_world: World = null
+
 
 func _init(network_sync) -> void:
 	_ns = network_sync
@@ -61,9 +81,6 @@ func tick(delta: float) -> void:
 
 	_flush_due_priorities()
 
-	# TODO: consider entity index cache if profiling shows O(N) iteration
-	# is bottleneck at 100+ entities
-
 
 ## Register a custom send handler for a component type.
 ## The handler is called instead of the default dirty-check for the named component type.
@@ -130,26 +147,30 @@ func _get_interval(priority: int) -> float:
 
 
 func _poll_entities_for_priority(priority: int) -> void:
-	for entity in _ns._world.entities:
+	_ensure_index()
+	_flushes_since_full_poll[priority] += 1
+	var full_poll: bool = _flushes_since_full_poll[priority] >= FULL_POLL_EVERY
+	if full_poll:
+		_flushes_since_full_poll[priority] = 0
+	# Custom handlers may send data without a detected change, so they see every entity
+	var visit_all: bool = full_poll or not _custom_send_handlers.is_empty()
+	for entity in _synced.keys():
 		if not is_instance_valid(entity):
+			_synced.erase(entity)
 			continue
 
-		var net_id: CN_NetworkIdentity = entity.get_component(CN_NetworkIdentity)
-		if net_id == null:
-			continue  # Non-networked entity
-
-		# Spawn-only: entities without CN_NetSync are not continuously synced
-		var net_sync: CN_NetSync = entity.get_component(CN_NetSync)
-		if net_sync == null:
-			continue
+		var net_sync: CN_NetSync = _synced[entity]
+		if not visit_all and not net_sync.has_changes_for_priority(priority):
+			continue  # Nothing dirty and nothing polled at this tier
 
+		var net_id: CN_NetworkIdentity = entity.get_component(CN_NetworkIdentity)
 		if not _should_broadcast(entity, net_id):
 			continue
 
 		# Determine component changes.
 		# Compute default dirty-check once (advances internal cache), then apply
 		# custom handler overrides: null = keep default, {} = suppress, dict = replace.
-		var changes: Dictionary = net_sync.check_changes_for_priority(priority)
+		var changes: Dictionary = net_sync.check_changes_for_priority(priority, full_poll)
 		if not _custom_send_handlers.is_empty():
 			for inst_id in net_sync._comp_refs.keys():
 				var comp = net_sync._comp_refs[inst_id]
@@ -178,6 +199,61 @@ func _poll_entities_for_priority(priority: int) -> void:
 				_pending[priority][entity.id][comp_type][prop_name] = changes[comp_type][prop_name]
 
 
+# ============================================================================
+# PRIVATE — NETWORKED ENTITY INDEX
+# ============================================================================
+
+
+## Build the index from the current world on first use (or after the world
+## changed) and subscribe to the world signals that keep it current.
+## Only entities with both CN_NetworkIdentity and CN_NetSync are indexed;
+## spawn-only entities (no CN_NetSync) are not continuously synced.
+func _ensure_index() -> void:
+	var world: World = _ns._world
+	if world == _indexed_world:
+		return
+	if is_instance_valid(_indexed_world):
+		_indexed_world.entity_added.disconnect(_index_entity)
+		_indexed_world.entity_removed.disconnect(_on_entity_removed)
+		_indexed_world.component_added.disconnect(_on_component_added)
+		_indexed_world.component_removed.disconnect(_on_component_removed)
+	_synced.clear()
+	_indexed_world = world
+	if world == null:
+		return
+	world.entity_added.connect(_index_entity)
+	world.entity_removed.connect(_on_entity_removed)
+	world.component_added.connect(_on_component_added)
+	world.component_removed.connect(_on_component_removed)
+	for entity in world.entities:
+		_index_entity(entity)
+
+
+func _index_entity(entity: Entity) -> void:
+	if not is_instance_valid(entity):
+		return
+	var net_sync: CN_NetSync = entity.get_component(CN_NetSync)
+	if net_sync != null and entity.get_component(CN_NetworkIdentity) != null:
+		_synced[entity] = net_sync
+	else:
+		_synced.erase(entity)
+
+
+func _on_entity_removed(entity: Entity) -> void:
+	_synced.erase(entity)
+
+
+func _on_component_added(entity: Entity, component: Variant) -> void:
+	if component is CN_NetSync or component is CN_NetworkIdentity:
+		_index_entity(entity)
+
+
+func _on_component_removed(entity: Entity, component: Variant) -> void:
+	# Erase rather than re-index: the component may still be attached while this fires
+	if component is CN_NetSync or component is CN_NetworkIdentity:
+		_synced.erase(entity)
+
+
 func _should_broadcast(_entity: Entity, net_id: CN_NetworkIdentity) -> bool:
 	# Server broadcasts all entities' changes
 	if _ns.net_adapter.is_server():
@@ -76,6 +76,7 @@ func add_gecs_network_project_settings():
 	add_project_setting("gecs/network/sync/medium_hz", 10, TYPE_INT)
 	add_project_setting("gecs/network/sync/low_hz", 2, TYPE_INT)
 	add_project_setting("gecs/network/sync/reconciliation_interval", 30.0, TYPE_FLOAT)
+	add_project_setting("gecs/network/sync/packed_encoding", false, TYPE_BOOL)
 
 
 ## Removes GECS related ProjectSettings from Godot.
@@ -0,0 +1,24 @@
+## Test component with packed fields (position, speed) and one non-packed field
+class_name C_PackedMotion
+extends Component
+
+@export var position: Vector3 = Vector3.ZERO:
+	set(value):
+		var old = position
+		position = value
+		property_changed.emit(self, "position", old, value)
+@export var speed: float = 0.0:
+	set(value):
+		var old = speed
+		speed = value
+		property_changed.emit(self, "speed", old, value)
+@export var label: String = ""
+
+
+func _init(_position: Vector3 = Vector3.ZERO, _speed: float = 0.0):
+	position = _position
+	speed = _speed
+
+
+func packed_fields() -> Array:
+	return [&"position", &"speed"]
@@ -0,0 +1,17 @@
+## Test component with a packed velocity field
+class_name C_PackedVelocity
+extends Component
+
+@export var velocity: Vector3 = Vector3.ZERO:
+	set(value):
+		var old = velocity
+		velocity = value
+		property_changed.emit(self, "velocity", old, value)
+
+
+func _init(_velocity: Vector3 = Vector3.ZERO):
+	velocity = _velocity
+
+
+func packed_fields() -> Array:
+	return [&"velocity"]
@@ -292,3 +292,59 @@ func test_issue87_batch_disable_entities_enabled_query():
 	assert_int(disabled_result.size()).is_equal(2)
 	assert_bool(disabled_result.has(e1)).is_true()
 	assert_bool(disabled_result.has(e3)).is_true()
+
+
+## CACHE-05: Creating a new archetype patches it into cached queries that match it
+## instead of wiping the archetype cache, so the next query is a hit, not a rescan.
+func test_cache05_new_archetype_added_to_cached_queries():
+	var e_a = Entity.new()
+	e_a.add_component(C_TestA.new())
+	world.add_entity(e_a)
+
+	# Prime the archetype cache for both queries
+	assert_int(world.query.with_all([C_TestA]).execute().size()).is_equal(1)
+	assert_int(world.query.with_all([C_TestB]).execute().size()).is_equal(0)
+	var before = world.get_cache_stats()
+
+	# New archetype A+B: matches both cached queries
+	var e_ab = Entity.new()
+	e_ab.add_component(C_TestA.new())
+	e_ab.add_component(C_TestB.new())
+	world.add_entity(e_ab)
+
+	var with_a = world.query.with_all([C_TestA]).execute()
+	var with_b = world.query.with_all([C_TestB]).execute()
+	var after = world.get_cache_stats()
+
+	assert_int(with_a.size()).is_equal(2)
+	assert_array(with_b).contains_exactly([e_ab])
+	assert_int(after.cache_misses).is_equal(before.cache_misses)
+	assert_int(after.archetype_adds - before.archetype_adds).is_equal(2)
+
+
+## CACHE-05: Deleting an (empty) archetype removes it from cached queries, and arrays
+## previously handed out by get_matching_archetypes() are not mutated in place.
+func test_cache05_deleted_archetype_removed_from_cached_queries():
+	var e_a = Entity.new()
+	e_a.add_component(C_TestA.new())
+	world.add_entity(e_a)
+	var e_ab = Entity.new()
+	e_ab.add_component(C_TestA.new())
+	e_ab.add_component(C_TestB.new())
+	world.add_entity(e_ab)
+
+	var held = world.get_matching_archetypes(world.query.with_all([C_TestA]))
+	assert_int(held.size()).is_equal(2)
+	var before = world.get_cache_stats()
+
+	# Removing the only A+B entity deletes its archetype
+	world.remove_entity(e_ab)
+
+	var current = world.get_matching_archetypes(world.query.with_all([C_TestA]))
+	var after = world.get_cache_stats()
+
+	assert_int(current.size()).is_equal(1)
+	assert_int(held.size()).is_equal(2)
+	assert_int(after.cache_misses).is_equal(before.cache_misses)
+	assert_int(after.archetype_removes - before.archetype_removes).is_equal(1)
+	assert_array(world.query.with_all([C_TestB]).execute()).is_empty()
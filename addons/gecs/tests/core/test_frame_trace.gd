@@ -0,0 +1,120 @@
+## Tests for FrameTrace and World.start_trace
+## Tests verify: ring buffer wraparound, name interning, system/frame/command flush/query
+## events recorded by World.process and the Chrome trace-event export.
+extends GdUnitTestSuite
+
+const TRACE_PATH := "res://reports/test_frame_trace.json"
+
+var runner: GdUnitSceneRunner
+var world: World
+
+
+func before():
+	runner = scene_runner("res://addons/gecs/tests/test_scene.tscn")
+	world = runner.get_property("world")
+	ECS.world = world
+
+
+func after_test():
+	world.stop_trace()
+	world.purge(false)
+
+
+func _events_of(trace: FrameTrace, kind: FrameTrace.Kind) -> Array:
+	return trace.get_events().filter(func(e): return e.kind == kind)
+
+
+func test_ring_buffer_keeps_newest_events():
+	var trace = FrameTrace.new(4)
+	for i in 6:
+		trace.record(FrameTrace.Kind.SYSTEM, trace.intern("event_%d" % i), i * 10, 5)
+
+	var events = trace.get_events()
+	assert_int(trace.size()).is_equal(4)
+	assert_int(trace.get_dropped()).is_equal(2)
+	assert_array(events.map(func(e): return e.name)).contains_exactly(
+		["event_2", "event_3", "event_4", "event_5"]
+	)
+	assert_int(events[0].start_usec).is_equal(20)
+
+	trace.clear()
+	assert_array(trace.get_events()).is_empty()
+
+
+func test_intern_reuses_ids():
+	var trace = FrameTrace.new()
+	var id = trace.intern("S_Move")
+	assert_int(trace.intern("S_Move")).is_equal(id)
+	assert_int(trace.intern("S_Other")).is_not_equal(id)
+	var calls := [0]  # Lambdas capture locals by value
+	var make_label = func():
+		calls[0] += 1
+		return "S_Move"
+	assert_int(trace.name_id(FrameTrace.Kind.SYSTEM, 7, make_label)).is_equal(id)
+	assert_int(trace.name_id(FrameTrace.Kind.SYSTEM, 7, make_label)).is_equal(id)
+	assert_int(calls[0]).is_equal(1)
+
+
+func test_process_records_systems_frames_and_flushes():
+	for i in 5:
+		world.add_entity(Entity.new(), [C_TestA.new()])
+	var tagger = ConcurrentTestSystem.new([C_TestA])
+	tagger.add_on_process = C_TestB
+	world.add_system(tagger)
+	var trace = world.start_trace()
+
+	world.process(0.016)
+
+	var systems = _events_of(trace, FrameTrace.Kind.SYSTEM)
+	assert_int(systems.size()).is_equal(1)
+	assert_str(systems[0].name).is_equal("s_concurrent_test")
+	assert_int(systems[0].entities).is_equal(5)
+	var flushes = _events_of(trace, FrameTrace.Kind.COMMAND_FLUSH)
+	assert_int(flushes.size()).is_equal(1)
+	assert_int(flushes[0].entities).is_equal(5)
+	var frames = _events_of(trace, FrameTrace.Kind.FRAME)
+	assert_int(frames.size()).is_equal(1)
+	# The frame event encloses the system event
+	assert_int(frames[0].start_usec).is_less_equal(systems[0].start_usec)
+	assert_int(frames[0].duration_usec).is_greater_equal(systems[0].duration_usec)
+
+
+func test_queries_only_recorded_inside_traced_frames():
+	world.add_entity(Entity.new(), [C_TestA.new()])
+	var trace = world.start_trace()
+
+	world.query.with_all([C_TestA]).execute()
+	assert_array(_events_of(trace, FrameTrace.Kind.QUERY)).is_empty()
+
+	world._tracing = true
+	world.query.with_all([C_TestA]).execute()
+	world._tracing = false
+	var queries = _events_of(trace, FrameTrace.Kind.QUERY)
+	assert_int(queries.size()).is_equal(1)
+	assert_int(queries[0].entities).is_equal(1)
+
+
+func test_stop_trace_stops_recording():
+	world.add_system(ConcurrentTestSystem.new([C_TestA]))
+	var trace = world.start_trace()
+	assert_object(world.stop_trace()).is_same(trace)
+
+	world.process(0.016)
+
+	assert_int(trace.size()).is_equal(0)
+	assert_object(world.stop_trace()).is_null()
+
+
+func test_chrome_trace_export():
+	var trace = FrameTrace.new()
+	trace.record(FrameTrace.Kind.OBSERVER, trace.intern("O_Health"), 100, 25, 1)
+
+	assert_int(trace.save_chrome_trace(TRACE_PATH)).is_equal(OK)
+	var data = JSON.parse_string(FileAccess.get_file_as_string(TRACE_PATH))
+	var events = data["traceEvents"].filter(func(e): return e["ph"] == "X")
+	assert_int(events.size()).is_equal(1)
+	assert_str(events[0]["name"]).is_equal("O_Health")
+	assert_str(events[0]["cat"]).is_equal("observer")
+	assert_float(events[0]["ts"]).is_equal(100.0)
+	assert_float(events[0]["dur"]).is_equal(25.0)
+	assert_float(events[0]["args"]["entities"]).is_equal(1.0)
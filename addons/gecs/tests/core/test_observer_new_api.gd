@@ -702,3 +702,62 @@ func test_observer_removed_during_own_callback_is_safe():
 	# second event was not delivered to the old observer.
 	if is_instance_valid(obs):
 		assert_int(obs.added_count).is_equal(1)
+
+
+func test_observer_added_after_first_dispatch_receives_later_events():
+	# The first ADDED event compiles the C_TestA dispatch table; registering another
+	# observer afterwards must rebuild it so the newcomer is reached.
+	var first = AddedObserver.new()
+	world.add_observer(first)
+	var e1 = Entity.new()
+	e1.add_component(C_TestA.new())
+	world.add_entity(e1)
+
+	var second = AddedObserver.new()
+	world.add_observer(second)
+	var e2 = Entity.new()
+	e2.add_component(C_TestA.new())
+	world.add_entity(e2)
+
+	assert_int(first.added_count).is_equal(2)
+	assert_int(second.added_count).is_equal(1)
+
+	world.remove_observer(first)
+	var e3 = Entity.new()
+	e3.add_component(C_TestA.new())
+	world.add_entity(e3)
+	assert_int(second.added_count).is_equal(2)
+
+
+class ExcludedChangeObserver:
+	extends Observer
+	var changed_count: int = 0
+
+	func query() -> QueryBuilder:
+		return q.with_all([C_ObserverHealth]).with_none([C_TestB]).on_changed()
+
+	func each(event: Variant, _entity: Entity, _payload: Variant = null) -> void:
+		if event == Observer.Event.CHANGED:
+			changed_count += 1
+
+
+func test_memoized_entity_filter_follows_archetype_moves():
+	var obs = ExcludedChangeObserver.new()
+	world.add_observer(obs)
+
+	var e = Entity.new()
+	world.add_entity(e, [C_ObserverHealth.new(100, 100)])
+	var health = e.get_component(C_ObserverHealth)
+
+	health.health = 90
+	assert_int(obs.changed_count).is_equal(1)
+
+	# Entity moves to an archetype the query excludes
+	e.add_component(C_TestB.new())
+	health.health = 80
+	assert_int(obs.changed_count).is_equal(1)
+
+	# ...and back to one it matches again
+	e.remove_component(C_TestB)
+	health.health = 70
+	assert_int(obs.changed_count).is_equal(2)
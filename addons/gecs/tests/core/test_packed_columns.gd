@@ -0,0 +1,214 @@
+extends GdUnitTestSuite
+## Test packed numeric column storage (Component.packed_fields / QueryBuilder.packed)
+
+var runner: GdUnitSceneRunner
+var world: World
+
+
+func before():
+	runner = scene_runner("res://addons/gecs/tests/test_scene.tscn")
+	world = runner.get_property("world")
+	ECS.world = world
+
+
+func after_test():
+	if world:
+		world.purge(false)
+
+
+## Packed mover over enabled entities only: the system gets gathered copies, not live columns
+class EnabledPackedMotionSystem:
+	extends PackedMotionTestSystem
+
+	func query() -> QueryBuilder:
+		var comps = [C_PackedMotion, C_PackedVelocity, C_TestA]
+		return ECS.world.query.with_all(comps).enabled().iterate(comps).packed([C_PackedMotion])
+
+
+func _motion_column(entity: Entity) -> Dictionary:
+	var archetype: Archetype = world.entity_to_archetype[entity]
+	return archetype.get_packed_column(C_PackedMotion.get_instance_id())
+
+
+func test_archetype_packs_declared_fields_on_add():
+	var entity = Entity.new()
+	world.add_entity(entity, [C_PackedMotion.new(Vector3(1, 2, 3), 4.5)])
+
+	var fields = _motion_column(entity)
+	assert_array(fields.keys()).contains_exactly_in_any_order([&"position", &"speed"])
+	assert_int(typeof(fields.position)).is_equal(TYPE_PACKED_VECTOR3_ARRAY)
+	assert_int(typeof(fields.speed)).is_equal(TYPE_PACKED_FLOAT64_ARRAY)
+	assert_vector(fields.position[0]).is_equal(Vector3(1, 2, 3))
+	assert_float(fields.speed[0]).is_equal(4.5)
+
+
+func test_non_packable_component_has_no_packed_column():
+	var entity = Entity.new()
+	world.add_entity(entity, [C_TestA.new(3)])
+
+	var archetype: Archetype = world.entity_to_archetype[entity]
+	assert_bool(archetype.get_packed_column(C_TestA.get_instance_id()).is_empty()).is_true()
+
+
+func test_swap_remove_keeps_packed_rows_aligned():
+	var entities = []
+	for i in 4:
+		var entity = Entity.new()
+		world.add_entity(entity, [C_PackedMotion.new(Vector3(i, 0, 0), float(i))])
+		entities.append(entity)
+
+	world.remove_entity(entities[0])
+
+	var archetype: Archetype = world.entity_to_archetype[entities[1]]
+	var fields = archetype.get_packed_column(C_PackedMotion.get_instance_id())
+	assert_int(fields.position.size()).is_equal(3)
+	assert_int(fields.speed.size()).is_equal(3)
+	for i in archetype.entities.size():
+		var component = archetype.entities[i].get_component(C_PackedMotion)
+		assert_vector(fields.position[i]).is_equal(component.position)
+		assert_float(fields.speed[i]).is_equal(component.speed)
+
+
+func test_property_change_updates_packed_value():
+	var entity = Entity.new()
+	world.add_entity(entity, [C_PackedMotion.new(Vector3.ZERO, 1.0)])
+	var motion: C_PackedMotion = entity.get_component(C_PackedMotion)
+
+	motion.position = Vector3(7, 8, 9)
+	motion.speed = 2.0
+
+	var fields = _motion_column(entity)
+	assert_vector(fields.position[0]).is_equal(Vector3(7, 8, 9))
+	assert_float(fields.speed[0]).is_equal(2.0)
+
+
+func test_component_added_later_fills_packed_row():
+	var entity = Entity.new()
+	world.add_entity(entity, [C_TestA.new()])
+	entity.add_component(C_PackedMotion.new(Vector3(5, 5, 5)))
+
+	var fields = _motion_column(entity)
+	assert_int(fields.position.size()).is_equal(1)
+	assert_vector(fields.position[0]).is_equal(Vector3(5, 5, 5))
+
+
+func test_packed_system_receives_packed_arrays_and_writes_back():
+	var system = PackedMotionTestSystem.new()
+	world.add_system(system)
+
+	var entity = Entity.new()
+	world.add_entity(
+		entity, [C_PackedMotion.new(Vector3(1, 0, 0)), C_PackedVelocity.new(Vector3(0, 2, 0)), C_TestA.new()]
+	)
+	var motion: C_PackedMotion = entity.get_component(C_PackedMotion)
+	var velocity: C_PackedVelocity = entity.get_component(C_PackedVelocity)
+
+	world.process(0.5)
+
+	# Packable components arrive as Dictionaries, the rest as Arrays of Resources
+	assert_array(system.column_types).is_equal([TYPE_DICTIONARY, TYPE_DICTIONARY, TYPE_ARRAY])
+	# C_PackedMotion is written back, C_PackedVelocity is read-only
+	assert_vector(motion.position).is_equal(Vector3(1, 1, 0))
+	assert_vector(velocity.velocity).is_equal(Vector3(0, 2, 0))
+	assert_vector(_motion_column(entity).position[0]).is_equal(Vector3(1, 1, 0))
+
+
+func test_packed_system_runs_in_parallel_ranges():
+	var system = PackedMotionTestSystem.new()
+	system.parallel_processing = true
+	system.parallel_threshold = 1
+	system.parallel_ranges = true
+	system.parallel_chunk_size = 8
+	world.add_system(system)
+
+	var spawned: Array[Entity] = []
+	for i in 50:
+		var entity = Entity.new()
+		world.add_entity(
+			entity,
+			[
+				C_PackedMotion.new(Vector3(i, 0, 0)),
+				C_PackedVelocity.new(Vector3(0, 0, 2)),
+				C_TestA.new(),
+			]
+		)
+		spawned.append(entity)
+
+	world.process(0.5)
+
+	# Every chunk's writes land in the shared columns and are written back
+	for i in spawned.size():
+		var motion: C_PackedMotion = spawned[i].get_component(C_PackedMotion)
+		assert_vector(motion.position).is_equal(Vector3(i, 0, 1))
+
+
+func test_packed_system_without_process_range_runs_serially():
+	var system = PackedMotionNoRangeTestSystem.new()
+	system.parallel_processing = true
+	system.parallel_threshold = 1
+	system.parallel_ranges = true
+	system.parallel_chunk_size = 8
+	world.add_system(system)
+
+	var spawned: Array[Entity] = []
+	for i in 50:
+		var entity = Entity.new()
+		world.add_entity(
+			entity, [C_PackedMotion.new(Vector3(i, 0, 0)), C_PackedVelocity.new(Vector3(0, 0, 2))]
+		)
+		spawned.append(entity)
+
+	world.process(0.5)
+
+	# The default process_range would move copies; the serial run writes the live columns
+	assert_int(system._overrides_process_range).is_equal(0)
+	for i in spawned.size():
+		var motion: C_PackedMotion = spawned[i].get_component(C_PackedMotion)
+		assert_vector(motion.position).is_equal(Vector3(i, 0, 1))
+
+
+func test_packed_write_back_skips_property_changed():
+	world.add_system(PackedMotionTestSystem.new())
+	var entity = Entity.new()
+	world.add_entity(
+		entity, [C_PackedMotion.new(Vector3(1, 0, 0)), C_PackedVelocity.new(Vector3(0, 2, 0)), C_TestA.new()]
+	)
+	var motion: C_PackedMotion = entity.get_component(C_PackedMotion)
+	var changes := []
+	motion.property_changed.connect(func(_c, property, _old, _new): changes.append(property))
+
+	world.process(0.5)
+
+	assert_vector(motion.position).is_equal(Vector3(1, 1, 0))
+	assert_array(changes).is_empty()
+	assert_bool(motion.is_blocking_signals()).is_false()
+
+
+func test_packed_write_back_updates_property_index():
+	world.add_property_index(C_PackedMotion, &"position")
+	world.add_system(PackedMotionTestSystem.new())
+	var entity = Entity.new()
+	world.add_entity(
+		entity, [C_PackedMotion.new(Vector3(1, 0, 0)), C_PackedVelocity.new(Vector3(0, 2, 0)), C_TestA.new()]
+	)
+
+	world.process(0.5)
+
+	var moved = world.query.with_all([{C_PackedMotion: {"position": {"_eq": Vector3(1, 1, 0)}}}])
+	assert_array(moved.execute()).contains_exactly([entity])
+	var stale = world.query.with_all([{C_PackedMotion: {"position": {"_eq": Vector3(1, 0, 0)}}}])
+	assert_array(stale.execute()).is_empty()
+
+
+func test_packed_write_back_of_gathered_copies_updates_archetype_column():
+	world.add_system(EnabledPackedMotionSystem.new())
+	var entity = Entity.new()
+	world.add_entity(
+		entity, [C_PackedMotion.new(Vector3(1, 0, 0)), C_PackedVelocity.new(Vector3(0, 2, 0)), C_TestA.new()]
+	)
+
+	world.process(0.5)
+
+	var motion: C_PackedMotion = entity.get_component(C_PackedMotion)
+	assert_vector(motion.position).is_equal(Vector3(1, 1, 0))
+	assert_vector(_motion_column(entity).position[0]).is_equal(Vector3(1, 1, 0))
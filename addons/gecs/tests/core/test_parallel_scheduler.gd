@@ -0,0 +1,144 @@
+## Tests for World.parallel_systems stage planning and execution
+extends GdUnitTestSuite
+
+var runner: GdUnitSceneRunner
+var world: World
+
+
+func before():
+	runner = scene_runner("res://addons/gecs/tests/test_scene.tscn")
+	world = runner.get_property("world")
+	ECS.world = world
+
+
+func after_test():
+	world.parallel_systems = false
+	world.purge(false)
+
+
+func test_disjoint_writers_share_a_stage():
+	var a = ConcurrentTestSystem.new([C_TestA])
+	var b = ConcurrentTestSystem.new([C_TestB])
+	world.add_systems([a, b])
+
+	var stages = world._plan_system_stages([a, b])
+
+	assert_int(stages.size()).is_equal(1)
+	assert_array(stages[0]).contains_exactly([a, b])
+
+
+func test_read_write_conflict_keeps_group_order():
+	var writer = ConcurrentTestSystem.new([C_TestA], [], [C_TestA])
+	var reader = ConcurrentTestSystem.new([C_TestA], [C_TestA], [C_TestB])
+	var other = ConcurrentTestSystem.new([C_TestC])
+	world.add_systems([writer, reader, other])
+
+	var stages = world._plan_system_stages([writer, reader, other])
+
+	assert_int(stages.size()).is_equal(2)
+	assert_array(stages[0]).contains_exactly([writer, other])
+	assert_array(stages[1]).contains_exactly([reader])
+
+
+func test_shared_readers_share_a_stage():
+	var a = ConcurrentTestSystem.new([C_TestA], [C_TestA], [C_TestB])
+	var b = ConcurrentTestSystem.new([C_TestA], [C_TestA], [C_TestC])
+	world.add_systems([a, b])
+
+	assert_int(world._plan_system_stages([a, b]).size()).is_equal(1)
+
+
+func test_non_concurrent_system_is_a_barrier():
+	var a = ConcurrentTestSystem.new([C_TestA])
+	var barrier = ConcurrentTestSystem.new([C_TestD], [], [], false)
+	var b = ConcurrentTestSystem.new([C_TestB])
+	world.add_systems([a, barrier, b])
+
+	var stages = world._plan_system_stages([a, barrier, b])
+
+	assert_int(stages.size()).is_equal(3)
+	assert_array(stages[1]).contains_exactly([barrier])
+
+
+func test_commands_flush_at_stage_barrier():
+	for i in 5:
+		var entity = Entity.new()
+		world.add_entity(entity, [C_TestA.new()])
+	# Same stage: the tagger's queued C_TestB only lands after the stage completes
+	var tagger = ConcurrentTestSystem.new([C_TestA])
+	tagger.add_on_process = C_TestB
+	var counter = ConcurrentTestSystem.new([C_TestB])
+	counter.process_empty = true
+	world.add_systems([tagger, counter])
+	world.parallel_systems = true
+
+	world.process(0.016)
+	var stats = world.get_schedule_stats()
+	world.process(0.016)
+
+	assert_array(tagger.seen_counts).contains_exactly([5, 5])
+	assert_array(counter.seen_counts).contains_exactly([0, 5])
+	assert_int(world.query.with_all([C_TestB]).execute().size()).is_equal(5)
+	assert_int(stats.stages).is_equal(1)
+	assert_int(stats.systems_run).is_equal(2)
+	assert_int(stats.max_width).is_equal(2)
+	assert_bool(stats.has("parallelism")).is_true()
+
+
+func test_toggling_concurrent_replans_stages():
+	var a = ConcurrentTestSystem.new([C_TestA])
+	var b = ConcurrentTestSystem.new([C_TestB])
+	world.add_systems([a, b])
+	world.parallel_systems = true
+
+	world.process(0.016)
+	var before_stages = world.get_schedule_stats().stages
+	b.concurrent = false
+	world.process(0.016)
+
+	assert_int(before_stages).is_equal(1)
+	assert_int(world.get_schedule_stats().stages).is_equal(2)
+
+
+func test_refresh_schedule_picks_up_new_access():
+	var writer = ConcurrentTestSystem.new([C_TestA], [], [C_TestA])
+	var reader = ConcurrentTestSystem.new([C_TestB], [C_TestB], [])
+	world.add_systems([writer, reader])
+	world.parallel_systems = true
+	world.process(0.016)
+	var before_stages = world.get_schedule_stats().stages
+
+	reader.reads = [C_TestA, C_TestB]
+	reader.refresh_schedule()
+	world.process(0.016)
+
+	assert_int(before_stages).is_equal(1)
+	assert_int(world.get_schedule_stats().stages).is_equal(2)
+
+
+func test_concurrent_setters_keep_property_indexes_consistent():
+	for i in 200:
+		world.add_entity(Entity.new(), [C_ObserverHealth.new(0)])
+		world.add_entity(Entity.new(), [C_ObserverTest.new(0)])
+	world.add_property_index(C_ObserverHealth, &"health")
+	world.add_property_index(C_ObserverTest, &"value")
+	var health = ConcurrentTestSystem.new([C_ObserverHealth])
+	health.on_entity = func(entity): entity.get_component(C_ObserverHealth).health = 7
+	var value = ConcurrentTestSystem.new([C_ObserverTest])
+	value.on_entity = func(entity): entity.get_component(C_ObserverTest).value = 9
+	world.add_systems([health, value])
+	world.parallel_systems = true
+	# ECS.debug runs stages sequentially
+	var debug = ECS.debug
+	ECS.debug = false
+
+	world.process(0.016)
+	ECS.debug = debug
+
+	# Both setters ran on worker threads in one stage; the World serialized the index updates
+	assert_int(world.get_schedule_stats().concurrent_stages).is_equal(1)
+	var healed = world.query.with_all([{C_ObserverHealth: {"health": {"_eq": 7}}}]).execute()
+	var valued = world.query.with_all([{C_ObserverTest: {"value": {"_eq": 9}}}]).execute()
+	assert_int(healed.size()).is_equal(200)
+	assert_int(valued.size()).is_equal(200)
+	assert_bool(world._stage_threaded).is_false()
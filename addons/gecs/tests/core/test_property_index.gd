@@ -0,0 +1,109 @@
+## Tests for World.add_property_index / PropertyIndex lookups used by property queries
+extends GdUnitTestSuite
+
+var runner: GdUnitSceneRunner
+var world: World
+
+
+func before():
+	runner = scene_runner("res://addons/gecs/tests/test_scene.tscn")
+	world = runner.get_property("world")
+	ECS.world = world
+
+
+func after_test():
+	world.purge(false)
+
+
+func _spawn_health(values: Array) -> Array[Entity]:
+	var spawned: Array[Entity] = []
+	for value in values:
+		var entity = Entity.new()
+		world.add_entity(entity, [C_ObserverHealth.new(value)])
+		spawned.append(entity)
+	return spawned
+
+
+func test_hash_index_answers_equality_and_in():
+	var spawned = _spawn_health([10, 20, 20, 30])
+	var index = world.add_property_index(C_ObserverHealth, &"health")
+
+	assert_int(index.size()).is_equal(4)
+	var twenty = world.query.with_all([{C_ObserverHealth: {"health": {"_eq": 20}}}]).execute()
+	assert_array(twenty).contains_exactly_in_any_order([spawned[1], spawned[2]])
+	var some = world.query.with_all([{C_ObserverHealth: {"health": {"_in": [10, 30]}}}]).execute()
+	assert_array(some).contains_exactly_in_any_order([spawned[0], spawned[3]])
+	# Range operators fall back to the regular scan on a hash index
+	assert_that(index.lookup({"_lt": 15})).is_null()
+
+
+func test_repeated_in_values_return_each_entity_once():
+	var spawned = _spawn_health([10, 20, 30])
+	for sorted in [false, true]:
+		world.add_property_index(C_ObserverHealth, &"health", sorted)
+		var query = {C_ObserverHealth: {"health": {"_in": [10, 10, 20.0, 20]}}}
+		var matches = world.query.with_all([query]).execute()
+		assert_array(matches).contains_exactly_in_any_order([spawned[0], spawned[1]])
+		world.remove_property_index(C_ObserverHealth, &"health")
+
+
+func test_sorted_index_answers_ranges():
+	var spawned = _spawn_health([5, 50, 15, 80, 9])
+	world.add_property_index(C_ObserverHealth, &"health", true)
+
+	var low = world.query.with_all([{C_ObserverHealth: {"health": {"_lt": 10}}}]).execute()
+	assert_array(low).contains_exactly_in_any_order([spawned[0], spawned[4]])
+	var mid = (
+		world.query.with_all([{C_ObserverHealth: {"health": {"_gte": 15, "_lte": 50}}}]).execute()
+	)
+	assert_array(mid).contains_exactly_in_any_order([spawned[1], spawned[2]])
+	# Operators the index can't answer are still applied to the candidates
+	var not_nine = (
+		world.query.with_all([{C_ObserverHealth: {"health": {"_lt": 10, "_ne": 9}}}]).execute()
+	)
+	assert_array(not_nine).contains_exactly([spawned[0]])
+
+
+func test_index_follows_property_changes():
+	var spawned = _spawn_health([100, 100, 100])
+	world.add_property_index(C_ObserverHealth, &"health", true)
+	var query = world.query.with_all([{C_ObserverHealth: {"health": {"_lt": 10}}}])
+	assert_array(query.execute()).is_empty()
+
+	spawned[1].get_component(C_ObserverHealth).health = 3
+
+	assert_array(query.execute()).contains_exactly([spawned[1]])
+	var index = world.get_property_index(C_ObserverHealth, &"health")
+	assert_int(index.lookup({"_lt": 10}).size()).is_equal(1)
+
+
+func test_index_drops_removed_components_and_entities():
+	var spawned = _spawn_health([1, 1, 1])
+	var index = world.add_property_index(C_ObserverHealth, &"health")
+
+	spawned[0].remove_component(C_ObserverHealth)
+	world.remove_entity(spawned[1])
+
+	assert_int(index.size()).is_equal(1)
+	assert_bool(index.has(spawned[2])).is_true()
+	var ones = world.query.with_all([{C_ObserverHealth: {"health": {"_eq": 1}}}]).execute()
+	assert_array(ones).contains_exactly([spawned[2]])
+
+
+func test_index_respects_structural_filters():
+	var spawned = _spawn_health([1, 1])
+	spawned[0].add_component(C_TestA.new())
+	world.add_property_index(C_ObserverHealth, &"health")
+
+	var with_a = (
+		world.query.with_all([C_TestA, {C_ObserverHealth: {"health": {"_eq": 1}}}]).execute()
+	)
+	assert_array(with_a).contains_exactly([spawned[0]])
+	var without_a = (
+		world
+		.query
+		.with_all([{C_ObserverHealth: {"health": {"_eq": 1}}}])
+		.with_none([C_TestA])
+		.execute()
+	)
+	assert_array(without_a).contains_exactly([spawned[1]])
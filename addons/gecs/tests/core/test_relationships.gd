@@ -1391,3 +1391,76 @@ func test_remove_specific_relationship():
 	assert_array(like1_rels).has_size(2)
 	assert_int(like1_rels[0].relation.value).is_equal(1)
 	assert_int(like1_rels[1].relation.value).is_equal(1)
+
+
+func test_relationship_sources_reverse_index():
+	e_heather.add_relationship(Relationship.new(C_Likes.new(), e_alice))
+
+	assert_array(world.get_relationship_sources(e_alice)).contains_exactly_in_any_order(
+		[e_bob, e_heather]
+	)
+	assert_array(world.get_relationship_sources(e_heather)).contains_exactly([e_alice])
+	assert_array(world.get_relationship_sources(e_heather, C_Likes)).is_empty()
+	assert_array(world.get_relationship_sources(e_heather, C_Loves.new())).contains_exactly(
+		[e_alice]
+	)
+
+	e_bob.remove_relationship(Relationship.new(C_Likes.new(), e_alice))
+	assert_array(world.get_relationship_sources(e_alice)).contains_exactly([e_heather])
+
+
+func test_relationship_sources_tracks_batch_paths():
+	var follows := [
+		Relationship.new(C_IsCryingInFrontOf.new(), e_apple),
+		Relationship.new(C_IsAttacking.new(), e_apple),
+	]
+	e_bob.add_relationships(follows)
+	assert_array(world.get_relationship_sources(e_apple)).contains_exactly_in_any_order(
+		[e_bob, e_heather]
+	)
+
+	e_bob.remove_relationships(follows)
+	assert_array(world.get_relationship_sources(e_apple)).contains_exactly([e_heather])
+
+
+func test_removing_target_cleans_up_indexed_sources():
+	e_heather.add_relationship(Relationship.new(C_Likes.new(), e_alice))
+
+	world.remove_entity(e_alice)
+
+	assert_bool(e_bob.has_relationship(Relationship.new(C_Likes.new(), e_alice))).is_false()
+	assert_bool(e_heather.has_relationship(Relationship.new(C_Likes.new(), e_alice))).is_false()
+	assert_bool(world._relationship_sources.has(e_alice)).is_false()
+	assert_array(world.get_relationship_sources(e_heather)).is_empty()
+
+
+func test_removing_source_drops_it_from_index():
+	world.remove_entity(e_bob)
+
+	assert_array(world.get_relationship_sources(e_alice)).is_empty()
+
+
+func test_purge_with_keep_prunes_relationship_sources():
+	e_heather.add_relationship(Relationship.new(C_Likes.new(), e_bob))
+
+	world.purge(false, [e_bob, e_heather])
+
+	# Only the kept heather -> bob entry survives
+	assert_array(world._relationship_sources.keys()).contains_exactly([e_bob])
+	assert_array(world.get_relationship_sources(e_bob)).contains_exactly([e_heather])
+	assert_array(world.get_relationship_sources(e_heather)).is_empty()
+
+
+func test_query_with_relationship_to():
+	e_heather.add_relationship(Relationship.new(C_Likes.new(), e_alice))
+	e_pizza.add_relationship(Relationship.new(C_Eats.new(), e_alice))
+	e_heather.add_component(C_Eats.new())
+
+	var likers = world.query.with_relationship_to(e_alice, C_Likes).execute()
+	assert_array(likers).contains_exactly_in_any_order([e_bob, e_heather])
+
+	var anything = world.query.with_relationship_to(e_alice).execute()
+	assert_array(anything).contains_exactly_in_any_order([e_bob, e_heather, e_pizza])
+
+	var eaters = world.query.with_all([C_Eats]).with_relationship_to(e_alice).execute()
+	assert_array(eaters).contains_exactly([e_heather])
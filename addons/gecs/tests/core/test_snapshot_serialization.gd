@@ -0,0 +1,214 @@
+extends GdUnitTestSuite
+## Test suite for GECSSnapshot (streaming binary snapshots).
+## Tests verify: full round trips, relationship restore and auto-inclusion,
+## delta contents and application, base mismatch rejection, failed writes and
+## truncated files, and async write/read/apply across many chunks.
+
+const FULL_PATH := "res://reports/test_snapshot_full.gsnap"
+const DELTA_PATH := "res://reports/test_snapshot_delta.gsnap"
+
+var runner: GdUnitSceneRunner
+var world: World
+
+
+func before():
+	runner = scene_runner("res://addons/gecs/tests/test_scene.tscn")
+	world = runner.get_property("world")
+	ECS.world = world
+
+
+func after_test():
+	if world:
+		world.purge(false)
+
+
+func _make_entity(entity_name: String, level: int) -> Entity:
+	var entity = Entity.new()
+	entity.name = entity_name
+	entity.add_component(C_Persistent.new(entity_name, level, 50.5, Vector2(level, 2), ["sword"]))
+	world.add_entity(entity)
+	return entity
+
+
+func test_full_snapshot_round_trip():
+	var hero = _make_entity("Hero", 7)
+	hero.add_component(
+		C_SerializationTest.new(5, 0.25, "text", false, Vector2(1, 2), Vector3(3, 4, 5), Color.BLUE)
+	)
+	_make_entity("Sidekick", 3)
+
+	var persistent_entities = world.query.with_all([C_Persistent]).execute()
+	assert_int(GECSSnapshot.new().write(persistent_entities, FULL_PATH)).is_equal(OK)
+	var entities = GECSSnapshot.new().read(FULL_PATH)
+	for entity in entities:
+		auto_free(entity)
+
+	assert_array(entities).has_size(2)
+	var loaded: Entity = entities.filter(func(e): return e.id == hero.id)[0]
+	assert_str(String(loaded.name)).is_equal("Hero")
+	var persistent: C_Persistent = loaded.get_component(C_Persistent)
+	assert_int(persistent.level).is_equal(7)
+	assert_float(persistent.health).is_equal(50.5)
+	assert_array(persistent.inventory).is_equal(["sword"])
+	var values: C_SerializationTest = loaded.get_component(C_SerializationTest)
+	assert_float(values.float_value).is_equal(0.25)
+	assert_that(values.vector3_value).is_equal(Vector3(3, 4, 5))
+	assert_that(values.color_value).is_equal(Color.BLUE)
+
+
+func test_relationships_and_related_entities_are_restored():
+	var hero = _make_entity("Hero", 1)
+	var target = Entity.new()
+	target.name = "Target"
+	world.add_entity(target)
+	hero.add_relationship(Relationship.new(C_TestA.new(), target))
+	hero.add_relationship(Relationship.new(C_TestB.new(), GecsFood))
+
+	GECSSnapshot.new().write([hero], FULL_PATH)
+	var entities = GECSSnapshot.new().read(FULL_PATH)
+	for entity in entities:
+		auto_free(entity)
+
+	# The relationship target is auto-included
+	assert_array(entities).has_size(2)
+	var loaded_hero: Entity = entities.filter(func(e): return e.id == hero.id)[0]
+	var loaded_target: Entity = entities.filter(func(e): return e.id == target.id)[0]
+	var to_target = Relationship.new(C_TestA.new(), loaded_target)
+	assert_bool(loaded_hero.has_relationship(to_target)).is_true()
+	assert_bool(loaded_hero.has_relationship(Relationship.new(C_TestB.new(), GecsFood))).is_true()
+
+
+func test_delta_stores_only_changes():
+	var entities: Array = []
+	for i in 50:
+		entities.append(_make_entity("Unit_%d" % i, i))
+	var snapshot = GECSSnapshot.new()
+	snapshot.write(entities, FULL_PATH)
+
+	entities[3].get_component(C_Persistent).level = 99
+	snapshot.write(entities, DELTA_PATH, true)
+
+	var full_size = FileAccess.get_file_as_bytes(FULL_PATH).size()
+	var delta_size = FileAccess.get_file_as_bytes(DELTA_PATH).size()
+	assert_int(delta_size).is_less(full_size)
+
+
+func test_delta_applies_on_top_of_base():
+	var kept = _make_entity("Kept", 1)
+	var changed = _make_entity("Changed", 2)
+	var removed = _make_entity("Removed", 3)
+	var snapshot = GECSSnapshot.new()
+	snapshot.write([kept, changed, removed], FULL_PATH)
+
+	changed.get_component(C_Persistent).level = 42
+	changed.add_component(C_SerializationTest.new(8))
+	var ids = [kept.id, changed.id, removed.id]
+	snapshot.write([kept, changed], DELTA_PATH, true)
+	world.purge(false)
+
+	var loader = GECSSnapshot.new()
+	assert_int(loader.apply(FULL_PATH, world)).is_equal(OK)
+	assert_int(loader.apply(DELTA_PATH, world)).is_equal(OK)
+
+	assert_int(world.get_entity_by_id(ids[0]).get_component(C_Persistent).level).is_equal(1)
+	var loaded_changed = world.get_entity_by_id(ids[1])
+	assert_int(loaded_changed.get_component(C_Persistent).level).is_equal(42)
+	assert_int(loaded_changed.get_component(C_SerializationTest).int_value).is_equal(8)
+	assert_bool(world.has_entity_with_id(ids[2])).is_false()
+
+
+func test_delta_rejected_without_matching_base():
+	var hero = _make_entity("Hero", 1)
+	var snapshot = GECSSnapshot.new()
+	snapshot.write([hero], FULL_PATH)
+	hero.get_component(C_Persistent).level = 2
+	snapshot.write([hero], DELTA_PATH, true)
+
+	assert_int(GECSSnapshot.new().apply(DELTA_PATH, world)).is_equal(ERR_INVALID_DATA)
+
+
+func test_failed_write_keeps_delta_base():
+	var hero = _make_entity("Hero", 1)
+	var snapshot = GECSSnapshot.new()
+	snapshot.write([hero], FULL_PATH)
+	var base_id: String = snapshot.snapshot_id
+
+	hero.get_component(C_Persistent).level = 2
+	var error = snapshot.write([hero], "res://reports/missing_dir/delta.gsnap", true)
+
+	assert_int(error).is_not_equal(OK)
+	assert_str(snapshot.snapshot_id).is_equal(base_id)
+	# The next delta is still written against the file that exists
+	snapshot.write([hero], DELTA_PATH, true)
+	var hero_id = hero.id
+	world.purge(false)
+	var loader = GECSSnapshot.new()
+	loader.apply(FULL_PATH, world)
+	assert_int(loader.apply(DELTA_PATH, world)).is_equal(OK)
+	assert_int(world.get_entity_by_id(hero_id).get_component(C_Persistent).level).is_equal(2)
+
+
+func test_truncated_file_leaves_world_untouched():
+	_make_entity("Hero", 1)
+	_make_entity("Sidekick", 2)
+	GECSSnapshot.new().write(world.entities, FULL_PATH)
+	var bytes = FileAccess.get_file_as_bytes(FULL_PATH)
+	var file = FileAccess.open(DELTA_PATH, FileAccess.WRITE)
+	file.store_buffer(bytes.slice(0, bytes.size() - 1))  # Chunks intact, BLOCK_END missing
+	file.close()
+	world.purge(false)
+
+	var loader = GECSSnapshot.new()
+	assert_int(loader.apply(DELTA_PATH, world)).is_equal(ERR_FILE_CORRUPT)
+
+	assert_array(world.entities).is_empty()
+	assert_str(loader.snapshot_id).is_empty()
+
+
+func test_async_write_and_read():
+	_make_entity("Hero", 4)
+	var snapshot = GECSSnapshot.new()
+
+	assert_int(snapshot.write_async(world.entities, FULL_PATH)).is_equal(OK)
+	assert_int(snapshot.write_async(world.entities, FULL_PATH)).is_equal(ERR_BUSY)
+	var written = await snapshot.write_completed
+	assert_int(written[1]).is_equal(OK)
+
+	assert_int(snapshot.read_async(FULL_PATH)).is_equal(OK)
+	var read = await snapshot.read_completed
+	for entity in read[1]:
+		auto_free(entity)
+	assert_array(read[1]).has_size(1)
+	assert_int(read[1][0].get_component(C_Persistent).level).is_equal(4)
+
+
+func test_async_streams_many_chunks():
+	var count := GECSSnapshot.CHUNK_SIZE * 2 + 5
+	for i in count:
+		_make_entity("E%d" % i, i)
+	var snapshot = GECSSnapshot.new()
+
+	# More chunks than the writer queue holds, so capture has to wait for the worker
+	assert_int(snapshot.write_async(world.entities, FULL_PATH)).is_equal(OK)
+	assert_int((await snapshot.write_completed)[1]).is_equal(OK)
+
+	var levels := {}
+	for entity in world.entities:
+		levels[entity.id] = entity.get_component(C_Persistent).level
+	world.purge(false)
+	assert_int(snapshot.apply_async(FULL_PATH, world)).is_equal(OK)
+	assert_int(snapshot.apply_async(FULL_PATH, world)).is_equal(ERR_BUSY)
+	assert_int((await snapshot.apply_completed)[1]).is_equal(OK)
+
+	assert_int(world.entities.size()).is_equal(count)
+	for entity in world.entities:
+		assert_int(entity.get_component(C_Persistent).level).is_equal(levels[entity.id])
+
+
+func test_read_rejects_unknown_files():
+	var file = FileAccess.open(DELTA_PATH, FileAccess.WRITE)
+	file.store_string("not a snapshot")
+	file.close()
+
+	assert_array(GECSSnapshot.new().read(DELTA_PATH)).is_empty()
+	assert_array(GECSSnapshot.new().read("res://reports/missing.gsnap")).is_empty()
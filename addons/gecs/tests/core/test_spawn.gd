@@ -0,0 +1,158 @@
+## Tests for World.spawn: bulk creation straight into one archetype.
+extends GdUnitTestSuite
+
+var runner: GdUnitSceneRunner
+var world: World
+
+
+func before():
+	runner = scene_runner("res://addons/gecs/tests/test_scene.tscn")
+	world = runner.get_property("world")
+	ECS.world = world
+
+
+func after_test():
+	PrefabRelatedTest.leader = null
+	PrefabRelatedTest.fixed_id = ""
+	PrefabRelatedTest.events.clear()
+	world.purge(false)
+
+
+class SpawnAddedObserver:
+	extends Observer
+	var added: Dictionary = {}
+
+	func query() -> QueryBuilder:
+		return q.with_all([C_TestA]).on_added()
+
+	func each(_event: Variant, entity: Entity, payload: Variant = null) -> void:
+		added[entity] = payload
+
+
+class SpawnOrderObserver:
+	extends Observer
+
+	func query() -> QueryBuilder:
+		return q.with_all([C_TestA]).on_added()
+
+	func each(_event: Variant, _entity: Entity, _payload: Variant = null) -> void:
+		PrefabRelatedTest.events.append("added")
+
+
+class SpawnMonitor:
+	extends Observer
+	var matched: int = 0
+
+	func query() -> QueryBuilder:
+		return q.with_all([C_TestA, C_TestB]).on_match()
+
+	func each(_event: Variant, _entity: Entity, _payload: Variant = null) -> void:
+		matched += 1
+
+
+func test_spawn_places_entities_in_one_archetype_with_own_components():
+	var spawned = world.spawn(20, [C_TestA.new(7), C_TestB.new()])
+
+	assert_int(spawned.size()).is_equal(20)
+	assert_int(world.entities.size()).is_equal(20)
+	assert_int(world.query.with_all([C_TestA, C_TestB]).execute().size()).is_equal(20)
+
+	var archetype = world.entity_to_archetype[spawned[0]]
+	for entity in spawned:
+		assert_object(world.entity_to_archetype[entity]).is_same(archetype)
+		assert_int(entity.get_component(C_TestA).value).is_equal(7)
+	assert_int(archetype.get_column(C_TestA.get_instance_id()).size()).is_equal(20)
+
+	# Every entity owns its component instance
+	spawned[0].get_component(C_TestA).value = 1
+	assert_int(spawned[1].get_component(C_TestA).value).is_equal(7)
+	assert_str(spawned[0].id).is_not_equal(spawned[1].id)
+
+
+func test_spawn_joins_existing_archetype_and_stays_removable():
+	var existing = Entity.new()
+	world.add_entity(existing, [C_TestA.new(1)])
+
+	var spawned = world.spawn(10, [C_TestA.new(2)])
+	assert_int(world.query.with_all([C_TestA]).execute().size()).is_equal(11)
+	assert_object(world.entity_to_archetype[spawned[0]]).is_same(
+		world.entity_to_archetype[existing]
+	)
+
+	world.remove_entity(spawned[3])
+	spawned[4].remove_component(C_TestA)
+	assert_int(world.query.with_all([C_TestA]).execute().size()).is_equal(9)
+
+
+func test_spawn_notifies_observers_once_per_entity():
+	var obs = SpawnAddedObserver.new()
+	var monitor = SpawnMonitor.new()
+	world.add_observers([obs, monitor])
+
+	var spawned = world.spawn(15, [C_TestA.new(), C_TestB.new()])
+
+	assert_int(obs.added.size()).is_equal(15)
+	for entity in spawned:
+		assert_object(obs.added[entity]).is_same(entity.get_component(C_TestA))
+	assert_int(monitor.matched).is_equal(15)
+
+
+func test_spawn_prefab_copies_template_components():
+	var prefab = load("res://addons/gecs/tests/entities/e_prefab_test.tscn") as PackedScene
+	var spawned = world.spawn(5, prefab)
+
+	assert_int(spawned.size()).is_equal(5)
+	for entity in spawned:
+		assert_bool(entity is PrefabTest).is_true()
+		assert_bool(entity.is_inside_tree()).is_true()
+		assert_int(entity.get_component(C_TestA).value).is_equal(1)
+		assert_int(entity.get_component(C_TestB).value).is_equal(2)
+	assert_object(spawned[0].get_component(C_TestA)).is_not_same(
+		spawned[1].get_component(C_TestA)
+	)
+	assert_int(world.query.with_all([C_TestA, C_TestB]).execute().size()).is_equal(5)
+
+
+func test_spawn_prefab_indexes_preset_relationships():
+	var leader = Entity.new()
+	world.add_entity(leader)
+	PrefabRelatedTest.leader = leader
+	var prefab = load("res://addons/gecs/tests/entities/e_prefab_related_test.tscn") as PackedScene
+
+	var spawned = world.spawn(4, prefab)
+
+	assert_array(world.get_relationship_sources(leader, C_TestC)).contains_exactly_in_any_order(
+		spawned
+	)
+	var followers = (
+		world.query.with_relationship([Relationship.new(C_TestC.new(), leader)]).execute()
+	)
+	assert_int(followers.size()).is_equal(4)
+
+
+func test_spawn_runs_on_ready_after_added_observers():
+	world.add_observer(SpawnOrderObserver.new())
+	var prefab = load("res://addons/gecs/tests/entities/e_prefab_related_test.tscn") as PackedScene
+
+	world.spawn(3, prefab)
+
+	assert_array(PrefabRelatedTest.events).is_equal(
+		["added", "added", "added", "ready", "ready", "ready"]
+	)
+
+
+func test_spawn_replaces_entity_with_colliding_id():
+	var existing = Entity.new()
+	existing.id = "prefab_fixed"
+	world.add_entity(existing, [C_TestB.new()])
+	PrefabRelatedTest.fixed_id = "prefab_fixed"
+	var prefab = load("res://addons/gecs/tests/entities/e_prefab_related_test.tscn") as PackedScene
+
+	var spawned = world.spawn(3, prefab)
+
+	# The first instance replaces the existing entity; the others get their own ids
+	assert_object(world.get_entity_by_id("prefab_fixed")).is_same(spawned[0])
+	assert_bool(world.entities.has(existing)).is_false()
+	assert_str(spawned[1].id).is_not_equal("prefab_fixed")
+	assert_str(spawned[2].id).is_not_equal(spawned[1].id)
+	assert_int(world.entities.size()).is_equal(3)
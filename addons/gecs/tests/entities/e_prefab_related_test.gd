@@ -0,0 +1,25 @@
+## Prefab test entity that relates itself to [member leader] before it is added to a World
+class_name PrefabRelatedTest
+extends Entity
+
+## Relationship target for new instances (set by the test)
+static var leader: Entity = null
+## Id given to new instances, "" for none (set by the test)
+static var fixed_id := ""
+## Lifecycle events of all instances, in order
+static var events: Array = []
+
+
+func _init() -> void:
+	if fixed_id:
+		id = fixed_id
+	if leader:
+		add_relationship(Relationship.new(C_TestC.new(), leader))
+
+
+func define_components() -> Array:
+	return [C_TestA.new(3)]
+
+
+func on_ready() -> void:
+	events.append("ready")
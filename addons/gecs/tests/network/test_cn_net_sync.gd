@@ -37,6 +37,53 @@ class MockCompMixed:
 	@export var client_only: bool = false
 
 
+class MockCompQuantized:
+	extends Component
+
+	@export_group("HIGH")
+	@export var velocity: Vector3 = Vector3.ZERO
+	@export_subgroup(CN_NetSync.QUANTIZE_HALF)
+	@export var heading: float = 0.0
+
+	@export_group("MEDIUM")
+	@export var stamina: float = 100.0
+
+
+class MockCompNotifying:
+	extends Component
+
+	@export_group("HIGH")
+	@export var speed: float = 0.0:
+		set(value):
+			var old = speed
+			speed = value
+			property_changed.emit(self, "speed", old, value)
+
+
+class MockCompNotifyingArray:
+	extends Component
+
+	@export_group("HIGH")
+	@export var inventory: Array = []:
+		set(value):
+			var old = inventory
+			inventory = value
+			property_changed.emit(self, "inventory", old, value)
+
+
+## Setter that only emits past an epsilon, as OBSERVERS.md recommends
+class MockCompEpsilon:
+	extends Component
+
+	@export_group("HIGH")
+	@export var heading: float = 0.0:
+		set(value):
+			var old = heading
+			heading = value
+			if absf(value - old) > 1.0:
+				property_changed.emit(self, "heading", old, value)
+
+
 class MockNetAdapter:
 	extends NetAdapter
 
@@ -146,6 +193,22 @@ func test_scanner_maps_export_group_to_priority():
 	assert_bool("stamina" in props_by_prio[CN_NetSync.Priority.MEDIUM]).is_true()
 
 
+func test_scanner_collects_quantize_subgroup_hints():
+	var net_sync := CN_NetSync.new()
+	var comp := MockCompQuantized.new()
+	var entity := _make_entity_with([net_sync, comp])
+
+	net_sync.scan_entity_components(entity)
+
+	# heading keeps its HIGH priority and gains the hint; the next group resets it
+	var inst_id := comp.get_instance_id()
+	assert_bool("heading" in net_sync._props_by_comp[inst_id][CN_NetSync.Priority.HIGH]).is_true()
+	var hints: Dictionary = net_sync.get_quantize_hints()[net_sync._comp_type_names[inst_id]]
+	assert_str(hints.get("heading", "")).is_equal(CN_NetSync.QUANTIZE_HALF)
+	assert_bool(hints.has("velocity")).is_false()
+	assert_bool(hints.has("stamina")).is_false()
+
+
 func test_scanner_skips_spawn_only_props():
 	var net_sync := CN_NetSync.new()
 	var comp := MockCompMixed.new()
@@ -295,3 +358,53 @@ func test_update_cache_silent_suppresses_resync():
 	# Poll should now show NO changes — the silent update prevents echo loop
 	var result: Dictionary = net_sync.check_changes_for_priority(CN_NetSync.Priority.MEDIUM)
 	assert_bool(result.is_empty()).is_true()
+
+
+func test_notifying_prop_is_checked_only_when_dirty():
+	var net_sync := CN_NetSync.new()
+	var comp := MockCompNotifying.new()
+	var entity := _make_entity_with([net_sync, comp])
+	net_sync.scan_entity_components(entity)
+
+	# Polled until the component proves its setter emits property_changed
+	assert_bool(net_sync.has_changes_for_priority(CN_NetSync.Priority.HIGH)).is_true()
+
+	comp.speed = 4.0
+	var changes := net_sync.check_changes_for_priority(CN_NetSync.Priority.HIGH)
+	assert_float(changes.values()[0]["speed"]).is_equal(4.0)
+	assert_bool(net_sync.has_changes_for_priority(CN_NetSync.Priority.HIGH)).is_false()
+
+	comp.speed = 5.0
+	assert_bool(net_sync.has_changes_for_priority(CN_NetSync.Priority.HIGH)).is_true()
+
+
+func test_array_prop_stays_polled_after_setter_emit():
+	var net_sync := CN_NetSync.new()
+	var comp := MockCompNotifyingArray.new()
+	var entity := _make_entity_with([net_sync, comp])
+	net_sync.scan_entity_components(entity)
+
+	comp.inventory = ["sword"]
+	var changes := net_sync.check_changes_for_priority(CN_NetSync.Priority.HIGH)
+	assert_array(changes.values()[0]["inventory"]).is_equal(["sword"])
+
+	# In-place mutation never calls the setter, so the prop must still be polled
+	comp.inventory.append("shield")
+	assert_bool(net_sync.has_changes_for_priority(CN_NetSync.Priority.HIGH)).is_true()
+	changes = net_sync.check_changes_for_priority(CN_NetSync.Priority.HIGH)
+	assert_array(changes.values()[0]["inventory"]).is_equal(["sword", "shield"])
+
+
+func test_full_poll_catches_writes_below_emit_epsilon():
+	var net_sync := CN_NetSync.new()
+	var comp := MockCompEpsilon.new()
+	var entity := _make_entity_with([net_sync, comp])
+	net_sync.scan_entity_components(entity)
+	comp.heading = 10.0
+	net_sync.check_changes_for_priority(CN_NetSync.Priority.HIGH)
+
+	# Below the epsilon: no emit, so only the full poll sees it
+	comp.heading = 10.5
+	assert_bool(net_sync.check_changes_for_priority(CN_NetSync.Priority.HIGH).is_empty()).is_true()
+	var changes := net_sync.check_changes_for_priority(CN_NetSync.Priority.HIGH, true)
+	assert_float(changes.values()[0]["heading"]).is_equal(10.5)
@@ -0,0 +1,240 @@
+extends GdUnitTestSuite
+## Test suite for InterestManager and the built-in interest policies.
+## Tests verify: per-peer relevant sets, spawn/despawn on enter/leave,
+## owner-always-relevant, batch filtering, targeted spawn/despawn, and that
+## updates only re-check entities that changed cell or owner.
+
+# ============================================================================
+# MOCK OBJECTS
+# ============================================================================
+
+
+class MockNetAdapter:
+	extends NetAdapter
+
+	var peers: Array[int] = [2, 3]
+
+	func is_server() -> bool:
+		return true
+
+	func get_my_peer_id() -> int:
+		return 1
+
+	func get_connected_peers() -> Array[int]:
+		return peers
+
+	func _has_multiplayer() -> bool:
+		return true
+
+	func is_in_game() -> bool:
+		return true
+
+
+class MockSpawnManager:
+	extends RefCounted
+
+	func serialize_entity(entity: Entity) -> Dictionary:
+		return {"id": entity.id}
+
+
+class MockNetworkSync:
+	extends RefCounted
+
+	var _world: World
+	var _game_session_id: int = 42
+	var _broadcast_pending: Dictionary = {}
+	var net_adapter: MockNetAdapter
+	var _spawn_manager: MockSpawnManager
+	var _sender: SyncSender  # Real sender: the manager reads its networked-entity index
+	var spawn_calls: Array = []  # [peer_id, entity_id]
+	var despawn_calls: Array = []  # [peer_id, entity_id]
+	var despawn_sessions: Array = []
+
+	func _init(w: World) -> void:
+		_world = w
+		net_adapter = MockNetAdapter.new()
+		_spawn_manager = MockSpawnManager.new()
+		_sender = SyncSender.new(self)
+
+	func _send_spawn_to_peer(peer_id: int, data: Dictionary) -> void:
+		spawn_calls.append([peer_id, data["id"]])
+
+	func _send_despawn_to_peer(peer_id: int, entity_id: String, session_id: int) -> void:
+		despawn_calls.append([peer_id, entity_id])
+		despawn_sessions.append(session_id)
+
+
+# ============================================================================
+# SETUP / TEARDOWN
+# ============================================================================
+
+var world: World
+var mock_ns: MockNetworkSync
+var manager: InterestManager
+
+
+func before_test():
+	world = World.new()
+	world.name = "TestWorld"
+	add_child(world)
+	ECS.world = world
+	mock_ns = MockNetworkSync.new(world)
+	manager = InterestManager.new(mock_ns)
+
+
+func after_test():
+	manager = null
+	mock_ns = null
+	if is_instance_valid(world):
+		for entity in world.entities.duplicate():
+			world.remove_entity(entity)
+			if is_instance_valid(entity):
+				entity.free()
+		world.free()
+	world = null
+
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+
+func _make_networked(id: String, owner: int, pos: Vector3) -> Entity:
+	var entity := Entity.new()
+	entity.id = id
+	world.add_entity(entity)
+	var net_id := CN_NetworkIdentity.new()
+	net_id.peer_id = owner
+	entity.add_component(net_id)
+	entity.add_component(CN_NetSync.new())
+	entity.add_component(C_TestPosition.new(pos))
+	return entity
+
+
+func _radius_policy(radius: float) -> RadiusInterestPolicy:
+	return RadiusInterestPolicy.new(
+		radius, 0.0, func(e: Entity): return e.get_component(C_TestPosition).position
+	)
+
+
+# ============================================================================
+# TESTS
+# ============================================================================
+
+
+func test_disabled_without_policy():
+	assert_bool(manager.is_enabled()).is_false()
+	manager.set_policy(_radius_policy(10.0))
+	assert_bool(manager.is_enabled()).is_true()
+
+
+func test_radius_policy_despawns_distant_entities_on_first_update():
+	_make_networked("player2", 2, Vector3.ZERO)
+	_make_networked("player3", 3, Vector3(100, 0, 0))
+	_make_networked("crate", 0, Vector3(5, 0, 0))
+	manager.set_policy(_radius_policy(10.0))
+
+	manager.update()
+
+	# Peer 2 sees the crate but not player3; peer 3 sees neither
+	assert_bool(mock_ns.despawn_calls.has([2, "player3"])).is_true()
+	assert_bool(mock_ns.despawn_calls.has([3, "player2"])).is_true()
+	assert_bool(mock_ns.despawn_calls.has([3, "crate"])).is_true()
+	assert_bool(mock_ns.despawn_calls.has([2, "crate"])).is_false()
+	assert_array(mock_ns.spawn_calls).is_empty()
+
+
+func test_entering_relevance_spawns_on_peer():
+	_make_networked("player2", 2, Vector3.ZERO)
+	var crate := _make_networked("crate", 0, Vector3(50, 0, 0))
+	manager.set_policy(_radius_policy(10.0))
+	manager.update()
+	mock_ns.spawn_calls.clear()
+
+	crate.get_component(C_TestPosition).position = Vector3(3, 0, 0)
+	manager.update()
+
+	assert_bool(mock_ns.spawn_calls.has([2, "crate"])).is_true()
+	assert_bool(mock_ns.spawn_calls.has([3, "crate"])).is_false()
+
+
+func test_owned_entities_are_always_relevant():
+	_make_networked("player2", 2, Vector3.ZERO)
+	manager.set_policy(CallableInterestPolicy.new(func(_e, _peer_id): return false))
+
+	manager.update()
+
+	assert_bool(mock_ns.despawn_calls.has([2, "player2"])).is_false()
+	assert_bool(mock_ns.despawn_calls.has([3, "player2"])).is_true()
+
+
+func test_filter_batch_keeps_relevant_entities_only():
+	_make_networked("player2", 2, Vector3.ZERO)
+	_make_networked("player3", 3, Vector3(100, 0, 0))
+	manager.set_policy(_radius_policy(10.0))
+	manager.update()
+
+	var batch := {"player2": {"C": {"x": 1}}, "player3": {"C": {"x": 2}}}
+
+	assert_dict(manager.filter_batch(2, batch)).is_equal({"player2": {"C": {"x": 1}}})
+	assert_dict(manager.filter_batch(3, batch)).is_equal({"player3": {"C": {"x": 2}}})
+
+
+func test_spawn_and_despawn_target_relevant_peers():
+	_make_networked("player2", 2, Vector3.ZERO)
+	_make_networked("player3", 3, Vector3(100, 0, 0))
+	manager.set_policy(_radius_policy(10.0))
+	manager.update()
+	mock_ns.spawn_calls.clear()
+	mock_ns.despawn_calls.clear()
+
+	var bullet := _make_networked("bullet", 0, Vector3(1, 0, 0))
+	manager.on_entity_spawned(bullet, {"id": "bullet"})
+	manager.on_entity_despawned("bullet", 7)
+
+	assert_array(mock_ns.spawn_calls).is_equal([[2, "bullet"]])
+	assert_array(mock_ns.despawn_calls).is_equal([[2, "bullet"]])
+	# The despawn carries the session it was issued in, not the current one
+	assert_array(mock_ns.despawn_sessions).is_equal([7])
+
+
+func test_viewer_changing_cell_updates_its_peer():
+	var player2 := _make_networked("player2", 2, Vector3.ZERO)
+	_make_networked("crate", 0, Vector3(5, 0, 0))
+	_make_networked("player3", 3, Vector3(100, 0, 0))
+	manager.set_policy(_radius_policy(10.0))
+	manager.update()
+	mock_ns.spawn_calls.clear()
+	mock_ns.despawn_calls.clear()
+
+	player2.get_component(C_TestPosition).position = Vector3(95, 0, 0)
+	manager.update()
+
+	# Peer 2 left the crate's cells and reached player3's; peer 3 now sees player2
+	assert_bool(mock_ns.despawn_calls.has([2, "crate"])).is_true()
+	assert_bool(mock_ns.spawn_calls.has([2, "player3"])).is_true()
+	assert_bool(mock_ns.spawn_calls.has([3, "player2"])).is_true()
+
+
+func test_update_only_checks_entities_that_changed():
+	var checks: Array = []  # [entity_id, peer_id]
+	for i in 20:
+		_make_networked("npc%d" % i, 0, Vector3.ZERO)
+	var npc := _make_networked("npc_owned", 0, Vector3.ZERO)
+	manager.set_policy(
+		CallableInterestPolicy.new(
+			func(e: Entity, peer_id: int):
+				checks.append([e.id, peer_id])
+				return true
+		)
+	)
+	manager.update()
+	checks.clear()
+
+	manager.update()
+	assert_array(checks).is_empty()
+
+	npc.get_component(CN_NetworkIdentity).peer_id = 3
+	manager.update()
+	# Owner 3 short-circuits the policy; only peer 2 asks it, for that entity only
+	assert_array(checks).is_equal([["npc_owned", 2]])
@@ -21,6 +21,7 @@ func _register_settings() -> void:
 	_add_setting("gecs/network/sync/medium_hz", 10, TYPE_INT)
 	_add_setting("gecs/network/sync/low_hz", 2, TYPE_INT)
 	_add_setting("gecs/network/sync/reconciliation_interval", 30.0, TYPE_FLOAT)
+	_add_setting("gecs/network/sync/packed_encoding", false, TYPE_BOOL)
 
 
 func _add_setting(path: String, default_value: Variant, type: int) -> void:
@@ -56,3 +57,8 @@ func test_low_hz_setting_registered():
 
 func test_reconciliation_interval_setting_registered():
 	assert_bool(ProjectSettings.has_setting("gecs/network/sync/reconciliation_interval")).is_true()
+
+
+func test_packed_encoding_setting_registered():
+	assert_bool(ProjectSettings.has_setting(GECSNetworkSettings.PACKED_ENCODING)).is_true()
+	assert_bool(ProjectSettings.get_setting(GECSNetworkSettings.PACKED_ENCODING)).is_false()
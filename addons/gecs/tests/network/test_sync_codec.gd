@@ -0,0 +1,169 @@
+extends GdUnitTestSuite
+## Test suite for SyncCodec (packed binary component sync).
+## Tests verify: value round-trips, interned definitions after ack,
+## resend of unacknowledged values, acked-baseline deltas, stale packet rejection,
+## entity id recycling, the self-acknowledging reliable channel and half-float quantization.
+
+var sender: SyncCodec
+var receiver: SyncCodec
+
+
+func before_test():
+	sender = SyncCodec.new()
+	receiver = SyncCodec.new()
+
+
+func _loopback(batch: Dictionary, hints: Dictionary = {}) -> Variant:
+	var decoded = receiver.decode(sender.encode(batch, hints))
+	var ack := receiver.take_ack()
+	if ack > 0:
+		sender.acknowledge(ack)
+	return decoded
+
+
+# ============================================================================
+# ROUND TRIP
+# ============================================================================
+
+
+func test_roundtrip_preserves_values():
+	var batch := {
+		"e1":
+		{
+			"C_Transform": {"position": Vector3(1.5, -2.0, 3.25), "offset": Vector2(0.5, 4.0)},
+			"C_Stats":
+			{
+				"hp": -42,
+				"big": 1 << 40,
+				"alive": true,
+				"ratio": 0.1,
+				"label": "boss",
+				"tags": ["a", "b"],
+			},
+		},
+	}
+
+	var decoded = _loopback(batch)
+
+	assert_dict(decoded).is_equal(batch)
+
+
+func test_definitions_are_dropped_after_ack():
+	var first := sender.encode({"entity_with_a_long_id": {"C_Velocity": {"speed": 1}}})
+	receiver.decode(first)
+	sender.acknowledge(receiver.take_ack())
+
+	var second := sender.encode({"entity_with_a_long_id": {"C_Velocity": {"speed": 2}}})
+
+	assert_int(second.size()).is_less(first.size())
+	assert_dict(receiver.decode(second)).is_equal(
+		{"entity_with_a_long_id": {"C_Velocity": {"speed": 2}}}
+	)
+
+
+# ============================================================================
+# DELTA BASELINE
+# ============================================================================
+
+
+func test_lost_packet_values_are_resent():
+	sender.encode({"e1": {"C_Health": {"hp": 50}}})  # Lost
+	var decoded = _loopback({"e1": {"C_Velocity": {"speed": 3}}})
+
+	assert_dict(decoded).is_equal({"e1": {"C_Health": {"hp": 50}, "C_Velocity": {"speed": 3}}})
+
+
+func test_acked_values_are_not_resent():
+	_loopback({"e1": {"C_Health": {"hp": 50}}})
+
+	var decoded = _loopback({"e1": {"C_Health": {"hp": 50}, "C_Velocity": {"speed": 3}}})
+
+	assert_dict(decoded).is_equal({"e1": {"C_Velocity": {"speed": 3}}})
+
+
+func test_pending_values_request_resend_when_idle():
+	sender.encode({"e1": {"C_Health": {"hp": 50}}})  # Lost
+
+	assert_bool(sender.needs_resend(SyncCodec.RESEND_INTERVAL)).is_true()
+	assert_dict(receiver.decode(sender.encode({}))).is_equal({"e1": {"C_Health": {"hp": 50}}})
+
+
+func test_stale_packet_is_dropped():
+	var older := sender.encode({"e1": {"C_Health": {"hp": 10}}})
+	var newer := sender.encode({"e1": {"C_Health": {"hp": 20}}})
+
+	assert_dict(receiver.decode(newer)).is_equal({"e1": {"C_Health": {"hp": 20}}})
+	assert_that(receiver.decode(older)).is_null()
+
+
+func test_forget_entity_drops_pending_values():
+	sender.encode({"e1": {"C_Health": {"hp": 50}}})  # Lost
+	sender.forget_entity("e1")
+
+	assert_bool(sender.needs_resend(SyncCodec.RESEND_INTERVAL)).is_false()
+
+
+func test_forget_entity_recycles_interned_id():
+	_loopback({"e1": {"C_Health": {"hp": 50}}})
+	sender.forget_entity("e1")
+	receiver.forget_entity("e1")
+
+	var decoded = _loopback({"e2": {"C_Health": {"hp": 50}}})
+
+	# e2 reuses e1's id (entity, component, property = 3 names) and is sent in full
+	assert_dict(decoded).is_equal({"e2": {"C_Health": {"hp": 50}}})
+	assert_int(sender._names.size()).is_equal(3)
+	assert_bool(receiver._remote_ids.has("e1")).is_false()
+	assert_dict(_loopback({"e2": {"C_Health": {"hp": 60}}})).is_equal(
+		{"e2": {"C_Health": {"hp": 60}}}
+	)
+
+
+func test_values_for_forgotten_entity_are_skipped():
+	_loopback({"e1": {"C_Health": {"hp": 50}}, "e2": {"C_Health": {"hp": 50}}})
+	receiver.forget_entity("e1")  # Despawned here before the sender heard about it
+
+	var decoded = _loopback({"e1": {"C_Health": {"hp": 1}}, "e2": {"C_Health": {"hp": 2}}})
+
+	assert_dict(decoded).is_equal({"e2": {"C_Health": {"hp": 2}}})
+
+
+# ============================================================================
+# RELIABLE CHANNEL
+# ============================================================================
+
+
+func test_reliable_codec_needs_no_ack():
+	var reliable_sender := SyncCodec.new(true)
+	var reliable_receiver := SyncCodec.new(true)
+	var first := reliable_sender.encode({"e1": {"C_Health": {"hp": 50, "max": 100}}})
+	var second := reliable_sender.encode({"e1": {"C_Health": {"hp": 40, "max": 100}}})
+
+	assert_dict(reliable_receiver.decode(first)).is_equal(
+		{"e1": {"C_Health": {"hp": 50, "max": 100}}}
+	)
+	# Definitions and unchanged values count as delivered as soon as they were sent
+	assert_int(second.size()).is_less(first.size())
+	assert_dict(reliable_receiver.decode(second)).is_equal({"e1": {"C_Health": {"hp": 40}}})
+	assert_bool(reliable_sender.needs_resend(SyncCodec.RESEND_INTERVAL)).is_false()
+
+
+# ============================================================================
+# QUANTIZATION
+# ============================================================================
+
+
+func test_half_hint_quantizes_floats_and_vectors():
+	var hints := {"C_Transform": {"heading": CN_NetSync.QUANTIZE_HALF}}
+	var full := SyncCodec.new().encode({"e1": {"C_Transform": {"heading": 1.2345}}})
+
+	var packed := sender.encode({"e1": {"C_Transform": {"heading": 1.2345}}}, hints)
+	var decoded = receiver.decode(packed)
+
+	assert_int(packed.size()).is_less(full.size())
+	assert_float(decoded["e1"]["C_Transform"]["heading"]).is_equal_approx(1.2345, 0.001)
+
+
+func test_malformed_packet_is_rejected():
+	assert_that(receiver.decode(PackedByteArray([SyncCodec.VERSION, 1, 200]))).is_null()
+	assert_that(receiver.decode(PackedByteArray())).is_null()
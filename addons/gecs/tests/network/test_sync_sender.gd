@@ -268,3 +268,33 @@ func test_no_dispatch_when_applying_network_data():
 	# No RPC calls should have been made
 	assert_int(mock_ns.unreliable_rpc_calls.size()).is_equal(0)
 	assert_int(mock_ns.reliable_rpc_calls.size()).is_equal(0)
+
+
+# ============================================================================
+# Networked entity index
+# ============================================================================
+
+
+func test_entities_added_after_first_tick_are_indexed():
+	var sender = SyncSender.new(mock_ns)
+	sender.tick(0.016)  # Builds the index from an empty world
+	assert_int(mock_ns.unreliable_rpc_calls.size()).is_equal(0)
+
+	var comp = MockCompRealtime.new()
+	var entity = _make_entity_with_sync(0, comp, "x", 2.0)
+	sender.tick(0.016)
+
+	assert_bool(sender._synced.has(entity)).is_true()
+	assert_int(mock_ns.unreliable_rpc_calls.size()).is_equal(1)
+
+
+func test_entity_without_net_sync_leaves_index():
+	var comp = MockCompRealtime.new()
+	var entity = _make_entity_with_sync(0, comp, "x", 2.0)
+	var sender = SyncSender.new(mock_ns)
+	sender.tick(0.016)
+	assert_bool(sender._synced.has(entity)).is_true()
+
+	entity.remove_component(CN_NetSync)
+
+	assert_bool(sender._synced.has(entity)).is_false()
@@ -1,7 +1,38 @@
 ## Simple performance timing helpers for GECS
 ## Records results to JSONL files (one JSON per line, one file per test)
+##
+## Results are buffered in memory for the whole session and written by [method flush],
+## which every perf suite calls from [code]after()[/code]. Each record carries the session's
+## [code]run_id[/code]; the run metadata (git commit, machine fingerprint, CPU count) is written
+## once per session as a [code]"kind": "run_meta"[/code] line.[br]
+## Set [code]GECS_PERF_OUTPUT=run[/code] (or [member per_run_file]) to write one
+## [code]run_<run_id>.jsonl[/code] file per session instead of appending to the per-test files.
 class_name PerfHelpers
 
+const PERF_DIR := "res://reports/perf"
+## Receives the run metadata lines when results go to per-test files
+const RUNS_FILE := "_runs.jsonl"
+## Flush automatically once this many records are buffered
+const MAX_BUFFERED := 2048
+
+## Default number of untimed calls before measuring in [method benchmark]
+const DEFAULT_WARMUP := 3
+## Default minimum number of timed samples in [method benchmark]
+const DEFAULT_ITERATIONS := 10
+## Default minimum total measured time in [method benchmark]
+const DEFAULT_MIN_TIME_MS := 50.0
+## Upper bound on timed samples, so slow benchmarks still finish
+const DEFAULT_MAX_ITERATIONS := 1000
+## Samples shorter than this are batched (several calls per sample) to stay above timer resolution
+const MIN_SAMPLE_USEC := 200
+
+## Write all of this session's records to a single run_<run_id>.jsonl file
+static var per_run_file := OS.get_environment("GECS_PERF_OUTPUT") == "run"
+
+static var _buffer: Array[Dictionary] = []
+static var _session := {}
+static var _session_written := false
+
 
 ## Time a callable and return milliseconds
 static func time_it(callable: Callable) -> float:
@@ -11,8 +42,104 @@ static func time_it(callable: Callable) -> float:
 	return (end_time - start_time) / 1000.0  # Return milliseconds
 
 
-## Record performance result to test-specific JSONL file
-static func record_result(test_name: String, scale: int, time_ms: float) -> void:
+## Benchmark a callable: [param warmup] untimed calls, then timed samples until at least
+## [param iterations] samples and [param min_time_ms] of measured time (capped at [param max_iterations]).[br]
+## Very fast callables are auto-calibrated: each sample runs the callable several times and
+## reports the per-call time. If [param setup] is valid it runs untimed before every call
+## (use it when the callable consumes state, e.g. removing entities), which disables batching.[br]
+## Returns a stats Dictionary: [code]time_ms[/code] (= median), [code]min_ms[/code], [code]median_ms[/code],
+## [code]mean_ms[/code], [code]p95_ms[/code], [code]p99_ms[/code], [code]max_ms[/code], [code]stddev_ms[/code],
+## [code]iterations[/code], [code]batch[/code] and [code]warmup[/code].
+static func benchmark(
+	callable: Callable,
+	iterations: int = DEFAULT_ITERATIONS,
+	warmup: int = DEFAULT_WARMUP,
+	min_time_ms: float = DEFAULT_MIN_TIME_MS,
+	max_iterations: int = DEFAULT_MAX_ITERATIONS,
+	setup: Callable = Callable()
+) -> Dictionary:
+	var has_setup = setup.is_valid()
+
+	for i in warmup:
+		if has_setup:
+			setup.call()
+		callable.call()
+
+	# Calibrate calls-per-sample so each sample is comfortably above timer resolution
+	var batch := 1
+	if not has_setup:
+		while batch < 1_000_000:
+			var start = Time.get_ticks_usec()
+			for b in batch:
+				callable.call()
+			if Time.get_ticks_usec() - start >= MIN_SAMPLE_USEC:
+				break
+			batch *= 2
+
+	var samples := PackedFloat64Array()
+	var total_usec := 0
+	var min_time_usec := int(min_time_ms * 1000.0)
+	while samples.size() < max_iterations and (samples.size() < iterations or total_usec < min_time_usec):
+		if has_setup:
+			setup.call()
+		var start = Time.get_ticks_usec()
+		for b in batch:
+			callable.call()
+		var elapsed = Time.get_ticks_usec() - start
+		total_usec += elapsed
+		samples.append(elapsed / 1000.0 / batch)
+
+	var stats = summarize(samples)
+	stats["batch"] = batch
+	stats["warmup"] = warmup
+	return stats
+
+
+## Summary statistics (milliseconds) for a set of timing samples
+static func summarize(samples: PackedFloat64Array) -> Dictionary:
+	var sorted := samples.duplicate()
+	sorted.sort()
+	var count := sorted.size()
+	if count == 0:
+		return {"time_ms": 0.0, "iterations": 0}
+
+	var mean := 0.0
+	for s in sorted:
+		mean += s
+	mean /= count
+	var variance := 0.0
+	for s in sorted:
+		variance += (s - mean) * (s - mean)
+	variance = variance / (count - 1) if count > 1 else 0.0
+
+	var median = percentile(sorted, 50.0)
+	return {
+		"time_ms": median,
+		"min_ms": sorted[0],
+		"median_ms": median,
+		"mean_ms": mean,
+		"p95_ms": percentile(sorted, 95.0),
+		"p99_ms": percentile(sorted, 99.0),
+		"max_ms": sorted[count - 1],
+		"stddev_ms": sqrt(variance),
+		"iterations": count,
+	}
+
+
+## Linearly interpolated percentile ([param pct] in 0..100) of an already sorted array
+static func percentile(sorted: PackedFloat64Array, pct: float) -> float:
+	if sorted.is_empty():
+		return 0.0
+	var pos = (sorted.size() - 1) * clampf(pct, 0.0, 100.0) / 100.0
+	var lo = int(floor(pos))
+	var hi = mini(lo + 1, sorted.size() - 1)
+	return lerpf(sorted[lo], sorted[hi], pos - lo)
+
+
+## Record performance result to test-specific JSONL file.[br]
+## [param stats] is merged into the record (e.g. the Dictionary returned by [method benchmark]);
+## [code]time_ms[/code] stays the headline number so older tooling keeps working.
+static func record_result(test_name: String, scale: int, time_ms: float, stats: Dictionary = {}) -> void:
 	var result = {
 		"timestamp": Time.get_datetime_string_from_system(),
 		"test": test_name,
@@ -20,36 +147,108 @@ static func record_result(test_name: String, scale: int, time_ms: float) -> void
 		"time_ms": time_ms,
 		"godot_version": Engine.get_version_info().string,
 	}
+	for key in stats:
+		if not result.has(key):
+			result[key] = stats[key]
+	result["run_id"] = session().run_id
+
+	_buffer.append(result)
+	if _buffer.size() >= MAX_BUFFERED:
+		flush()
+
+	# Print result for console visibility
+	if stats.has("p95_ms"):
+		prints(
+			(
+				"📊 %s (scale=%d): %.3f ms median, %.3f min, %.3f p95, %.3f p99 (n=%d)"
+				% [test_name, scale, time_ms, stats.min_ms, stats.p95_ms, stats.p99_ms, stats.iterations]
+			)
+		)
+	else:
+		prints("📊 %s (scale=%d): %.2f ms" % [test_name, scale, time_ms])
+
+
+## Metadata describing this test session; created on first use
+static func session() -> Dictionary:
+	if _session.is_empty():
+		var machine = "%s|%s|%s|%d" % [
+			OS.get_name(), OS.get_model_name(), OS.get_processor_name(), OS.get_processor_count()
+		]
+		var stamp = Time.get_datetime_string_from_system().replace(":", "").replace("-", "")
+		_session = {
+			"kind": "run_meta",
+			"run_id": "%s_%06x" % [stamp, randi() & 0xFFFFFF],
+			"timestamp": Time.get_datetime_string_from_system(),
+			"godot_version": Engine.get_version_info().string,
+			"git_commit": _git_commit(),
+			"machine": machine.md5_text().substr(0, 12),
+			"os": OS.get_name(),
+			"cpu": OS.get_processor_name(),
+			"cpu_count": OS.get_processor_count(),
+			"debug_build": OS.is_debug_build(),
+		}
+	return _session
+
+
+static func _git_commit() -> String:
+	var sha = OS.get_environment("GITHUB_SHA")
+	if not sha.is_empty():
+		return sha
+	var output = []
+	if OS.execute("git", ["rev-parse", "HEAD"], output) == 0 and not output.is_empty():
+		return str(output[0]).strip_edges()
+	return ""
+
 
-	# Ensure perf directory exists
-	var dir = DirAccess.open("res://")
-	if dir:
-		if not dir.dir_exists("reports"):
-			dir.make_dir("reports")
-		if not dir.dir_exists("reports/perf"):
-			dir.make_dir("reports/perf")
+## Write all buffered records, opening each target file once.
+## Perf suites call this from [code]after()[/code]; it is safe to call with an empty buffer.
+static func flush() -> void:
+	if _buffer.is_empty():
+		return
+	DirAccess.make_dir_recursive_absolute(PERF_DIR)
 
-	# Append to test-specific JSONL file (one JSON per line)
-	var filepath = "res://reports/perf/%s.jsonl" % test_name
+	# Group lines per destination file
+	var lines_by_file := {}
+	if not _session_written:
+		var meta_file = _run_file() if per_run_file else RUNS_FILE
+		lines_by_file[meta_file] = [JSON.stringify(session())]
+		_session_written = true
+	for result in _buffer:
+		var file_name = _run_file() if per_run_file else "%s.jsonl" % result.test
+		if not lines_by_file.has(file_name):
+			lines_by_file[file_name] = []
+		lines_by_file[file_name].append(JSON.stringify(result))
+	_buffer.clear()
+
+	for file_name in lines_by_file:
+		_append_lines("%s/%s" % [PERF_DIR, file_name], lines_by_file[file_name])
+
+
+static func _run_file() -> String:
+	return "run_%s.jsonl" % session().run_id
+
+
+static func _append_lines(filepath: String, lines: Array) -> void:
 	# Check if file exists, if not create it with WRITE, otherwise open with READ_WRITE
 	var file_exists = FileAccess.file_exists(filepath)
 	var file = FileAccess.open(filepath, FileAccess.READ_WRITE if file_exists else FileAccess.WRITE)
-
-	if file:
-		if file_exists:
-			file.seek_end()
-		file.store_line(JSON.stringify(result))
-		file.close()
-	else:
+	if not file:
 		push_error(
 			(
 				"Failed to open performance log file: %s (Error: %s)"
 				% [filepath, error_string(FileAccess.get_open_error())]
 			)
 		)
+		return
+	if file_exists:
+		file.seek_end()
+	file.store_string("\n".join(lines) + "\n")
+	file.close()
 
-	# Print result for console visibility
-	prints("📊 %s (scale=%d): %.2f ms" % [test_name, scale, time_ms])
+
+## Record the stats returned by [method benchmark] (median as [code]time_ms[/code])
+static func record_benchmark(test_name: String, scale: int, stats: Dictionary) -> void:
+	record_result(test_name, scale, stats.get("time_ms", 0.0), stats)
 
 
 ## Optional: Assert performance threshold (simple version)
@@ -0,0 +1,154 @@
+## Headless end-to-end scenario benchmark
+## Runs a whole game scene for a fixed number of frames and records frame-time percentiles
+## and memory through [PerfHelpers] (same JSONL schema as the perf suites, scale = entity
+## count). Driven by [code]tools/scenario_matrix.py[/code]; can also be run by hand:
+## [codeblock]
+## godot --headless --path . --fixed-fps 60 \
+##     -s res://addons/gecs/tests/performance/scenario_benchmark.gd -- \
+##     --scene=res://example_stress_test/main.tscn --entities=5000 --parallel=true
+## [/codeblock]
+## Options (all [code]--key=value[/code], after the [code]--[/code] separator):[br]
+## [code]scene[/code] scene to run (required), [code]entities[/code] entities spawned before
+## the run (default 1000), [code]frames[/code] measured frames (600), [code]warmup[/code]
+## untimed frames (60), [code]seed[/code] global RNG seed (1), [code]parallel[/code] and
+## [code]parallel_threshold[/code] set on every system, [code]parallel_systems[/code] sets
+## [member World.parallel_systems], [code]disable[/code] comma-separated system node names
+## to deactivate (the system mix), [code]name[/code] test name (default
+## [code]scenario_<scene dir>[/code]).[br]
+## Entities are spawned by the first system with a [code]spawn(count)[/code] method.
+## [code]--fixed-fps[/code] makes every frame simulate the same delta, so runs are
+## reproducible regardless of machine speed.
+extends SceneTree
+
+const DEFAULT_ENTITIES := 1000
+const DEFAULT_FRAMES := 600
+const DEFAULT_WARMUP := 60
+const DEFAULT_SEED := 1
+## Prefix of the machine-readable result line printed for the driver
+const RESULT_PREFIX := "SCENARIO_RESULT "
+
+var _options := {}
+var _scene: Node
+var _world: World
+var _frame := -1
+var _last_usec := 0
+var _samples := PackedFloat64Array()
+
+
+func _initialize() -> void:
+	for arg in OS.get_cmdline_user_args():
+		var parts := arg.trim_prefix("--").split("=", true, 1)
+		_options[parts[0].replace("-", "_")] = parts[1] if parts.size() > 1 else "true"
+
+
+func _process(_delta: float) -> bool:
+	var now := Time.get_ticks_usec()
+	if _frame == -1:
+		# Autoloads and the tree are ready from the first frame on
+		if not _start():
+			quit(1)
+		_frame = 0
+		_last_usec = Time.get_ticks_usec()
+		return false
+	if _frame >= _option_int("warmup", DEFAULT_WARMUP):
+		_samples.append((now - _last_usec) / 1000.0)
+	_frame += 1
+	_last_usec = now
+	if _samples.size() >= maxi(_option_int("frames", DEFAULT_FRAMES), 1):
+		_finish()
+		return true
+	return false
+
+
+func _start() -> bool:
+	var scene_path: String = _options.get("scene", "")
+	var packed = load(scene_path) if scene_path != "" else null
+	if not packed is PackedScene:
+		push_error("scenario_benchmark: --scene must point to a scene, got '%s'" % scene_path)
+		return false
+	seed(_option_int("seed", DEFAULT_SEED))
+	_scene = packed.instantiate()
+	# HUD overlays react to the real FPS (the stress test HUD freezes all systems below
+	# 15 FPS), which would make the measured workload depend on machine speed
+	for child in _scene.get_children():
+		if child is CanvasItem:
+			child.process_mode = Node.PROCESS_MODE_DISABLED
+	root.add_child(_scene)
+	_world = _find_world(_scene)
+	if _world == null:
+		push_error("scenario_benchmark: no World in %s" % scene_path)
+		return false
+
+	var disabled: PackedStringArray = _options.get("disable", "").split(",", false)
+	for system in _world.systems:
+		if disabled.has(String(system.name)):
+			system.active = false
+		if _options.has("parallel"):
+			system.parallel_processing = _option_bool("parallel")
+		if _options.has("parallel_threshold"):
+			system.parallel_threshold = _option_int("parallel_threshold", 0)
+	if _options.has("parallel_systems"):
+		_world.parallel_systems = _option_bool("parallel_systems")
+
+	var entities := _option_int("entities", DEFAULT_ENTITIES)
+	var spawner = null
+	for system in _world.systems:
+		if system.has_method("spawn"):
+			spawner = system
+			break
+	if spawner:
+		spawner.spawn(entities)
+	elif entities > 0:
+		push_warning("scenario_benchmark: no system with spawn(count) in %s" % scene_path)
+	return true
+
+
+func _finish() -> void:
+	var stats := PerfHelpers.summarize(_samples)
+	var sorted_samples := _samples.duplicate()
+	sorted_samples.sort()
+	stats["p50_ms"] = stats["median_ms"]
+	stats["p90_ms"] = PerfHelpers.percentile(sorted_samples, 90.0)
+	stats["fps"] = 1000.0 / stats["mean_ms"] if stats["mean_ms"] > 0.0 else 0.0
+	stats["scene"] = _options["scene"]
+	stats["warmup"] = _option_int("warmup", DEFAULT_WARMUP)
+	stats["seed"] = _option_int("seed", DEFAULT_SEED)
+	stats["parallel"] = _option_bool("parallel")
+	stats["parallel_threshold"] = _option_int("parallel_threshold", 0)
+	stats["parallel_systems"] = _world.parallel_systems
+	stats["disabled"] = _options.get("disable", "")
+	stats["threads"] = ProjectSettings.get_setting("threading/worker_pool/max_threads", -1)
+	stats["cpu_count"] = OS.get_processor_count()
+	stats["final_entities"] = _world.entities.size()
+	stats["memory_bytes"] = OS.get_static_memory_usage()
+	stats["memory_peak_bytes"] = OS.get_static_memory_peak_usage()
+	stats["object_count"] = int(Performance.get_monitor(Performance.OBJECT_COUNT))
+
+	var default_name: String = (
+		"scenario_%s" % _options["scene"].get_base_dir().get_file().trim_prefix("example_")
+	)
+	var test_name: String = _options.get("name", default_name)
+	var entities := _option_int("entities", DEFAULT_ENTITIES)
+	PerfHelpers.record_result(test_name, entities, stats["time_ms"], stats)
+	PerfHelpers.flush()
+	stats["test"] = test_name
+	stats["scale"] = entities
+	print(RESULT_PREFIX + JSON.stringify(stats))
+
+
+func _find_world(node: Node) -> World:
+	if node is World:
+		return node
+	for child in node.get_children():
+		var found := _find_world(child)
+		if found:
+			return found
+	return null
+
+
+func _option_int(key: String, default_value: int) -> int:
+	return int(_options[key]) if _options.has(key) else default_value
+
+
+func _option_bool(key: String) -> bool:
+	return _options.get(key, "false") in ["true", "1", "yes"]
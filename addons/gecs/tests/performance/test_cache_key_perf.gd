@@ -12,6 +12,10 @@ func before():
 	ECS.world = world
 
 
+func after():
+	PerfHelpers.flush()
+
+
 func after_test():
 	if world:
 		world.purge(false)
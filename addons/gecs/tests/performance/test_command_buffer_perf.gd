@@ -12,30 +12,18 @@ func before():
 	ECS.world = world
 
 
+func after():
+	PerfHelpers.flush()
+
+
 func after_test():
 	if world:
 		world.purge(false)
 
 
-## Write performance result to JSONL file
+## Record a performance result under the command_buffer_ prefix used by the perf tooling
 func _write_perf_result(test_name: String, scale: int, time_ms: float) -> void:
-	var dir_path = "reports/perf"
-	if not DirAccess.dir_exists_absolute(dir_path):
-		DirAccess.make_dir_recursive_absolute(dir_path)
-
-	var file_path = dir_path + "/command_buffer_" + test_name + ".jsonl"
-	var file = FileAccess.open(file_path, FileAccess.WRITE_READ)
-	if file:
-		file.seek_end()
-		var result = {
-			"timestamp": Time.get_datetime_string_from_system(),
-			"test": test_name,
-			"scale": scale,
-			"time_ms": time_ms,
-			"godot_version": Engine.get_version_info()["string"],
-		}
-		file.store_line(JSON.stringify(result))
-		file.close()
+	PerfHelpers.record_result("command_buffer_" + test_name, scale, time_ms)
 
 
 ## Test bulk entity removal with backwards iteration (OLD WAY)
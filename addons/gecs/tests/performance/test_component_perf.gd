@@ -12,6 +12,10 @@ func before():
 	ECS.world = world
 
 
+func after():
+	PerfHelpers.flush()
+
+
 ## Test adding components to entities
 func test_component_addition(scale: int, test_parameters := [[100], [1000], [10000]]):
 	var entities = []
@@ -12,6 +12,10 @@ func before():
 	ECS.world = world
 
 
+func after():
+	PerfHelpers.flush()
+
+
 ## Test entity creation performance at different scales
 func test_entity_creation(scale: int, test_parameters := [[100], [1000], [10000]]):
 	var entities = []
@@ -106,3 +110,31 @@ func test_bulk_entity_operations(scale: int, test_parameters := [[100], [1000],
 
 	PerfHelpers.record_result("bulk_entity_operations", scale, time_ms)
 	world.purge(false)
+
+
+## Baseline for test_entity_spawn: add_entities with the same two components per entity
+func test_entity_add_entities_with_components(
+	scale: int, test_parameters := [[100], [1000], [10000]]
+):
+	var time_ms = PerfHelpers.time_it(
+		func():
+			var entities = []
+			for i in scale:
+				var entity = Entity.new()
+				entity.add_component(C_TestA.new(i))
+				entity.add_component(C_TestB.new())
+				entities.append(entity)
+			world.add_entities(entities)
+	)
+
+	PerfHelpers.record_result("entity_add_entities_with_components", scale, time_ms)
+	world.purge(false)
+
+
+## Test bulk spawning from a component template straight into one archetype
+func test_entity_spawn(scale: int, test_parameters := [[100], [1000], [10000]]):
+	var time_ms = PerfHelpers.time_it(func(): world.spawn(scale, [C_TestA.new(), C_TestB.new()]))
+
+	PerfHelpers.record_result("entity_spawn", scale, time_ms)
+	assert_int(world.query.with_all([C_TestA, C_TestB]).execute().size()).is_equal(scale)
+	world.purge(false)
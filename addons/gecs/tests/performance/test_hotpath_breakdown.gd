@@ -1,5 +1,6 @@
 ## System Processing Hotpath Breakdown Tests
 ## Detailed profiling of where time is spent during system processing
+## These model per-frame work, so they use PerfHelpers.benchmark (warm, repeated samples)
 extends GdUnitTestSuite
 
 var runner: GdUnitSceneRunner
@@ -12,6 +13,10 @@ func before():
 	ECS.world = world
 
 
+func after():
+	PerfHelpers.flush()
+
+
 func after_test():
 	if world:
 		world.purge(false)
@@ -30,11 +35,11 @@ func setup_velocity_entities(count: int) -> void:
 func test_query_execution_only(scale: int, test_parameters := [[100], [1000], [10000]]):
 	setup_velocity_entities(scale)
 
-	var time_ms = PerfHelpers.time_it(
+	var stats = PerfHelpers.benchmark(
 		func(): var _result = world.query.with_all([C_Velocity]).execute()
 	)
 
-	PerfHelpers.record_result("hotpath_query_execution", scale, time_ms)
+	PerfHelpers.record_benchmark("hotpath_query_execution", scale, stats)
 	world.purge(false)
 
 
@@ -45,13 +50,13 @@ func test_component_access(scale: int, test_parameters := [[100], [1000], [10000
 	var entities = world.query.with_all([C_Velocity]).execute()
 	var c_velocity_key = (C_Velocity as GDScript).get_instance_id()
 
-	var time_ms = PerfHelpers.time_it(
+	var stats = PerfHelpers.benchmark(
 		func():
 			for entity in entities:
 				var _component = entity.components.get(c_velocity_key, null) as C_Velocity
 	)
 
-	PerfHelpers.record_result("hotpath_component_access", scale, time_ms)
+	PerfHelpers.record_benchmark("hotpath_component_access", scale, stats)
 	world.purge(false)
 
 
@@ -62,7 +67,7 @@ func test_component_data_read(scale: int, test_parameters := [[100], [1000], [10
 	var entities = world.query.with_all([C_Velocity]).execute()
 	var c_velocity_key = (C_Velocity as GDScript).get_instance_id()
 
-	var time_ms = PerfHelpers.time_it(
+	var stats = PerfHelpers.benchmark(
 		func():
 			for entity in entities:
 				var component = entity.components.get(c_velocity_key, null) as C_Velocity
@@ -71,7 +76,7 @@ func test_component_data_read(scale: int, test_parameters := [[100], [1000], [10
 					var _vel = component.velocity
 	)
 
-	PerfHelpers.record_result("hotpath_data_read", scale, time_ms)
+	PerfHelpers.record_benchmark("hotpath_data_read", scale, stats)
 	world.purge(false)
 
 
@@ -82,7 +87,7 @@ func test_simulated_system_loop(scale: int, test_parameters := [[100], [1000], [
 	var c_velocity_key = (C_Velocity as GDScript).get_instance_id()
 	var delta = 0.016
 
-	var time_ms = PerfHelpers.time_it(
+	var stats = PerfHelpers.benchmark(
 		func():
 			# Simulate what a system does: query + iterate + component access + work
 			var entities = world.query.with_all([C_Velocity]).execute()
@@ -93,7 +98,7 @@ func test_simulated_system_loop(scale: int, test_parameters := [[100], [1000], [
 					var _new_pos = component.velocity * delta
 	)
 
-	PerfHelpers.record_result("hotpath_simulated_system", scale, time_ms)
+	PerfHelpers.record_benchmark("hotpath_simulated_system", scale, stats)
 	world.purge(false)
 
 
@@ -109,9 +114,9 @@ func test_actual_system_processing(scale: int, test_parameters := [[100], [1000]
 	var test_system = PerformanceTestSystem.new()
 	world.add_system(test_system)
 
-	var time_ms = PerfHelpers.time_it(func(): world.process(0.016))
+	var stats = PerfHelpers.benchmark(func(): world.process(0.016))
 
-	PerfHelpers.record_result("hotpath_actual_system", scale, time_ms)
+	PerfHelpers.record_benchmark("hotpath_actual_system", scale, stats)
 	world.purge(false)
 
 
@@ -124,14 +129,14 @@ func test_multiple_queries_per_frame(scale: int, test_parameters := [[100], [100
 		entity.add_component(C_TestA.new())
 		entity.add_component(C_TestB.new())
 
-	var time_ms = PerfHelpers.time_it(
+	var stats = PerfHelpers.benchmark(
 		func():
 			var _r1 = world.query.with_all([C_Velocity]).execute()
 			var _r2 = world.query.with_all([C_TestA]).execute()
 			var _r3 = world.query.with_all([C_TestB]).execute()
 	)
 
-	PerfHelpers.record_result("hotpath_multiple_queries", scale, time_ms)
+	PerfHelpers.record_benchmark("hotpath_multiple_queries", scale, stats)
 	world.purge(false)
 
 
@@ -143,19 +148,19 @@ func test_component_access_patterns(scale: int, test_parameters := [[100], [1000
 
 	# Test with cached key (current best practice)
 	var c_velocity_key = (C_Velocity as GDScript).get_instance_id()
-	var time_cached = PerfHelpers.time_it(
+	var stats_cached = PerfHelpers.benchmark(
 		func():
 			for entity in entities:
 				var _component = entity.components.get(c_velocity_key, null) as C_Velocity
 	)
 
 	# Test with get_component() helper
-	var time_helper = PerfHelpers.time_it(
+	var stats_helper = PerfHelpers.benchmark(
 		func():
 			for entity in entities:
 				var _component = entity.get_component(C_Velocity)
 	)
 
-	PerfHelpers.record_result("hotpath_component_access_cached", scale, time_cached)
-	PerfHelpers.record_result("hotpath_component_access_helper", scale, time_helper)
+	PerfHelpers.record_benchmark("hotpath_component_access_cached", scale, stats_cached)
+	PerfHelpers.record_benchmark("hotpath_component_access_helper", scale, stats_helper)
 	world.purge(false)
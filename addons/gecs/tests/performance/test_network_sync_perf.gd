@@ -0,0 +1,172 @@
+## Network Sync Performance Tests
+## Loopback comparison of Dictionary batches vs SyncCodec packed batches
+## (bytes per tick on the wire plus encode/decode time), and SyncSender flush cost.
+extends GdUnitTestSuite
+
+const TICKS := 60
+
+var runner: GdUnitSceneRunner
+var world: World
+
+
+## Server-side stand-in for NetworkSync: counts dispatched batches.
+class PerfNetAdapter:
+	extends NetAdapter
+
+	func is_server() -> bool:
+		return true
+
+	func is_in_game() -> bool:
+		return true
+
+
+class PerfNetworkSync:
+	extends RefCounted
+
+	var _world: World
+	var _applying_network_data: bool = false
+	var net_adapter := PerfNetAdapter.new()
+	var batches: int = 0
+
+	func _init(w: World) -> void:
+		_world = w
+
+	func _send_sync_unreliable(_batch: Dictionary) -> void:
+		batches += 1
+
+	func _send_sync_reliable(_batch: Dictionary) -> void:
+		batches += 1
+
+
+## HIGH-priority component whose setter emits property_changed (push-tracked).
+class PerfSyncedComp:
+	extends Component
+
+	@export_group(CN_NetSync.HIGH)
+	@export var position: Vector3 = Vector3.ZERO:
+		set(value):
+			var old = position
+			position = value
+			property_changed.emit(self, "position", old, value)
+
+
+func before():
+	runner = scene_runner("res://addons/gecs/tests/test_scene.tscn")
+	world = runner.get_property("world")
+	ECS.world = world
+
+
+func after():
+	PerfHelpers.flush()
+
+
+func after_test():
+	if world:
+		world.purge(false)
+
+
+## Build one tick of HIGH-priority sync data: every entity moved, one in ten took damage.
+func _make_batch(scale: int, tick: int) -> Dictionary:
+	var batch: Dictionary = {}
+	for i in scale:
+		var comps := {
+			"C_Transform":
+			{
+				"position": Vector3(i + tick * 0.25, 1.0, tick * 0.5),
+				"rotation": Vector3(0.0, tick * 0.1, 0.0),
+			},
+		}
+		if (i + tick) % 10 == 0:
+			comps["C_Health"] = {"hp": 100 - tick}
+		batch["Entity_%d" % i] = comps
+	return batch
+
+
+## Baseline: the Dictionary batch Godot's RPC layer serializes with var_to_bytes.
+func test_network_sync_dictionary(scale: int, test_parameters := [[10], [100], [1000]]):
+	var batches: Array = []
+	for tick in TICKS:
+		batches.append(_make_batch(scale, tick))
+
+	var total_bytes := 0
+	var encode_ms := 0.0
+	var decode_ms := 0.0
+	for batch in batches:
+		var out := [PackedByteArray()]  # Lambdas capture locals by value
+		encode_ms += PerfHelpers.time_it(func(): out[0] = var_to_bytes(batch))
+		decode_ms += PerfHelpers.time_it(func(): bytes_to_var(out[0]))
+		total_bytes += out[0].size()
+
+	(
+		PerfHelpers
+		.record_result(
+			"network_sync_dictionary",
+			scale,
+			encode_ms + decode_ms,
+			{
+				"bytes_per_tick": total_bytes / TICKS,
+				"encode_ms": encode_ms,
+				"decode_ms": decode_ms,
+			},
+		)
+	)
+
+
+## Packed: SyncCodec encode -> decode -> ack over a lossless loopback.
+func test_network_sync_packed(scale: int, test_parameters := [[10], [100], [1000]]):
+	var batches: Array = []
+	for tick in TICKS:
+		batches.append(_make_batch(scale, tick))
+
+	var sender := SyncCodec.new()
+	var receiver := SyncCodec.new()
+	var total_bytes := 0
+	var encode_ms := 0.0
+	var decode_ms := 0.0
+	for batch in batches:
+		var out := [PackedByteArray()]  # Lambdas capture locals by value
+		encode_ms += PerfHelpers.time_it(func(): out[0] = sender.encode(batch))
+		decode_ms += PerfHelpers.time_it(func(): receiver.decode(out[0]))
+		sender.acknowledge(receiver.take_ack())
+		total_bytes += out[0].size()
+
+	(
+		PerfHelpers
+		.record_result(
+			"network_sync_packed",
+			scale,
+			encode_ms + decode_ms,
+			{
+				"bytes_per_tick": total_bytes / TICKS,
+				"encode_ms": encode_ms,
+				"decode_ms": decode_ms,
+			},
+		)
+	)
+	prints("Packed sync: %d bytes/tick for %d entities" % [total_bytes / TICKS, scale])
+
+
+## SyncSender flushes over many networked entities where only 1 in 100 moves per tick.
+func test_network_sender_sparse_changes(scale: int, test_parameters := [[100], [1000], [10000]]):
+	var comps: Array = []
+	for i in scale:
+		var entity := Entity.new()
+		world.add_entity(entity, null, false)
+		var net_sync := CN_NetSync.new()
+		var comp := PerfSyncedComp.new()
+		entity.add_components([CN_NetworkIdentity.new(0), net_sync, comp])
+		net_sync.scan_entity_components(entity)
+		comps.append(comp)
+
+	var ns := PerfNetworkSync.new(world)
+	var sender := SyncSender.new(ns)
+	var time_ms = PerfHelpers.time_it(
+		func():
+			for tick in TICKS:
+				for i in range(tick % 100, scale, 100):
+					comps[i].position = Vector3(tick, 0, 0)
+				sender.tick(0.05)
+	)
+
+	PerfHelpers.record_result("network_sender_sparse_changes", scale, time_ms)
+	world.purge(false)
@@ -12,6 +12,10 @@ func before():
 	ECS.world = world
 
 
+func after():
+	PerfHelpers.flush()
+
+
 func after_test():
 	if world:
 		world.purge(false)
@@ -61,6 +65,18 @@ class PerfHealthObserver:
 		health_changed_count = 0
 
 
+## Observer on a component the benchmarks never touch — dispatch should skip it for free.
+class PerfUnrelatedObserver:
+	extends Observer
+	var changed_count: int = 0
+
+	func query() -> QueryBuilder:
+		return q.with_all([C_TestA]).on_added().on_removed().on_changed()
+
+	func each(_event: Variant, _entity: Entity, _payload: Variant = null) -> void:
+		changed_count += 1
+
+
 ## Setup entities with position and velocity for movement tests
 func setup_velocity_entities(count: int) -> void:
 	for i in count:
@@ -287,6 +303,38 @@ func test_multiple_observers_same_component(
 	world.purge(false)
 
 
+## Test dispatch cost when many observers watch other components
+## Only one of the 33 observers can fire for C_ObserverTest changes
+func test_observer_many_unrelated_observers(
+	scale: int, test_parameters := [[100], [1000], [10000]]
+):
+	setup_observer_test_entities(scale)
+
+	var unrelated: Array = []
+	for i in range(32):
+		unrelated.append(PerfUnrelatedObserver.new())
+	world.add_observers(unrelated)
+	var observer = PerfObserver.new()
+	world.add_observer(observer)
+	observer.reset_counts()
+
+	var entities = world.query.with_all([C_ObserverTest]).execute()
+
+	var time_ms = PerfHelpers.time_it(
+		func():
+			for entity in entities:
+				var comp = entity.get_component(C_ObserverTest)
+				for j in range(10):
+					comp.value = comp.value + 1
+	)
+
+	PerfHelpers.record_result("observer_many_unrelated_observers", scale, time_ms)
+	assert_int(observer.changed_count).is_equal(scale * 10)
+	for other in unrelated:
+		assert_int(other.changed_count).is_equal(0)
+	world.purge(false)
+
+
 ## Test observer query filtering performance
 ## Shows cost of query evaluation for observers
 func test_observer_with_complex_query(scale: int, test_parameters := [[100], [1000], [10000]]):
@@ -12,6 +12,10 @@ func before():
 	ECS.world = world
 
 
+func after():
+	PerfHelpers.flush()
+
+
 func after_test():
 	if world:
 		world.purge(false)
@@ -113,6 +117,50 @@ func test_query_with_component_query(scale: int, test_parameters := [[100], [100
 	world.purge(false)
 
 
+## Setup entities with C_ObserverHealth values 0..count-1 (its setter emits property_changed)
+func setup_health_entities(count: int) -> void:
+	for i in count:
+		var entity = Entity.new()
+		world.add_entity(entity, [C_ObserverHealth.new(i)], false)
+
+
+## Test a selective (~1%) range property query scanning every candidate
+func test_query_selective_component_query(
+	scale: int, test_parameters := [[100], [1000], [10000]]
+):
+	setup_health_entities(scale)
+	var limit = maxi(scale / 100, 1)
+
+	var time_ms = PerfHelpers.time_it(
+		func():
+			var entities = (
+				world.query.with_all([{C_ObserverHealth: {"health": {"_lt": limit}}}]).execute()
+			)
+	)
+
+	PerfHelpers.record_result("query_selective_component_query", scale, time_ms)
+	world.purge(false)
+
+
+## Test the same selective query answered by a sorted property index
+func test_query_indexed_component_query(
+	scale: int, test_parameters := [[100], [1000], [10000]]
+):
+	setup_health_entities(scale)
+	world.add_property_index(C_ObserverHealth, &"health", true)
+	var limit = maxi(scale / 100, 1)
+
+	var time_ms = PerfHelpers.time_it(
+		func():
+			var entities = (
+				world.query.with_all([{C_ObserverHealth: {"health": {"_lt": limit}}}]).execute()
+			)
+	)
+
+	PerfHelpers.record_result("query_indexed_component_query", scale, time_ms)
+	world.purge(false)
+
+
 ## Test query caching performance
 func test_query_caching(scale: int, test_parameters := [[100], [1000], [10000]]):
 	setup_diverse_entities(scale)
@@ -2,7 +2,8 @@
 ## Measures Entity.get_relationships(pattern) — the hot path used by the
 ## sheep-herding example's flocking helper. Compares pre-allocated vs
 ## per-call pattern (Relationship + Component) allocation at different
-## flock sizes.
+## flock sizes. Also measures reverse-index target cleanup and "who points at X"
+## queries for a commonly-targeted entity.
 extends GdUnitTestSuite
 
 var runner: GdUnitSceneRunner
@@ -17,6 +18,10 @@ func before():
 	ECS.world = world
 
 
+func after():
+	PerfHelpers.flush()
+
+
 func after_test():
 	if world:
 		world.purge(false)
@@ -79,3 +84,49 @@ func test_get_relationships_cached_probe(
 				var _rels: Array = e.get_relationships(probe)
 	)
 	PerfHelpers.record_result("relationship_get_relationships_cached", scale, time_ms)
+
+
+## Build [param count] followers of one leader, spread over several relation
+## types so the world holds many relationship archetypes unrelated to the leader.
+func _setup_followers(count: int) -> Entity:
+	var leader := Entity.new()
+	leader.name = "Leader"
+	world.add_entity(leader)
+	var others: Array = []
+	for i in 10:
+		var other := Entity.new()
+		world.add_entity(other)
+		others.append(other)
+	for i in count:
+		var e := Entity.new()
+		e.name = "Follower_%d" % i
+		world.add_entity(e)
+		e.add_relationship(Relationship.new(C_TestA.new(), leader))
+		e.add_relationship(Relationship.new(C_TestB.new(), others[i % others.size()]))
+	return leader
+
+
+## Removing a commonly-targeted entity: REMOVE-policy cleanup of every follower.
+func test_relationship_target_cleanup(
+	scale: int,
+	test_parameters := [[100], [1000], [2000]],
+) -> void:
+	var leader := _setup_followers(scale)
+
+	var time_ms := PerfHelpers.time_it(func(): world.remove_entity(leader))
+	PerfHelpers.record_result("relationship_target_cleanup", scale, time_ms)
+
+
+## "Who points at X" through QueryBuilder.with_relationship_to (reverse index).
+func test_relationship_query_sources(
+	scale: int,
+	test_parameters := [[100], [1000], [2000]],
+) -> void:
+	var leader := _setup_followers(scale)
+
+	var time_ms := PerfHelpers.time_it(
+		func():
+			for i in 10:
+				var _followers = world.query.with_relationship_to(leader, C_TestA).execute()
+	)
+	PerfHelpers.record_result("relationship_query_sources", scale, time_ms)
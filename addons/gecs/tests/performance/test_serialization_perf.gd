@@ -0,0 +1,125 @@
+## Serialization Performance Tests
+## Compares the GecsData Resource path (.tres text and .res binary through ResourceSaver)
+## with GECSSnapshot streaming binary snapshots: save time, load time and file size,
+## plus the size and cost of a delta snapshot after 1% of the entities changed.
+extends GdUnitTestSuite
+
+const TRES_PATH := "res://reports/perf_serialization_text.tres"
+# GECSIO.save swaps .tres for .res in binary mode; a separate name keeps the text
+# load from picking the binary file up
+const BINARY_PATH := "res://reports/perf_serialization_binary.tres"
+const SNAPSHOT_PATH := "res://reports/perf_serialization.gsnap"
+const DELTA_PATH := "res://reports/perf_serialization_delta.gsnap"
+
+var runner: GdUnitSceneRunner
+var world: World
+
+
+func before():
+	runner = scene_runner("res://addons/gecs/tests/test_scene.tscn")
+	world = runner.get_property("world")
+	ECS.world = world
+
+
+func after():
+	PerfHelpers.flush()
+
+
+func after_test():
+	if world:
+		world.purge(false)
+
+
+## Two archetypes: every entity is persistent, every other one also carries test values.
+func _setup_entities(count: int) -> Array:
+	var entities: Array = []
+	for i in count:
+		var entity := Entity.new()
+		entity.name = "SaveEntity_%d" % i
+		world.add_entity(entity, null, false)
+		entity.add_component(C_Persistent.new("Unit_%d" % i, i, 100.0 - i * 0.01, Vector2(i, i)))
+		if i % 2 == 0:
+			entity.add_component(C_SerializationTest.new(i, i * 0.5))
+		entities.append(entity)
+	return entities
+
+
+func _free_all(entities: Array) -> void:
+	for entity in entities:
+		entity.free()
+
+
+func _file_size(path: String) -> int:
+	var file := FileAccess.open(path, FileAccess.READ)
+	return file.get_length() if file else 0
+
+
+func test_serialization_resource(scale: int, test_parameters := [[100], [1000], [10000]]):
+	var entities := _setup_entities(scale)
+
+	for binary in [false, true]:
+		var path: String = BINARY_PATH if binary else TRES_PATH
+		var format := "res" if binary else "tres"
+		var save_ms = PerfHelpers.time_it(
+			func(): GECSIO.save(GECSIO.serialize_entities(entities), path, binary)
+		)
+		var loaded := [[]]  # Lambdas capture locals by value
+		var load_ms = PerfHelpers.time_it(func(): loaded[0] = GECSIO.deserialize(path))
+		_free_all(loaded[0])
+		(
+			PerfHelpers
+			.record_result(
+				"serialization_save_%s" % format,
+				scale,
+				save_ms,
+				{"file_bytes": _file_size(path.replace(".tres", ".%s" % format))},
+			)
+		)
+		PerfHelpers.record_result("serialization_load_%s" % format, scale, load_ms)
+
+
+func test_serialization_snapshot(scale: int, test_parameters := [[100], [1000], [10000]]):
+	var entities := _setup_entities(scale)
+	var snapshot := GECSSnapshot.new()
+
+	var save_ms = PerfHelpers.time_it(func(): snapshot.write(entities, SNAPSHOT_PATH))
+	var loaded := [[]]  # Lambdas capture locals by value
+	var load_ms = PerfHelpers.time_it(
+		func(): loaded[0] = GECSSnapshot.new().read(SNAPSHOT_PATH)
+	)
+	_free_all(loaded[0])
+	(
+		PerfHelpers
+		.record_result(
+			"serialization_save_snapshot",
+			scale,
+			save_ms,
+			{"file_bytes": _file_size(SNAPSHOT_PATH)},
+		)
+	)
+	PerfHelpers.record_result("serialization_load_snapshot", scale, load_ms)
+
+	# 1% of the entities change, then a delta against the snapshot above
+	for i in range(0, scale, 100):
+		entities[i].get_component(C_Persistent).level += 1
+	var delta_ms = PerfHelpers.time_it(func(): snapshot.write(entities, DELTA_PATH, true))
+	(
+		PerfHelpers
+		.record_result(
+			"serialization_save_snapshot_delta",
+			scale,
+			delta_ms,
+			{"file_bytes": _file_size(DELTA_PATH)},
+		)
+	)
+
+
+## Main-thread cost of write_async: value capture only, encoding runs on a worker.
+func test_serialization_snapshot_async(scale: int, test_parameters := [[100], [1000], [10000]]):
+	var entities := _setup_entities(scale)
+	var snapshot := GECSSnapshot.new()
+
+	var capture_ms = PerfHelpers.time_it(func(): snapshot.write_async(entities, SNAPSHOT_PATH))
+	var written = await snapshot.write_completed
+	assert_int(written[1]).is_equal(OK)
+	PerfHelpers.record_result("serialization_save_snapshot_async", scale, capture_ms)
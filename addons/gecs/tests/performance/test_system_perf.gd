@@ -12,6 +12,10 @@ func before():
 	ECS.world = world
 
 
+func after():
+	PerfHelpers.flush()
+
+
 func after_test():
 	if world:
 		world.purge(false)
@@ -43,6 +47,61 @@ func test_system_processing(scale: int, test_parameters := [[100], [1000], [1000
 	world.purge(false)
 
 
+## Setup movers whose components declare packed fields
+func setup_packed_movers(count: int) -> void:
+	for i in count:
+		var entity = Entity.new()
+		entity.name = "Mover_%d" % i
+		entity.add_component(C_PackedMotion.new(Vector3(i, 0, 0)))
+		entity.add_component(C_PackedVelocity.new(Vector3(1, 0, 1)))
+		entity.add_component(C_TestA.new())
+		world.add_entity(entity, null, false)
+
+
+## Test a mover system that iterates component Resources
+func test_system_resource_iteration(scale: int, test_parameters := [[100], [1000], [10000]]):
+	setup_packed_movers(scale)
+	world.add_system(ResourceMotionTestSystem.new())
+
+	var stats = PerfHelpers.benchmark(func(): world.process(0.016))
+
+	PerfHelpers.record_benchmark("system_resource_iteration", scale, stats)
+	world.purge(false)
+
+
+## Test the same mover system over packed columns (only moved positions are written back)
+func test_system_packed_iteration(scale: int, test_parameters := [[100], [1000], [10000]]):
+	setup_packed_movers(scale)
+	world.add_system(PackedMotionTestSystem.new())
+
+	var stats = PerfHelpers.benchmark(func(): world.process(0.016))
+
+	PerfHelpers.record_benchmark("system_packed_iteration", scale, stats)
+	world.purge(false)
+
+
+## Packed vs Resource motion on the same movers in one run. The packed write-back copies
+## positions without a property_changed signal per entity; speedup = resource / packed median.
+func test_system_packed_vs_resource_motion(scale: int, test_parameters := [[100], [1000], [10000]]):
+	setup_packed_movers(scale)
+	var resource_system = ResourceMotionTestSystem.new()
+	world.add_system(resource_system)
+	var resource_stats = PerfHelpers.benchmark(func(): world.process(0.016))
+	world.remove_system(resource_system)
+	world.add_system(PackedMotionTestSystem.new())
+	var packed_stats = PerfHelpers.benchmark(func(): world.process(0.016))
+
+	var speedup = (
+		resource_stats.time_ms / packed_stats.time_ms if packed_stats.time_ms > 0.0 else 0.0
+	)
+	var stats = packed_stats.duplicate()
+	stats["resource_ms"] = resource_stats.time_ms
+	stats["speedup"] = speedup
+	PerfHelpers.record_benchmark("system_packed_vs_resource_motion", scale, stats)
+	prints("   packed %.2fx faster than resource motion" % speedup)
+	world.purge(false)
+
+
 ## Test multiple systems processing
 func test_multiple_systems(scale: int, test_parameters := [[100], [1000], [10000]]):
 	setup_entities_for_systems(scale)
@@ -0,0 +1,39 @@
+## Configurable system for the parallel scheduler tests
+class_name ConcurrentTestSystem
+extends System
+
+var query_components: Array = []
+var reads: Array = []
+var writes: Array = []
+## Component queued through cmd for every processed entity (null = none)
+var add_on_process: Script = null
+## Called with every processed entity (runs on the worker thread in a threaded stage)
+var on_entity: Callable
+var seen_counts: Array = []
+
+
+func _init(_query_components := [], _reads := [], _writes := [], _concurrent := true):
+	query_components = _query_components
+	reads = _reads
+	writes = _writes
+	concurrent = _concurrent
+
+
+func access() -> Dictionary[int, Array]:
+	if reads.is_empty() and writes.is_empty():
+		return {}
+	return {Access.Read: reads, Access.Write: writes}
+
+
+func query() -> QueryBuilder:
+	return q.with_all(query_components)
+
+
+func process(entities: Array[Entity], components: Array, delta: float) -> void:
+	seen_counts.append(entities.size())
+	if add_on_process:
+		for entity in entities:
+			cmd.add_component(entity, add_on_process.new())
+	if on_entity.is_valid():
+		for entity in entities:
+			on_entity.call(entity)
@@ -0,0 +1,15 @@
+## Test system like PackedMotionTestSystem, but without a process_range override
+class_name PackedMotionNoRangeTestSystem
+extends System
+
+
+func query() -> QueryBuilder:
+	var comps = [C_PackedMotion, C_PackedVelocity]
+	return ECS.world.query.with_all(comps).iterate(comps).packed([C_PackedMotion])
+
+
+func process(entities: Array[Entity], components: Array, delta: float) -> void:
+	var positions: PackedVector3Array = components[0].position
+	var velocities: PackedVector3Array = components[1].velocity
+	for i in entities.size():
+		positions[i] += velocities[i] * delta
@@ -0,0 +1,28 @@
+## Test system that moves C_PackedMotion by C_PackedVelocity using packed arrays
+class_name PackedMotionTestSystem
+extends System
+
+var column_types: Array = []
+
+
+func query() -> QueryBuilder:
+	var comps = [C_PackedMotion, C_PackedVelocity, C_TestA]
+	return ECS.world.query.with_all(comps).iterate(comps).packed([C_PackedMotion])
+
+
+func process(entities: Array[Entity], components: Array, delta: float) -> void:
+	column_types = components.map(func(column): return typeof(column))
+	_move(components, 0, entities.size(), delta)
+
+
+func process_range(
+	entities: Array[Entity], components: Array, from: int, to: int, delta: float
+) -> void:
+	_move(components, from, to, delta)
+
+
+func _move(components: Array, from: int, to: int, delta: float) -> void:
+	var positions: PackedVector3Array = components[0].position
+	var velocities: PackedVector3Array = components[1].velocity
+	for i in range(from, to):
+		positions[i] += velocities[i] * delta
@@ -0,0 +1,15 @@
+## Same work as PackedMotionTestSystem, reading and writing the component Resources
+class_name ResourceMotionTestSystem
+extends System
+
+
+func query() -> QueryBuilder:
+	var comps = [C_PackedMotion, C_PackedVelocity, C_TestA]
+	return ECS.world.query.with_all(comps).iterate(comps)
+
+
+func process(entities: Array[Entity], components: Array, delta: float) -> void:
+	var motions = components[0]
+	var velocities = components[1]
+	for i in entities.size():
+		motions[i].position += velocities[i].velocity * delta
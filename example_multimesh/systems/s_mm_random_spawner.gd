@@ -14,6 +14,18 @@ func setup():
 
 
 func process(_es: Array, _cs: Array, _d: float):
+	_spawn_one()
+
+
+## Spawn [param count] entities right away (headless benchmark prepopulation, see
+## scenario_benchmark.gd).
+func spawn(count: int) -> void:
+	for i in count:
+		_spawn_one()
+	cmd.execute()
+
+
+func _spawn_one() -> void:
 	var entity = Entity.new()
 	var half = spawn_area / 2.0
 	entity.add_component(
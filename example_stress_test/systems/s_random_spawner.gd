@@ -49,6 +49,14 @@ func _spawn_one() -> void:
 	cmd.add_entity(entity)
 
 
+## Spawn [param count] movers right away, bypassing the ramp (headless benchmark
+## prepopulation, see scenario_benchmark.gd).
+func spawn(count: int) -> void:
+	for i in count:
+		_spawn_one()
+	cmd.execute()
+
+
 ## Current spawn rate for HUD display.
 func current_spawn_rate() -> float:
 	return base_spawns_per_second + ramp_per_second * _elapsed
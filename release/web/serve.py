@@ -2,12 +2,35 @@
 
 import argparse
 import contextlib
+import gzip
+import hashlib
 import os
+import shutil
 import socket
 import subprocess
 import sys
+import threading
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
 from http.server import HTTPServer, SimpleHTTPRequestHandler
 from pathlib import Path
+from socketserver import ThreadingMixIn
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Content types worth compressing; everything else is served as-is.
+COMPRESSIBLE_EXTENSIONS = {".wasm", ".pck", ".js", ".mjs", ".html", ".htm", ".css", ".json", ".svg", ".txt", ".xml"}
+
+# Encoding name -> (sibling file suffix, available for on-demand compression)
+ENCODINGS = {
+    "br": (".br", brotli is not None),
+    "gzip": (".gz", True),
+}
+
+COPY_CHUNK = 256 * 1024
 
 
 # See cpython GH-17851 and GH-17864.
@@ -19,6 +42,10 @@ class DualStackServer(HTTPServer):
         return super().server_bind()
 
 
+class ThreadingDualStackServer(ThreadingMixIn, DualStackServer):
+    daemon_threads = True
+
+
 class CORSRequestHandler(SimpleHTTPRequestHandler):
     def end_headers(self):
         self.send_header("Cross-Origin-Opener-Policy", "same-origin")
@@ -27,6 +54,221 @@ class CORSRequestHandler(SimpleHTTPRequestHandler):
         super().end_headers()
 
 
+class AssetRequestHandler(CORSRequestHandler):
+    """Serves files with content negotiation, ETags and byte ranges.
+
+    - A `file.br` / `file.gz` sibling is sent with `Content-Encoding` when the
+      client accepts it and the sibling is not older than the file itself.
+    - With `compress_cache` set, missing siblings are created on first request
+      in that directory (gzip always, brotli when the `brotli` module exists).
+    - `ETag` / `If-None-Match` (and `If-Modified-Since`) answer 304, and a
+      single `Range` (optionally guarded by `If-Range`) answers 206.
+    - `Cache-Control` is `no-cache` (always revalidate, cheap with ETags)
+      unless `max_age` is set, in which case responses are cacheable for it.
+    - Keep-alive (HTTP/1.1) is only enabled by create_server() on the threaded server;
+      on the single-threaded one an idle open connection would block every
+      other client.
+    """
+
+    extensions_map = {
+        **SimpleHTTPRequestHandler.extensions_map,
+        ".wasm": "application/wasm",
+        ".pck": "application/octet-stream",
+        ".js": "application/javascript",
+        ".mjs": "application/javascript",
+    }
+
+    # Configured by serve()
+    compress_cache = None
+    max_age = 0
+    _compress_locks = {}
+    _compress_locks_guard = threading.Lock()
+
+    def send_head(self):
+        self._remaining = None
+        path = self.translate_path(self.path)
+        if os.path.isdir(path):
+            # Redirects, index.html and directory listings
+            if not self.path.split("?", 1)[0].endswith("/"):
+                return super().send_head()
+            for index in ("index.html", "index.htm"):
+                if os.path.isfile(os.path.join(path, index)):
+                    path = os.path.join(path, index)
+                    break
+            else:
+                return super().send_head()
+        if path.endswith("/") or not os.path.isfile(path):
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return None
+
+        source = os.stat(path)
+        ctype = self.guess_type(path)
+        encoding, body_path = self.select_encoding(path, source)
+        body = os.stat(body_path) if body_path != path else source
+        etag = '"%x-%x%s"' % (source.st_size, source.st_mtime_ns, f"-{encoding}" if encoding else "")
+
+        if self.not_modified(etag, source.st_mtime):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_validators(etag, source.st_mtime, encoding is not None or self.compressible(path))
+            self.end_headers()
+            return None
+
+        size = body.st_size
+        start, end = 0, size - 1
+        status = HTTPStatus.OK
+        byte_range = self.headers.get("Range")
+        if byte_range and self.headers.get("If-Range", etag) == etag:
+            parsed = self.parse_range(byte_range, size)
+            if parsed is False:
+                self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                self.send_header("Content-Range", f"bytes */{size}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return None
+            if parsed is not None:
+                start, end = parsed
+                status = HTTPStatus.PARTIAL_CONTENT
+
+        f = open(body_path, "rb")
+        try:
+            self.send_response(status)
+            self.send_header("Content-Type", ctype)
+            if encoding:
+                self.send_header("Content-Encoding", encoding)
+            self.send_validators(etag, source.st_mtime, encoding is not None or self.compressible(path))
+            self.send_header("Accept-Ranges", "bytes")
+            if status == HTTPStatus.PARTIAL_CONTENT:
+                self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+            self.send_header("Content-Length", str(end - start + 1 if size else 0))
+            self.end_headers()
+            f.seek(start)
+            self._remaining = end - start + 1 if size else 0
+            return f
+        except:
+            f.close()
+            raise
+
+    def copyfile(self, source, outputfile):
+        remaining = getattr(self, "_remaining", None)
+        if remaining is None:
+            # Directory listings
+            return super().copyfile(source, outputfile)
+        while remaining > 0:
+            chunk = source.read(min(COPY_CHUNK, remaining))
+            if not chunk:
+                break
+            outputfile.write(chunk)
+            remaining -= len(chunk)
+        self._remaining = None
+
+    def send_validators(self, etag, mtime, vary):
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", self.date_time_string(mtime))
+        if self.max_age > 0:
+            self.send_header("Cache-Control", f"public, max-age={self.max_age}")
+        else:
+            self.send_header("Cache-Control", "no-cache")
+        if vary:
+            self.send_header("Vary", "Accept-Encoding")
+
+    def not_modified(self, etag, mtime):
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match is not None:
+            tags = [tag.strip() for tag in if_none_match.split(",")]
+            return "*" in tags or etag in tags or f"W/{etag}" in tags
+        if_modified_since = self.headers.get("If-Modified-Since")
+        if if_modified_since is not None:
+            with contextlib.suppress(TypeError, ValueError, IndexError, OverflowError):
+                return int(mtime) <= parsedate_to_datetime(if_modified_since).timestamp()
+        return False
+
+    @staticmethod
+    def parse_range(header, size):
+        """(start, end) for a single satisfiable range, None to ignore the header, False if unsatisfiable."""
+        unit, _, spec = header.partition("=")
+        if unit.strip() != "bytes" or "," in spec:
+            return None  # Multiple ranges are allowed to be answered with the full body
+        first, sep, last = spec.strip().partition("-")
+        if not sep:
+            return None
+        try:
+            if first:
+                start = int(first)
+                end = int(last) if last else size - 1
+            else:
+                start = max(0, size - int(last))
+                end = size - 1
+        except ValueError:
+            return None
+        if start >= size or end < start:
+            return False
+        return start, min(end, size - 1)
+
+    def compressible(self, path):
+        return os.path.splitext(path)[1].lower() in COMPRESSIBLE_EXTENSIONS
+
+    def accepted_encodings(self):
+        """Encodings accepted by the client, most preferred first."""
+        accepted = {}
+        for item in self.headers.get("Accept-Encoding", "").split(","):
+            name, _, params = item.strip().partition(";")
+            q = 1.0
+            for param in params.split(";"):
+                key, _, value = param.strip().partition("=")
+                if key == "q":
+                    with contextlib.suppress(ValueError):
+                        q = float(value)
+            if name:
+                accepted[name.strip().lower()] = q
+        wildcard = accepted.get("*", 0.0)
+        ranked = [(accepted.get(name, wildcard), name) for name in ENCODINGS]
+        # br before gzip on equal preference
+        return [name for q, name in sorted(ranked, key=lambda r: -r[0]) if q > 0]
+
+    def select_encoding(self, path, source):
+        """(encoding or None, path of the file to send)."""
+        if not self.compressible(path):
+            return None, path
+        for encoding in self.accepted_encodings():
+            suffix, can_compress = ENCODINGS[encoding]
+            sibling = path + suffix
+            with contextlib.suppress(OSError):
+                if os.stat(sibling).st_mtime_ns >= source.st_mtime_ns:
+                    return encoding, sibling
+            if self.compress_cache and can_compress:
+                cached = self.compressed_copy(path, source, encoding, suffix)
+                if cached:
+                    return encoding, cached
+        return None, path
+
+    def compressed_copy(self, path, source, encoding, suffix):
+        """Path of a cached compressed copy of `path`, created on first use."""
+        key = hashlib.sha1(f"{os.path.abspath(path)}|{source.st_size}|{source.st_mtime_ns}".encode()).hexdigest()
+        cached = os.path.join(self.compress_cache, key + suffix)
+        if os.path.isfile(cached):
+            return cached
+        with self._compress_locks_guard:
+            lock = self._compress_locks.setdefault(cached, threading.Lock())
+        with lock:
+            if os.path.isfile(cached):
+                return cached
+            tmp = f"{cached}.{threading.get_ident()}.tmp"
+            try:
+                with open(path, "rb") as src, open(tmp, "wb") as dst:
+                    if encoding == "br":
+                        dst.write(brotli.compress(src.read(), quality=9))
+                    else:
+                        with gzip.GzipFile(fileobj=dst, mode="wb", compresslevel=9, mtime=0) as gz:
+                            shutil.copyfileobj(src, gz, COPY_CHUNK)
+                os.replace(tmp, cached)
+            except OSError as e:
+                self.log_error("Could not compress %s: %s", path, e)
+                with contextlib.suppress(OSError):
+                    os.remove(tmp)
+                return None
+        return cached
+
+
 def shell_open(url):
     if sys.platform == "win32":
         os.startfile(url)
@@ -35,11 +277,25 @@ def shell_open(url):
         subprocess.call([opener, url])
 
 
-def serve(root, port, run_browser):
+def create_server(address, threaded=False, compress_cache=None, max_age=0):
+    """Configure AssetRequestHandler and bind a server serving the working directory."""
+    AssetRequestHandler.compress_cache = str(compress_cache) if compress_cache else None
+    AssetRequestHandler.max_age = max_age
+    # The single-threaded server handles one connection at a time, so a browser
+    # holding a keep-alive connection open would stall its parallel requests.
+    AssetRequestHandler.protocol_version = "HTTP/1.1" if threaded else "HTTP/1.0"
+
+    server_class = ThreadingDualStackServer if threaded else DualStackServer
+    return server_class(address, AssetRequestHandler)
+
+
+def serve(root, port, run_browser, threaded=False, compress_cache=None, max_age=0):
+    if compress_cache is not None:
+        compress_cache = Path(compress_cache).resolve()
+        compress_cache.mkdir(parents=True, exist_ok=True)
     os.chdir(root)
 
-    address = ("", port)
-    httpd = DualStackServer(address, CORSRequestHandler)
+    httpd = create_server(("", port), threaded, compress_cache, max_age)
 
     url = f"http://127.0.0.1:{port}"
     if run_browser:
@@ -68,11 +324,33 @@ if __name__ == "__main__":
     browser_parser.add_argument(
         "-n", "--no-browser", help="don't open default web browser automatically", dest="browser", action="store_false"
     )
+    parser.add_argument(
+        "-t",
+        "--threaded",
+        help="handle each connection on its own thread, with keep-alive (for load testing)",
+        action="store_true",
+    )
+    parser.add_argument(
+        "-c",
+        "--compress-cache",
+        help="compress assets without a .br/.gz sibling on first request, caching the result in this directory",
+        default=None,
+        type=Path,
+    )
+    parser.add_argument(
+        "--max-age",
+        help="seconds browsers may cache responses without revalidating (default: 0 = always revalidate via ETag)",
+        default=0,
+        type=int,
+    )
     parser.set_defaults(browser=True)
     args = parser.parse_args()
 
+    # Resolve the cache directory against the caller's working directory
+    compress_cache = args.compress_cache.resolve() if args.compress_cache else None
+
     # Change to the directory where the script is located,
     # so that the script can be run from any location.
     os.chdir(Path(__file__).resolve().parent)
 
-    serve(args.root, args.port, args.browser)
\ No newline at end of file
+    serve(args.root, args.port, args.browser, args.threaded, compress_cache, args.max_age)
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Tests for serve.py. Run with `python -m unittest` from this directory."""
+
+import http.client
+import os
+import tempfile
+import threading
+import unittest
+
+import serve
+
+
+class OverlappingConnectionsTest(unittest.TestCase):
+    """A browser keeps its first connection open while fetching the .wasm and .pck in parallel."""
+
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._root = tempfile.TemporaryDirectory()
+        os.chdir(self._root.name)
+        for name in ("index.html", "game.wasm", "game.pck"):
+            with open(name, "wb") as f:
+                f.write(os.urandom(4096))
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._root.cleanup()
+
+    def _start(self, threaded):
+        httpd = serve.create_server(("127.0.0.1", 0), threaded)
+        thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(httpd.server_close)
+        self.addCleanup(httpd.shutdown)
+        return httpd.server_address[1]
+
+    def _check_overlapping(self, threaded):
+        port = self._start(threaded)
+        first = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+        self.addCleanup(first.close)
+        first.request("GET", "/index.html")
+        self.assertEqual(first.getresponse().read(), open("index.html", "rb").read())
+
+        # The first connection is left open; a second one must still be served
+        second = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+        self.addCleanup(second.close)
+        for name in ("game.wasm", "game.pck"):
+            second.request("GET", "/" + name)
+            response = second.getresponse()
+            self.assertEqual(response.status, 200)
+            self.assertEqual(response.read(), open(name, "rb").read())
+
+    def test_single_threaded_server_closes_connections(self):
+        self._check_overlapping(threaded=False)
+
+    def test_threaded_server_keeps_connections_alive(self):
+        self._check_overlapping(threaded=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
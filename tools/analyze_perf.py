@@ -1,158 +1,168 @@
 #!/usr/bin/env python3
-"""Analyze and compare GECS performance test results between two dates."""
-
-import json
-import os
-from datetime import datetime
-from collections import defaultdict
-from pathlib import Path
-
-def parse_jsonl(filepath):
-    """Parse a JSONL file and return list of records."""
-    records = []
-    try:
-        with open(filepath, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    records.append(json.loads(line))
-    except FileNotFoundError:
-        pass
-    return records
-
-def get_records_by_date(records, target_date):
-    """Filter records by date (YYYY-MM-DD format)."""
-    filtered = []
-    for record in records:
-        timestamp = record.get('timestamp', '')
-        if timestamp.startswith(target_date):
-            filtered.append(record)
-    return filtered
-
-def calculate_stats(records):
-    """Calculate average and min/max for records."""
-    if not records:
-        return None
-
-    times = [r.get('time_ms', 0) for r in records]
-    return {
-        'avg': sum(times) / len(times),
-        'min': min(times),
-        'max': max(times),
-        'count': len(times)
-    }
+"""Analyze and compare GECS performance test results between two windows of runs.
 
-def main():
-    perf_dir = Path('reports/perf')
+Usage:
+    python tools/analyze_perf.py                                  # latest day vs the 7 days before it
+    python tools/analyze_perf.py --base 2025-10-15 --current 2025-10-19
+    python tools/analyze_perf.py --base 2025-10-01:2025-10-07 --current 2025-10-14:2025-10-20
+    python tools/analyze_perf.py --scale 10000 --alpha 0.01
+    python tools/analyze_perf.py --metric p95_ms
+
+Each (test, scale) is compared with perf_stats: medians, a bootstrap confidence
+interval for the change and a Mann-Whitney U test. Regressions are attributed
+to the run where change-point detection says they first appeared.
+"""
+
+import argparse
+import sys
+from datetime import date, timedelta
+
+import perf_stats
+from perf_history import METRICS, PerfHistory, seconds_to_datetime
 
-    # Dates to compare
-    date_old = '2025-10-15'  # October 15th
-    date_new = '2025-10-19'  # Today (October 19th)
 
-    # Collect all data
-    all_tests = defaultdict(lambda: {'old': [], 'new': []})
+def parse_window(text):
+    """Parse 'YYYY-MM-DD' or 'YYYY-MM-DD:YYYY-MM-DD' into an inclusive (first, last) date pair."""
+    first, _, last = text.partition(':')
+    first = date.fromisoformat(first)
+    return first, date.fromisoformat(last) if last else first
 
-    # Read all JSONL files
-    for jsonl_file in perf_dir.glob('*.jsonl'):
-        test_name = jsonl_file.stem
-        records = parse_jsonl(jsonl_file)
 
-        old_records = get_records_by_date(records, date_old)
-        new_records = get_records_by_date(records, date_new)
+def latest_date(history):
+    """Most recent date that has any record."""
+    newest = max(
+        (max(series.ts) for series in history.series.values() if len(series)),
+        default=None,
+    )
+    return seconds_to_datetime(newest).date() if newest is not None else date.today()
 
-        if old_records or new_records:
-            all_tests[test_name]['old'] = old_records
-            all_tests[test_name]['new'] = new_records
+
+def fmt_window(window):
+    first, last = window
+    return str(first) if first == last else f"{first}..{last}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare GECS performance results between two windows")
+    parser.add_argument('--base', type=str, default=None,
+                        help="Baseline window: DATE or FIRST:LAST (default: the --days days before --current)")
+    parser.add_argument('--current', type=str, default=None,
+                        help="Current window: DATE or FIRST:LAST (default: latest day with data)")
+    parser.add_argument('--days', type=int, default=7,
+                        help="Length of the default baseline window in days (default: 7)")
+    parser.add_argument('--scale', type=int, action='append', default=None,
+                        help="Only compare this scale (repeatable)")
+    parser.add_argument('--alpha', type=float, default=0.05,
+                        help="Significance level (default: 0.05)")
+    parser.add_argument('--min-effect', type=float, default=2.0,
+                        help="Ignore significant changes smaller than this %% (default: 2)")
+    parser.add_argument('--metric', choices=METRICS, default='time_ms',
+                        help="Per-run value to compare (time_ms is the median for benchmark records)")
+    parser.add_argument('--perf-dir', type=str, default='reports/perf',
+                        help="Path to perf JSONL directory")
+    parser.add_argument('--jobs', type=int, default=0,
+                        help="Processes used to parse new JSONL data (default: 0 = CPU count, 1 = serial)")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Parse the JSONL files without reading or writing the history cache")
+    args = parser.parse_args()
+
+    history = PerfHistory.load(args.perf_dir, use_cache=not args.no_cache, jobs=args.jobs or None)
+    if not len(history):
+        print(f"No data found in {args.perf_dir}/ - run performance tests first.")
+        sys.exit(1)
+
+    current = parse_window(args.current) if args.current else (latest_date(history),) * 2
+    if args.base:
+        base = parse_window(args.base)
+    else:
+        base = (current[0] - timedelta(days=args.days), current[0] - timedelta(days=1))
+
+    results = perf_stats.compare_all(
+        history, base, current, scales=args.scale, alpha=args.alpha, min_effect_pct=args.min_effect,
+        metric=args.metric,
+    )
+
+    improvements = [r for r in results if r.verdict == 'improvement']
+    regressions = [r for r in results if r.verdict == 'regression']
+    unchanged = [r for r in results if r.verdict == 'unchanged']
+    insufficient = [r for r in results if r.verdict == 'insufficient' and r.base_n and r.cur_n]
+    new_tests = [r for r in results if r.verdict == 'new']
+    missing_tests = [r for r in results if r.verdict == 'missing']
 
     # Generate report
     print("=" * 100)
-    print(f"GECS Performance Comparison: {date_old} vs {date_new}")
+    print(f"GECS Performance Comparison: {fmt_window(base)} vs {fmt_window(current)}")
+    print(f"Medians of {args.metric} per window, alpha={args.alpha}, min effect={args.min_effect}%")
+    print(f"Ingested {history.throughput()}")
     print("=" * 100)
     print()
 
-    # Sort tests by category
-    improvements = []
-    regressions = []
-    new_tests = []
-    missing_tests = []
-
-    for test_name in sorted(all_tests.keys()):
-        data = all_tests[test_name]
-        old_stats = calculate_stats(data['old'])
-        new_stats = calculate_stats(data['new'])
-
-        if old_stats and new_stats:
-            # Compare
-            old_avg = old_stats['avg']
-            new_avg = new_stats['avg']
-            diff_ms = new_avg - old_avg
-            diff_pct = ((new_avg - old_avg) / old_avg) * 100 if old_avg > 0 else 0
-
-            result = {
-                'name': test_name,
-                'old_avg': old_avg,
-                'new_avg': new_avg,
-                'diff_ms': diff_ms,
-                'diff_pct': diff_pct,
-                'old_stats': old_stats,
-                'new_stats': new_stats
-            }
-
-            if diff_pct < -5:  # 5% faster = improvement
-                improvements.append(result)
-            elif diff_pct > 5:  # 5% slower = regression
-                regressions.append(result)
-        elif new_stats and not old_stats:
-            new_tests.append({'name': test_name, 'stats': new_stats})
-        elif old_stats and not new_stats:
-            missing_tests.append({'name': test_name, 'stats': old_stats})
+    def print_change(r):
+        ci = f"[{r.ci_low_pct:+.1f}%, {r.ci_high_pct:+.1f}%]"
+        name = f"{r.test} @{r.scale}"
+        print(f"  {name:<50} {r.base_median:>8.2f}ms -> {r.cur_median:>8.2f}ms  ({r.change_pct:>+6.1f}%)"
+              f"  CI {ci:<20} p={r.p_value:.3g}  n={r.base_n}/{r.cur_n}")
+        if r.first_seen:
+            commit = f", commit {r.first_seen_commit[:10]}" if r.first_seen_commit else ""
+            print(f"  {'':<50} first seen in run {r.first_seen} (godot {r.first_seen_version}{commit})")
 
     # Print improvements
     if improvements:
         print(f"\n[+] IMPROVEMENTS ({len(improvements)} tests)")
         print("-" * 100)
-        improvements.sort(key=lambda x: x['diff_pct'])
+        improvements.sort(key=lambda x: x.change_pct)
         for r in improvements:
-            print(f"  {r['name']:<50} {r['old_avg']:>8.2f}ms -> {r['new_avg']:>8.2f}ms  ({r['diff_pct']:>+6.1f}%)")
+            print_change(r)
 
     # Print regressions
     if regressions:
         print(f"\n[-] REGRESSIONS ({len(regressions)} tests)")
         print("-" * 100)
-        regressions.sort(key=lambda x: x['diff_pct'], reverse=True)
+        regressions.sort(key=lambda x: x.change_pct, reverse=True)
         for r in regressions:
-            print(f"  {r['name']:<50} {r['old_avg']:>8.2f}ms -> {r['new_avg']:>8.2f}ms  ({r['diff_pct']:>+6.1f}%)")
+            print_change(r)
+
+    # Too few runs to call either way: show the raw medians
+    if insufficient:
+        print(f"\n[?] NOT ENOUGH RUNS ({len(insufficient)} tests, need {perf_stats.MIN_SAMPLES} per window)")
+        print("-" * 100)
+        for r in sorted(insufficient, key=lambda x: (x.test, x.scale)):
+            name = f"{r.test} @{r.scale}"
+            change = f"({r.change_pct:>+6.1f}%)" if r.change_pct is not None else ""
+            print(f"  {name:<50} {r.base_median:>8.2f}ms -> {r.cur_median:>8.2f}ms  {change}  n={r.base_n}/{r.cur_n}")
 
     # Print new tests
     if new_tests:
         print(f"\n[*] NEW TESTS ({len(new_tests)} tests)")
         print("-" * 100)
-        for t in sorted(new_tests, key=lambda x: x['name']):
-            print(f"  {t['name']:<50} {t['stats']['avg']:>8.2f}ms (new)")
+        for t in sorted(new_tests, key=lambda x: (x.test, x.scale)):
+            print(f"  {t.test + ' @' + str(t.scale):<50} {t.cur_median:>8.2f}ms (new)")
 
     # Print missing tests
     if missing_tests:
         print(f"\n[!] MISSING TESTS ({len(missing_tests)} tests)")
         print("-" * 100)
-        for t in sorted(missing_tests, key=lambda x: x['name']):
-            print(f"  {t['name']:<50} {t['stats']['avg']:>8.2f}ms (missing from {date_new})")
+        for t in sorted(missing_tests, key=lambda x: (x.test, x.scale)):
+            print(f"  {t.test + ' @' + str(t.scale):<50} {t.base_median:>8.2f}ms (missing from {fmt_window(current)})")
 
     # Summary statistics
     print(f"\n" + "=" * 100)
     print("SUMMARY")
     print("=" * 100)
-    if improvements or regressions:
-        total_tests = len(improvements) + len(regressions)
-        avg_improvement = sum(r['diff_pct'] for r in improvements) / len(improvements) if improvements else 0
-        avg_regression = sum(r['diff_pct'] for r in regressions) / len(regressions) if regressions else 0
+    compared = improvements + regressions + unchanged
+    if compared:
+        avg_improvement = sum(r.change_pct for r in improvements) / len(improvements) if improvements else 0
+        avg_regression = sum(r.change_pct for r in regressions) / len(regressions) if regressions else 0
 
-        print(f"Total tests compared: {total_tests}")
+        print(f"Total tests compared: {len(compared)}")
         print(f"Improvements: {len(improvements)} tests (avg {avg_improvement:.1f}% faster)")
         print(f"Regressions: {len(regressions)} tests (avg {avg_regression:.1f}% slower)")
+        print(f"Within noise: {len(unchanged)} tests")
+        print(f"Not enough runs: {len(insufficient)}")
         print(f"New tests: {len(new_tests)}")
         print(f"Missing tests: {len(missing_tests)}")
     else:
-        print("No comparable data found between the two dates.")
+        print("No comparable data found between the two windows.")
 
     print()
 
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""Analyze a GECS frame trace (FrameTrace.save_chrome_trace / World.start_trace).
+
+Usage:
+    python tools/analyze_trace.py frame_trace.json
+    python tools/analyze_trace.py frame_trace.json --top 20 --worst 5
+    python tools/analyze_trace.py frame_trace.json --category system --spike-percentile 95
+    python tools/analyze_trace.py frame_trace.json --spike-ms 16.6
+
+The same file opens in chrome://tracing or https://ui.perfetto.dev for a timeline view.
+This script prints per-event p50/p99/max timings, the worst frames with their biggest
+contributors, and attributes each spike frame (above the chosen frame-time percentile)
+to the event with the largest excess over its own median.
+"""
+
+import argparse
+import json
+import sys
+from collections import defaultdict
+
+import numpy as np
+
+
+def load_events(path):
+    """Complete ("X") events of a Chrome trace file as dicts with ms durations."""
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    raw = data['traceEvents'] if isinstance(data, dict) else data
+    events = []
+    for e in raw:
+        if e.get('ph') != 'X':
+            continue
+        args = e.get('args', {})
+        events.append({
+            'name': e['name'],
+            'cat': e.get('cat', ''),
+            'tid': e.get('tid', 0),
+            'start_ms': e['ts'] / 1000.0,
+            'dur_ms': e['dur'] / 1000.0,
+            'frame': int(args.get('frame', -1)),
+            'entities': int(args.get('entities', 0)),
+        })
+    return events, (data.get('otherData', {}) if isinstance(data, dict) else {})
+
+
+def summarize(events):
+    """Per (category, name) duration statistics, sorted by total time."""
+    groups = defaultdict(list)
+    entity_counts = defaultdict(list)
+    for e in events:
+        groups[(e['cat'], e['name'])].append(e['dur_ms'])
+        entity_counts[(e['cat'], e['name'])].append(e['entities'])
+    rows = []
+    for key, durations in groups.items():
+        d = np.asarray(durations)
+        rows.append({
+            'cat': key[0],
+            'name': key[1],
+            'count': len(d),
+            'total_ms': float(d.sum()),
+            'p50_ms': float(np.percentile(d, 50)),
+            'p99_ms': float(np.percentile(d, 99)),
+            'max_ms': float(d.max()),
+            'entities': float(np.mean(entity_counts[key])),
+        })
+    rows.sort(key=lambda r: r['total_ms'], reverse=True)
+    return rows
+
+
+def frame_times(events):
+    """Engine frame -> summed duration of its World.process() calls."""
+    frames = defaultdict(float)
+    for e in events:
+        if e['cat'] == 'frame':
+            frames[e['frame']] += e['dur_ms']
+    return frames
+
+
+def attribute_spikes(events, frames, threshold_ms, medians):
+    """For each frame slower than threshold_ms: the system with the largest excess over its median."""
+    by_frame = defaultdict(list)
+    for e in events:
+        if e['cat'] == 'system':
+            by_frame[e['frame']].append(e)
+    spikes = []
+    for frame, total in sorted(frames.items()):
+        if total <= threshold_ms or not by_frame[frame]:
+            continue
+        culprit = max(by_frame[frame], key=lambda e: e['dur_ms'] - medians[('system', e['name'])])
+        excess = culprit['dur_ms'] - medians[('system', culprit['name'])]
+        spikes.append((frame, total, culprit, excess))
+    return spikes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analyze a GECS frame trace (Chrome trace JSON)")
+    parser.add_argument('trace', help="Trace file written by FrameTrace.save_chrome_trace")
+    parser.add_argument('--category', choices=['frame', 'system', 'query', 'observer', 'command_flush'],
+                        action='append', default=None, help="Only summarize this category (repeatable)")
+    parser.add_argument('--top', type=int, default=15, help="Rows in the timing table (default: 15)")
+    parser.add_argument('--worst', type=int, default=10, help="Worst frames to list (default: 10)")
+    parser.add_argument('--spike-percentile', type=float, default=99.0,
+                        help="Frames above this frame-time percentile count as spikes (default: 99)")
+    parser.add_argument('--spike-ms', type=float, default=None,
+                        help="Absolute spike threshold in ms (overrides --spike-percentile)")
+    args = parser.parse_args()
+
+    events, meta = load_events(args.trace)
+    if not events:
+        print(f"No events in {args.trace} - was the trace started and a frame processed?")
+        sys.exit(1)
+
+    rows = summarize(events)
+    medians = {(r['cat'], r['name']): r['p50_ms'] for r in rows}
+    frames = frame_times(events)
+
+    print("=" * 100)
+    print(f"GECS Frame Trace: {args.trace}")
+    print(f"{len(events)} events over {len(frames)} sampled frames"
+          f" (sample_every={meta.get('sample_every', 1)}, dropped={meta.get('dropped', 0)})")
+    print("=" * 100)
+
+    # Per-event timings
+    shown = [r for r in rows if not args.category or r['cat'] in args.category]
+    print(f"\nTIMINGS (top {min(args.top, len(shown))} of {len(shown)} by total time)")
+    print("-" * 100)
+    print(f"  {'category':<14} {'name':<36} {'count':>7} {'p50 ms':>9} {'p99 ms':>9} {'max ms':>9}"
+          f" {'entities':>9}")
+    for r in shown[:args.top]:
+        print(f"  {r['cat']:<14} {r['name'][:36]:<36} {r['count']:>7} {r['p50_ms']:>9.3f}"
+              f" {r['p99_ms']:>9.3f} {r['max_ms']:>9.3f} {r['entities']:>9.0f}")
+
+    if not frames:
+        print("\nNo frame events: record through World.process() for frame and spike analysis.")
+        return
+
+    # Worst frames with their biggest contributors
+    contributors = defaultdict(list)
+    for e in events:
+        if e['cat'] == 'system':
+            contributors[e['frame']].append(e)
+    print(f"\nWORST FRAMES ({min(args.worst, len(frames))})")
+    print("-" * 100)
+    for frame, total in sorted(frames.items(), key=lambda x: x[1], reverse=True)[:args.worst]:
+        top = sorted(contributors[frame], key=lambda e: e['dur_ms'], reverse=True)[:3]
+        parts = ", ".join(f"{e['name']} {e['dur_ms']:.2f}ms" for e in top)
+        print(f"  frame {frame:<10} {total:>9.3f}ms  {parts}")
+
+    # Spike attribution
+    totals = np.asarray(list(frames.values()))
+    threshold = args.spike_ms if args.spike_ms is not None else float(
+        np.percentile(totals, args.spike_percentile))
+    spikes = attribute_spikes(events, frames, threshold, medians)
+    print(f"\nSPIKES (frames over {threshold:.3f}ms, median frame {np.median(totals):.3f}ms)")
+    print("-" * 100)
+    if not spikes:
+        print("  None")
+        return
+    blame = defaultdict(int)
+    for frame, total, culprit, excess in spikes:
+        blame[culprit['name']] += 1
+        print(f"  frame {frame:<10} {total:>9.3f}ms  {culprit['name']} +{excess:.3f}ms over its median"
+              f" ({culprit['entities']} entities)")
+    print("\n  Spikes per system:")
+    for name, count in sorted(blame.items(), key=lambda x: x[1], reverse=True):
+        print(f"    {name:<40} {count:>5} ({count * 100.0 / len(spikes):.0f}%)")
+
+
+if __name__ == '__main__':
+    main()
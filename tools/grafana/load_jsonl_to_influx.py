@@ -1,96 +1,324 @@
 #!/usr/bin/env python3
 """
 Load JSONL performance data into InfluxDB for Grafana visualization
+
+Files are streamed line by line and converted to InfluxDB line protocol. Lines
+are grouped into size-bounded batches and handed to a background writer thread,
+so parsing the next batch overlaps with the network write of the previous one.
+
+Loading is incremental: a state file remembers how many bytes of each JSONL
+file have been written successfully (the high-water mark), and only lines past
+it are sent on the next run. A mark only advances after the batch containing
+its lines is acknowledged. Points are keyed by measurement, tags (test, scale,
+godot_version and run_id) and timestamp, so re-sending a line after a crash
+overwrites rather than duplicates it, while the scales of one run stay distinct.
+
+Usage:
+    python load_jsonl_to_influx.py                          # incremental load into InfluxDB
+    python load_jsonl_to_influx.py --full                   # ignore the state file, resend everything
+    python load_jsonl_to_influx.py --dry-run                # parse and batch only, report throughput
+    python load_jsonl_to_influx.py --emit-line-protocol out.lp   # write line protocol to a file instead
+
+InfluxDB settings come from INFLUXDB_URL / INFLUXDB_TOKEN / INFLUXDB_ORG /
+INFLUXDB_BUCKET. The influxdb-client package (see requirements.txt) is only
+needed when writing to a live InfluxDB.
 """
+import argparse
+import glob
 import json
 import os
-import glob
-from datetime import datetime
+import queue
+import sys
+import threading
 import time
+from calendar import timegm
+from datetime import datetime
 
-try:
-    from influxdb_client import InfluxDBClient, Point
-    from influxdb_client.client.write_api import SYNCHRONOUS
-except ImportError:
-    print("Installing required packages...")
-    os.system("pip install influxdb-client")
-    from influxdb_client import InfluxDBClient, Point
-    from influxdb_client.client.write_api import SYNCHRONOUS
-
-def load_jsonl_files():
-    """Load all JSONL files from /data/perf into InfluxDB"""
-    
-    # InfluxDB configuration from environment
-    url = os.getenv('INFLUXDB_URL', 'http://localhost:8086')
-    token = os.getenv('INFLUXDB_TOKEN')
-    org = os.getenv('INFLUXDB_ORG', 'gecs')
-    bucket = os.getenv('INFLUXDB_BUCKET', 'performance')
-    
-    if not token:
-        print("Error: INFLUXDB_TOKEN environment variable not set")
-        return
-    
-    # Wait for InfluxDB to be ready
-    print("Waiting for InfluxDB to be ready...")
-    for i in range(30):
-        try:
-            client = InfluxDBClient(url=url, token=token, org=org)
-            health = client.health()
-            if health.status == "pass":
-                print("InfluxDB is ready!")
-                break
-        except Exception as e:
-            print(f"Waiting for InfluxDB... ({i+1}/30)")
-            time.sleep(2)
+MEASUREMENT = "gecs_performance"
+# Optional numeric fields written by PerfHelpers.benchmark
+FLOAT_FIELDS = ("min_ms", "median_ms", "mean_ms", "p95_ms", "p99_ms", "max_ms", "stddev_ms")
+INT_FIELDS = ("iterations",)
+
+DEFAULT_STATE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".influx_state.json")
+
+
+# ---------------------------------------------------------------------------
+# Line protocol
+# ---------------------------------------------------------------------------
+def _escape_tag(value: str) -> str:
+    return value.replace("\\", "\\\\").replace(",", "\\,").replace("=", "\\=").replace(" ", "\\ ")
+
+
+def to_line_protocol(data: dict) -> str | None:
+    """Convert one JSONL record to a line-protocol line (second precision).
+
+    Returns None for lines that are not perf records (e.g. run_meta lines).
+    Raises on malformed records.
+    """
+    if data.get("kind") == "run_meta":
+        return None
+    # Timestamps are written without an offset; treat them as UTC like before
+    timestamp = datetime.fromisoformat(data['timestamp'].replace('Z', '+00:00'))
+    if timestamp.tzinfo is not None:
+        seconds = int(timestamp.timestamp())
     else:
-        print("Failed to connect to InfluxDB after 60 seconds")
+        seconds = timegm(timestamp.timetuple())
+
+    fields = [f"time_ms={float(data['time_ms'])!r}"]
+    for key in FLOAT_FIELDS:
+        if key in data:
+            fields.append(f"{key}={float(data[key])!r}")
+    for key in INT_FIELDS:
+        if key in data:
+            fields.append(f"{key}={int(data[key])}i")
+
+    # One run writes every scale of a test within the same second, so scale (and the
+    # run id, when present) must be part of the series key or the points overwrite
+    # each other. Tags are sorted by key, as InfluxDB recommends.
+    tags = {"godot_version": data['godot_version'], "scale": str(int(data['scale'])), "test": data['test']}
+    if data.get("run_id"):
+        tags["run_id"] = data["run_id"]
+    tag_set = ",".join(f"{key}={_escape_tag(tags[key])}" for key in sorted(tags))
+    return f"{MEASUREMENT},{tag_set} {','.join(fields)} {seconds}"
+
+
+# ---------------------------------------------------------------------------
+# Incremental state
+# ---------------------------------------------------------------------------
+def load_state(path: str | None) -> dict:
+    if not path:
+        return {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_state(path: str | None, state: dict):
+    if not path:
         return
-    
-    write_api = client.write_api(write_options=SYNCHRONOUS)
-    
-    # Find all JSONL files
-    jsonl_files = glob.glob('/data/perf/*.jsonl')
-    print(f"Found {len(jsonl_files)} JSONL files")
-    
-    total_points = 0
-    
+    tmp = path + ".tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f, indent=1, sort_keys=True)
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"Warning: could not write state file {path}: {e}")
+
+
+def iter_batches(jsonl_files: list[str], state: dict, batch_points: int, batch_bytes: int, stats: dict):
+    """Stream new lines from every file, yielding (lines, marks) batches.
+
+    `marks` maps file name -> byte offset reached once this batch is written.
+    """
+    lines: list[str] = []
+    marks: dict[str, int] = {}
+    size = 0
     for file_path in jsonl_files:
-        test_name = os.path.basename(file_path).replace('.jsonl', '')
-        print(f"Loading {test_name}...")
-        
-        points = []
-        with open(file_path, 'r') as f:
-            for line_num, line in enumerate(f, 1):
+        name = os.path.basename(file_path)
+        offset = state.get(name, 0)
+        if os.path.getsize(file_path) < offset:
+            # File was truncated or replaced; start over
+            offset = 0
+        start = offset
+        with open(file_path, "rb") as f:
+            f.seek(offset)
+            line_num = 0
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break  # partially written line; picked up on the next run
+                offset += len(raw)
+                line_num += 1
+                raw = raw.strip()
+                if not raw:
+                    continue
                 try:
-                    data = json.loads(line.strip())
-                    
-                    # Parse timestamp
-                    timestamp = datetime.fromisoformat(data['timestamp'].replace('Z', '+00:00'))
-                    
-                    # Create InfluxDB point
-                    point = Point("gecs_performance") \
-                        .tag("test", data['test']) \
-                        .tag("godot_version", data['godot_version']) \
-                        .field("time_ms", float(data['time_ms'])) \
-                        .field("scale", int(data['scale'])) \
-                        .time(timestamp)
-                    
-                    points.append(point)
-                    
+                    line = to_line_protocol(json.loads(raw))
                 except Exception as e:
-                    print(f"Error parsing line {line_num} in {file_path}: {e}")
+                    stats["errors"] += 1
+                    print(f"Error parsing {file_path} (line {line_num} from byte {start}): {e}")
+                    continue
+                marks[name] = offset
+                if line is None:
                     continue
-        
-        if points:
+                lines.append(line)
+                size += len(line) + 1
+                if len(lines) >= batch_points or size >= batch_bytes:
+                    yield lines, marks
+                    lines, marks, size = [], {}, 0
+        # Skipped-only tails (blank/meta/bad lines) still advance the mark
+        marks[name] = offset
+    if lines or marks:
+        yield lines, marks
+
+
+# ---------------------------------------------------------------------------
+# Sinks
+# ---------------------------------------------------------------------------
+class InfluxSink:
+    def __init__(self, url: str, token: str, org: str, bucket: str):
+        try:
+            from influxdb_client import InfluxDBClient, WritePrecision
+            from influxdb_client.client.write_api import SYNCHRONOUS
+        except ImportError:
+            sys.exit("influxdb-client is not installed: pip install -r requirements.txt "
+                     "(or use --dry-run / --emit-line-protocol)")
+        self.org, self.bucket = org, bucket
+        self.precision = WritePrecision.S
+        self.client = self._connect(InfluxDBClient, url, token, org)
+        # Batching is done by BackgroundWriter; each call writes one whole batch
+        self.write_api = self.client.write_api(write_options=SYNCHRONOUS)
+
+    @staticmethod
+    def _connect(client_cls, url, token, org):
+        # Wait for InfluxDB to be ready
+        print("Waiting for InfluxDB to be ready...")
+        for i in range(30):
             try:
-                write_api.write(bucket=bucket, org=org, record=points)
-                total_points += len(points)
-                print(f"  Loaded {len(points)} points from {test_name}")
+                client = client_cls(url=url, token=token, org=org)
+                if client.health().status == "pass":
+                    print("InfluxDB is ready!")
+                    return client
+            except Exception:
+                pass
+            print(f"Waiting for InfluxDB... ({i+1}/30)")
+            time.sleep(2)
+        sys.exit("Failed to connect to InfluxDB after 60 seconds")
+
+    def write(self, lines: list[str]):
+        self.write_api.write(bucket=self.bucket, org=self.org, record="\n".join(lines),
+                             write_precision=self.precision)
+
+    def close(self):
+        self.client.close()
+
+
+class FileSink:
+    """Writes line protocol to a local file (or discards it when path is None)."""
+
+    def __init__(self, path: str | None):
+        self.file = open(path, "w", encoding="utf-8") if path else None
+
+    def write(self, lines: list[str]):
+        if self.file:
+            self.file.write("\n".join(lines))
+            self.file.write("\n")
+
+    def close(self):
+        if self.file:
+            self.file.close()
+
+
+class BackgroundWriter:
+    """Sends batches from a bounded queue on a worker thread.
+
+    On success the batch's high-water marks are merged into `state`; after a
+    failed batch nothing later is acknowledged, so the next run resends from
+    the last good mark.
+    """
+
+    def __init__(self, sink, state: dict, max_pending: int = 4):
+        self.sink = sink
+        self.state = state
+        self.points = 0
+        self.failed = False
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._thread = threading.Thread(target=self._run, name="influx-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, lines: list[str], marks: dict[str, int]):
+        self._queue.put((lines, marks))
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            lines, marks = item
+            if self.failed:
+                continue
+            try:
+                if lines:
+                    self.sink.write(lines)
+                self.points += len(lines)
+                self.state.update(marks)
             except Exception as e:
-                print(f"Error writing points for {test_name}: {e}")
-    
-    print(f"\nTotal points loaded: {total_points}")
-    client.close()
+                print(f"Error writing batch of {len(lines)} points: {e}")
+                self.failed = True
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+
+
+def load_jsonl_files(args):
+    """Load new JSONL lines from args.perf_dir into InfluxDB (or a local sink)."""
+    dry_run = args.dry_run or args.emit_line_protocol is not None
+    if dry_run:
+        sink = FileSink(args.emit_line_protocol)
+    else:
+        # InfluxDB configuration from environment
+        token = os.getenv('INFLUXDB_TOKEN')
+        if not token:
+            print("Error: INFLUXDB_TOKEN environment variable not set")
+            return 1
+        sink = InfluxSink(
+            url=os.getenv('INFLUXDB_URL', 'http://localhost:8086'),
+            token=token,
+            org=os.getenv('INFLUXDB_ORG', 'gecs'),
+            bucket=os.getenv('INFLUXDB_BUCKET', 'performance'),
+        )
+
+    # A dry run never advances the real high-water marks unless asked to
+    state_file = args.state_file if (not dry_run or args.state_file != DEFAULT_STATE_FILE) else None
+    state = {} if args.full else load_state(state_file)
+
+    # Find all JSONL files
+    jsonl_files = sorted(glob.glob(os.path.join(args.perf_dir, '*.jsonl')))
+    print(f"Found {len(jsonl_files)} JSONL files")
+
+    stats = {"errors": 0}
+    start = time.perf_counter()
+    writer = BackgroundWriter(sink, state)
+    try:
+        for lines, marks in iter_batches(jsonl_files, state, args.batch_size, args.batch_bytes, stats):
+            writer.submit(lines, marks)
+            if writer.failed:
+                break
+    finally:
+        writer.close()
+        sink.close()
+    elapsed = time.perf_counter() - start
+
+    save_state(state_file, state)
+
+    rate = writer.points / elapsed if elapsed > 0 else 0.0
+    target = args.emit_line_protocol or ("dry run" if dry_run else "InfluxDB")
+    print(f"\nTotal points loaded: {writer.points} -> {target} "
+          f"in {elapsed:.2f}s ({rate:,.0f} points/s, {stats['errors']} bad lines)")
+    return 1 if writer.failed else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load GECS perf JSONL into InfluxDB")
+    parser.add_argument("--perf-dir", default=os.getenv("PERF_DIR", "/data/perf"),
+                        help="Directory containing the perf JSONL files (default: /data/perf)")
+    parser.add_argument("--state-file", default=os.getenv("INFLUX_STATE_FILE", DEFAULT_STATE_FILE),
+                        help="File storing the per-file high-water marks")
+    parser.add_argument("--full", action="store_true",
+                        help="Ignore the high-water marks and resend every line")
+    parser.add_argument("--batch-size", type=int, default=5000,
+                        help="Maximum points per write (default: 5000)")
+    parser.add_argument("--batch-bytes", type=int, default=1 << 20,
+                        help="Maximum line-protocol bytes per write (default: 1 MiB)")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Parse and batch without contacting InfluxDB")
+    parser.add_argument("--emit-line-protocol", metavar="PATH", default=None,
+                        help="Write line protocol to PATH instead of InfluxDB (implies --dry-run)")
+    args = parser.parse_args()
+    sys.exit(load_jsonl_files(args))
+
 
 if __name__ == "__main__":
-    load_jsonl_files()
\ No newline at end of file
+    main()
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+GECS Performance Dashboard
+==========================
+Renders the perf history as one self-contained HTML file (inline CSS and SVG,
+no scripts or external assets), so trends can be browsed as a CI artifact
+without the InfluxDB + Grafana stack in tools/grafana/.
+
+The page has:
+  * regression highlights: significant changes and tests whose scaling
+    exponent grew (same analysis as `perf_report.py` / `--scaling`)
+  * per-category tables with a sparkline of each test's history at its
+    report scale and a log-log scaling curve (current window vs base window)
+
+Sparklines are built from bucketed medians (at most MAX_POINTS buckets per
+test, one day wide until the history gets long), so the page size and the
+render time stay flat no matter how many years of runs are stored.
+
+Normally used through perf_report:
+    python tools/perf_report.py --html reports/perf_dashboard.html --window 7
+"""
+
+import html
+import math
+from datetime import datetime
+
+import numpy as np
+
+import perf_stats
+from perf_history import PerfHistory, seconds_to_datetime
+
+# Maximum number of points per sparkline
+MAX_POINTS = 180
+DAY = 86400.0
+
+SPARK_W, SPARK_H = 180, 34
+CURVE_W, CURVE_H = 130, 60
+
+STYLE = """
+body { font: 13px/1.4 system-ui, sans-serif; margin: 24px; color: #1d2330; background: #fafbfc; }
+h1 { font-size: 20px; margin: 0 0 4px; }
+h2 { font-size: 15px; margin: 28px 0 8px; border-bottom: 1px solid #d6dae1; padding-bottom: 4px; }
+.meta { color: #5c6577; margin-bottom: 16px; }
+table { border-collapse: collapse; width: 100%; background: #fff; }
+th, td { padding: 4px 8px; border-bottom: 1px solid #eceff3; text-align: right; vertical-align: middle; }
+th { background: #f1f3f6; font-weight: 600; }
+td.name, th.name { text-align: left; font-family: ui-monospace, monospace; }
+tr.regression td { background: #fdecec; }
+tr.improvement td { background: #eaf7ee; }
+.worse { color: #c0392b; font-weight: 600; }
+.better { color: #1e8449; font-weight: 600; }
+.noise { color: #8a93a3; }
+.grew { color: #c0392b; font-weight: 600; }
+.empty { color: #8a93a3; font-style: italic; }
+svg { display: block; }
+"""
+
+
+def bucket_medians(history: PerfHistory, test: str, scale: int, metric: str = "time_ms",
+                   max_points: int = MAX_POINTS) -> tuple[np.ndarray, np.ndarray]:
+    """(bucket start seconds, median value) over the whole history of one (test, scale).
+
+    Buckets are whole days, widened so there are at most `max_points` of them.
+    """
+    rows = history.rows(test, scale)
+    if not len(rows):
+        return np.empty(0), np.empty(0)
+    idx = np.frombuffer(rows, dtype=np.int64)
+    ts = perf_stats.as_numpy(history.column(test, "ts"))[idx]
+    values = perf_stats.as_numpy(history.column(test, metric))[idx]
+    day = np.floor(ts / DAY)
+    width = max(1, math.ceil((day[-1] - day[0] + 1) / max_points))
+    bucket = (day - day[0]) // width
+    # Rows are in timestamp order, so every bucket is one contiguous run
+    starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+    medians = np.array([np.median(g) for g in np.split(values, starts[1:])])
+    return day[starts] * DAY, medians
+
+
+def sparkline(xs: np.ndarray, ys: np.ndarray, highlight: str | None = None, unit: str = "ms") -> str:
+    """Inline SVG trend line; the last point is coloured by `highlight` (verdict)."""
+    if not len(ys):
+        return '<span class="empty">no data</span>'
+    pad = 3
+    lo, hi = float(ys.min()), float(ys.max())
+    span_y = hi - lo or 1.0
+    span_x = float(xs[-1] - xs[0]) or 1.0
+    px = pad + (xs - xs[0]) / span_x * (SPARK_W - 2 * pad)
+    py = SPARK_H - pad - (ys - lo) / span_y * (SPARK_H - 2 * pad)
+    points = " ".join(f"{x:.1f},{y:.1f}" for x, y in zip(px, py))
+    colour = {"regression": "#c0392b", "improvement": "#1e8449"}.get(highlight, "#2d6cdf")
+    first_day = seconds_to_datetime(xs[0]).date()
+    last_day = seconds_to_datetime(xs[-1]).date()
+    title = (f"{first_day}: {ys[0]:.3f}{unit} -> {last_day}: {ys[-1]:.3f}{unit} "
+             f"(min {lo:.3f}, max {hi:.3f}, {len(ys)} points)")
+    return (
+        f'<svg width="{SPARK_W}" height="{SPARK_H}" viewBox="0 0 {SPARK_W} {SPARK_H}">'
+        f"<title>{html.escape(title)}</title>"
+        f'<polyline fill="none" stroke="#2d6cdf" stroke-width="1.2" points="{points}"/>'
+        f'<circle cx="{px[-1]:.1f}" cy="{py[-1]:.1f}" r="2.5" fill="{colour}"/>'
+        "</svg>"
+    )
+
+
+def scaling_curve(change) -> str:
+    """Log-log SVG of median time per scale: current window solid, base window dashed."""
+    fits = [f for f in (change.cur, change.base) if f is not None] if change else []
+    if not fits:
+        return '<span class="empty">one scale</span>'
+    pad = 5
+    all_n = [n for f in fits for n in f.scales]
+    all_t = [t for f in fits for t in f.medians]
+    x0, x1 = math.log(min(all_n)), math.log(max(all_n))
+    y0, y1 = math.log(min(all_t)), math.log(max(all_t))
+
+    def xy(n, t):
+        x = pad + (math.log(n) - x0) / ((x1 - x0) or 1.0) * (CURVE_W - 2 * pad)
+        y = CURVE_H - pad - (math.log(t) - y0) / ((y1 - y0) or 1.0) * (CURVE_H - 2 * pad)
+        return x, y
+
+    parts = []
+    for fit, style in ((change.base, 'stroke="#9aa3b2" stroke-dasharray="3,2"'), (change.cur, 'stroke="#2d6cdf"')):
+        if fit is None:
+            continue
+        pts = [xy(n, t) for n, t in zip(fit.scales, fit.medians)]
+        parts.append(f'<polyline fill="none" stroke-width="1.4" {style} '
+                     f'points="{" ".join(f"{x:.1f},{y:.1f}" for x, y in pts)}"/>')
+        if fit is change.cur:
+            parts.extend(f'<circle cx="{x:.1f}" cy="{y:.1f}" r="2" fill="#2d6cdf"/>' for x, y in pts)
+    lines = []
+    for label, fit in (("current", change.cur), ("base", change.base)):
+        if fit is not None:
+            lines.append(f"{label}: exponent {fit.exponent:.2f} ({fit.model}), "
+                         + ", ".join(f"{n}={t:.3f}ms" for n, t in zip(fit.scales, fit.medians)))
+    return (
+        f'<svg width="{CURVE_W}" height="{CURVE_H}" viewBox="0 0 {CURVE_W} {CURVE_H}">'
+        f"<title>{html.escape(chr(10).join(lines))}</title>"
+        f'<rect x="0.5" y="0.5" width="{CURVE_W - 1}" height="{CURVE_H - 1}" fill="none" stroke="#eceff3"/>'
+        + "".join(parts) + "</svg>"
+    )
+
+
+def _pct_cell(c) -> str:
+    if c is None or c.change_pct is None:
+        return '<td class="noise">N/A</td>'
+    cls = {"regression": "worse", "improvement": "better"}.get(c.verdict, "noise")
+    return f'<td class="{cls}">{c.change_pct:+.1f}%</td>'
+
+
+def _ms(value) -> str:
+    return f"{value:.3f}" if value is not None else "N/A"
+
+
+def render_dashboard(
+    history: PerfHistory,
+    results: dict,
+    scaling: list,
+    categories: dict,
+    ref_label: str,
+    cmp_label: str,
+    metric: str = "time_ms",
+    show_all: bool = False,
+    confidence: float = 0.95,
+) -> str:
+    """Render the dashboard page.
+
+    `results` is perf_report.build_results() output and `scaling` is
+    perf_stats.compare_scaling() output for the same two windows, both computed
+    at `confidence` (1 - alpha).
+    """
+    esc = html.escape
+    by_test = {c.test: c for c in scaling}
+    cats = dict(categories)
+    categorized = {t for tests in categories.values() for t in tests}
+    uncategorized = sorted(t for t in results if t not in categorized)
+    if show_all and uncategorized:
+        cats["Other"] = uncategorized
+    shown = {t for tests in cats.values() for t in tests}
+
+    out = [
+        "<!DOCTYPE html>",
+        '<html lang="en"><head><meta charset="utf-8">',
+        "<title>GECS Performance Dashboard</title>",
+        f"<style>{STYLE}</style></head><body>",
+        "<h1>GECS Performance Dashboard</h1>",
+        f'<div class="meta">{esc(ref_label)} vs {esc(cmp_label)} &middot; metric {esc(metric)} &middot; '
+        f"{len(history):,} records, {len(history.tests())} tests &middot; "
+        f"generated {datetime.now().isoformat(timespec='seconds')}</div>",
+    ]
+
+    # Highlights
+    significant = sorted(
+        (results[t]["comparison"] for t in shown if t in results and results[t]["comparison"].significant),
+        key=lambda c: -(c.change_pct or 0),
+    )
+    grown = sorted((c for c in scaling if c.flagged and c.test in shown), key=lambda c: -c.growth)
+    out.append("<h2>Highlights</h2>")
+    if not significant and not grown:
+        out.append('<p class="empty">No significant changes.</p>')
+    if significant:
+        out.append('<table><tr><th class="name">Test</th><th>Scale</th><th>Verdict</th>'
+                   f"<th>{esc(cmp_label)} ms</th><th>{esc(ref_label)} ms</th><th>Change</th>"
+                   f'<th>{confidence * 100:g}% CI</th><th>p</th><th class="name">First seen</th></tr>')
+        for c in significant:
+            first = ""
+            if c.first_seen:
+                first = f"{c.first_seen} ({c.first_seen_version})"
+                if c.first_seen_commit:
+                    first += f" @ {c.first_seen_commit[:10]}"
+            out.append(
+                f'<tr class="{c.verdict}"><td class="name">{esc(c.test)}</td><td>{c.scale}</td>'
+                f"<td>{c.verdict}</td><td>{_ms(c.base_median)}</td><td>{_ms(c.cur_median)}</td>"
+                f"{_pct_cell(c)}<td>[{c.ci_low_pct:+.1f}%, {c.ci_high_pct:+.1f}%]</td>"
+                f'<td>{c.p_value:.3g}</td><td class="name">{esc(first)}</td></tr>'
+            )
+        out.append("</table>")
+    if grown:
+        out.append('<table style="margin-top:12px"><tr><th class="name">Test</th><th>Base exponent</th>'
+                   '<th>Current exponent</th><th>Growth</th><th>Growth CI</th><th class="name">Model</th></tr>')
+        for c in grown:
+            out.append(
+                f'<tr class="regression"><td class="name">{esc(c.test)}</td><td>{c.base.exponent:.2f}</td>'
+                f'<td>{c.cur.exponent:.2f}</td><td class="grew">{c.growth:+.2f}</td>'
+                f"<td>[{c.ci_low:+.2f}, {c.ci_high:+.2f}]</td>"
+                f'<td class="name">{esc(c.base.model)} &rarr; {esc(c.cur.model)}</td></tr>'
+            )
+        out.append("</table>")
+
+    # Per-category tables
+    for cat, tests in cats.items():
+        present = [t for t in tests if t in results]
+        if not present:
+            continue
+        out.append(f"<h2>{esc(cat)}</h2>")
+        out.append('<table><tr><th class="name">Test</th><th>Scale</th>'
+                   f"<th>{esc(cmp_label)} ms</th><th>{esc(ref_label)} ms</th><th>Change</th>"
+                   "<th>History</th><th>Exponent</th><th>&micro;s/entity</th><th>Scaling</th></tr>")
+        for t in present:
+            r = results[t]
+            c = r["comparison"]
+            xs, ys = bucket_medians(history, t, r["scale"], metric)
+            change = by_test.get(t)
+            fit = (change.cur or change.base) if change else None
+            exponent = f"{fit.exponent:.2f}" if fit else "N/A"
+            if change is not None and change.flagged:
+                exponent = f'<span class="grew">{exponent} ({change.growth:+.2f})</span>'
+            row_cls = f' class="{c.verdict}"' if c.significant else ""
+            out.append(
+                f'<tr{row_cls}><td class="name">{esc(t)}</td><td>{r["scale"]}</td>'
+                f'<td>{_ms(r["cmp_ms"])}</td><td>{_ms(r["ref_ms"])}</td>{_pct_cell(c)}'
+                f"<td>{sparkline(xs, ys, c.verdict)}</td><td>{exponent}</td>"
+                f"<td>{f'{fit.per_entity_us:.3f}' if fit else 'N/A'}</td>"
+                f"<td>{scaling_curve(change)}</td></tr>"
+            )
+        out.append("</table>")
+
+    out.append("</body></html>")
+    return "\n".join(out)
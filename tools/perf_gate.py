@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+GECS Performance Gate
+=====================
+Turn the perf JSONL history into a pass/fail signal for CI.
+
+The newest run (by `run_id`, or the newest day for records written before run
+ids existed) is compared per (test, scale) against a rolling baseline made of
+the previous runs. A test fails its budget when it is slower than the baseline
+median by more than `max_regression_pct` AND by more than `noise_sigmas` robust
+standard deviations of the baseline (so noisy tests do not flap). With several
+current samples the perf_stats significance test is used instead of the sigma
+rule. An absolute `max_ms` ceiling can be set as well.
+
+Budgets live in a JSON config (default: tools/perf_gate.json), layered as
+default -> category (from perf_report.CATEGORIES) -> test:
+
+    {
+      "default":    {"max_regression_pct": 20, "noise_sigmas": 3, "mode": "warn"},
+      "categories": {"Query": {"max_regression_pct": 10, "mode": "fail"}},
+      "tests":      {"query_with_component_query": {"max_regression_pct": 5, "max_ms": 50}}
+    }
+
+`mode` is "fail" (breaks the build), "warn" (reported only) or "off".
+
+Usage:
+    python tools/perf_gate.py                                   # newest run vs previous 10 runs
+    python tools/perf_gate.py --baseline-runs 20 --json gate.json --junit gate.xml
+    python tools/perf_gate.py --run 20260317T100000_3fa2c1 --config my_budgets.json
+
+Exit status: 0 = pass, 1 = at least one "fail" budget exceeded, 2 = no usable
+data (unless --allow-missing-baseline).
+"""
+
+import argparse, json, os, sys
+from dataclasses import asdict, dataclass, field
+from xml.etree import ElementTree as ET
+
+import numpy as np
+
+import perf_stats
+from perf_history import METRICS, PerfHistory, seconds_to_datetime
+from perf_report import CATEGORIES
+
+DEFAULT_CONFIG = os.path.join(os.path.dirname(os.path.abspath(__file__)), "perf_gate.json")
+DEFAULT_BUDGET = {"max_regression_pct": 20.0, "noise_sigmas": 3.0, "min_baseline": 3, "max_ms": None, "mode": "warn"}
+
+
+@dataclass
+class GateResult:
+    test: str
+    scale: int
+    category: str
+    mode: str
+    status: str                      # "pass" | "fail" | "warn" | "no_baseline" | "off"
+    current_ms: float | None
+    baseline_ms: float | None
+    change_pct: float | None
+    threshold_pct: float
+    baseline_n: int
+    current_n: int
+    reasons: list[str] = field(default_factory=list)
+
+
+def load_config(path: str | None) -> dict:
+    if not path:
+        return {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        if path != DEFAULT_CONFIG:
+            sys.exit(f"Config file not found: {path}")
+        return {}
+
+
+def category_of(test: str) -> str:
+    for cat, tests in CATEGORIES.items():
+        if test in tests:
+            return cat
+    return "Other"
+
+
+def budget_for(config: dict, test: str, category: str) -> dict:
+    budget = dict(DEFAULT_BUDGET)
+    budget.update(config.get("default", {}))
+    budget.update(config.get("categories", {}).get(category, {}))
+    budget.update(config.get("tests", {}).get(test, {}))
+    return budget
+
+
+def latest_run(history: PerfHistory) -> tuple[str, float]:
+    """(run_id, timestamp) of the newest record; run_id is "" for legacy records."""
+    best_ts, best = float("-inf"), ""
+    for series in history.series.values():
+        if not len(series):
+            continue
+        ts = perf_stats.as_numpy(series.ts)
+        i = int(np.nanargmax(ts))
+        if ts[i] > best_ts:
+            best_ts, best = ts[i], history.run_ids[series.run[i]]
+    return best, best_ts
+
+
+def split_rows(history: PerfHistory, test: str, scale: int, run_index: int, day_start: float | None, baseline_runs: int):
+    """Current rows (this run / this day) and the rolling baseline rows before them.
+
+    `run_index` indexes history.run_ids; it is ignored when `day_start` is set.
+    """
+    rows = history.rows(test, scale)
+    if not len(rows):
+        return [], []
+    idx = np.frombuffer(rows, dtype=np.int64)
+    ts = perf_stats.as_numpy(history.column(test, "ts"))[idx]
+    if day_start is None:
+        run_col = np.frombuffer(history.column(test, "run"), dtype=np.uint32)[idx]
+        current_mask = run_col == run_index
+    else:
+        current_mask = ts >= day_start
+    if not current_mask.any():
+        return [], []
+    first = ts[current_mask].min()
+    before = idx[(ts < first) & ~current_mask]
+    if day_start is None:
+        # Keep the newest `baseline_runs` runs, however many samples each has
+        run_col = np.frombuffer(history.column(test, "run"), dtype=np.uint32)
+        runs_before = run_col[before]
+        keep_runs = []
+        for r in runs_before[::-1]:
+            if r not in keep_runs:
+                keep_runs.append(r)
+                if len(keep_runs) >= baseline_runs:
+                    break
+        before = before[np.isin(runs_before, keep_runs)]
+    else:
+        before = before[-baseline_runs:]
+    return idx[current_mask], before
+
+
+def evaluate(
+    history: PerfHistory,
+    test: str,
+    scale: int,
+    current_rows,
+    baseline_rows,
+    budget: dict,
+    metric: str,
+) -> GateResult:
+    category = category_of(test)
+    cur = perf_stats.window_values(history, test, current_rows, metric)
+    base = perf_stats.window_values(history, test, baseline_rows, metric)
+    result = GateResult(test, scale, category, budget["mode"], "pass", None, None, None,
+                        float(budget["max_regression_pct"]), len(base), len(cur))
+    if budget["mode"] == "off":
+        result.status = "off"
+        return result
+    if len(cur):
+        result.current_ms = float(np.median(cur))
+
+    exceeded = False
+    if budget.get("max_ms") is not None and result.current_ms is not None and result.current_ms > budget["max_ms"]:
+        exceeded = True
+        result.reasons.append(f"{result.current_ms:.3f}ms exceeds absolute budget {budget['max_ms']}ms")
+
+    if len(base) < int(budget["min_baseline"]):
+        if not exceeded:
+            result.status = "no_baseline"
+            result.reasons.append(f"only {len(base)} baseline samples (need {budget['min_baseline']})")
+            return result
+    else:
+        base_med, base_mad = perf_stats.median_mad(base)
+        result.baseline_ms = base_med
+        if base_med > 0:
+            result.change_pct = (result.current_ms - base_med) / base_med * 100.0
+            over_budget = result.change_pct > result.threshold_pct
+            if len(cur) >= perf_stats.MIN_SAMPLES:
+                cmp = perf_stats.compare(test, scale, base, cur)
+                beyond_noise = cmp.verdict == "regression"
+                noise = f"p={cmp.p_value:.3g}"
+            else:
+                sigma = perf_stats.MAD_TO_SIGMA * base_mad
+                beyond_noise = result.current_ms > base_med + float(budget["noise_sigmas"]) * sigma
+                noise = f"{(result.current_ms - base_med) / sigma:.1f} sigma" if sigma > 0 else "no baseline noise"
+            if over_budget and beyond_noise:
+                exceeded = True
+                result.reasons.append(
+                    f"{result.change_pct:+.1f}% vs baseline median {base_med:.3f}ms "
+                    f"(budget {result.threshold_pct:+.1f}%, {noise})"
+                )
+
+    if exceeded:
+        result.status = "fail" if budget["mode"] == "fail" else "warn"
+    return result
+
+
+def write_junit(path: str, results: list[GateResult], label: str):
+    root = ET.Element("testsuites", name=f"perf_gate {label}")
+    by_category: dict[str, list[GateResult]] = {}
+    for r in results:
+        by_category.setdefault(r.category, []).append(r)
+    for category, items in by_category.items():
+        suite = ET.SubElement(
+            root, "testsuite", name=f"perf.{category}", tests=str(len(items)),
+            failures=str(sum(r.status == "fail" for r in items)),
+            skipped=str(sum(r.status in ("no_baseline", "off") for r in items)),
+        )
+        for r in items:
+            case = ET.SubElement(suite, "testcase", classname=f"perf.{category}", name=f"{r.test}@{r.scale}")
+            if r.status == "fail":
+                ET.SubElement(case, "failure", message="; ".join(r.reasons), type="PerfRegression")
+            elif r.status in ("no_baseline", "off"):
+                ET.SubElement(case, "skipped", message="; ".join(r.reasons) or r.status)
+            elif r.status == "warn":
+                ET.SubElement(case, "system-out").text = "WARNING: " + "; ".join(r.reasons)
+    ET.ElementTree(root).write(path, encoding="utf-8", xml_declaration=True)
+
+
+def main():
+    sys.stdout.reconfigure(encoding="utf-8")
+
+    parser = argparse.ArgumentParser(description="GECS performance regression gate")
+    parser.add_argument("--perf-dir", type=str, default="reports/perf",
+                        help="Path to perf JSONL directory")
+    parser.add_argument("--config", type=str, default=DEFAULT_CONFIG,
+                        help="Budget config JSON (default: tools/perf_gate.json)")
+    parser.add_argument("--run", type=str, default=None,
+                        help="run_id to gate (default: the newest run)")
+    parser.add_argument("--baseline-runs", type=int, default=10,
+                        help="Number of previous runs forming the rolling baseline (default: 10)")
+    parser.add_argument("--metric", choices=METRICS, default="time_ms",
+                        help="Per-run value to gate on (default: time_ms)")
+    parser.add_argument("--category", type=str, action="append", default=None,
+                        help="Only gate these categories (repeatable)")
+    parser.add_argument("--json", type=str, default=None,
+                        help="Write a JSON summary to this path")
+    parser.add_argument("--junit", type=str, default=None,
+                        help="Write a JUnit XML report to this path")
+    parser.add_argument("--allow-missing-baseline", action="store_true",
+                        help="Exit 0 instead of 2 when there is no data to gate on")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Parse the JSONL files without reading or writing the history cache")
+    args = parser.parse_args()
+
+    config = load_config(args.config)
+    history = PerfHistory.load(args.perf_dir, use_cache=not args.no_cache)
+    missing_exit = 0 if args.allow_missing_baseline else 2
+    if not len(history):
+        print(f"perf_gate: no data found in {args.perf_dir}/")
+        sys.exit(missing_exit)
+
+    run_id, newest = latest_run(history)
+    if args.run:
+        if args.run not in history.run_ids:
+            sys.exit(f"perf_gate: unknown run '{args.run}' (no records with that run_id in {args.perf_dir}/)")
+        run_id = args.run
+    run_index = history.run_ids.index(run_id) if run_id in history.run_ids else -1
+    day_start = None
+    if not run_id:
+        # Legacy records without run ids: the newest day is the current run
+        newest_day = seconds_to_datetime(newest).replace(hour=0, minute=0, second=0, microsecond=0)
+        day_start = (newest_day - seconds_to_datetime(0)).total_seconds()
+        label = f"day {newest_day.date()}"
+    else:
+        label = f"run {run_id}"
+
+    wanted = {c.lower() for c in args.category} if args.category else None
+    results = []
+    for test in history.tests():
+        category = category_of(test)
+        if wanted is not None and category.lower() not in wanted:
+            continue
+        budget = budget_for(config, test, category)
+        for scale in history.scales(test):
+            current_rows, baseline_rows = split_rows(history, test, scale, run_index, day_start, args.baseline_runs)
+            if not len(current_rows):
+                continue
+            results.append(evaluate(history, test, scale, current_rows, baseline_rows, budget, args.metric))
+
+    failures = [r for r in results if r.status == "fail"]
+    warnings = [r for r in results if r.status == "warn"]
+    no_baseline = [r for r in results if r.status == "no_baseline"]
+
+    print(f"GECS perf gate: {label}, {len(results)} checks, baseline = previous {args.baseline_runs} runs, metric {args.metric}")
+    for r in failures + warnings:
+        print(f"  {r.status.upper():<5} [{r.category}] {r.test}@{r.scale}: {'; '.join(r.reasons)}")
+    print(f"  {len(failures)} failed, {len(warnings)} warnings, {len(no_baseline)} without baseline, "
+          f"{sum(r.status == 'pass' for r in results)} passed")
+
+    if not results:
+        status = missing_exit
+    elif failures:
+        status = 1
+    elif len(no_baseline) == len(results):
+        status = missing_exit
+    else:
+        status = 0
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({
+                "run": label,
+                "metric": args.metric,
+                "baseline_runs": args.baseline_runs,
+                "status": "fail" if status == 1 else ("pass" if status == 0 else "no_data"),
+                "exit_code": status,
+                "counts": {"checks": len(results), "failed": len(failures), "warnings": len(warnings),
+                           "no_baseline": len(no_baseline)},
+                "results": [asdict(r) for r in results],
+            }, f, indent=2)
+    if args.junit:
+        write_junit(args.junit, results, label)
+
+    sys.exit(status)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,517 @@
+#!/usr/bin/env python3
+"""
+GECS Performance History Store
+==============================
+Compact, incrementally refreshed cache of the `reports/perf/*.jsonl` history.
+
+Every record is stored once in per-test columnar arrays (timestamp, scale,
+time_ms, godot_version and the PerfHelpers.benchmark statistics) and indexed by (test, scale) in timestamp order, so
+reports can do date-range lookups with a bisect instead of rescanning and
+re-sorting every JSONL line on every run.
+
+The cache remembers the byte offset it has consumed in each JSONL file. Since
+the perf suites only ever append, a refresh only parses the new tail of each
+file. If a file shrinks or disappears the cache is rebuilt from scratch. Large
+refreshes (a first build, or many new runs) are parsed concurrently in a
+process pool, one newline-aligned byte range per task, and merged in file
+order; small ones stay serial.
+
+Usage:
+    from perf_history import PerfHistory
+    history = PerfHistory.load("reports/perf")
+    rows = history.rows_on_date("query_with_all", 1000, date.today())
+    history.column("query_with_all", "time_ms")[rows[-1]]
+
+    python tools/perf_history.py --rebuild     # force a full rebuild
+    python tools/perf_history.py               # refresh and print a summary
+
+Records written by `PerfHelpers.benchmark` carry min/p95/p99/stddev and an
+iteration count. Older single-sample records are stored as one iteration
+whose percentiles all equal `time_ms`, so every metric column is populated.
+
+Records carry the `run_id` of the PerfHelpers session that produced them. The
+session metadata (git commit, machine fingerprint, CPU count) arrives as a
+`"kind": "run_meta"` line, either in `_runs.jsonl` or at the top of a per-run
+`run_<run_id>.jsonl` file; both layouts are read the same way.
+"""
+
+import argparse, glob, json, os, pickle, sys, time
+from array import array
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date, datetime, timedelta
+
+CACHE_FORMAT = 3
+CACHE_NAME = ".perf_history.cache"
+HEAD_BYTES = 256  # leading bytes remembered per file to detect rewrites
+# Parse in a process pool only when there is at least this much new data;
+# below it the pool start-up costs more than it saves.
+PARALLEL_MIN_BYTES = 4 << 20
+# Large files are split into newline-aligned ranges of about this size.
+CHUNK_BYTES = 8 << 20
+
+_EPOCH = datetime(1970, 1, 1)
+
+# Per-sample timing columns that can be selected as the metric for reports.
+METRICS = ("time_ms", "min_ms", "p95_ms", "p99_ms")
+
+
+def ts_to_seconds(ts: str) -> float:
+    """Parse an ISO timestamp into naive seconds since 1970 (NaN if invalid).
+
+    The Godot side writes local wall-clock time without an offset, so the
+    value is treated as naive on purpose: date boundaries stay where they are
+    in the JSONL files regardless of the machine running the report.
+    """
+    try:
+        dt = datetime.fromisoformat(ts)
+    except Exception:
+        return float("nan")
+    if dt.tzinfo is not None:
+        dt = dt.replace(tzinfo=None)
+    return (dt - _EPOCH).total_seconds()
+
+
+def seconds_to_datetime(seconds: float) -> datetime:
+    return _EPOCH + timedelta(seconds=seconds)
+
+
+def date_to_seconds(d: date) -> float:
+    return (datetime(d.year, d.month, d.day) - _EPOCH).total_seconds()
+
+
+class TestSeries:
+    """Columnar storage for every record of one test, in ingestion order."""
+
+    __slots__ = ("ts", "scale", "time_ms", "version", "min_ms", "p95_ms", "p99_ms", "stddev_ms", "iterations", "run")
+
+    def __init__(self):
+        self.ts = array("d")
+        self.scale = array("q")
+        self.time_ms = array("d")  # median for benchmark records
+        self.version = array("H")  # index into PerfHistory.versions
+        self.min_ms = array("d")
+        self.p95_ms = array("d")
+        self.p99_ms = array("d")
+        self.stddev_ms = array("d")
+        self.iterations = array("q")
+        self.run = array("I")  # index into PerfHistory.run_ids
+
+    def __len__(self) -> int:
+        return len(self.time_ms)
+
+    def columns(self) -> dict[str, array]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_columns(cls, columns: dict[str, array]) -> "TestSeries":
+        series = cls()
+        for name in cls.__slots__:
+            setattr(series, name, columns[name])
+        return series
+
+    def append(self, ts: float, scale: int, time_ms: float, version: int, run: int, rec: dict):
+        self.ts.append(ts)
+        self.scale.append(scale)
+        self.time_ms.append(time_ms)
+        self.version.append(version)
+        # A single-sample record is its own min and percentiles
+        self.min_ms.append(float(rec.get("min_ms", time_ms)))
+        self.p95_ms.append(float(rec.get("p95_ms", time_ms)))
+        self.p99_ms.append(float(rec.get("p99_ms", time_ms)))
+        self.stddev_ms.append(float(rec.get("stddev_ms", 0.0)))
+        self.iterations.append(int(rec.get("iterations", 1)))
+        self.run.append(run)
+
+
+class PerfHistory:
+    """Per-test columnar perf history with (test, scale, date) range lookups."""
+
+    def __init__(self, perf_dir: str = "reports/perf"):
+        self.perf_dir = perf_dir
+        self.series: dict[str, TestSeries] = {}
+        self.versions: list[str] = []
+        self.offsets: dict[str, int] = {}  # jsonl basename -> bytes consumed
+        self.heads: dict[str, bytes] = {}  # jsonl basename -> leading bytes seen at ingest
+        self._version_ids: dict[str, int] = {}
+        self.run_ids: list[str] = [""]  # index 0: records written before run ids existed
+        self._run_ids: dict[str, int] = {"": 0}
+        self.runs: dict[str, dict] = {}  # run_id -> run_meta record
+        self._index: dict[tuple[str, int], tuple[array, array]] = {}
+        self.new_records = 0  # records parsed by the last refresh()
+        self.last_refresh = {"records": 0, "bytes": 0, "seconds": 0.0, "workers": 0}
+
+    # ------------------------------------------------------------------
+    # Loading / persistence
+    # ------------------------------------------------------------------
+    @property
+    def cache_path(self) -> str:
+        return os.path.join(self.perf_dir, CACHE_NAME)
+
+    @classmethod
+    def load(
+        cls, perf_dir: str = "reports/perf", use_cache: bool = True, rebuild: bool = False, jobs: int | None = None
+    ) -> "PerfHistory":
+        """Load the cached history for `perf_dir` and ingest any new JSONL lines.
+
+        `use_cache=False` parses everything in memory without touching the cache
+        file; `rebuild=True` ignores the existing cache and writes a fresh one.
+        `jobs` caps the parse worker processes (None = CPU count, 1 = serial).
+        """
+        history = None
+        if use_cache and not rebuild:
+            history = cls._read_cache(perf_dir)
+        if history is None:
+            history = cls(perf_dir)
+        history.refresh(jobs)
+        if use_cache and (rebuild or history.new_records or not os.path.exists(history.cache_path)):
+            history.save()
+        return history
+
+    @classmethod
+    def _read_cache(cls, perf_dir: str) -> "PerfHistory | None":
+        path = os.path.join(perf_dir, CACHE_NAME)
+        try:
+            with open(path, "rb") as f:
+                state = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+            return None
+        if not isinstance(state, dict) or state.get("format") != CACHE_FORMAT:
+            return None
+        history = cls(perf_dir)
+        history.versions = state["versions"]
+        history._version_ids = {v: i for i, v in enumerate(history.versions)}
+        history.run_ids = state["run_ids"]
+        history._run_ids = {r: i for i, r in enumerate(history.run_ids)}
+        history.runs = state["runs"]
+        history.offsets = state["offsets"]
+        history.heads = state["heads"]
+        for test, columns in state["series"].items():
+            history.series[test] = TestSeries.from_columns(columns)
+        return history
+
+    def _state(self) -> dict:
+        return {
+            "versions": self.versions,
+            "run_ids": self.run_ids,
+            "runs": self.runs,
+            # Plain arrays only, so the state loads no matter which script wrote it.
+            "series": {test: series.columns() for test, series in self.series.items()},
+        }
+
+    def save(self):
+        state = self._state()
+        state.update(format=CACHE_FORMAT, offsets=self.offsets, heads=self.heads)
+        tmp = self.cache_path + ".tmp"
+        try:
+            with open(tmp, "wb") as f:
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self.cache_path)
+        except OSError as e:
+            print(f"Warning: could not write perf history cache {self.cache_path}: {e}", file=sys.stderr)
+
+    def _reset(self):
+        self.series.clear()
+        self.versions.clear()
+        self._version_ids.clear()
+        self.run_ids[:] = [""]
+        self._run_ids = {"": 0}
+        self.runs.clear()
+        self.offsets.clear()
+        self.heads.clear()
+        self._index.clear()
+
+    def refresh(self, jobs: int | None = None) -> int:
+        """Ingest lines appended since the last refresh. Returns the number of new records."""
+        start = time.perf_counter()
+        paths = {os.path.basename(p): p for p in glob.glob(os.path.join(self.perf_dir, "*.jsonl"))}
+
+        # Append-only is the contract; anything else means the cache is stale.
+        stale = any(not self._is_appended(name, paths.get(name)) for name in self.offsets)
+        if stale:
+            self._reset()
+
+        pending = []
+        for name in sorted(paths):
+            offset, size = self.offsets.get(name, 0), os.path.getsize(paths[name])
+            if size > offset:
+                pending.append((name, paths[name], offset, size))
+        total = sum(size - offset for _, _, offset, size in pending)
+
+        workers = min(jobs or _available_cpus(), 61)  # 61: ProcessPoolExecutor limit on Windows
+        ranges = _split_ranges(pending) if workers > 1 and total >= PARALLEL_MIN_BYTES else None
+        if ranges and len(ranges) > 1:
+            try:
+                self.new_records = self._ingest_parallel(ranges, workers)
+            except (OSError, BrokenProcessPool):
+                # No usable process pool here (sandbox, frozen app, ...); parse serially
+                workers, self.new_records = 1, self._ingest_serial(pending)
+        else:
+            workers, self.new_records = 1, self._ingest_serial(pending)
+
+        for name, path, _, _ in pending:
+            self._update_head(name, path)
+        if self.new_records:
+            self._index.clear()
+        self.last_refresh = {
+            "records": self.new_records,
+            "bytes": total,
+            "seconds": time.perf_counter() - start,
+            "workers": workers,
+        }
+        return self.new_records
+
+    def throughput(self) -> str:
+        """Human readable summary of the last refresh, e.g. for report headers."""
+        r = self.last_refresh
+        rate = r["records"] / r["seconds"] if r["seconds"] > 0 else 0.0
+        return (f"{r['records']:,} new records ({r['bytes'] / 1048576:.1f} MiB) in {r['seconds']:.2f}s "
+                f"= {rate:,.0f} records/s, {r['workers']} worker(s)")
+
+    def _is_appended(self, name: str, path: str | None) -> bool:
+        """True if `path` still starts with what was ingested and has not shrunk."""
+        if path is None or os.path.getsize(path) < self.offsets[name]:
+            return False
+        head = self.heads.get(name, b"")
+        with open(path, "rb") as f:
+            return f.read(len(head)) == head
+
+    def _update_head(self, name: str, path: str):
+        if len(self.heads.get(name, b"")) < HEAD_BYTES:
+            with open(path, "rb") as f:
+                self.heads[name] = f.read(min(HEAD_BYTES, self.offsets.get(name, 0)))
+
+    def _ingest_serial(self, pending: list[tuple[str, str, int, int]]) -> int:
+        count = 0
+        for name, path, offset, size in pending:
+            end, n = _read_range(path, offset, size, self)
+            self.offsets[name] = end
+            count += n
+        return count
+
+    def _ingest_parallel(self, ranges: list[tuple[str, str, int, int]], workers: int) -> int:
+        """Parse byte ranges in worker processes, then merge them in order."""
+        with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as pool:
+            results = list(pool.map(_parse_range, [(path, start, end) for _, path, start, end in ranges]))
+        count = 0
+        for (name, _, _, _), (end, n, part) in zip(ranges, results):
+            self._merge(part)
+            self.offsets[name] = end  # ranges are in file order, so the last one wins
+            count += n
+        return count
+
+    def _merge(self, part: dict):
+        """Append another history's _state() (parsed elsewhere) to this one."""
+        vmap = [self._intern_version(v) for v in part["versions"]]
+        rmap = [self._intern_run(r) for r in part["run_ids"]]
+        self.runs.update(part["runs"])
+        for test, columns in part["series"].items():
+            series = self.series.get(test)
+            if series is None:
+                series = self.series[test] = TestSeries()
+            for name in TestSeries.__slots__:
+                if name == "version":
+                    series.version.extend(vmap[v] for v in columns[name])
+                elif name == "run":
+                    series.run.extend(rmap[r] for r in columns[name])
+                else:
+                    getattr(series, name).extend(columns[name])
+
+    def _ingest_bytes(self, data: bytes) -> int:
+        count = 0
+        for line in data.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                rec = json.loads(line)
+                self.add_record(rec)
+                count += 1
+            except Exception:
+                pass
+        return count
+
+    def add_record(self, rec: dict):
+        """Append one parsed JSONL record to its test's columns (or register run metadata)."""
+        if rec.get("kind") == "run_meta":
+            self.runs[rec["run_id"]] = rec
+            return
+        test = rec["test"]
+        time_ms = float(rec["time_ms"])
+        scale = int(rec.get("scale") or 0)
+        vid = self._intern_version(rec.get("godot_version", ""))
+        rid = self._intern_run(rec.get("run_id", ""))
+        series = self.series.get(test)
+        if series is None:
+            series = self.series[test] = TestSeries()
+        series.append(ts_to_seconds(rec.get("timestamp", "")), scale, time_ms, vid, rid, rec)
+
+    def _intern_version(self, version: str) -> int:
+        vid = self._version_ids.get(version)
+        if vid is None:
+            vid = len(self.versions)
+            self.versions.append(version)
+            self._version_ids[version] = vid
+        return vid
+
+    def _intern_run(self, run_id: str) -> int:
+        rid = self._run_ids.get(run_id)
+        if rid is None:
+            rid = len(self.run_ids)
+            self.run_ids.append(run_id)
+            self._run_ids[run_id] = rid
+        return rid
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def tests(self) -> list[str]:
+        return sorted(self.series)
+
+    def scales(self, test: str) -> list[int]:
+        series = self.series.get(test)
+        return sorted(set(series.scale)) if series else []
+
+    def column(self, test: str, name: str) -> array:
+        """Raw column (any TestSeries slot, e.g. `ts`, `time_ms`, `p95_ms`) for a test."""
+        return getattr(self.series[test], name)
+
+    def version_of(self, test: str, row: int) -> str:
+        return self.versions[self.series[test].version[row]]
+
+    def run_of(self, test: str, row: int) -> dict:
+        """Run metadata for a row ({"run_id": ...} only if its run_meta line is missing)."""
+        run_id = self.run_ids[self.series[test].run[row]]
+        if not run_id:
+            return {}
+        return self.runs.get(run_id, {"run_id": run_id})
+
+    def _sorted(self, test: str, scale: int) -> tuple[array, array]:
+        """(sorted timestamps, matching row indices) for one (test, scale)."""
+        key = (test, scale)
+        entry = self._index.get(key)
+        if entry is None:
+            series = self.series.get(test)
+            if series is None:
+                entry = (array("d"), array("q"))
+            else:
+                ts = series.ts
+                rows = sorted(
+                    (i for i, s in enumerate(series.scale) if s == scale and ts[i] == ts[i]),
+                    key=ts.__getitem__,
+                )
+                entry = (array("d", (ts[i] for i in rows)), array("q", rows))
+            self._index[key] = entry
+        return entry
+
+    def rows(self, test: str, scale: int) -> array:
+        """All rows for (test, scale) in timestamp order."""
+        return self._sorted(test, scale)[1]
+
+    def rows_between(self, test: str, scale: int, start: float | None = None, end: float | None = None) -> array:
+        """Rows for (test, scale) with start <= timestamp < end (seconds), timestamp ordered."""
+        ts, rows = self._sorted(test, scale)
+        lo = 0 if start is None else bisect_left(ts, start)
+        hi = len(ts) if end is None else bisect_left(ts, end)
+        return rows[lo:hi]
+
+    def rows_in_dates(self, test: str, scale: int, first: date, last: date) -> array:
+        """Rows for (test, scale) whose date lies in [first, last]."""
+        return self.rows_between(test, scale, date_to_seconds(first), date_to_seconds(last + timedelta(days=1)))
+
+    def rows_on_date(self, test: str, scale: int, d: date) -> array:
+        return self.rows_in_dates(test, scale, d, d)
+
+    def count_until(self, test: str, scale: int, end: float) -> int:
+        ts, _ = self._sorted(test, scale)
+        return bisect_right(ts, end)
+
+    def records(self, test: str) -> list[dict]:
+        """Materialise a test's records as JSONL-shaped dicts (ingestion order)."""
+        series = self.series.get(test)
+        if series is None:
+            return []
+        return [
+            {
+                "timestamp": seconds_to_datetime(series.ts[i]).isoformat() if series.ts[i] == series.ts[i] else "",
+                "test": test,
+                "scale": series.scale[i],
+                "time_ms": series.time_ms[i],
+                "godot_version": self.versions[series.version[i]],
+                "min_ms": series.min_ms[i],
+                "p95_ms": series.p95_ms[i],
+                "p99_ms": series.p99_ms[i],
+                "stddev_ms": series.stddev_ms[i],
+                "iterations": series.iterations[i],
+                "run_id": self.run_ids[series.run[i]],
+            }
+            for i in range(len(series))
+        ]
+
+    def __len__(self) -> int:
+        return sum(len(s) for s in self.series.values())
+
+
+def _available_cpus() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1  # respects CI container CPU pinning
+    return os.cpu_count() or 1
+
+
+def _read_range(path: str, start: int, end: int, history: PerfHistory) -> tuple[int, int]:
+    """Ingest the complete lines of path[start:end] into `history`.
+
+    Returns (offset after the last complete line, records ingested); a partially
+    written tail is left for the next refresh.
+    """
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    cut = data.rfind(b"\n") + 1
+    return start + cut, history._ingest_bytes(data[:cut]) if cut else 0
+
+
+def _parse_range(args: tuple[str, int, int]) -> tuple[int, int, dict]:
+    """Process-pool worker: parse one byte range into a standalone history state."""
+    path, start, end = args
+    part = PerfHistory("")
+    consumed, count = _read_range(path, start, end, part)
+    return consumed, count, part._state()
+
+
+def _split_ranges(pending: list[tuple[str, str, int, int]]) -> list[tuple[str, str, int, int]]:
+    """Split each pending (name, path, start, end) into newline-aligned ranges of ~CHUNK_BYTES."""
+    ranges = []
+    for name, path, start, end in pending:
+        with open(path, "rb") as f:
+            pos = start
+            while end - pos > CHUNK_BYTES:
+                f.seek(pos + CHUNK_BYTES)
+                f.readline()
+                boundary = f.tell()
+                if boundary >= end:
+                    break
+                ranges.append((name, path, pos, boundary))
+                pos = boundary
+        ranges.append((name, path, pos, end))
+    return ranges
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GECS performance history cache")
+    parser.add_argument("--perf-dir", type=str, default="reports/perf",
+                        help="Path to perf JSONL directory")
+    parser.add_argument("--rebuild", action="store_true",
+                        help="Discard the existing cache and rebuild it from the JSONL files")
+    parser.add_argument("--jobs", type=int, default=0,
+                        help="Parse worker processes (default: 0 = CPU count, 1 = serial)")
+    args = parser.parse_args()
+
+    history = PerfHistory.load(args.perf_dir, rebuild=args.rebuild, jobs=args.jobs or None)
+    print(f"Perf history: {len(history)} records, {len(history.series)} tests -> {history.cache_path}")
+    print(f"  Ingested: {history.throughput()}")
+
+
+if __name__ == "__main__":
+    main()
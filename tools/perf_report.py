@@ -10,11 +10,29 @@ Usage:
     python tools/perf_report.py --category Query       # filter to one category
     python tools/perf_report.py --scale 1000           # only show scale=1000 results
     python tools/perf_report.py --all                  # show all tests (not just major categories)
+    python tools/perf_report.py --metric p95_ms        # compare benchmark p95 instead of the median
+    python tools/perf_report.py --window 7             # compare the last 7 days vs the 7 days before
+    python tools/perf_report.py --rebuild-cache        # rebuild the perf history cache first
+    python tools/perf_report.py --scaling --window 7   # fit time vs scale, flag exponent growth
+    python tools/perf_report.py --html dashboard.html  # self-contained HTML/SVG dashboard
+
+History is read through the incremental cache in tools/perf_history.py, so only
+JSONL lines appended since the previous run are parsed. Each side of the
+comparison is the median of its window of runs; with enough runs per window
+the change is tested for significance (tools/perf_stats.py), and changes
+within the noise are labelled as such.
+
+--scaling uses every recorded scale instead of one: time is fitted against
+scale per test (log-log), reporting the empirical exponent (1 = linear,
+2 = quadratic), the best matching complexity class and the marginal cost per
+entity, and flagging tests whose exponent grew between the two windows.
 """
 
-import json, glob, sys, argparse
-from collections import defaultdict
-from datetime import datetime, date, timedelta
+import sys, argparse
+from datetime import date, timedelta
+
+import perf_stats
+from perf_history import METRICS, PerfHistory, seconds_to_datetime
 
 # ---------------------------------------------------------------------------
 # Category definitions — add/remove tests here as new suites are added
@@ -23,6 +41,7 @@ CATEGORIES = {
     "Entity": [
         "entity_creation", "entity_with_components", "entity_world_addition",
         "entity_removal", "bulk_entity_operations",
+        "entity_add_entities_with_components", "entity_spawn",
     ],
     "Component": [
         "component_addition", "multiple_component_addition", "component_removal",
@@ -32,10 +51,12 @@ CATEGORIES = {
         "query_with_all", "query_with_any", "query_with_none", "query_complex",
         "query_caching", "query_with_component_query", "query_with_group",
         "query_group_with_components", "query_disabled_entities_no_impact",
+        "query_selective_component_query", "query_indexed_component_query",
     ],
     "System": [
         "system_processing", "multiple_systems", "system_no_matches",
         "system_groups", "system_dynamic_entities", "system_continuous_velocity",
+        "system_resource_iteration", "system_packed_iteration",
     ],
     "Hotpath": [
         "hotpath_query_execution", "hotpath_component_access", "hotpath_data_read",
@@ -47,6 +68,7 @@ CATEGORIES = {
         "observer_property_changes", "observer_baseline_overhead",
         "observer_frequent_changes", "observer_sporadic_changes",
         "multiple_observers_same_component", "observer_complex_query",
+        "observer_many_unrelated_observers",
     ],
     "CommandBuffer": [
         "command_buffer_bulk_removal_backwards", "command_buffer_bulk_removal_command_buffer",
@@ -60,49 +82,33 @@ CATEGORIES = {
     ],
     "Relationship": [
         "relationship_query_exact", "relationship_query_wildcard",
-        "component_query_for_rel_comparison",
+        "component_query_for_rel_comparison", "relationship_target_cleanup",
+        "relationship_query_sources",
+    ],
+    "Network": [
+        "network_sync_dictionary", "network_sync_packed", "network_sender_sparse_changes",
+    ],
+    "Serialization": [
+        "serialization_save_tres", "serialization_load_tres", "serialization_save_res",
+        "serialization_load_res", "serialization_save_snapshot", "serialization_load_snapshot",
+        "serialization_save_snapshot_delta", "serialization_save_snapshot_async",
     ],
 }
 
 PREFER_LOWER = True  # lower time_ms = better
 
 
-def parse_ts(ts: str) -> datetime:
-    try:
-        return datetime.fromisoformat(ts)
-    except Exception:
-        return datetime.min
-
-
-def load_data(perf_dir: str = "reports/perf") -> dict[str, list[dict]]:
-    data: dict[str, list[dict]] = defaultdict(list)
-    for path in glob.glob(f"{perf_dir}/*.jsonl"):
-        with open(path, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    rec = json.loads(line)
-                    data[rec["test"]].append(rec)
-                except Exception:
-                    pass
-    return data
-
-
-def pick_scale(records: list[dict], prefer: int | None = None) -> tuple[int | None, list[dict]]:
-    if prefer is not None:
-        hits = [r for r in records if r.get("scale") == prefer]
-        if hits:
-            return prefer, hits
+def pick_scale(history: PerfHistory, test_name: str, prefer: int | None = None) -> int | None:
+    scales = history.scales(test_name)
+    if prefer is not None and prefer in scales:
+        return prefer
     for s in [10000, 1000, 100]:
-        hits = [r for r in records if r.get("scale") == s]
-        if hits:
-            return s, hits
-    return None, records
+        if s in scales:
+            return s
+    return scales[-1] if scales else None
 
 
-def pct_str(val: float | None, ref: float | None) -> str:
+def pct_str(val: float | None, ref: float | None, verdict: str | None = None) -> str:
     if val is None or ref is None:
         return "N/A"
     if ref == 0:
@@ -111,30 +117,48 @@ def pct_str(val: float | None, ref: float | None) -> str:
     if abs(diff) < 1.0:
         return "~0%"
     sign = "+" if diff > 0 else "-"
-    better = diff < 0  # lower is better for time
-    label = "BETTER" if better else "WORSE "
+    if verdict == "unchanged":
+        # Enough runs to test, and the difference is within the noise
+        label = "noise "
+    else:
+        better = diff < 0  # lower is better for time
+        label = "BETTER" if better else "WORSE "
     return f"{sign}{abs(diff):.1f}% {label}"
 
 
-def build_results(data: dict, ref_date: date, cmp_date: date, scale_pref: int | None) -> dict:
+def build_results(
+    history: PerfHistory,
+    ref_date: date,
+    cmp_date: date,
+    scale_pref: int | None,
+    window: int = 1,
+    alpha: float = 0.05,
+    metric: str = "time_ms",
+) -> dict:
+    """Per-test medians of the `window` days ending at ref_date / cmp_date, plus a
+    statistical verdict for ref vs cmp (see perf_stats.compare_dates)."""
+    span = timedelta(days=window - 1)
     results = {}
-    for test_name, records in data.items():
-        records.sort(key=lambda r: parse_ts(r.get("timestamp", "")))
-        scale, scale_records = pick_scale(records, scale_pref)
-        if not scale_records:
+    for test_name in history.tests():
+        scale = pick_scale(history, test_name, scale_pref)
+        rows = history.rows(test_name, scale) if scale is not None else []
+        if not rows:
             continue
-        scale_records.sort(key=lambda r: parse_ts(r.get("timestamp", "")))
 
-        earliest = scale_records[0]
-        ref_recs = [r for r in scale_records if parse_ts(r.get("timestamp", "")).date() == ref_date]
-        cmp_recs = [r for r in scale_records if parse_ts(r.get("timestamp", "")).date() == cmp_date]
+        times = history.column(test_name, metric)
+        earliest = rows[0]
+        comparison = perf_stats.compare_dates(
+            history, test_name, scale, (cmp_date - span, cmp_date), (ref_date - span, ref_date),
+            alpha=alpha, metric=metric,
+        )
 
         results[test_name] = {
             "scale": scale,
-            "earliest_date": str(parse_ts(earliest.get("timestamp", "")).date()),
-            "earliest_ms": earliest["time_ms"],
-            "ref_ms": ref_recs[-1]["time_ms"] if ref_recs else None,   # "today"
-            "cmp_ms": cmp_recs[-1]["time_ms"] if cmp_recs else None,   # "yesterday"
+            "earliest_date": str(seconds_to_datetime(history.column(test_name, "ts")[earliest]).date()),
+            "earliest_ms": times[earliest],
+            "ref_ms": comparison.cur_median,    # "today"
+            "cmp_ms": comparison.base_median,   # "yesterday"
+            "comparison": comparison,
         }
     return results
 
@@ -195,7 +219,7 @@ def print_report(
             e_str = f"{earliest:.2f}ms ({r['earliest_date']})"
             cmp_str = f"{cmp:.2f}ms" if cmp is not None else "N/A"
             ref_str = f"{ref:.2f}ms" if ref is not None else "N/A"
-            vs_cmp = pct_str(ref, cmp)
+            vs_cmp = pct_str(ref, cmp, r["comparison"].verdict)
             vs_first = pct_str(ref if ref is not None else cmp, earliest)
 
             cat_rows.append((t, r["scale"], e_str, cmp_str, ref_str, vs_cmp, vs_first))
@@ -223,6 +247,79 @@ def print_report(
 
     if not any_printed:
         print("\n  No results found for the given filters.")
+        return
+
+    shown = {t for tests in cats_to_show.values() for t in tests}
+    significant = [results[t]["comparison"] for t in sorted(shown) if t in results and results[t]["comparison"].significant]
+    if significant:
+        print(f"\n{'='*120}")
+        print(f"  SIGNIFICANT CHANGES ({ref_label} vs {cmp_label})")
+        print(f"{'='*120}")
+        for c in significant:
+            ci = f"[{c.ci_low_pct:+.1f}%, {c.ci_high_pct:+.1f}%]"
+            line = (f"  {c.verdict.upper():<12} {c.test:<52} {c.change_pct:+7.1f}%  CI {ci:<20}"
+                    f"  p={c.p_value:.3g}  n={c.base_n}/{c.cur_n}")
+            if c.first_seen:
+                line += f"  first seen {c.first_seen} ({c.first_seen_version})"
+                if c.first_seen_commit:
+                    line += f" @ {c.first_seen_commit[:10]}"
+            print(line)
+
+
+def print_scaling(
+    changes: list, ref_label: str, cmp_label: str, categories: dict, show_all: bool, confidence: float = 0.95
+):
+    by_test = {c.test: c for c in changes}
+    categorized = {t for tests in categories.values() for t in tests}
+    cats_to_show = dict(categories)
+    uncategorized = sorted(t for t in by_test if t not in categorized)
+    if show_all and uncategorized:
+        cats_to_show["Other"] = uncategorized
+
+    header = (
+        f"  {'Test':<52} {'Scales':>16}  {ref_label + ' exp':>14} {f'{confidence * 100:g}% CI':>15}  {'Model':<11}"
+        f"  {'us/entity':>10}  {cmp_label + ' exp':>12}  {'Growth':>7}"
+    )
+    any_printed = False
+    for cat, tests in cats_to_show.items():
+        cat_rows = [by_test[t] for t in tests if t in by_test]
+        if not cat_rows:
+            continue
+        print(f"\n{'='*120}")
+        print(f"  {cat.upper()}  (time vs scale)")
+        print(f"{'='*120}")
+        print(header)
+        print("  " + "-" * (len(header) - 2))
+        for c in cat_rows:
+            fit = c.cur or c.base
+            scales = "/".join(str(s) for s in fit.scales)
+            if c.cur is not None:
+                cur = f"{c.cur.exponent:.2f}"
+                ci = f"[{c.cur.ci_low:.2f}, {c.cur.ci_high:.2f}]"
+            else:
+                cur, ci = "N/A", ""
+            base = f"{c.base.exponent:.2f}" if c.base is not None else "N/A"
+            growth = f"{c.growth:+.2f}" if c.growth is not None else ""
+            flag = "  GREW" if c.flagged else ""
+            print(
+                f"  {c.test:<52} {scales:>16}  {cur:>14} {ci:>15}  {fit.model:<11}"
+                f"  {fit.per_entity_us:>10.3f}  {base:>12}  {growth:>7}{flag}"
+            )
+        any_printed = True
+
+    if not any_printed:
+        print("\n  No tests with results at two or more scales.")
+        return
+
+    shown = {t for tests in cats_to_show.values() for t in tests}
+    grown = [c for c in changes if c.flagged and c.test in shown]
+    if grown:
+        print(f"\n{'='*120}")
+        print(f"  SCALING GREW ({ref_label} vs {cmp_label})")
+        print(f"{'='*120}")
+        for c in sorted(grown, key=lambda c: -c.growth):
+            print(f"  {c.test:<52} exponent {c.base.exponent:.2f} -> {c.cur.exponent:.2f}"
+                  f"  ({c.base.model} -> {c.cur.model}, growth CI [{c.ci_low:+.2f}, {c.ci_high:+.2f}])")
 
 
 def main():
@@ -245,6 +342,24 @@ def main():
                         help="Reference date YYYY-MM-DD (default: today)")
     parser.add_argument("--cmp-date", type=str, default=None,
                         help="Comparison date YYYY-MM-DD (default: N days ago)")
+    parser.add_argument("--window", type=int, default=1,
+                        help="Days of runs on each side of the comparison (default: 1)")
+    parser.add_argument("--alpha", type=float, default=0.05,
+                        help="Significance level for regression detection (default: 0.05)")
+    parser.add_argument("--metric", choices=METRICS, default="time_ms",
+                        help="Per-run value to compare: time_ms (median for benchmark records), min_ms, p95_ms, p99_ms")
+    parser.add_argument("--scaling", action="store_true",
+                        help="Fit time against scale per test and report complexity exponents")
+    parser.add_argument("--min-growth", type=float, default=0.1,
+                        help="With --scaling, flag exponent growth of at least this much (default: 0.1)")
+    parser.add_argument("--html", type=str, default=None, metavar="PATH",
+                        help="Write a self-contained HTML dashboard (trends, scaling curves, regressions) to PATH")
+    parser.add_argument("--jobs", type=int, default=0,
+                        help="Processes used to parse new JSONL data (default: 0 = CPU count, 1 = serial)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Parse the JSONL files without reading or writing the history cache")
+    parser.add_argument("--rebuild-cache", action="store_true",
+                        help="Discard the history cache and rebuild it from the JSONL files")
     args = parser.parse_args()
 
     ref_date = date.fromisoformat(args.ref_date) if args.ref_date else date.today()
@@ -253,13 +368,13 @@ def main():
     ref_label = str(ref_date) if args.ref_date else "Today"
     cmp_label = str(cmp_date) if args.cmp_date else f"-{args.days}d"
 
-    data = load_data(args.perf_dir)
-    if not data:
+    history = PerfHistory.load(
+        args.perf_dir, use_cache=not args.no_cache, rebuild=args.rebuild_cache, jobs=args.jobs or None
+    )
+    if not len(history):
         print(f"No data found in {args.perf_dir}/ — run performance tests first.")
         sys.exit(1)
 
-    results = build_results(data, ref_date, cmp_date, args.scale)
-
     cats = CATEGORIES
     if args.category:
         matched = {k: v for k, v in CATEGORIES.items() if k.lower() == args.category.lower()}
@@ -271,10 +386,40 @@ def main():
     print(f"\nGECS Performance Report")
     print(f"  Reference : {ref_label}  ({ref_date})")
     print(f"  Compare   : {cmp_label}  ({cmp_date})")
-    print(f"  Scale pref: {args.scale or 'auto (10000 > 1000 > 100)'}")
+    if args.scaling:
+        print(f"  Scales    : all (log-log fit, min growth {args.min_growth})")
+    else:
+        print(f"  Scale pref: {args.scale or 'auto (10000 > 1000 > 100)'}")
+    print(f"  Window    : {max(1, args.window)} day(s) per side, alpha={args.alpha}")
+    print(f"  Metric    : {args.metric}")
     print(f"  Data dir  : {args.perf_dir}/")
-
-    print_report(results, ref_label, cmp_label, cats, args.show_all, args.min_diff)
+    print(f"  Ingested  : {history.throughput()}")
+
+    span = timedelta(days=max(1, args.window) - 1)
+    if args.html:
+        from perf_dashboard import render_dashboard
+
+        results = build_results(history, ref_date, cmp_date, args.scale, max(1, args.window), args.alpha, args.metric)
+        changes = perf_stats.compare_scaling(
+            history, (cmp_date - span, cmp_date), (ref_date - span, ref_date),
+            min_growth=args.min_growth, confidence=1.0 - args.alpha, metric=args.metric,
+        )
+        page = render_dashboard(
+            history, results, changes, cats, ref_label, cmp_label, args.metric, args.show_all,
+            confidence=1.0 - args.alpha,
+        )
+        with open(args.html, "w", encoding="utf-8") as f:
+            f.write(page)
+        print(f"\n  Dashboard : {args.html} ({len(page) / 1024:.0f} KiB)")
+    elif args.scaling:
+        changes = perf_stats.compare_scaling(
+            history, (cmp_date - span, cmp_date), (ref_date - span, ref_date),
+            min_growth=args.min_growth, confidence=1.0 - args.alpha, metric=args.metric,
+        )
+        print_scaling(changes, ref_label, cmp_label, cats, args.show_all, 1.0 - args.alpha)
+    else:
+        results = build_results(history, ref_date, cmp_date, args.scale, max(1, args.window), args.alpha, args.metric)
+        print_report(results, ref_label, cmp_label, cats, args.show_all, args.min_diff)
     print()
 
 
@@ -0,0 +1,486 @@
+#!/usr/bin/env python3
+"""
+GECS Performance Statistics
+===========================
+Shared regression analysis for the perf tooling (perf_report, analyze_perf).
+
+A single `PerfHelpers.time_it` sample is noisy, so comparisons are made
+between *windows* of runs rather than single records:
+
+  * median and MAD (median absolute deviation) per window
+  * bootstrap confidence interval for the relative change of the medians
+  * Mann-Whitney U test for "the current window is slower/faster"
+  * change-point detection over the full (test, scale) history, used to tie
+    a regression to the run where it first appeared
+  * scaling curves: a log-log fit of time against scale per test, giving the
+    empirical complexity exponent and the marginal cost per entity
+
+Everything operates on NumPy views of the columnar arrays kept by
+`perf_history.PerfHistory`, and the bootstrap is evaluated for all resamples
+at once, so analysing thousands of (test, scale) pairs stays fast.
+
+Requires NumPy (`pip install -r tools/requirements.txt`).
+"""
+
+import sys
+from dataclasses import dataclass, field
+from datetime import date
+from math import erfc
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    sys.exit("perf_stats requires NumPy: pip install -r tools/requirements.txt")
+
+from perf_history import PerfHistory, date_to_seconds, seconds_to_datetime
+
+# Below this many runs per window we still report medians but never call a verdict.
+MIN_SAMPLES = 3
+# Exact Mann-Whitney distribution is used when both windows are at most this size.
+EXACT_MWU_LIMIT = 30
+# Consistency constant turning a MAD into a normal-equivalent standard deviation.
+MAD_TO_SIGMA = 1.4826
+# Candidate complexity classes for scaling fits (f(n) up to a constant factor).
+COMPLEXITY_MODELS = {
+    "O(1)": lambda n: np.ones_like(n),
+    "O(log n)": np.log,
+    "O(n)": lambda n: n,
+    "O(n log n)": lambda n: n * np.log(n),
+    "O(n^2)": lambda n: n * n,
+}
+
+
+@dataclass
+class Comparison:
+    """Outcome of comparing one (test, scale) between a base and a current window."""
+
+    test: str
+    scale: int
+    base_n: int
+    cur_n: int
+    base_median: float | None
+    cur_median: float | None
+    base_mad: float | None
+    cur_mad: float | None
+    change_pct: float | None       # relative change of medians, + = slower
+    ci_low_pct: float | None       # bootstrap CI of change_pct
+    ci_high_pct: float | None
+    p_value: float | None          # two-sided Mann-Whitney U
+    verdict: str                   # "regression" | "improvement" | "unchanged" | "insufficient" | "new" | "missing"
+    first_seen: str | None = None  # timestamp of the run that introduced a regression
+    first_seen_version: str | None = None
+    first_seen_commit: str | None = None  # git commit of that run, if its run metadata is known
+
+    @property
+    def significant(self) -> bool:
+        return self.verdict in ("regression", "improvement")
+
+
+@dataclass
+class ScalingFit:
+    """Time-vs-scale fit for one test over one window of runs."""
+
+    test: str
+    scales: list[int]
+    medians: list[float]           # median time per scale
+    counts: list[int]              # runs per scale
+    exponent: float                # slope of log(time) vs log(scale)
+    ci_low: float                  # bootstrap CI of the exponent
+    ci_high: float
+    model: str                     # best matching COMPLEXITY_MODELS key
+    per_entity_us: float           # marginal cost per entity between the two largest scales
+    boot: np.ndarray = field(default=None, repr=False)  # bootstrap exponents
+
+
+@dataclass
+class ScalingChange:
+    """Exponent of one test in a base window vs a current window."""
+
+    test: str
+    base: ScalingFit | None
+    cur: ScalingFit | None
+    growth: float | None           # cur.exponent - base.exponent
+    ci_low: float | None           # bootstrap CI of the growth
+    ci_high: float | None
+    flagged: bool = False
+
+
+# ---------------------------------------------------------------------------
+# Primitive statistics
+# ---------------------------------------------------------------------------
+def as_numpy(values) -> np.ndarray:
+    """Zero-copy float64 view of an array('d') column (copies anything else)."""
+    try:
+        return np.frombuffer(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        return np.asarray(values, dtype=np.float64)
+
+
+def window_values(history: PerfHistory, test: str, rows, column: str = "time_ms") -> np.ndarray:
+    """Values of `column` for the given timestamp-ordered rows."""
+    if len(rows) == 0:
+        return np.empty(0, dtype=np.float64)
+    idx = np.frombuffer(rows, dtype=np.int64) if hasattr(rows, "typecode") else np.asarray(rows, dtype=np.int64)
+    return as_numpy(history.column(test, column))[idx]
+
+
+def median_mad(x: np.ndarray) -> tuple[float, float]:
+    med = float(np.median(x))
+    return med, float(np.median(np.abs(x - med)))
+
+
+def rankdata(x: np.ndarray) -> np.ndarray:
+    """Average ranks (1-based), matching scipy.stats.rankdata(method='average')."""
+    order = np.argsort(x, kind="mergesort")
+    xs = x[order]
+    # Start index of each run of equal values
+    starts = np.flatnonzero(np.r_[True, xs[1:] != xs[:-1]])
+    counts = np.diff(np.r_[starts, len(xs)])
+    avg = starts + (counts + 1) / 2.0
+    ranks = np.empty(len(x), dtype=np.float64)
+    ranks[order] = np.repeat(avg, counts)
+    return ranks
+
+
+def _exact_u_cdf(m: int, n: int) -> np.ndarray:
+    """P(U <= u) for u in 0..m*n under H0, assuming no ties."""
+    # freq[i][j] = distribution of U for i vs j samples; built one row at a time.
+    prev = [np.ones(1, dtype=np.float64) for _ in range(n + 1)]  # i = 0: U is always 0
+    for i in range(1, m + 1):
+        cur = [np.ones(1, dtype=np.float64)]  # j = 0
+        for j in range(1, n + 1):
+            size = i * j + 1
+            dist = np.zeros(size)
+            a = prev[j]      # largest element from the first sample: contributes j
+            dist[j:j + len(a)] += a
+            b = cur[j - 1]   # largest element from the second sample: contributes 0
+            dist[:len(b)] += b
+            cur.append(dist)
+        prev = cur
+    freq = prev[n]
+    return np.cumsum(freq) / freq.sum()
+
+
+def mann_whitney(a: np.ndarray, b: np.ndarray) -> float:
+    """Two-sided Mann-Whitney U p-value for samples a and b."""
+    m, n = len(a), len(b)
+    if m == 0 or n == 0:
+        return 1.0
+    ranks = rankdata(np.concatenate([a, b]))
+    u = float(ranks[:m].sum() - m * (m + 1) / 2.0)
+    u_min = min(u, m * n - u)
+
+    has_ties = len(np.unique(np.concatenate([a, b]))) < m + n
+    if m <= EXACT_MWU_LIMIT and n <= EXACT_MWU_LIMIT and not has_ties:
+        cdf = _exact_u_cdf(m, n)
+        return float(min(1.0, 2.0 * cdf[int(round(u_min))]))
+
+    # Normal approximation with tie correction and continuity correction
+    _, tie_counts = np.unique(ranks, return_counts=True)
+    total = m + n
+    tie_term = float((tie_counts ** 3 - tie_counts).sum()) / (total * (total - 1))
+    sigma = np.sqrt(m * n / 12.0 * ((total + 1) - tie_term))
+    if sigma == 0:
+        return 1.0
+    z = (abs(u - m * n / 2.0) - 0.5) / sigma
+    return float(min(1.0, erfc(z / np.sqrt(2.0))))
+
+
+def bootstrap_change_ci(
+    base: np.ndarray,
+    cur: np.ndarray,
+    n_boot: int = 2000,
+    confidence: float = 0.95,
+    rng: np.random.Generator | None = None,
+) -> tuple[float, float]:
+    """Bootstrap CI (percent) for the relative change of medians, cur vs base."""
+    rng = rng if rng is not None else np.random.default_rng(0)
+    base_med = np.median(base[rng.integers(0, len(base), (n_boot, len(base)))], axis=1)
+    cur_med = np.median(cur[rng.integers(0, len(cur), (n_boot, len(cur)))], axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        change = (cur_med - base_med) / base_med * 100.0
+    change = change[np.isfinite(change)]
+    if len(change) == 0:
+        return float("nan"), float("nan")
+    tail = (1.0 - confidence) / 2.0 * 100.0
+    lo, hi = np.percentile(change, [tail, 100.0 - tail])
+    return float(lo), float(hi)
+
+
+# ---------------------------------------------------------------------------
+# Change-point detection
+# ---------------------------------------------------------------------------
+def change_points(x: np.ndarray, min_size: int = 3, penalty: float = 3.0) -> list[int]:
+    """Binary segmentation for shifts in level of log(x).
+
+    Returns the sorted indices where a new segment starts. Segment cost is the
+    squared deviation from the segment mean; a split is accepted when it lowers
+    the cost by more than `penalty * sigma^2 * log(n)`, with sigma estimated
+    robustly from first differences so the outliers we are looking for do not
+    inflate it.
+    """
+    n = len(x)
+    if n < 2 * min_size:
+        return []
+    y = np.log(np.maximum(x, 1e-9))
+    diffs = np.diff(y)
+    sigma = MAD_TO_SIGMA * float(np.median(np.abs(diffs - np.median(diffs)))) / np.sqrt(2.0)
+    if sigma <= 0:
+        sigma = float(np.std(y)) or 1e-9
+    threshold = penalty * sigma * sigma * np.log(n)
+
+    csum = np.r_[0.0, np.cumsum(y)]
+    csum2 = np.r_[0.0, np.cumsum(y * y)]
+
+    found: list[int] = []
+    stack = [(0, n)]
+    while stack:
+        lo, hi = stack.pop()
+        if hi - lo < 2 * min_size:
+            continue
+        splits = np.arange(lo + min_size, hi - min_size + 1)
+        gains = _segment_cost(csum, csum2, lo, hi) - (
+            _segment_cost(csum, csum2, lo, splits) + _segment_cost(csum, csum2, splits, hi)
+        )
+        best = int(np.argmax(gains))
+        if gains[best] > threshold:
+            k = int(splits[best])
+            found.append(k)
+            stack.append((lo, k))
+            stack.append((k, hi))
+    return sorted(found)
+
+
+def _segment_cost(csum: np.ndarray, csum2: np.ndarray, lo, hi):
+    """Sum of squared deviations of y[lo:hi]; either bound may be an index array."""
+    length = hi - lo
+    s = csum[hi] - csum[lo]
+    return (csum2[hi] - csum2[lo]) - s * s / length
+
+
+def first_regressing_run(x: np.ndarray, start: int = 0, end: int | None = None, min_size: int = 3) -> int | None:
+    """Index of the run where the largest upward level shift in x[start:end] begins."""
+    end = len(x) if end is None else end
+    best, best_shift = None, 0.0
+    points = change_points(x, min_size=min_size)
+    bounds = [0] + points + [len(x)]
+    for i, k in enumerate(points):
+        if not (start < k <= end):
+            continue
+        before = np.median(x[bounds[i]:k])
+        after = np.median(x[k:bounds[i + 2]])
+        shift = (after - before) / before if before > 0 else 0.0
+        if shift > best_shift:
+            best, best_shift = k, shift
+    return best
+
+
+# ---------------------------------------------------------------------------
+# Window comparison
+# ---------------------------------------------------------------------------
+def compare(
+    test: str,
+    scale: int,
+    base: np.ndarray,
+    cur: np.ndarray,
+    alpha: float = 0.05,
+    min_effect_pct: float = 2.0,
+    n_boot: int = 2000,
+    rng: np.random.Generator | None = None,
+) -> Comparison:
+    """Compare two windows of samples. Lower time is better."""
+    base_med, base_mad = median_mad(base) if len(base) else (None, None)
+    cur_med, cur_mad = median_mad(cur) if len(cur) else (None, None)
+    result = Comparison(test, scale, len(base), len(cur), base_med, cur_med, base_mad, cur_mad,
+                        None, None, None, None, "insufficient")
+    if not len(base):
+        result.verdict = "new" if len(cur) else "insufficient"
+        return result
+    if not len(cur):
+        result.verdict = "missing"
+        return result
+    if base_med:
+        result.change_pct = (cur_med - base_med) / base_med * 100.0
+    if len(base) < MIN_SAMPLES or len(cur) < MIN_SAMPLES or not base_med:
+        return result
+
+    result.ci_low_pct, result.ci_high_pct = bootstrap_change_ci(base, cur, n_boot=n_boot, confidence=1.0 - alpha, rng=rng)
+    result.p_value = mann_whitney(base, cur)
+
+    # Significant only if the test rejects H0, the CI excludes zero and the
+    # effect is large enough to matter.
+    if result.p_value < alpha and abs(result.change_pct) >= min_effect_pct:
+        if result.change_pct > 0 and result.ci_low_pct > 0:
+            result.verdict = "regression"
+        elif result.change_pct < 0 and result.ci_high_pct < 0:
+            result.verdict = "improvement"
+        else:
+            result.verdict = "unchanged"
+    else:
+        result.verdict = "unchanged"
+    return result
+
+
+def compare_dates(
+    history: PerfHistory,
+    test: str,
+    scale: int,
+    base_dates: tuple[date, date],
+    cur_dates: tuple[date, date],
+    alpha: float = 0.05,
+    min_effect_pct: float = 2.0,
+    attribute: bool = True,
+    metric: str = "time_ms",
+) -> Comparison:
+    """Compare runs in [base_dates] against runs in [cur_dates] for one (test, scale).
+
+    When the result is a regression and `attribute` is set, change-point
+    detection over the full history up to the end of the current window
+    identifies the run where the slowdown first appeared. `metric` selects the
+    per-run value compared (`time_ms` is the median for benchmark records).
+    """
+    base_rows = history.rows_in_dates(test, scale, *base_dates)
+    cur_rows = history.rows_in_dates(test, scale, *cur_dates)
+    result = compare(test, scale, window_values(history, test, base_rows, metric), window_values(history, test, cur_rows, metric),
+                     alpha=alpha, min_effect_pct=min_effect_pct)
+
+    if attribute and result.verdict == "regression":
+        rows = history.rows(test, scale)
+        x = window_values(history, test, rows, metric)
+        base_start = history.count_until(test, scale, date_to_seconds(base_dates[0]) - 1e-6)
+        cur_end = history.count_until(test, scale, date_to_seconds(cur_dates[1]) + 86400 - 1e-6)
+        k = first_regressing_run(x[:cur_end], start=base_start)
+        if k is not None:
+            row = rows[k]
+            result.first_seen = seconds_to_datetime(history.column(test, "ts")[row]).isoformat()
+            result.first_seen_version = history.version_of(test, row)
+            result.first_seen_commit = history.run_of(test, row).get("git_commit") or None
+    return result
+
+
+def compare_all(
+    history: PerfHistory,
+    base_dates: tuple[date, date],
+    cur_dates: tuple[date, date],
+    scales: list[int] | None = None,
+    tests: list[str] | None = None,
+    alpha: float = 0.05,
+    min_effect_pct: float = 2.0,
+    metric: str = "time_ms",
+) -> list[Comparison]:
+    """compare_dates() for every (test, scale) in the history (optionally filtered)."""
+    results = []
+    for test in tests if tests is not None else history.tests():
+        for scale in history.scales(test):
+            if scales is not None and scale not in scales:
+                continue
+            results.append(compare_dates(history, test, scale, base_dates, cur_dates, alpha, min_effect_pct, metric=metric))
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Scaling curves
+# ---------------------------------------------------------------------------
+def loglog_slope(n: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """Least-squares slope of log(t) against log(n); `t` may be (scales,) or (k, scales)."""
+    x = np.log(n)
+    x = x - x.mean()
+    y = np.log(t)
+    return (y - y.mean(axis=-1, keepdims=True)) @ x / (x @ x)
+
+
+def best_model(n: np.ndarray, t: np.ndarray) -> str:
+    """COMPLEXITY_MODELS entry whose shape best fits t(n) in log space."""
+    y = np.log(t)
+    best, best_cost = None, np.inf
+    for name, f in COMPLEXITY_MODELS.items():
+        r = y - np.log(f(n))
+        cost = float(((r - r.mean()) ** 2).sum())
+        if cost < best_cost - 1e-12:
+            best, best_cost = name, cost
+    return best
+
+
+def fit_scaling(
+    test: str,
+    samples: dict[int, np.ndarray],
+    n_boot: int = 1000,
+    confidence: float = 0.95,
+    rng: np.random.Generator | None = None,
+) -> ScalingFit | None:
+    """Fit time against scale from per-scale samples. None with fewer than two usable scales."""
+    usable = sorted(s for s, x in samples.items() if s > 1 and len(x) and np.all(x > 0))
+    if len(usable) < 2:
+        return None
+    n = np.asarray(usable, dtype=np.float64)
+    medians = np.array([np.median(samples[s]) for s in usable])
+
+    # Resample every scale's runs independently and refit
+    rng = rng if rng is not None else np.random.default_rng(0)
+    boot_t = np.empty((n_boot, len(usable)))
+    for j, s in enumerate(usable):
+        x = samples[s]
+        boot_t[:, j] = np.median(x[rng.integers(0, len(x), size=(n_boot, len(x)))], axis=1)
+    boot = loglog_slope(n, boot_t)
+    tail = (1.0 - confidence) / 2.0 * 100.0
+    low, high = np.percentile(boot, [tail, 100.0 - tail])
+
+    per_entity = (medians[-1] - medians[-2]) / (n[-1] - n[-2]) * 1000.0
+    return ScalingFit(
+        test, usable, medians.tolist(), [len(samples[s]) for s in usable],
+        float(loglog_slope(n, medians)), float(low), float(high),
+        best_model(n, medians), float(per_entity), boot,
+    )
+
+
+def scaling_in_dates(
+    history: PerfHistory,
+    test: str,
+    dates: tuple[date, date],
+    metric: str = "time_ms",
+    n_boot: int = 1000,
+    confidence: float = 0.95,
+    rng: np.random.Generator | None = None,
+) -> ScalingFit | None:
+    """fit_scaling() over every scale's runs within the inclusive date window."""
+    samples = {
+        scale: window_values(history, test, history.rows_in_dates(test, scale, *dates), metric)
+        for scale in history.scales(test)
+    }
+    return fit_scaling(test, samples, n_boot=n_boot, confidence=confidence, rng=rng)
+
+
+def compare_scaling(
+    history: PerfHistory,
+    base_dates: tuple[date, date],
+    cur_dates: tuple[date, date],
+    tests: list[str] | None = None,
+    min_growth: float = 0.1,
+    confidence: float = 0.95,
+    metric: str = "time_ms",
+    rng: np.random.Generator | None = None,
+) -> list[ScalingChange]:
+    """Exponent change per test between two windows.
+
+    A test is flagged when its exponent grew by at least `min_growth` and the
+    bootstrap CI of the growth excludes zero (with a single run per scale the
+    CI collapses to the point estimate, so only `min_growth` applies).
+    Both windows draw from one generator, so their bootstraps are independent.
+    """
+    tail = (1.0 - confidence) / 2.0 * 100.0
+    rng = rng if rng is not None else np.random.default_rng(0)
+    changes = []
+    for test in tests if tests is not None else history.tests():
+        base = scaling_in_dates(history, test, base_dates, metric, confidence=confidence, rng=rng)
+        cur = scaling_in_dates(history, test, cur_dates, metric, confidence=confidence, rng=rng)
+        if base is None and cur is None:
+            continue
+        change = ScalingChange(test, base, cur, None, None, None)
+        if base is not None and cur is not None:
+            change.growth = cur.exponent - base.exponent
+            diff = cur.boot - base.boot
+            low, high = np.percentile(diff, [tail, 100.0 - tail])
+            change.ci_low, change.ci_high = float(low), float(high)
+            change.flagged = change.growth >= min_growth and change.ci_low > 0
+        changes.append(change)
+    return changes
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""Run the headless GECS scenario benchmark over a parameter matrix and summarize scaling.
+
+Usage:
+    python tools/scenario_matrix.py                                   # default matrix
+    python tools/scenario_matrix.py --scene stress_test --entities 1000 10000 --threads 1 2 4 8
+    python tools/scenario_matrix.py --mix steady churn --parallel on --frames 1200
+    python tools/scenario_matrix.py --godot /path/to/godot --dry-run
+
+Each cell launches Godot with --headless --fixed-fps 60 on
+addons/gecs/tests/performance/scenario_benchmark.gd, which plays the example scene for a
+fixed number of frames with a fixed seed and appends frame-time percentiles and memory to
+reports/perf/<test>.jsonl (the same schema as the perf suites, scale = entity count).
+
+The worker thread count cannot be set from the command line, so each run writes it to an
+override.cfg in the project root (restored afterwards). The summary reports throughput
+(entities processed per second of frame time) per thread count, with speedup and parallel
+efficiency relative to the lowest thread count.
+"""
+
+import argparse
+import itertools
+import json
+import os
+import subprocess
+import sys
+
+import numpy as np
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUNNER = "res://addons/gecs/tests/performance/scenario_benchmark.gd"
+RESULT_PREFIX = "SCENARIO_RESULT "
+OVERRIDE_CFG = os.path.join(PROJECT_ROOT, "override.cfg")
+
+SCENES = {
+    "stress_test": "res://example_stress_test/main.tscn",
+    "multimesh": "res://example_multimesh/multimesh_main.tscn",
+}
+
+# System mixes: system node names deactivated for the run
+MIXES = {
+    # Fixed entity count, iteration only
+    "steady": ["RandomSpawnerSystem", "LifetimeSystem"],
+    # Spawning and despawning on top of iteration
+    "churn": [],
+}
+
+
+def default_threads():
+    """Powers of two up to the CPU count (plus the CPU count itself)."""
+    cpus = os.cpu_count() or 1
+    counts = [1 << i for i in range(cpus.bit_length()) if (1 << i) <= cpus]
+    if counts[-1] != cpus:
+        counts.append(cpus)
+    return counts
+
+
+def write_override(threads):
+    with open(OVERRIDE_CFG, 'w', encoding='utf-8') as f:
+        f.write("[threading]\n\n")
+        f.write(f"worker_pool/max_threads={threads}\n")
+
+
+def run_cell(args, scene, mix, entities, parallel, threads):
+    """Run one benchmark cell; returns the result record or None on failure."""
+    # Serial runs do not use the worker pool, so their history does not depend on threads
+    label = f"{mix}_parallel_t{threads}" if parallel else f"{mix}_serial"
+    user_args = [
+        f"--scene={SCENES[scene]}",
+        f"--name=scenario_{scene}_{label}",
+        f"--entities={entities}",
+        f"--frames={args.frames}",
+        f"--warmup={args.warmup}",
+        f"--seed={args.seed}",
+        f"--parallel={'true' if parallel else 'false'}",
+        f"--parallel-threshold={args.parallel_threshold}",
+        f"--parallel-systems={'true' if parallel else 'false'}",
+        f"--disable={','.join(MIXES[mix])}",
+    ]
+    cmd = [args.godot, "--headless", "--path", PROJECT_ROOT, "--fixed-fps", "60", "-s", RUNNER, "--"]
+    cmd += user_args
+    if args.dry_run:
+        print(f"[threads={threads}] " + " ".join(cmd))
+        return None
+
+    write_override(threads)
+    try:
+        proc = subprocess.run(cmd, capture_output=True, text=True, timeout=args.timeout)
+    except subprocess.TimeoutExpired:
+        print(f"  TIMEOUT {scene} {label} @{entities}")
+        return None
+    for line in proc.stdout.splitlines():
+        if line.startswith(RESULT_PREFIX):
+            record = json.loads(line[len(RESULT_PREFIX):])
+            record.update({"scene_key": scene, "mix": mix, "threads_requested": threads})
+            print(f"  {scene:<12} {label:<24} @{entities:<7} p50 {record['p50_ms']:>8.3f}ms"
+                  f"  p99 {record['p99_ms']:>8.3f}ms  {record['memory_peak_bytes'] / 1e6:>8.1f}MB")
+            return record
+    print(f"  FAILED {scene} {label} @{entities} (exit {proc.returncode})")
+    if args.verbose:
+        print(proc.stdout[-2000:])
+        print(proc.stderr[-2000:])
+    return None
+
+
+def print_scaling(results):
+    """Throughput per thread count for every (scene, mix, parallel, entities) series."""
+    series = {}
+    for r in results:
+        key = (r['scene_key'], r['mix'], r['parallel'], r['scale'])
+        series.setdefault(key, []).append(r)
+
+    print("\n" + "=" * 100)
+    print("Throughput scaling (entities per second of frame time, median frame)")
+    print("=" * 100)
+    print(f"  {'scene':<12} {'mix':<8} {'mode':<9} {'entities':>9} {'threads':>8} {'p50 ms':>9} {'p99 ms':>9}"
+          f" {'Mentity/s':>10} {'speedup':>8} {'eff.':>6}")
+    for key in sorted(series):
+        scene, mix, parallel, entities = key
+        rows = sorted(series[key], key=lambda r: r['threads_requested'])
+        base = None
+        for r in rows:
+            throughput = entities / (r['p50_ms'] / 1000.0) if r['p50_ms'] > 0 else 0.0
+            base = base or throughput
+            speedup = throughput / base if base else 0.0
+            eff = speedup * rows[0]['threads_requested'] / r['threads_requested']
+            print(f"  {scene:<12} {mix:<8} {'parallel' if parallel else 'serial':<9} {entities:>9}"
+                  f" {r['threads_requested']:>8} {r['p50_ms']:>9.3f} {r['p99_ms']:>9.3f}"
+                  f" {throughput / 1e6:>10.3f} {speedup:>7.2f}x {eff:>5.0%}")
+
+    # Entity scaling: growth exponent of frame time vs entity count (1.0 = linear)
+    print("\n  Entity scaling (log-log slope of p50 frame time vs entities, 1.0 = linear):")
+    by_config = {}
+    for r in results:
+        key = (r['scene_key'], r['mix'], r['parallel'], r['threads_requested'])
+        by_config.setdefault(key, []).append((r['scale'], r['p50_ms']))
+    for key in sorted(by_config):
+        points = sorted(p for p in by_config[key] if p[0] > 0 and p[1] > 0)
+        if len(points) < 2:
+            continue
+        x, y = np.log([p[0] for p in points]), np.log([p[1] for p in points])
+        slope = np.polyfit(x, y, 1)[0]
+        scene, mix, parallel, threads = key
+        print(f"    {scene:<12} {mix:<8} {'parallel' if parallel else 'serial':<9} t{threads:<4} {slope:>6.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the GECS headless scenario benchmark matrix")
+    parser.add_argument('--godot', default=os.environ.get('GODOT_BIN', 'godot'),
+                        help="Godot executable (default: $GODOT_BIN or 'godot')")
+    parser.add_argument('--scene', choices=sorted(SCENES), nargs='+', default=sorted(SCENES),
+                        help="Scenes to run (default: all)")
+    parser.add_argument('--entities', type=int, nargs='+', default=[1000, 5000, 20000],
+                        help="Entity counts (default: 1000 5000 20000)")
+    parser.add_argument('--threads', type=int, nargs='+', default=None,
+                        help="Worker thread counts (default: powers of two up to the CPU count)")
+    parser.add_argument('--mix', choices=sorted(MIXES), nargs='+', default=['steady'],
+                        help="System mixes (default: steady)")
+    parser.add_argument('--parallel', choices=['off', 'on', 'both'], default='both',
+                        help="parallel_processing and World.parallel_systems (default: both)")
+    parser.add_argument('--parallel-threshold', type=int, default=50,
+                        help="System.parallel_threshold (default: 50)")
+    parser.add_argument('--frames', type=int, default=600, help="Measured frames per run (default: 600)")
+    parser.add_argument('--warmup', type=int, default=60, help="Untimed frames per run (default: 60)")
+    parser.add_argument('--seed', type=int, default=1, help="Global RNG seed (default: 1)")
+    parser.add_argument('--timeout', type=int, default=600, help="Seconds per run (default: 600)")
+    parser.add_argument('--json', type=str, default=None, help="Also write all results to this file")
+    parser.add_argument('--dry-run', action='store_true', help="Print the commands without running them")
+    parser.add_argument('--verbose', action='store_true', help="Print Godot output of failed runs")
+    args = parser.parse_args()
+
+    threads = args.threads or default_threads()
+    parallel_modes = {'off': [False], 'on': [True], 'both': [False, True]}[args.parallel]
+
+    backup = None
+    if os.path.exists(OVERRIDE_CFG) and not args.dry_run:
+        with open(OVERRIDE_CFG, encoding='utf-8') as f:
+            backup = f.read()
+
+    results = []
+    # Serial runs do not use the worker pool: one run per (scene, mix, entities) is enough
+    cells = [
+        cell for cell in itertools.product(args.scene, args.mix, args.entities, parallel_modes, threads)
+        if cell[3] or cell[4] == threads[0]
+    ]
+    print("=" * 100)
+    print(f"GECS Scenario Benchmark: {len(cells)} runs, {args.frames} frames each (+{args.warmup} warmup)")
+    print("=" * 100)
+    try:
+        for scene, mix, entities, parallel, thread_count in cells:
+            record = run_cell(args, scene, mix, entities, parallel, thread_count)
+            if record:
+                results.append(record)
+    finally:
+        if not args.dry_run:
+            if backup is None:
+                if os.path.exists(OVERRIDE_CFG):
+                    os.remove(OVERRIDE_CFG)
+            else:
+                with open(OVERRIDE_CFG, 'w', encoding='utf-8') as f:
+                    f.write(backup)
+
+    if args.dry_run:
+        return
+    if not results:
+        print("\nNo results - check --godot and run with --verbose.")
+        sys.exit(1)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    print_scaling(results)
+
+
+if __name__ == '__main__':
+    main()